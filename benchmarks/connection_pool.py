@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+
+"""Latency of each request with the connection pool (keep-alive) and with a new connection every time.
+By default it asks a local server, so it measures the client and not the internet. Pass --url to ask
+a real one (like https://api.guildwars2.com/v2/build, where the TLS handshake is what the pool saves).
+
+    python benchmarks/connection_pool.py --requests 200
+    python benchmarks/connection_pool.py --url https://api.guildwars2.com/v2/build --requests 20"""
+import argparse
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from core.http_client import HttpClient  # noqa: E402
+
+BODY = b'{"id": 115267}'
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    """Answers every GET with a small JSON, keeping the connection open."""
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written apart, with Nagle every keep-alive answer would wait for a delayed ACK
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, *arguments):
+        pass
+
+
+def measure(url, requests, pooled, timeout):
+    """Seconds each request took, one after the other like the program does."""
+    # A negative idle timeout drops every idle connection, so each request opens a new one
+    client = HttpClient(idle_timeout=60 if pooled else -1, timeout=timeout)
+    times = []
+    try:
+        for _ in range(requests):
+            start = time.perf_counter()
+            client.request(url, use_cache=False)
+            times.append(time.perf_counter() - start)
+    finally:
+        client.close()
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="Ask this url instead of a local server")
+    parser.add_argument("--requests", type=int, default=100, help="Requests of each mode")
+    parser.add_argument("--timeout", type=float, default=10, help="Socket timeout of each request")
+    args = parser.parse_args()
+    server = None
+    url = args.url
+    if url is None:
+        server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = "http://127.0.0.1:{0}/v2/build".format(server.server_address[1])
+    try:
+        for name, pooled in (("fresh", False), ("pooled", True)):
+            times = measure(url, args.requests, pooled, args.timeout)
+            ordered = sorted(times)
+            print("{0:>6}: median {1:7.2f} ms, p90 {2:7.2f} ms, first {3:7.2f} ms, total {4:7.1f} ms".format(
+                name,
+                statistics.median(ordered) * 1000,
+                ordered[max(0, int(len(ordered) * 0.9) - 1)] * 1000,
+                times[0] * 1000,
+                sum(times) * 1000))
+    finally:
+        if server is not None:
+            server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
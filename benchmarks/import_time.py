@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+
+"""How long importing the program takes, and what the modules imported on first use would cost on startup.
+Every run is a fresh interpreter. Nothing is shown and options.ini is not read.
+
+    python benchmarks/import_time.py --runs 10"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+# Imported by the game buttons, the ArcDps updater, the web buttons and the raid pages, only when they are used
+ON_FIRST_USE = ("psutil", "subprocess", "hashlib", "webbrowser",
+                "ui.raid_hot_ui", "ui.raid_pof_ui", "ui.raid_achievements_ui")
+CHILD = """
+import json, sys, time
+sys.path.insert(0, {root!r})
+start = time.perf_counter()
+import gw2raidexplorer
+program = time.perf_counter() - start
+loaded = {{name: name in sys.modules for name in {modules!r}}}
+deferred = {{}}
+for name in {modules!r}:
+    start = time.perf_counter()
+    __import__(name)
+    deferred[name] = time.perf_counter() - start
+print(json.dumps({{"program": program, "loaded": loaded, "deferred": deferred}}))
+"""
+
+
+def run_once():
+    """Run a fresh interpreter and return what it measured."""
+    output = subprocess.run([sys.executable, "-c", CHILD.format(root=str(ROOT), modules=ON_FIRST_USE)],
+                            check=True, cwd=str(ROOT), stdout=subprocess.PIPE, universal_newlines=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters to run")
+    args = parser.parse_args()
+    results = [run_once() for _ in range(args.runs)]
+    print("Import of gw2raidexplorer: {0:7.1f} ms (median of {1} runs)".format(
+        statistics.median(result['program'] for result in results) * 1000, args.runs))
+    for name in ON_FIRST_USE:
+        if results[0]['loaded'][name]:
+            print("{0:>24}: already imported on startup (by another module)".format(name))
+        else:
+            print("{0:>24}: {1:7.1f} ms saved on startup, paid on first use".format(
+                name, statistics.median(result['deferred'][name] for result in results) * 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+
+"""Compare the two ways of loading the images on startup: the resources.rcc bundle and the resources_rc module.
+Every run is a fresh interpreter, that registers the images, shows one of them and reports
+how long it took and how much memory the process has.
+
+    python benchmarks/startup_resources.py --runs 10"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+CHILD = """
+import json, sys, time
+sys.path.insert(0, {root!r})
+import psutil
+from PySide2.QtGui import QGuiApplication, QPixmap
+app = QGuiApplication([])
+rss_before = psutil.Process().memory_info().rss
+start = time.perf_counter()
+if {mode!r} == "rcc":
+    from rc import load_resources
+    used = load_resources()
+else:
+    import rc.resources_rc
+    used = "module"
+loaded = time.perf_counter()
+pixmap = QPixmap(":/images/Images/Main.ico")
+shown = time.perf_counter()
+print(json.dumps({{"used": used, "load": loaded - start, "first_image": shown - loaded, "null": pixmap.isNull(),
+                  "rss": psutil.Process().memory_info().rss - rss_before}}))
+"""
+
+
+def run_once(mode):
+    """Run a fresh interpreter and return what it measured."""
+    output = subprocess.run([sys.executable, "-c", CHILD.format(root=str(ROOT), mode=mode)],
+                            check=True, stdout=subprocess.PIPE, universal_newlines=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="Runs of each mode (the first one also compiles the module)")
+    args = parser.parse_args()
+    for mode in ("module", "rcc"):
+        results = [run_once(mode) for _ in range(args.runs)]
+        if results[0]['used'] != mode or any(result['null'] for result in results):
+            print("{0}: not available ({1} was used)".format(mode, results[0]['used']))
+            continue
+        print("{0:>6}: load {1:7.1f} ms (first run {2:7.1f} ms), first image {3:5.1f} ms, RSS +{4:6.1f} MB".format(
+            mode,
+            statistics.median(result['load'] for result in results) * 1000,
+            results[0]['load'] * 1000,
+            statistics.median(result['first_image'] for result in results) * 1000,
+            statistics.median(result['rss'] for result in results) / 2 ** 20))
+
+
+if __name__ == "__main__":
+    main()
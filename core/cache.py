@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+
+"""Persistent cache of HTTP responses.
+Bodies are stored compressed on disk together with the ETag, Last-Modified and
+Cache-Control the server gave us, so next time we can ask "has it changed?"
+and get a tiny 304 instead of downloading everything again."""
+import hashlib
+import json
+import threading
+import time
+import urllib.parse
+import zlib
+from collections import OrderedDict
+from pathlib import Path
+
+DEFAULT_CACHE_FOLDER = "cache"
+DEFAULT_CACHE_SIZE = 50 * 1024 * 1024
+INDEX_FILE = "index.json"
+TOKEN_PARAMETER = "access_token"
+
+
+def token_fingerprint(token):
+    """Short hash of an API key, so keys are never written to disk."""
+    if not token:
+        return ""
+    return hashlib.sha256(token.encode('utf8')).hexdigest()[:16]
+
+
+def parse_cache_control(value):
+    """Turn 'public, max-age=300' into {'public': True, 'max-age': '300'}."""
+    directives = {}
+    for item in (value or "").split(","):
+        item = item.strip().lower()
+        if not item:
+            continue
+        name, _, argument = item.partition("=")
+        directives[name.strip()] = argument.strip().strip('"') or True
+    return directives
+
+
+def freshness_lifetime(headers):
+    """Seconds a response can be used without asking the server again."""
+    directives = parse_cache_control(headers.get("cache-control"))
+    if "no-cache" in directives or "no-store" in directives:
+        return 0
+    try:
+        return max(0, int(directives.get("max-age", 0)))
+    except ValueError:
+        return 0
+
+
+class ResponseCache(object):
+    """On-disk LRU cache of response bodies, compressed with zlib.
+    Entries are keyed by endpoint, query and a fingerprint of the token.
+    The least recently used ones are removed once the cache grows over `max_size` bytes."""
+    def __init__(self, folder=DEFAULT_CACHE_FOLDER, max_size=DEFAULT_CACHE_SIZE):
+        self.folder = Path(folder)
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._index = OrderedDict()
+        self._load_index()
+
+    ###########
+    # HELPERS #
+    ###########
+
+    @staticmethod
+    def key_for(url):
+        """Cache key of an url: endpoint + query (without the token) + token fingerprint."""
+        parts = urllib.parse.urlsplit(url)
+        query = urllib.parse.parse_qsl(parts.query, keep_blank_values=True)
+        token = "".join(value for name, value in query if name == TOKEN_PARAMETER)
+        query = sorted((name, value) for name, value in query if name != TOKEN_PARAMETER)
+        identity = "{0}{1}?{2}#{3}".format(parts.netloc, parts.path, urllib.parse.urlencode(query),
+                                           token_fingerprint(token))
+        return hashlib.sha1(identity.encode('utf8')).hexdigest()
+
+    def _body_path(self, key):
+        """File where the body of that key lives."""
+        return self.folder / "{0}.bin".format(key)
+
+    def _load_index(self):
+        """Read the index of entries from disk. A broken index means an empty cache."""
+        try:
+            with open(self.folder / INDEX_FILE, "r", encoding="utf8") as index_file:
+                self._index = OrderedDict(json.load(index_file))
+        except (OSError, ValueError):
+            self._index = OrderedDict()
+
+    def _save_index(self):
+        """Write the index of entries to disk."""
+        self.folder.mkdir(parents=True, exist_ok=True)
+        temporary = self.folder / (INDEX_FILE + ".tmp")
+        with open(temporary, "w", encoding="utf8") as index_file:
+            json.dump(list(self._index.items()), index_file)
+        temporary.replace(self.folder / INDEX_FILE)
+
+    def _evict(self):
+        """Remove least recently used entries until we fit in the budget."""
+        total = sum(entry['size'] for entry in self._index.values())
+        while total > self.max_size and self._index:
+            key, entry = self._index.popitem(last=False)
+            total -= entry['size']
+            try:
+                self._body_path(key).unlink()
+            except OSError:
+                pass
+
+    ##########
+    # PUBLIC #
+    ##########
+
+    def lookup(self, url):
+        """Get the metadata of a cached url, or None."""
+        with self._lock:
+            entry = self._index.get(self.key_for(url))
+            return dict(entry) if entry is not None else None
+
+    @staticmethod
+    def is_fresh(entry):
+        """Check if an entry can be used without revalidating it."""
+        return time.time() < entry['expires']
+
+    @staticmethod
+    def conditional_headers(entry):
+        """Headers to ask the server if our copy is still valid."""
+        headers = {}
+        if entry.get('etag'):
+            headers["If-None-Match"] = entry['etag']
+        if entry.get('last_modified'):
+            headers["If-Modified-Since"] = entry['last_modified']
+        return headers
+
+    def read(self, url):
+        """Get the cached body of an url (and mark it as recently used), or None."""
+        key = self.key_for(url)
+        with self._lock:
+            if key not in self._index:
+                return None
+            try:
+                body = zlib.decompress(self._body_path(key).read_bytes())
+            except (OSError, zlib.error):
+                del self._index[key]
+                return None
+            self._index.move_to_end(key)
+            return body
+
+    def store(self, url, headers, body):
+        """Save a response, unless the server told us not to."""
+        directives = parse_cache_control(headers.get("cache-control"))
+        if "no-store" in directives:
+            return
+        # Without validators nor freshness we could never use it again
+        if not headers.get("etag") and not headers.get("last-modified") and not freshness_lifetime(headers):
+            return
+        key = self.key_for(url)
+        compressed = zlib.compress(body, 6)
+        with self._lock:
+            self.folder.mkdir(parents=True, exist_ok=True)
+            self._body_path(key).write_bytes(compressed)
+            self._index[key] = {"etag": headers.get("etag"),
+                                "last_modified": headers.get("last-modified"),
+                                "cache_control": headers.get("cache-control"),
+                                "expires": time.time() + freshness_lifetime(headers),
+                                "size": len(compressed)}
+            self._index.move_to_end(key)
+            self._evict()
+            self._save_index()
+
+    def revalidated(self, url, headers):
+        """The server answered 304: our copy is good, refresh its freshness."""
+        key = self.key_for(url)
+        with self._lock:
+            entry = self._index.get(key)
+            if entry is None:
+                return
+            if headers.get("cache-control"):
+                entry['cache_control'] = headers.get("cache-control")
+            if headers.get("etag"):
+                entry['etag'] = headers.get("etag")
+            entry['expires'] = time.time() + freshness_lifetime({"cache-control": entry['cache_control']})
+            self._index.move_to_end(key)
+            self._save_index()
+
+    def clear(self):
+        """Remove everything."""
+        with self._lock:
+            for key in list(self._index):
+                try:
+                    self._body_path(key).unlink()
+                except OSError:
+                    pass
+            self._index.clear()
+            self._save_index()
+
+    def size(self):
+        """Bytes used by the cached bodies."""
+        with self._lock:
+            return sum(entry['size'] for entry in self._index.values())
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+
+"""Everything we track of each raid wing: bosses, achievements, minis and skins.
+The data lives in raid_catalog.json, it's read once and compiled into lookup tables,
+so adding a new wing is editing that file (and the UI), not the code."""
+import json
+import os
+
+CATALOG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "raid_catalog.json")
+SECTIONS = ("bosses", "achievements", "minis", "skins")
+
+
+class RaidCatalog(object):
+    """Compiled catalog. For each section, `entries` and `widget_by_id` keep the order of the file.
+    Bosses have a widget each, the rest are shown in grids and have a name (and an icon)."""
+    def __init__(self, wings):
+        self.wings = wings
+        self.entries = {section: [] for section in SECTIONS}
+        self.widget_by_id = {section: {} for section in SECTIONS}
+        self.id_by_widget = {section: {} for section in SECTIONS}
+        self.wing_by_id = {section: {} for section in SECTIONS}
+        for wing in wings:
+            for section in SECTIONS:
+                for entry in wing.get(section, []):
+                    if entry['id'] in self.wing_by_id[section]:
+                        raise ValueError("{0} {1} is twice in the catalog".format(section, entry['id']))
+                    self.entries[section].append(dict(entry, wing=wing['wing']))
+                    self.wing_by_id[section][entry['id']] = wing['wing']
+                    if "widget" in entry:
+                        self.widget_by_id[section][entry['id']] = entry['widget']
+                        self.id_by_widget[section][entry['widget']] = entry['id']
+
+    @classmethod
+    def load(cls, path=CATALOG_FILE):
+        """Read and compile a catalog file."""
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(json.load(f)['wings'])
+
+    def ids(self, section):
+        """API ids of a section, in order."""
+        return [entry['id'] for entry in self.entries[section]]
+
+    def wing_names(self, section):
+        """Dict of wing number -> name, of the wings that have something of a section."""
+        return {wing['wing']: wing['name'] for wing in self.wings if wing.get(section)}
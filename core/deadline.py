@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+
+"""Deadlines and cancellation for a group of requests.
+A whole load gets one time budget, every request inside it uses what's left,
+and cancelling it (changing key, closing the window) aborts the requests in flight."""
+import threading
+import time
+
+
+class Cancelled(Exception):
+    """The work was cancelled by the user."""
+    def __init__(self):
+        Exception.__init__(self, "Cancelled.")
+
+
+class DeadlineExceeded(Exception):
+    """The time budget ran out."""
+    def __init__(self):
+        Exception.__init__(self, "It took too long.")
+
+
+class Deadline(object):
+    """Time budget (in seconds, None means no limit) that can also be cancelled.
+    Children share the cancellation of their parent but may have a shorter budget."""
+    def __init__(self, budget=None, parent=None):
+        expires = None if budget is None else time.monotonic() + budget
+        if parent is not None and parent.expires is not None:
+            expires = parent.expires if expires is None else min(expires, parent.expires)
+        self.expires = expires
+        self._cancelled = parent._cancelled if parent is not None else threading.Event()
+        self._callbacks = parent._callbacks if parent is not None else set()
+        self._lock = parent._lock if parent is not None else threading.Lock()
+
+    def remaining(self):
+        """Seconds left, or None if there is no limit."""
+        if self.expires is None:
+            return None
+        return max(0.0, self.expires - time.monotonic())
+
+    def timeout(self, steps_left=1, default=None):
+        """Share of the remaining budget for the next of `steps_left` sequential steps."""
+        remaining = self.remaining()
+        if remaining is None:
+            return default
+        share = remaining / max(1, steps_left)
+        return share if default is None else min(share, default)
+
+    def cancelled(self):
+        """Check if it was cancelled."""
+        return self._cancelled.is_set()
+
+    def expired(self):
+        """Check if the budget ran out."""
+        return self.expires is not None and time.monotonic() >= self.expires
+
+    def check(self):
+        """Raise if it was cancelled or the budget ran out."""
+        if self.cancelled():
+            raise Cancelled()
+        if self.expired():
+            raise DeadlineExceeded()
+
+    def sleep(self, seconds):
+        """Sleep, but wake up as soon as it's cancelled. Raises if cancelled or expired."""
+        remaining = self.remaining()
+        if remaining is not None and remaining < seconds:
+            raise DeadlineExceeded()
+        self._cancelled.wait(seconds)
+        self.check()
+
+    def cancel(self):
+        """Cancel it, aborting everything registered with on_cancel."""
+        self._cancelled.set()
+        with self._lock:
+            callbacks = list(self._callbacks)
+            self._callbacks.clear()
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception:
+                pass
+
+    def on_cancel(self, callback):
+        """Call `callback` if it gets cancelled (at once if it already was).
+        Returns a function to unregister it."""
+        with self._lock:
+            if not self._cancelled.is_set():
+                self._callbacks.add(callback)
+                return lambda: self._discard(callback)
+        callback()
+        return lambda: None
+
+    def _discard(self, callback):
+        """Forget a callback."""
+        with self._lock:
+            self._callbacks.discard(callback)
@@ -0,0 +1,459 @@
+# -*- coding: utf-8 -*-
+
+"""HTTP client shared by the whole program.
+It keeps a pool of keep-alive connections per host, so every call to the
+GW2 API (or GitHub, or deltaconnected) doesn't pay a new TCP connect and
+TLS handshake."""
+import http.client
+import json
+import os
+import socket
+import ssl
+import threading
+import time
+import urllib.parse
+import zlib
+from collections import deque
+from core.retry import RetryPolicy, CircuitBreaker, CircuitOpenError, Counters
+from core.ratelimit import INTERACTIVE
+from core.deadline import Cancelled, DeadlineExceeded
+
+DEFAULT_POOL_SIZE = 4
+DEFAULT_IDLE_TIMEOUT = 60
+DEFAULT_TIMEOUT = 30
+USER_AGENT = "Gw2RaidExplorer"
+REDIRECT_CODES = (301, 302, 303, 307, 308)
+MAX_REDIRECTS = 5
+ACCEPT_ENCODING = "gzip, deflate"
+CHUNK_SIZE = 65536
+CONDITIONAL_HEADERS = ("if-none-match", "if-modified-since")
+
+########################################################
+##################### EXCEPTIONS #######################
+########################################################
+
+
+class HttpError(Exception):
+    """The server answered, but not with a successful status.
+    The message mimics urllib so old checks like "HTTP Error 400" keep working."""
+    def __init__(self, url, status, reason, headers=None):
+        Exception.__init__(self, "HTTP Error {0}: {1}".format(status, reason))
+        self.url = url
+        self.status = status
+        self.reason = reason
+        self.headers = headers or {}
+
+########################################################
+#################### DECOMPRESSION #####################
+########################################################
+
+
+def read_body(answer, chunk_size=CHUNK_SIZE):
+    """Read the whole body of an answer, decompressing gzip/deflate while it arrives.
+    Returns the body and how many bytes actually travelled over the wire."""
+    encoding = (answer.getheader("Content-Encoding") or "identity").strip().lower()
+    if encoding == "gzip":
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    elif encoding == "deflate":
+        decompressor = zlib.decompressobj(zlib.MAX_WBITS)
+    else:
+        body = answer.read()
+        return body, len(body)
+    chunks = []
+    wire_size = 0
+    for chunk in iter(lambda: answer.read(chunk_size), b""):
+        if wire_size == 0 and encoding == "deflate":
+            # Some servers send raw deflate instead of zlib-wrapped deflate
+            try:
+                chunks.append(decompressor.decompress(chunk))
+            except zlib.error:
+                decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+                chunks.append(decompressor.decompress(chunk))
+        else:
+            chunks.append(decompressor.decompress(chunk))
+        wire_size += len(chunk)
+    chunks.append(decompressor.flush())
+    return b"".join(chunks), wire_size
+
+########################################################
+###################### RESPONSE ########################
+########################################################
+
+
+class Response(object):
+    """Everything we need from an answer, already read from the socket."""
+    def __init__(self, url, status, reason, headers, body, elapsed, from_cache=False, wire_size=None,
+                 stale=False):
+        self.url = url
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self.body = body
+        self.elapsed = elapsed
+        self.from_cache = from_cache
+        self.wire_size = len(body) if wire_size is None else wire_size
+        self.stale = stale
+
+    def text(self):
+        """Body decoded as text."""
+        return self.body.decode('utf8')
+
+    def json(self):
+        """Body parsed as JSON."""
+        return json.loads(self.text())
+
+########################################################
+################## CONNECTION POOL #####################
+########################################################
+
+
+class ConnectionPool(object):
+    """Keep-alive connections to a single host.
+    At most `size` connections are in use at the same time, and idle ones
+    are dropped once they have been waiting for more than `idle_timeout` seconds."""
+    def __init__(self, scheme, host, port, size=DEFAULT_POOL_SIZE, idle_timeout=DEFAULT_IDLE_TIMEOUT):
+        self.scheme = scheme
+        self.host = host
+        self.port = port
+        self.size = size
+        self.idle_timeout = idle_timeout
+        self._idle = deque()
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(size)
+        self._ssl_context = ssl.create_default_context() if scheme == "https" else None
+
+    def _new_connection(self, timeout=None):
+        """Open a brand new connection (the handshake happens on first use)."""
+        if self.scheme == "https":
+            return http.client.HTTPSConnection(self.host, self.port, timeout=timeout, context=self._ssl_context)
+        return http.client.HTTPConnection(self.host, self.port, timeout=timeout)
+
+    def acquire(self, timeout=None, wait=None):
+        """Get a connection, reusing an idle one if there is any.
+        `timeout` is the socket timeout, `wait` how long we can wait for a free slot.
+        Returns the connection and whether it was reused."""
+        if not self._slots.acquire(timeout=wait):
+            raise DeadlineExceeded()
+        now = time.monotonic()
+        with self._lock:
+            while self._idle:
+                connection, last_used = self._idle.pop()
+                if now - last_used <= self.idle_timeout:
+                    connection.timeout = timeout
+                    if connection.sock is not None:
+                        connection.sock.settimeout(timeout)
+                    return connection, True
+                connection.close()
+        return self._new_connection(timeout), False
+
+    def release(self, connection, reusable=True):
+        """Give back a connection. Broken or closed ones are thrown away."""
+        try:
+            if reusable and connection.sock is not None:
+                with self._lock:
+                    self._idle.append((connection, time.monotonic()))
+            else:
+                connection.close()
+        finally:
+            self._slots.release()
+
+    def warm_up(self, count=1, timeout=DEFAULT_TIMEOUT):
+        """Open `count` connections in advance and leave them idle.
+        `timeout` bounds the connect (and the wait for a free slot), so a dead host can't hang it."""
+        # Hold them all until the end, or the same idle connection would be taken every time
+        held = []
+        try:
+            for _ in range(min(count, self.size)):
+                connection, reused = self.acquire(timeout, wait=timeout)
+                held.append(connection)
+                if not reused:
+                    connection.connect()
+        except OSError:
+            self.release(held.pop(), reusable=False)
+        finally:
+            for connection in held:
+                self.release(connection)
+
+    def close(self):
+        """Close every idle connection."""
+        with self._lock:
+            while self._idle:
+                self._idle.pop()[0].close()
+
+########################################################
+##################### HTTP CLIENT ######################
+########################################################
+
+
+class HttpClient(object):
+    """Small GET-only client on top of one ConnectionPool per host.
+    With a ResponseCache, answers are stored on disk and revalidated with conditional requests.
+    Failed requests are retried following a RetryPolicy, and a CircuitBreaker per host
+    stops calling a host that keeps failing (serving cached data meanwhile, if there is any).
+    With a RequestScheduler, every request that really goes to the network waits for its turn.
+    `timeout` is the socket timeout of the requests that don't say otherwise."""
+    def __init__(self, pool_size=DEFAULT_POOL_SIZE, idle_timeout=DEFAULT_IDLE_TIMEOUT, cache=None,
+                 retry_policy=None, scheduler=None, timeout=DEFAULT_TIMEOUT):
+        self.pool_size = pool_size
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+        self.cache = cache
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.scheduler = scheduler
+        self.counters = Counters()
+        self._pools = {}
+        self._breakers = {}
+        self._lock = threading.Lock()
+
+    def _pool_for(self, parts):
+        """Get (or create) the pool for the host of that url."""
+        port = parts.port or (443 if parts.scheme == "https" else 80)
+        pool_key = (parts.scheme, parts.hostname, port)
+        with self._lock:
+            if pool_key not in self._pools:
+                self._pools[pool_key] = ConnectionPool(parts.scheme, parts.hostname, port,
+                                                       self.pool_size, self.idle_timeout)
+            return self._pools[pool_key]
+
+    def _breaker_for(self, host):
+        """Get (or create) the circuit breaker of a host."""
+        with self._lock:
+            if host not in self._breakers:
+                self._breakers[host] = CircuitBreaker(counters=self.counters)
+            return self._breakers[host]
+
+    def _send(self, url, headers, timeout, consume, deadline=None):
+        """Send a GET using a pooled connection and hand the raw answer to `consume`.
+        A reused keep-alive connection may have been closed by the server while idle,
+        in that case we try once more on a fresh one.
+        With a deadline, the socket timeout is what's left of it, and cancelling it
+        shuts the socket down so the request stops at once."""
+        parts = urllib.parse.urlsplit(url)
+        pool = self._pool_for(parts)
+        path = parts.path or "/"
+        if parts.query:
+            path = path + "?" + parts.query
+        request_headers = {"User-Agent": USER_AGENT, "Connection": "keep-alive"}
+        request_headers.update(headers or {})
+        while True:
+            if deadline is not None:
+                deadline.check()
+                socket_timeout = deadline.timeout(default=timeout or self.timeout)
+            else:
+                socket_timeout = timeout or self.timeout
+            connection, reused = pool.acquire(socket_timeout, wait=socket_timeout if deadline else None)
+            unregister = deadline.on_cancel(lambda: self._abort(connection)) if deadline else None
+            try:
+                connection.request("GET", path, headers=request_headers)
+                answer = connection.getresponse()
+                result = consume(answer)
+            except (http.client.RemoteDisconnected, ConnectionResetError,
+                    BrokenPipeError, http.client.BadStatusLine) as e:
+                pool.release(connection, reusable=False)
+                if deadline is not None and deadline.cancelled():
+                    raise Cancelled() from e
+                if reused:
+                    continue
+                raise e
+            except Exception as e:
+                pool.release(connection, reusable=False)
+                if deadline is not None and deadline.cancelled():
+                    raise Cancelled() from e
+                raise
+            finally:
+                if unregister is not None:
+                    unregister()
+            pool.release(connection, reusable=not answer.will_close)
+            return answer, result
+
+    @staticmethod
+    def _abort(connection):
+        """Stop a request in flight from another thread."""
+        if connection.sock is not None:
+            try:
+                connection.sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+    def request(self, url, headers=None, timeout=None, use_cache=True, priority=INTERACTIVE, key=None,
+                deadline=None):
+        """GET an url, following redirects, and return a Response.
+        Fresh cached copies are returned straight away, stale ones are revalidated.
+        Transient failures are retried with backoff, and if the host is down
+        the last cached copy is returned (flagged as stale) instead of failing.
+        With a Deadline, nothing (waiting for the rate limit, retries, sockets) goes beyond it.
+        `key` is the API key the request is charged to, by default the access_token of the url."""
+        started = time.perf_counter()
+        cache = self.cache if use_cache else None
+        entry = cache.lookup(url) if cache is not None else None
+        if entry is not None and cache.is_fresh(entry):
+            body = cache.read(url)
+            if body is not None:
+                return Response(url, 200, "OK", {}, body, time.perf_counter() - started, from_cache=True,
+                                wire_size=0)
+            entry = None
+        parts = urllib.parse.urlsplit(url)
+        host = parts.hostname
+        token = key if key is not None else urllib.parse.parse_qs(parts.query).get("access_token", [None])[0]
+        breaker = self._breaker_for(host)
+        policy = self.retry_policy
+        attempt = 0
+        while True:
+            if not breaker.allow():
+                stale = self._stale_response(url, cache, started)
+                if stale is not None:
+                    return stale
+                raise CircuitOpenError(host)
+            try:
+                if deadline is not None:
+                    deadline.check()
+                if self.scheduler is not None:
+                    wait = deadline.remaining() if deadline is not None else None
+                    if not self.scheduler.acquire(token, priority, wait, deadline):
+                        raise DeadlineExceeded()
+            except (Cancelled, DeadlineExceeded):
+                # Nothing was sent, if this was the trial of a half open breaker someone else can be it
+                breaker.release_trial()
+                raise
+            attempt += 1
+            self.counters.increment("requests")
+            try:
+                response = self._fetch(url, headers, timeout, cache, entry, started, deadline)
+            except (Cancelled, DeadlineExceeded):
+                breaker.release_trial()
+                raise
+            except Exception as e:
+                server_failure = policy.is_server_failure(e)
+                if server_failure:
+                    breaker.record_failure()
+                elif isinstance(e, HttpError):
+                    # The server answered, so it's alive
+                    breaker.record_success()
+                else:
+                    breaker.release_trial()
+                if policy.should_retry(e, attempt):
+                    self.counters.increment("retries")
+                    if deadline is not None:
+                        deadline.sleep(policy.delay(attempt, e))
+                    else:
+                        time.sleep(policy.delay(attempt, e))
+                    continue
+                self.counters.increment("failures")
+                if server_failure or getattr(e, "status", None) == 429:
+                    stale = self._stale_response(url, cache, started)
+                    if stale is not None:
+                        return stale
+                raise
+            breaker.record_success()
+            return response
+
+    def _fetch(self, url, headers, timeout, cache, entry, started, deadline=None):
+        """Send one GET (conditional if we have a cached copy) and build its Response."""
+        request_headers = {"Accept-Encoding": ACCEPT_ENCODING}
+        request_headers.update(headers or {})
+        if entry is not None:
+            request_headers.update(cache.conditional_headers(entry))
+        original_url = url
+        for _ in range(MAX_REDIRECTS + 1):
+            answer, (body, wire_size) = self._send(url, request_headers, timeout, read_body, deadline)
+            answer_headers = {key.lower(): value for key, value in answer.getheaders()}
+            if answer.status in REDIRECT_CODES and "location" in answer_headers:
+                url = urllib.parse.urljoin(url, answer_headers["location"])
+                continue
+            if answer.status == 304:
+                body = cache.read(original_url) if entry is not None else None
+                if body is None:
+                    # Our copy vanished meanwhile (or we never had one), ask again without conditions
+                    unconditional = {name: value for name, value in (headers or {}).items()
+                                     if name.lower() not in CONDITIONAL_HEADERS}
+                    if entry is None and unconditional == (headers or {}):
+                        raise HttpError(url, answer.status, "Not Modified, but there is no cached copy")
+                    return self._fetch(original_url, unconditional, timeout, cache, None, started, deadline)
+                cache.revalidated(original_url, answer_headers)
+                return Response(url, 200, "OK", answer_headers, body, time.perf_counter() - started,
+                                from_cache=True, wire_size=wire_size)
+            if answer.status >= 400:
+                raise HttpError(url, answer.status, answer.reason, answer_headers)
+            if cache is not None:
+                cache.store(original_url, answer_headers, body)
+            return Response(url, answer.status, answer.reason, answer_headers, body,
+                            time.perf_counter() - started, wire_size=wire_size)
+        raise HttpError(url, answer.status, "Too many redirects")
+
+    def _stale_response(self, url, cache, started):
+        """Last cached copy of an url, for when the server can't give us a new one."""
+        body = cache.read(url) if cache is not None else None
+        if body is None:
+            return None
+        self.counters.increment("served_stale")
+        return Response(url, 200, "OK", {}, body, time.perf_counter() - started, from_cache=True,
+                        wire_size=0, stale=True)
+
+    def stats(self):
+        """Counters of the retry engine plus the state of every circuit breaker."""
+        stats = self.counters.snapshot()
+        if self.scheduler is not None:
+            stats["queue_depth"] = self.scheduler.queue_depth()
+        with self._lock:
+            for host, breaker in self._breakers.items():
+                stats["breaker {0}".format(host)] = breaker.state
+        return stats
+
+    def get(self, url, headers=None, timeout=None, deadline=None):
+        """GET an url and return the body as bytes."""
+        return self.request(url, headers, timeout, deadline=deadline).body
+
+    def get_json(self, url, headers=None, timeout=None, deadline=None):
+        """GET an url and return the body parsed as JSON."""
+        return self.request(url, headers, timeout, deadline=deadline).json()
+
+    def download(self, url, filepath, headers=None, timeout=None, chunk_size=CHUNK_SIZE, deadline=None):
+        """GET an url and stream the body into a file.
+        It's written next to it first, so an aborted download never leaves a broken file."""
+        partial_file = "{0}.part".format(filepath)
+
+        def write_to_file(answer):
+            if answer.status in REDIRECT_CODES or answer.status >= 400:
+                return answer.read()
+            with open(partial_file, "wb") as file_to_write:
+                for chunk in iter(lambda: answer.read(chunk_size), b""):
+                    if deadline is not None:
+                        deadline.check()
+                    file_to_write.write(chunk)
+            os.replace(partial_file, filepath)
+            return None
+        for _ in range(MAX_REDIRECTS + 1):
+            try:
+                answer, _ = self._send(url, headers, timeout, write_to_file, deadline)
+            except Exception:
+                if os.path.exists(partial_file):
+                    os.remove(partial_file)
+                raise
+            location = answer.getheader("Location")
+            if answer.status in REDIRECT_CODES and location:
+                url = urllib.parse.urljoin(url, location)
+                continue
+            if answer.status >= 400:
+                raise HttpError(url, answer.status, answer.reason)
+            return filepath
+        raise HttpError(url, answer.status, "Too many redirects")
+
+    def warm_up(self, urls, connections=1, timeout=None):
+        """Pre-connect to the hosts of those urls in a background thread,
+        so the first real request finds the handshake already done.
+        Each connect takes at most `timeout` seconds (the client's timeout by default)."""
+        def run():
+            for url in urls:
+                try:
+                    self._pool_for(urllib.parse.urlsplit(url)).warm_up(connections, timeout or self.timeout)
+                except Exception:
+                    pass
+        thread = threading.Thread(target=run, name="http-warm-up", daemon=True)
+        thread.start()
+        return thread
+
+    def close(self):
+        """Close every idle connection of every host."""
+        with self._lock:
+            for pool in self._pools.values():
+                pool.close()
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+
+"""Index of every item of an account, built in a single pass over all its locations.
+After that, asking how many of an item there are (and where) is a dict lookup."""
+
+SHARED_INVENTORY = "Shared inventory"
+MATERIAL_STORAGE = "Material storage"
+BANK = "Bank"
+
+
+class ItemIndex(object):
+    """item_id -> total count, plus item_id -> {location: count}."""
+    def __init__(self):
+        self.totals = {}
+        self.locations = {}
+
+    def add(self, item_id, count, location):
+        """Count `count` units of an item in a location."""
+        if not count:
+            return
+        self.totals[item_id] = self.totals.get(item_id, 0) + count
+        where = self.locations.setdefault(item_id, {})
+        where[location] = where.get(location, 0) + count
+
+    def add_slots(self, slots, location):
+        """Count every non empty slot of a list (bags, bank, shared inventory, materials)."""
+        for slot in slots or []:
+            if slot is not None and "id" in slot:
+                self.add(slot['id'], slot.get('count', 1), location)
+
+    def count(self, item_id):
+        """Total units of an item in the whole account."""
+        return self.totals.get(item_id, 0)
+
+    def where(self, item_id):
+        """Dict of location -> units of an item."""
+        return dict(self.locations.get(item_id, {}))
+
+    @classmethod
+    def build(cls, characters, shared_inventory, materials, bank):
+        """Index everything the API told us about an account."""
+        index = cls()
+        for char in characters:
+            name = char.get('name', "?")
+            # Equipped items
+            for equipped in char.get('equipment') or []:
+                if equipped is not None and "id" in equipped:
+                    index.add(equipped['id'], equipped.get('count', 1), "{0} (equipped)".format(name))
+            # Inventories
+            for bag in char.get('bags') or []:
+                if bag is not None:
+                    index.add_slots(bag['inventory'], "{0} (bags)".format(name))
+        index.add_slots(shared_inventory, SHARED_INVENTORY)
+        index.add_slots(materials, MATERIAL_STORAGE)
+        index.add_slots(bank, BANK)
+        return index
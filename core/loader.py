@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+
+"""Run the network part of several sections at the same time.
+The sections don't depend on each other, so the whole load should take
+as long as the slowest section, not the sum of all of them."""
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+DEFAULT_MAX_WORKERS = 5
+
+
+class SectionLoader(object):
+    """Bounded thread pool that fetches every section concurrently."""
+    def __init__(self, max_workers=DEFAULT_MAX_WORKERS):
+        self.max_workers = max_workers
+
+    def run(self, jobs):
+        """Execute every job (a dict of name -> callable) at the same time.
+        Yields (name, result, error) in the order they finish, where
+        error is the exception raised by that job or None."""
+        if not jobs:
+            return
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(jobs))) as executor:
+            futures = {executor.submit(job): name for name, job in jobs.items()}
+            for future in as_completed(futures):
+                error = future.exception()
+                result = None if error is not None else future.result()
+                yield futures[future], result, error
+
+    def gather(self, jobs):
+        """Execute every job at the same time and return a dict of name -> result.
+        The first error found is raised once everything has finished."""
+        results = {}
+        first_error = None
+        for name, result, error in self.run(jobs):
+            if error is not None and first_error is None:
+                first_error = error
+            results[name] = result
+        if first_error is not None:
+            raise first_error
+        return results
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+
+"""In-memory memoization of API answers that barely change, like tokeninfo.
+Every entry expires after its own TTL and can be dropped explicitly,
+for example when a key is deleted."""
+import threading
+import time
+
+
+class MemoCache(object):
+    """Thread-safe dict of (section, arguments, token) -> value with a TTL per entry."""
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key_for(section, token=None, **arguments):
+        """Build the key of an API call."""
+        return section, tuple(sorted((name, str(value)) for name, value in arguments.items())), token
+
+    def get(self, key):
+        """Get a value, or None if it's missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires = entry
+            if time.monotonic() >= expires:
+                del self._entries[key]
+                return None
+            return value
+
+    def set(self, key, value, ttl):
+        """Remember a value for `ttl` seconds."""
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + ttl)
+
+    def get_or_load(self, key, ttl, loader):
+        """Get a value, calling `loader` (and remembering its result) if we don't have it."""
+        value = self.get(key)
+        if value is None:
+            value = loader()
+            self.set(key, value, ttl)
+        return value
+
+    def invalidate(self, token=None, section=None):
+        """Forget every entry of a token and/or a section. Without arguments, forget everything."""
+        with self._lock:
+            for key in list(self._entries):
+                if (token is None or key[2] == token) and (section is None or key[0] == section):
+                    del self._entries[key]
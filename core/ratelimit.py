@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+
+"""Client-side rate limiting for the GW2 API.
+ANet limits requests per key and per IP, so every request first takes a token
+from a global bucket and from the bucket of its key. When there are no tokens,
+requests wait in a queue where interactive loads go before background refreshes."""
+import heapq
+import itertools
+import threading
+import time
+from core.deadline import Cancelled
+
+# Priority classes, lower goes first
+INTERACTIVE = 0
+BACKGROUND = 1
+
+DEFAULT_GLOBAL_RATE = 10.0
+DEFAULT_GLOBAL_BURST = 30
+DEFAULT_KEY_RATE = 5.0
+DEFAULT_KEY_BURST = 15
+
+########################################################
+#################### TOKEN BUCKET ######################
+########################################################
+
+
+class TokenBucket(object):
+    """Classic token bucket: `rate` tokens per second, holding at most `burst` tokens.
+    Not thread-safe by itself, the scheduler protects it."""
+    def __init__(self, rate, burst):
+        self.rate = float(rate)
+        self.burst = float(burst)
+        self.tokens = float(burst)
+        self._updated = time.monotonic()
+
+    def _refill(self, now):
+        """Add the tokens earned since last time. A `now` taken before the bucket was created earns nothing."""
+        if now > self._updated:
+            self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+    def wait_time(self, now, tokens=1.0):
+        """Seconds until `tokens` tokens are available."""
+        self._refill(now)
+        if self.tokens >= tokens:
+            return 0.0
+        return (tokens - self.tokens) / self.rate
+
+    def take(self, now, tokens=1.0):
+        """Spend tokens (call it only when wait_time says 0)."""
+        self._refill(now)
+        self.tokens -= tokens
+
+########################################################
+##################### SCHEDULER ########################
+########################################################
+
+
+class RequestScheduler(object):
+    """Queue of requests waiting for their turn.
+    A request goes when it's the first of the queue (by priority, then arrival)
+    and both the global bucket and the bucket of its key have a token."""
+    def __init__(self, global_rate=DEFAULT_GLOBAL_RATE, global_burst=DEFAULT_GLOBAL_BURST,
+                 key_rate=DEFAULT_KEY_RATE, key_burst=DEFAULT_KEY_BURST):
+        self.global_bucket = TokenBucket(global_rate, global_burst)
+        self.key_rate = key_rate
+        self.key_burst = key_burst
+        self._key_buckets = {}
+        self._queue = []
+        self._arrival = itertools.count()
+        self._condition = threading.Condition()
+
+    def _bucket_for(self, key):
+        """Get (or create) the bucket of a key. Requests without key only use the global one."""
+        if key is None:
+            return None
+        if key not in self._key_buckets:
+            self._key_buckets[key] = TokenBucket(self.key_rate, self.key_burst)
+        return self._key_buckets[key]
+
+    def _wait_for(self, key, now):
+        """Seconds until a request of that key could go."""
+        wait = self.global_bucket.wait_time(now)
+        bucket = self._bucket_for(key)
+        if bucket is not None:
+            wait = max(wait, bucket.wait_time(now))
+        return wait
+
+    def acquire(self, key=None, priority=INTERACTIVE, timeout=None, cancellable=None):
+        """Block until this request can be sent. Returns False if `timeout` seconds pass first.
+        If the Deadline `cancellable` gets cancelled meanwhile, the request leaves the queue and raises Cancelled."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        unregister = cancellable.on_cancel(self._wake_up) if cancellable is not None else None
+        with self._condition:
+            ticket = (priority, next(self._arrival), key)
+            heapq.heappush(self._queue, ticket)
+            try:
+                while True:
+                    if cancellable is not None and cancellable.cancelled():
+                        raise Cancelled()
+                    now = time.monotonic()
+                    wait = self._wait_for(key, now) if self._queue[0] is ticket else None
+                    if wait == 0:
+                        self.global_bucket.take(now)
+                        bucket = self._bucket_for(key)
+                        if bucket is not None:
+                            bucket.take(now)
+                        return True
+                    if deadline is not None:
+                        left = deadline - now
+                        if left <= 0:
+                            return False
+                        wait = left if wait is None else min(wait, left)
+                    self._condition.wait(wait)
+            finally:
+                self._queue.remove(ticket)
+                heapq.heapify(self._queue)
+                self._condition.notify_all()
+                if unregister is not None:
+                    unregister()
+
+    def _wake_up(self):
+        """Make every waiting request look again (one of them was cancelled)."""
+        with self._condition:
+            self._condition.notify_all()
+
+    def queue_depth(self, priority=None):
+        """Requests waiting right now, optionally only those of a priority class."""
+        with self._condition:
+            return sum(1 for ticket in self._queue if priority is None or ticket[0] == priority)
+
+    def expected_wait(self, key=None, priority=INTERACTIVE):
+        """Rough seconds a new request would wait: the tokens needed by the requests
+        that would go before it, plus itself, at the global rate (or its key rate if slower)."""
+        with self._condition:
+            now = time.monotonic()
+            ahead = [ticket for ticket in self._queue if ticket[0] <= priority]
+            global_wait = self.global_bucket.wait_time(now, len(ahead) + 1)
+            bucket = self._bucket_for(key)
+            if bucket is None:
+                return global_wait
+            same_key = sum(1 for ticket in ahead if ticket[2] == key)
+            return max(global_wait, bucket.wait_time(now, same_key + 1))
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+
+"""Retries with exponential backoff and a circuit breaker per host.
+A single 502 or a dropped connection shouldn't ruin a whole load, but when
+ANet servers are really down we should stop hammering them for a while."""
+import http.client
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+########################################################
+###################### COUNTERS ########################
+########################################################
+
+
+class Counters(object):
+    """Thread-safe named counters, to see what the retry engine has been doing."""
+    def __init__(self):
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def increment(self, name, amount=1):
+        """Add `amount` to a counter."""
+        with self._lock:
+            self._values[name] = self._values.get(name, 0) + amount
+
+    def snapshot(self):
+        """Copy of every counter."""
+        with self._lock:
+            return dict(self._values)
+
+########################################################
+#################### RETRY POLICY ######################
+########################################################
+
+
+def retry_after_seconds(headers):
+    """Seconds the server asked us to wait in the Retry-After header, or None."""
+    value = (headers or {}).get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryPolicy(object):
+    """When and how long to wait before retrying an idempotent GET.
+    Waits grow exponentially with full jitter, so clients don't retry in lockstep."""
+    def __init__(self, max_attempts=3, base_delay=0.5, max_delay=8.0, max_retry_after=30.0):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_retry_after = max_retry_after
+
+    @staticmethod
+    def is_server_failure(error):
+        """Errors that mean the server (or the network) is in trouble."""
+        status = getattr(error, "status", None)
+        if status is not None:
+            return status in RETRY_STATUSES and status != 429
+        return isinstance(error, (OSError, http.client.HTTPException))
+
+    def should_retry(self, error, attempt):
+        """Check if a failed attempt (starting at 1) deserves another try."""
+        if attempt >= self.max_attempts:
+            return False
+        status = getattr(error, "status", None)
+        if status is not None:
+            return status in RETRY_STATUSES
+        return isinstance(error, (OSError, http.client.HTTPException))
+
+    def delay(self, attempt, error=None):
+        """Seconds to wait after the failed attempt number `attempt`."""
+        retry_after = retry_after_seconds(getattr(error, "headers", None))
+        if retry_after is not None:
+            return min(retry_after, self.max_retry_after)
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** (attempt - 1))))
+
+########################################################
+################## CIRCUIT BREAKER #####################
+########################################################
+
+
+class CircuitOpenError(Exception):
+    """We are not even trying, the host failed too many times in a row."""
+    def __init__(self, host):
+        Exception.__init__(self, "{0} seems to be down, try again in a while.".format(host))
+        self.host = host
+
+
+class CircuitBreaker(object):
+    """Stop calling a host after `failure_threshold` failures in a row.
+    After `reset_timeout` seconds a single trial request is let through (half open):
+    if it works the breaker closes again, if not it stays open for another while."""
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(self, failure_threshold=5, reset_timeout=30.0, counters=None):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.counters = counters or Counters()
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    def allow(self):
+        """Check if a request can be sent now."""
+        with self._lock:
+            if self.state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                self._trial_running = False
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.HALF_OPEN and not self._trial_running:
+                self._trial_running = True
+                return True
+            self.counters.increment("breaker_rejected")
+            return False
+
+    def record_success(self):
+        """A request worked."""
+        with self._lock:
+            self._failures = 0
+            self._trial_running = False
+            if self.state != self.CLOSED:
+                self.counters.increment("breaker_closed")
+            self.state = self.CLOSED
+
+    def record_failure(self):
+        """A request failed because of the server or the network."""
+        with self._lock:
+            self._failures += 1
+            self._trial_running = False
+            if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    self.counters.increment("breaker_opened")
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+
+    def release_trial(self):
+        """The trial request ended without telling anything about the server (e.g. a 404)."""
+        with self._lock:
+            self._trial_running = False
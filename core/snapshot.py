@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+
+"""Last data loaded of each key, so it can be painted as soon as the program opens (or the key
+is selected) while the fresh data is loaded. One small compressed JSON file per key,
+named after its fingerprint so keys are never written to disk."""
+import json
+import time
+import zlib
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from core.cache import token_fingerprint
+
+SNAPSHOT_FILE = "snapshot_{0}.json.z"
+# Raid bosses can be killed again every Monday at 07:30 UTC
+WEEKLY_RESET = (0, 7, 30)
+
+
+def last_weekly_reset(now=None):
+    """Time (seconds since the epoch) of the most recent weekly reset."""
+    weekday, hour, minute = WEEKLY_RESET
+    now = datetime.fromtimestamp(time.time() if now is None else now, timezone.utc)
+    reset = (now - timedelta(days=(now.weekday() - weekday) % 7)).replace(
+        hour=hour, minute=minute, second=0, microsecond=0)
+    if reset > now:
+        reset -= timedelta(days=7)
+    return reset.timestamp()
+
+
+def changed_since_weekly_reset(last_modified, now=None):
+    """Check if an account changed (its ISO 8601 last_modified) after the most recent weekly reset.
+    If it didn't, what was loaded since it last changed may be from before the reset."""
+    try:
+        changed = datetime.strptime(last_modified, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc)
+    except (TypeError, ValueError):
+        return False
+    return changed.timestamp() >= last_weekly_reset(now)
+
+
+class SnapshotStore(object):
+    """Dict of section name -> data (anything JSON can hold) of each key, kept in a folder.
+    Every section can have a version too, like when the account last changed before it was loaded."""
+    def __init__(self, folder):
+        self.folder = Path(folder)
+
+    def _path(self, api_key):
+        """File of the snapshot of a key."""
+        return self.folder / SNAPSHOT_FILE.format(token_fingerprint(api_key))
+
+    def load(self, api_key):
+        """Get (time saved, {section: data}, {section: version}) of a key, or None if there is none.
+        A broken file means no snapshot."""
+        try:
+            with open(self._path(api_key), "rb") as snapshot_file:
+                snapshot = json.loads(zlib.decompress(snapshot_file.read()).decode('utf8'))
+            return snapshot['saved'], snapshot['sections'], snapshot.get('versions', {})
+        except (OSError, ValueError, KeyError, zlib.error):
+            return None
+
+    def save(self, api_key, sections, versions=None):
+        """Replace the snapshot of a key."""
+        self.folder.mkdir(parents=True, exist_ok=True)
+        path = self._path(api_key)
+        temporary = path.with_name(path.name + ".tmp")
+        data = json.dumps({"saved": time.time(), "sections": sections, "versions": versions or {}},
+                          separators=(",", ":"))
+        with open(temporary, "wb") as snapshot_file:
+            snapshot_file.write(zlib.compress(data.encode('utf8')))
+        temporary.replace(path)
+
+    def delete(self, api_key):
+        """Forget the snapshot of a key."""
+        try:
+            self._path(api_key).unlink()
+        except OSError:
+            pass
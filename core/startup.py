@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+
+"""Measure where the startup time goes, with the --profile-startup option.
+Everything is timed from the moment the profiler is created (the first thing the program does):
+the imports, the phases between marks, the spans of named steps (also the ones that end later,
+like the network checks), and it's all written as JSON so releases can be compared."""
+import builtins
+import json
+import platform
+import sys
+import time
+from contextlib import contextmanager
+
+PROFILE_OPTION = "--profile-startup"
+DEFAULT_PROFILE_FILE = "startup_profile.json"
+
+
+class ImportTimer(object):
+    """Time how long each module takes to be imported the first time, its own imports included."""
+    def __init__(self, clock):
+        self.clock = clock
+        self.times = {}
+        self._original_import = None
+
+    def install(self):
+        """Start timing every import statement."""
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._timed_import
+
+    def uninstall(self):
+        """Stop timing, imports cost what they did before."""
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        if level or name in sys.modules:
+            return self._original_import(name, globals, locals, fromlist, level)
+        start = self.clock()
+        try:
+            return self._original_import(name, globals, locals, fromlist, level)
+        finally:
+            if name in sys.modules:
+                self.times.setdefault(name, self.clock() - start)
+
+
+class StartupProfiler(object):
+    """Marks, spans and imports of the startup. When it's not enabled everything does nothing."""
+    def __init__(self, enabled=True, output=DEFAULT_PROFILE_FILE, clock=time.perf_counter):
+        self.enabled = enabled
+        self.output = output
+        self.clock = clock
+        self.origin = clock()
+        self.wall_origin = time.time()
+        self.marks = []
+        self.spans = {}
+        self.pending = {}
+        self.imports = ImportTimer(clock)
+        if enabled:
+            self.imports.install()
+
+    @classmethod
+    def from_argv(cls, argv):
+        """Enabled by "--profile-startup" (report in startup_profile.json) or "--profile-startup=file.json"."""
+        for argument in argv[1:]:
+            if argument == PROFILE_OPTION:
+                return cls()
+            if argument.startswith(PROFILE_OPTION + "="):
+                return cls(output=argument.split("=", 1)[1])
+        return cls(enabled=False)
+
+    def now(self):
+        """Seconds since the profiler was created."""
+        return self.clock() - self.origin
+
+    def mark(self, name):
+        """Something is done, the phase since the previous mark ends here. Only the first mark of a name counts."""
+        if self.enabled and name not in (mark_name for mark_name, _ in self.marks):
+            self.marks.append((name, self.now()))
+
+    @contextmanager
+    def phase(self, name):
+        """Time a block of code as a named span."""
+        start = self.now()
+        try:
+            yield
+        finally:
+            if self.enabled:
+                self.spans.setdefault(name, (start, self.now()))
+
+    def begin(self, name):
+        """A named span starts, it ends when end() is called (like a network check)."""
+        if self.enabled and name not in self.spans:
+            self.pending.setdefault(name, self.now())
+
+    def end(self, name):
+        """A span started with begin() ends. Does nothing if it wasn't started."""
+        if name in self.pending:
+            self.spans[name] = (self.pending.pop(name), self.now())
+
+    def is_done(self, *marks):
+        """Check if some marks were reached and every span has ended."""
+        reached = set(mark_name for mark_name, _ in self.marks)
+        return self.enabled and not self.pending and reached.issuperset(marks)
+
+    def report(self, **extra):
+        """Everything measured, as a dict ready for JSON. Times are in seconds since the profiler was created."""
+        phases = []
+        previous = 0.0
+        for name, at in self.marks:
+            phases.append({"name": name, "start": previous, "duration": at - previous})
+            previous = at
+        report = {"created": self.wall_origin,
+                  "python": platform.python_version(),
+                  "platform": platform.platform(),
+                  "process_start": self.process_start(),
+                  "total": previous,
+                  "phases": phases,
+                  "spans": [{"name": name, "start": start, "duration": end - start}
+                            for name, (start, end) in sorted(self.spans.items(), key=lambda span: span[1][0])],
+                  "unfinished": sorted(self.pending),
+                  "imports": [{"module": module, "cumulative": seconds}
+                              for module, seconds in sorted(self.imports.times.items(), key=lambda item: -item[1])]}
+        report.update(extra)
+        return report
+
+    def process_start(self):
+        """Seconds between the start of the process and the profiler (the interpreter starting), if we can know it."""
+        try:
+            import psutil
+            return max(0.0, self.wall_origin - psutil.Process().create_time())
+        except Exception:
+            return None
+
+    def write(self, **extra):
+        """Stop profiling and write the report. Returns the file written."""
+        self.enabled = False
+        self.imports.uninstall()
+        with open(self.output, "w", encoding="utf-8") as f:
+            json.dump(self.report(**extra), f, indent=2)
+        return self.output
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+
+"""Compact sets of unlocked ids (skins, minis...), stored as a bitmap.
+An account has thousands of skins, with one bit per id they take a few KB,
+checking one is O(1) and comparing accounts is a handful of big integer operations."""
+import zlib
+
+
+class UnlockSet(object):
+    """Set of non negative integer ids backed by a bytearray, bit `n` set means id `n` is unlocked."""
+    __slots__ = ("_bits",)
+
+    def __init__(self, ids=()):
+        ids = list(ids)
+        self._bits = bytearray((max(ids) >> 3) + 1 if ids else 0)
+        for unlock_id in ids:
+            if unlock_id < 0:
+                raise ValueError("Unlock ids can't be negative: {0}".format(unlock_id))
+            self._bits[unlock_id >> 3] |= 1 << (unlock_id & 7)
+
+    @classmethod
+    def _from_int(cls, value):
+        """Build it from the integer where bit `n` is id `n`."""
+        unlocks = cls()
+        unlocks._bits = bytearray(value.to_bytes((value.bit_length() + 7) >> 3, "little"))
+        return unlocks
+
+    def _to_int(self):
+        """The whole bitmap as a single integer."""
+        return int.from_bytes(self._bits, "little")
+
+    def __contains__(self, unlock_id):
+        index = unlock_id >> 3
+        return 0 <= index < len(self._bits) and bool(self._bits[index] & (1 << (unlock_id & 7)))
+
+    def __iter__(self):
+        for index, byte in enumerate(self._bits):
+            if byte:
+                for bit in range(8):
+                    if byte & (1 << bit):
+                        yield (index << 3) | bit
+
+    def __len__(self):
+        return bin(self._to_int()).count("1")
+
+    def __bool__(self):
+        return any(self._bits)
+
+    def __eq__(self, other):
+        if not isinstance(other, UnlockSet):
+            return NotImplemented
+        return self._to_int() == other._to_int()
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    def __hash__(self):
+        return hash(self._to_int())
+
+    def __and__(self, other):
+        return self._from_int(self._to_int() & other._to_int())
+
+    def __or__(self, other):
+        return self._from_int(self._to_int() | other._to_int())
+
+    def __sub__(self, other):
+        return self._from_int(self._to_int() & ~other._to_int())
+
+    def __xor__(self, other):
+        return self._from_int(self._to_int() ^ other._to_int())
+
+    def __repr__(self):
+        return "UnlockSet({0} ids)".format(len(self))
+
+    def issubset(self, other):
+        """Check if every id of this set is also in `other`."""
+        return not (self - other)
+
+    def to_bytes(self):
+        """Compact serialized form: the compressed bitmap."""
+        return zlib.compress(bytes(self._bits))
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Load it from what to_bytes gave."""
+        unlocks = cls()
+        unlocks._bits = bytearray(zlib.decompress(data))
+        return unlocks
@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+
+"""Remember the last state painted on each widget, so a new load only touches
+the widgets whose state actually changed."""
+
+_MISSING = object()
+
+
+class ViewState(object):
+    """Dict of widget -> last state applied (any comparable value, like "yes" or "no")."""
+    def __init__(self):
+        self._applied = {}
+
+    def diff(self, states):
+        """Keep only the states of a dict of widget -> state that differ from what's painted."""
+        return {widget: state for widget, state in states.items() if self._applied.get(widget, _MISSING) != state}
+
+    def applied(self, changes):
+        """Remember that these states are painted now."""
+        self._applied.update(changes)
+
+    def forget(self, widgets=None):
+        """Forget what's painted on some widgets (or all of them) so they get painted again."""
+        if widgets is None:
+            self._applied.clear()
+        else:
+            for widget in widgets:
+                self._applied.pop(widget, None)
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+
+"""Workers to run the network stuff outside of the GUI thread.
+They run on the global QThreadPool and talk back to the window with signals,
+which Qt delivers on the GUI thread, so slots can touch widgets safely."""
+from PySide2.QtCore import QObject, QRunnable, QThreadPool, Signal
+from core.loader import SectionLoader
+
+########################################################
+###################### SIGNALS #########################
+########################################################
+
+
+class WorkerSignals(QObject):
+    """Signals of a worker. QRunnable is not a QObject, so they live here."""
+    result = Signal(object)
+    error = Signal(object)
+    status = Signal(str, str)
+    section_loaded = Signal(str, object)
+    section_failed = Signal(str, object)
+    finished = Signal()
+
+########################################################
+###################### WORKERS #########################
+########################################################
+
+
+class Worker(QRunnable):
+    """Run any function in the background.
+    The function gets a `status` keyword to report progress on the status bar."""
+    def __init__(self, function, *args, **kwargs):
+        QRunnable.__init__(self)
+        self.signals = WorkerSignals()
+        self.function = function
+        self.args = args
+        self.kwargs = kwargs
+
+    def run(self):
+        """Execute the function and emit the result or the error."""
+        try:
+            result = self.function(*self.args, status=self.signals.status.emit, **self.kwargs)
+        except Exception as e:
+            self.signals.error.emit(e)
+        else:
+            self.signals.result.emit(result)
+        finally:
+            self.signals.finished.emit()
+
+
+class SectionsWorker(QRunnable):
+    """Fetch several sections at the same time and emit each one as soon as it's ready,
+    so the window can paint bosses while currency is still being scanned."""
+    def __init__(self, jobs, loader=None):
+        QRunnable.__init__(self)
+        self.signals = WorkerSignals()
+        self.jobs = jobs
+        self.loader = loader or SectionLoader()
+
+    def run(self):
+        """Fetch everything and emit a signal per section."""
+        try:
+            for name, result, error in self.loader.run(self.jobs):
+                if error is not None:
+                    self.signals.section_failed.emit(name, error)
+                else:
+                    self.signals.section_loaded.emit(name, result)
+        finally:
+            self.signals.finished.emit()
+
+########################################################
+####################### START ##########################
+########################################################
+
+
+def start_worker(worker, owner):
+    """Start a worker on the global pool.
+    The owner keeps a reference until it finishes, so Python doesn't collect the signals."""
+    owner.running_workers.add(worker)
+    worker.signals.finished.connect(lambda: owner.running_workers.discard(worker))
+    worker.setAutoDelete(False)
+    QThreadPool.globalInstance().start(worker)
+    return worker
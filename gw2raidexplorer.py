@@ -8,28 +8,117 @@ That said, the goal is to make a Guild Wars 2 Raid API manager to check for info
 and embbed everything a Raider might ever need in Guild Wars 2 (short: GW2)
 """
 
+import sys
+from core.startup import StartupProfiler
+# Before anything else, so it can time the imports (does nothing without --profile-startup)
+PROFILER = StartupProfiler.from_argv(sys.argv)
 import json
-import urllib.request
+import time
 import urllib.parse
-import webbrowser
-import hashlib
-import sys
-import psutil
-from subprocess import Popen
+from functools import partial
 from os import environ
 from pathlib import Path
-from ui.custom_utils import ThemedLayout, msgbox_question
-from PySide2.QtWidgets import (QApplication, QComboBox, QDialog, QFileDialog, QLineEdit,
-                               QGraphicsColorizeEffect, QGroupBox, QLabel, QMainWindow,
-                               QPlainTextEdit, QPushButton, QStackedWidget, QTabWidget, QTextEdit)
-from PySide2.QtGui import QIcon, QColor
-from PySide2.QtCore import Qt, QEvent, QPoint, QSize, QSettings
+from core.http_client import HttpClient, HttpError, DEFAULT_POOL_SIZE, DEFAULT_IDLE_TIMEOUT, DEFAULT_TIMEOUT
+from core.cache import ResponseCache, DEFAULT_CACHE_FOLDER, DEFAULT_CACHE_SIZE, token_fingerprint
+from core.loader import SectionLoader
+from core.memo import MemoCache
+from core.deadline import Deadline, Cancelled, DeadlineExceeded
+from core.inventory import ItemIndex
+from core.unlocks import UnlockSet
+from core.catalog import RaidCatalog
+from core.viewstate import ViewState
+from core.snapshot import SnapshotStore, changed_since_weekly_reset
+from core.ratelimit import (RequestScheduler, INTERACTIVE, BACKGROUND, DEFAULT_GLOBAL_RATE, DEFAULT_GLOBAL_BURST,
+                            DEFAULT_KEY_RATE, DEFAULT_KEY_BURST)
+from core.workers import Worker, SectionsWorker, start_worker
+PROFILER.mark("import core")
+from rc import load_resources
+# The images have to be registered before the ui modules are imported
+RESOURCES = load_resources()
+PROFILER.mark("load resources")
+from ui.custom_utils import msgbox_question, set_style_property
+from ui.pixmap_cache import TintedPixmapCache
+from ui.lazy_pages import LazyPages
+from ui.unlock_grid import UnlockGridModel, UnlockDelegate, setup_grid
+from PySide2.QtWidgets import QApplication, QDialog, QFileDialog, QMainWindow
+from PySide2.QtGui import QIcon
+from PySide2.QtCore import Qt, QEvent, QPoint, QSize, QSettings, QTimer, Signal
 from ui.gw2info_ui import Ui_MainWindow
 from ui.add_ui import Ui_Dialog
+PROFILER.mark("import ui")
 
 __version__ = "1.1.0"
 __author__ = "(Made by Aens) - https://github.com/Aens"
-INI_OPTIONS = QSettings("options.ini", QSettings.IniFormat)
+# Options and everything built from them, set up by initialize_settings() when the program starts,
+# so importing this module doesn't read options.ini nor the cache index
+INI_OPTIONS = None
+HTTP_CLIENT = None
+SNAPSHOTS = None
+API_MEMO = MemoCache()
+GW2_API = "https://api.guildwars2.com/v2/"
+# Endpoints that barely change, and for how many seconds we remember them
+MEMO_TTLS = {"tokeninfo": 10 * 60}
+# Most ids the API takes in a single ?ids= request
+API_MAX_IDS = 200
+# Endpoints that only take ids as a query, even if there is a single one
+IDS_AS_QUERY = ("account/achievements",)
+# Schema of /v2/account that has last_modified, when the account last changed
+ACCOUNT_SCHEMA = "2019-02-21T00:00:00Z"
+# Seconds the network checks done on startup can take before we give up
+STARTUP_TIMEOUT = 5
+# Milliseconds the key has to stay selected before its data is loaded again in the background
+REVALIDATE_DELAY = 500
+# Seconds a whole load of every section can take (from options.ini)
+LOAD_BUDGET = None
+# Seconds to check and download ArcDps
+ARCDPS_BUDGET = 120
+# Bosses, achievements, minis and skins of every wing, read by initialize_settings()
+RAID_CATALOG = None
+# Background and border of the YES/NO fields and achievements, the rest of their style comes from the theme
+LINE_STATE_COLORS = {"yes": ((160, 200, 90), (180, 200, 90)),
+                     "no": ((200, 0, 0), (220, 0, 0))}
+# Style of the status bar in each mode ("ready" looks like the rest of the theme)
+STATUS_STYLES = {"wait": "background-color: rgb(234, 140, 6); color: rgb(0, 0, 0);",
+                 "ready": "",
+                 "error": "background-color: rgb(200, 0, 0); color: rgb(255, 255, 255);",
+                 "special": "background-color: rgb(190, 1, 190); color: rgb(255, 255, 255);"}
+# Color of the messages of the Add API window
+INFO_STYLES = {"error": "color: rgb(250, 0, 0);", "success": "color: rgb(0, 190, 0);"}
+# Tint of the mini and skin icons for each state ("reset" shows the original icon)
+ICON_TINTS = {"yes": (0, 150, 0), "no": (150, 0, 0), "grey": (0, 0, 0)}
+PIXMAP_CACHE = TintedPixmapCache()
+# Columns of the grids of each section, and size of their cells
+GRID_LAYOUTS = {"achievements": (3, 193, 18), "minis": (5, 30, 30), "skins": (6, 30, 30)}
+# Wallet currencies and items of the currency section, and their fields
+WALLET_FIELDS = {28: "lineCurrency_Magnetiteshards", 39: "lineCurrency_Gaetingcrystals"}
+ITEM_FIELDS = {77302: "lineCurrency_Legend_insights", 88485: "lineCurrency_Legend_divinations"}
+PROFILER.mark("module setup")
+
+
+def initialize_settings(ini_file="options.ini"):
+    """Open the options file and build what depends on it: the HTTP client, the snapshots and the load budget.
+    Also read the raid catalog, the main window needs it."""
+    global INI_OPTIONS, HTTP_CLIENT, SNAPSHOTS, LOAD_BUDGET, RAID_CATALOG
+    INI_OPTIONS = QSettings(ini_file, QSettings.IniFormat)
+    HTTP_CLIENT = HttpClient(pool_size=int(INI_OPTIONS.value("http_pool_size", DEFAULT_POOL_SIZE)),
+                             idle_timeout=float(INI_OPTIONS.value("http_idle_timeout", DEFAULT_IDLE_TIMEOUT)),
+                             timeout=float(INI_OPTIONS.value("http_timeout", DEFAULT_TIMEOUT)),
+                             cache=ResponseCache(INI_OPTIONS.value("http_cache_folder", DEFAULT_CACHE_FOLDER),
+                                                 int(INI_OPTIONS.value("http_cache_size", DEFAULT_CACHE_SIZE))),
+                             scheduler=RequestScheduler(
+                                 float(INI_OPTIONS.value("api_global_rate", DEFAULT_GLOBAL_RATE)),
+                                 int(INI_OPTIONS.value("api_global_burst", DEFAULT_GLOBAL_BURST)),
+                                 float(INI_OPTIONS.value("api_key_rate", DEFAULT_KEY_RATE)),
+                                 int(INI_OPTIONS.value("api_key_burst", DEFAULT_KEY_BURST))))
+    SNAPSHOTS = SnapshotStore(INI_OPTIONS.value("http_cache_folder", DEFAULT_CACHE_FOLDER))
+    LOAD_BUDGET = float(INI_OPTIONS.value("load_budget", 60))
+    RAID_CATALOG = RaidCatalog.load()
+
+
+def open_in_browser(address):
+    """Open a website in the browser. webbrowser is only imported the first time a website is opened."""
+    import webbrowser
+    webbrowser.open(address)
 
 
 ###############
@@ -38,6 +127,7 @@ INI_OPTIONS = QSettings("options.ini", QSettings.IniFormat)
 
 class MainForm(QMainWindow, Ui_MainWindow):
     """Main window of the program."""
+    debug_message = Signal(str)
 
     def __init__(self, parent=None):
         """Set the initial state of the window (size/pos).
@@ -46,13 +136,38 @@ class MainForm(QMainWindow, Ui_MainWindow):
         Set proper colors to their items.
         And fire up initial functions."""
         QMainWindow.__init__(self, parent)
-        self.setupUi(self)
+        with PROFILER.phase("setupUi"):
+            self.setupUi(self)
         self.setWindowIcon(QIcon(":/images/Images/Main.ico"))
         self.setWindowTitle("Gw2 API Raid Explorer {0} {1}".format(__version__, __author__))
         # Initial window size/pos last saved. Use default values for first time
         self.setFixedSize(QSize(970, 600))
         self.move(INI_OPTIONS.value("menu_position", QPoint(350, 250)))
         self.lineInstallationFolder.setText((INI_OPTIONS.value("installation_folder", "")))
+        # API id -> widget name of every boss, shared by the fill and reset functions
+        self.boss_fields = RAID_CATALOG.widget_by_id['bosses']
+        # Achievements, minis and skins are painted by grids: a single one for the achievements,
+        # one per wing for the minis and skins. Their models live even while their page is not built
+        self.raid_grids = {"achievements": {None: UnlockGridModel(RAID_CATALOG.entries['achievements'],
+                                                                  GRID_LAYOUTS['achievements'][0])}}
+        for section in ("minis", "skins"):
+            self.raid_grids[section] = {
+                wing: UnlockGridModel([entry for entry in RAID_CATALOG.entries[section] if entry['wing'] == wing],
+                                      GRID_LAYOUTS[section][0])
+                for wing in RAID_CATALOG.wing_names(section)}
+        self.grid_delegate = UnlockDelegate(PIXMAP_CACHE, ICON_TINTS, LINE_STATE_COLORS, self)
+        # Last state painted on each widget, so we only repaint what changes,
+        # and what to paint on the widgets of the pages not built yet
+        self.view_state = ViewState()
+        self.pending_states = {}
+        self.pending_texts = {}
+        # The raid pages are built (and their modules imported) the first time they are shown
+        self.raid_pages = LazyPages(self, self.tabRaids,
+                                    {self.tab_bosses_hot: "ui.raid_hot_ui.Ui_RaidHotPage",
+                                     self.tab_bosses_pof: "ui.raid_pof_ui.Ui_RaidPofPage",
+                                     self.tab_achievements: "ui.raid_achievements_ui.Ui_RaidAchievementsPage"},
+                                    on_built=self.on_page_built)
+        self.raid_pages.build_current()
         # Left side Buttons
         self.buttonThemeLight.clicked.connect(lambda: self.initialize_colors("light"))
         self.buttonThemeDark.clicked.connect(lambda: self.initialize_colors("dark"))
@@ -62,7 +177,8 @@ class MainForm(QMainWindow, Ui_MainWindow):
         self.buttonLanguage_french.clicked.connect(lambda: self.initialize_language("fr"))
         self.buttonLanguage_deutsch.clicked.connect(lambda: self.initialize_language("de"))
         self.buttonWebsite_Anet.clicked.connect(self.open_web_anet)
-        self.buttonLoad.clicked.connect(self.load_api)
+        self.buttonLoad.clicked.connect(self.on_load_clicked)
+        self.buttonLoad.setToolTip("Shift+click to load everything again, even if your account didn't change.")
         self.buttonAddAPI.clicked.connect(self.open_window_add)
         self.buttonDeleteAPI.clicked.connect(self.delete_api)
         self.buttonDonate.clicked.connect(self.open_web_donate)
@@ -81,6 +197,7 @@ class MainForm(QMainWindow, Ui_MainWindow):
         self.buttonWebsite_raidar.clicked.connect(self.open_web_raidar)
         self.buttonWebsite_gw2raidexplorer.clicked.connect(self.open_web_gw2raidexplorer)
         self.buttonDebugger.clicked.connect(self.debugger)
+        self.debug_message.connect(self.plainDebugger.appendPlainText)
         # Events
         self.comboSelectAPI.installEventFilter(self)
         self.comboSelectAPI.activated.connect(self.load_combo_stuff)
@@ -94,8 +211,38 @@ class MainForm(QMainWindow, Ui_MainWindow):
         self.stored_keys = []
         self.api_key = None
         self.api_permissions = None
-        self.style_background = ""
-        self.style_lineedits = ""
+        self.running_workers = set()
+        self.permissions_pending = False
+        self.load_pending = False
+        self.load_priority = INTERACTIVE
+        self.load_generation = 0
+        self.load_sections = {}
+        self.load_warnings = []
+        self.load_errors = []
+        self.startup_warnings = []
+        self.served_stale = False
+        self.load_timeouts = []
+        # Sections of the last load of the selected key, and the ones painted from it and not loaded again yet
+        self.snapshot_sections = {}
+        self.snapshot_saved = None
+        self.snapshot_versions = {}
+        self.stale_sections = set()
+        self.snapshot_changed = False
+        self.load_last_modified = None
+        self.load_unchanged = False
+        # Everything about the selected key is cancelled when it changes, everything else on close
+        self.key_deadline = Deadline()
+        self.app_deadline = Deadline()
+        # Going through the keys in the combo only loads the data of the one that stays selected
+        self.revalidate_timer = QTimer(self)
+        self.revalidate_timer.setSingleShot(True)
+        self.revalidate_timer.setInterval(REVALIDATE_DELAY)
+        self.revalidate_timer.timeout.connect(lambda: self.load_api(priority=BACKGROUND))
+        self.theme_stylesheets = {}
+        # Open the connections to ANet servers while we get ready
+        HTTP_CLIENT.warm_up([GW2_API], timeout=STARTUP_TIMEOUT)
+        if PROFILER.enabled:
+            self.installEventFilter(self)  # To know when the window is painted
         # Check if we are ready to work
         self.check_if_ready()
 
@@ -106,6 +253,9 @@ class MainForm(QMainWindow, Ui_MainWindow):
     def closeEvent(self, event):
         """Write window position to config file"""
         INI_OPTIONS.setValue("menu_position", self.pos())
+        self.key_deadline.cancel()
+        self.app_deadline.cancel()
+        HTTP_CLIENT.close()
         event.accept()
 
     def eventFilter(self, target, event):
@@ -113,55 +263,73 @@ class MainForm(QMainWindow, Ui_MainWindow):
         # Comboboxes
         if target == self.comboSelectAPI and event.type() == QEvent.MouseButtonPress:
             self.fill_combo_selectapi()
+        # Profile of the startup
+        if target is self and event.type() == QEvent.Paint:
+            self.removeEventFilter(self)
+            PROFILER.mark("first paint")
+            self.finish_startup_profile()
         return False
 
     def change_statusbar(self, statusmode, message):
-        """Edit the status bar, both with a message and style."""
-        if statusmode == "wait":
-            self.statusbar.setStyleSheet("background-color: rgb(234, 140, 6);color: rgb(0, 0, 0);")
-            self.statusbar.showMessage("WAIT: " + message)
-        elif statusmode == "ready":
-            self.statusbar.setStyleSheet(self.style_background)
-            self.statusbar.showMessage("READY: " + message)
-        elif statusmode == "error":
-            self.statusbar.setStyleSheet("background-color: rgb(200, 0, 0);color: rgb(255, 255, 255);")
-            self.statusbar.showMessage("ERROR: " + message)
-        elif statusmode == "special":
-            self.statusbar.setStyleSheet("background-color: rgb(190, 1, 190);color: rgb(255, 255, 255);")
-            self.statusbar.showMessage("SPECIAL: " + message)
+        """Edit the status bar, both with a message and style.
+        The stylesheet of the application has a rule for each mode."""
+        if statusmode in STATUS_STYLES:
+            set_style_property(self.statusbar, "status", statusmode)
+            self.statusbar.showMessage("{0}: {1}".format(statusmode.upper(), message))
 
     def api_open(self, section, **keyarguments):
-        """Build the right address"""
-        address = "https://api.guildwars2.com/v2/"+section
-        separator = "?"
+        """Open an API section, remembering the stable ones in memory for a while."""
+        deadline = keyarguments.pop('deadline', None)
+        priority = keyarguments.pop('priority', INTERACTIVE)
+        ttl = MEMO_TTLS.get(section)
+        if ttl is not None and 'ids' not in keyarguments:
+            key = API_MEMO.key_for(section, **keyarguments)
+            return API_MEMO.get_or_load(key, ttl, lambda: self.api_fetch(section, deadline, priority, **keyarguments))
+        return self.api_fetch(section, deadline, priority, **keyarguments)
+
+    def api_fetch(self, section, deadline=None, priority=INTERACTIVE, **keyarguments):
+        """Build the right address. `headers` and `use_cache` go to the HTTP client as they are."""
+        headers = keyarguments.pop('headers', None)
+        use_cache = keyarguments.pop('use_cache', True)
+        address = GW2_API + urllib.parse.quote(section, safe='/')
+        query = {}
         if 'ids' in keyarguments:
-            if len(keyarguments['ids']) > 1:
-                address = address+"?ids="+",".join(keyarguments['ids'])
-                separator = "&"
+            if len(keyarguments['ids']) > 1 or section in IDS_AS_QUERY:
+                query['ids'] = ",".join(keyarguments['ids'])
             else:
-                address = address+"/"+keyarguments['ids'][0]
+                address = address + "/" + urllib.parse.quote(keyarguments['ids'][0], safe='')
         # Check for special parameters
         if 'token' in keyarguments:
-            address = address+separator+"access_token="+keyarguments['token']
+            query['access_token'] = keyarguments['token']
         elif 'lang' in keyarguments:
-            address = address+separator+"lang="+keyarguments['lang']
-        # Now encode, debug and open it
-        address = urllib.parse.quote(address, safe='/:=', encoding="utf-8", errors="strict")
+            query['lang'] = keyarguments['lang']
+        # Only the values get encoded, so the HTTP client and the cache can still read the query
+        if query:
+            address = address + "?" + urllib.parse.urlencode(query, safe=',', quote_via=urllib.parse.quote)
+        response = HTTP_CLIENT.request(address, headers=headers, use_cache=use_cache, priority=priority,
+                                       key=keyarguments.get('token'), deadline=deadline)
+        if response.stale:
+            self.served_stale = True
         if self.debug_mode:
-            self.plainDebugger.appendPlainText(address)
-        address = urllib.request.urlopen(address).read().decode('utf8')
-        return json.loads(address)
+            # This may run on a loader thread, the signal takes it to the GUI thread
+            self.debug_message.emit("{0} ({1:.0f} ms, {2:,} bytes received, {3:,} bytes of JSON{4})".format(
+                address, response.elapsed * 1000, response.wire_size, len(response.body),
+                ", stale cache" if response.stale else ", cached" if response.from_cache else ""))
+        return response.json()
 
     ###########
     # ON LOAD #
     ###########
 
     def check_if_ready(self):
-        """Make sure we are ready to work."""
+        """Make sure we are ready to work.
+        Only local stuff happens here so the window shows up at once,
+        the network checks start in the background as soon as it's visible."""
         self.change_statusbar("wait", "Checking if everything is fine...")
-        warning = []
+        self.startup_warnings = []
         # Theme and colors
-        self.initialize_colors(INI_OPTIONS.value("theme", "default"))
+        with PROFILER.phase("initialize_colors"):
+            self.initialize_colors(INI_OPTIONS.value("theme", "default"))
         # Languages
         self.initialize_language(INI_OPTIONS.value("language", "en"))
         # Load checkboxes status
@@ -172,18 +340,43 @@ class MainForm(QMainWindow, Ui_MainWindow):
         # Check if there is something stored
         self.fill_combo_selectapi()
         if not self.stored_keys:
-            warning.append("There is no API keys yet, add one.")
+            self.startup_warnings.append("There is no API keys yet, add one.")
         else:
-            self.load_permissions()
-        # Check if we are in the last version
-        version = self.check_online_version()
-        if version is not None:
-            warning.append(version)
-        # Check if there is warnings
-        if len(warning) >= 1:
-            self.change_statusbar("error", ",".join(warning))
+            self.paint_cached_permissions()
+            self.paint_snapshot()
+        # Everything else needs the network, do it once the window is shown
+        QTimer.singleShot(0, self.check_online)
+
+    def check_online(self):
+        """Refresh the permissions and check if we are in the last version, in the background."""
+        if self.stored_keys:
+            self.load_permissions(budget=STARTUP_TIMEOUT, priority=BACKGROUND)
+            if self.stale_sections:
+                self.load_api(priority=BACKGROUND)
+        PROFILER.begin("check_online_version")
+        worker = Worker(self.fetch_online_version, deadline=Deadline(STARTUP_TIMEOUT, parent=self.app_deadline))
+        worker.signals.result.connect(self.check_online_version)
+        worker.signals.error.connect(lambda e: self.startup_warnings.append(
+            "I couldn't check if there is a new version availible: {0}".format(str(e))))
+        worker.signals.finished.connect(self.show_startup_status)
+        start_worker(worker, self)
+        PROFILER.mark("network checks started")
+
+    def show_startup_status(self):
+        """Tell if everything went fine on startup."""
+        PROFILER.end("check_online_version")
+        if len(self.startup_warnings) >= 1:
+            self.change_statusbar("error", ",".join(self.startup_warnings))
         else:
             self.change_statusbar("ready", "Everything seems fine. Program ready.")
+        self.finish_startup_profile()
+
+    def finish_startup_profile(self):
+        """With --profile-startup, write the report and quit once the window is painted
+        and the startup network checks are done."""
+        if PROFILER.is_done("first paint", "network checks started"):
+            PROFILER.write(version=__version__, resources=RESOURCES, warnings=self.startup_warnings)
+            app.quit()
 
     @staticmethod
     def load_checkboxes_status(checkbox):
@@ -314,52 +507,35 @@ class MainForm(QMainWindow, Ui_MainWindow):
             colors = self.light_theme()
             INI_OPTIONS.setValue("theme", "light")
         else:
+            theme = "default"
             colors = self.default_theme()
             INI_OPTIONS.setValue("theme", "default")
-        # Let's paint them
-        for widget in app.topLevelWidgets():
-            if widget.isWindow():
-                self.set_colors(widget, colors)
-        self.style_background = colors['backgroundcolor']  # For the statusbar
-        self.style_lineedits = colors['inputcolorreadonly']  # For the reset of YES/NO fields
-        self.load_permissions()
+        # Let's paint them, the stylesheet of each theme is built only the first time it's used
+        if theme not in self.theme_stylesheets:
+            self.theme_stylesheets[theme] = self.compile_stylesheet(colors)
+        app.setStyleSheet(self.theme_stylesheets[theme])
+        self.repaint_permissions()
         self.change_statusbar("ready", "New theme loaded.")
 
-    def set_colors(self, widget, colors):
-        """Paint the initial colors for the controls"""
-        for item in widget.children():
-            item_objectname = item.objectName()
-            # SPECIALS: Set background to it and then re-iterate on these items
-            if (item_objectname == "MainLayout"
-                    or isinstance(item, ThemedLayout)
-                    or isinstance(item, QDialog)):
-                widget.setStyleSheet(colors['backgroundcolor'])
-                self.set_colors(item, colors)
-            # SPECIALS: Set style to it and then re-iterate on these items
-            elif isinstance(item, QGroupBox):
-                item.setStyleSheet(colors['groupstyle'])
-                self.set_colors(item, colors)
-            elif isinstance(item, QTabWidget) or isinstance(item, QStackedWidget):
-                item.setStyleSheet(colors['tabstyle'])
-                self.set_colors(item, colors)
-            # OTHER: Stand-alone widgets
-            elif isinstance(item, QLineEdit):
-                if item.isReadOnly():
-                    item.setStyleSheet(colors['inputcolorreadonly'])
-                else:
-                    item.setStyleSheet(colors['inputcolor'])
-            elif isinstance(item, QPlainTextEdit):
-                item.setStyleSheet(colors['inputcolor'])
-            elif isinstance(item, QTextEdit):
-                item.setStyleSheet(colors['inputcolor'])
-            elif isinstance(item, QLabel):
-                item.setStyleSheet(colors['labelcolor'])
-            elif isinstance(item, QPushButton):
-                item.setStyleSheet(colors['buttoncolor'])
-            elif isinstance(item, QComboBox):
-                item.setStyleSheet(colors['dropdowncolor'])
-            else:
-                pass
+    def compile_stylesheet(self, colors):
+        """Build the stylesheet of the whole application for a theme.
+        YES/NO fields pick their style with their "state" property."""
+        line_styles = self.compile_line_styles(colors)
+        rules = ["* {{{0}}}".format(colors['backgroundcolor']),
+                 colors['groupstyle'],
+                 colors['tabstyle'],
+                 "QLineEdit, QPlainTextEdit, QTextEdit {{{0}}}".format(colors['inputcolor']),
+                 'QLineEdit[readOnly="true"] {{{0}}}'.format(colors['inputcolorreadonly']),
+                 "QLabel {{{0}}}".format(colors['labelcolor']),
+                 "QPushButton {{{0}}}".format(colors['buttoncolor']),
+                 "QComboBox {{{0}}}".format(colors['dropdowncolor'])]
+        for state in ("reset", "yes", "no"):
+            rules.append('QLineEdit[state="{0}"] {{{1}}}'.format(state, line_styles[state]))
+        for mode, style in STATUS_STYLES.items():
+            rules.append('QStatusBar[status="{0}"] {{{1}}}'.format(mode, style))
+        for status, style in INFO_STYLES.items():
+            rules.append('QLabel[status="{0}"] {{{1}}}'.format(status, style))
+        return "\n".join(rules)
 
     def initialize_language(self, lang):
         """Iterate over every widget to paint them."""
@@ -367,29 +543,30 @@ class MainForm(QMainWindow, Ui_MainWindow):
         INI_OPTIONS.setValue("lang", lang)
 
     @staticmethod
-    def check_online_version():
-        """Check if we need an update."""
+    def fetch_online_version(status, deadline=None):
+        """Get the last version published. Runs on a worker thread."""
         version_file = "https://raw.githubusercontent.com/Aens/Gw2RaidExplorer/master/version.txt"
+        address = urllib.parse.quote(version_file, safe='/:=', encoding="utf-8", errors="strict")
+        return HTTP_CLIENT.get_json(address, deadline=deadline)
+
+    def check_online_version(self, data):
+        """Check if we need an update."""
         try:
-            address = urllib.parse.quote(version_file, safe='/:=', encoding="utf-8", errors="strict")
-            address = urllib.request.urlopen(address).read().decode('utf8')
-            data = json.loads(address)
             online_version = int(data["version"].replace(".", ""))
             offline_version = int(__version__.replace(".", ""))
         except Exception as e:
-            return "I couldn't check if there is a new version availible: {0}".format(str(e))
-        else:
-            if offline_version < online_version:
-                if msgbox_question(
-                        title="New update found.",
-                        message="There is a new version availible for this program."
-                                "\n\nYou have the outdated version: {0}"
-                                "\nDo you want to Download the new one: {1}?"
-                                "\n\nIMPORTANT: Before updating, backup your options.ini file, it's located "
-                                "in this program folder and that's where your API keys and settings are stored."
-                                .format(__version__, data["version"])):
-                    webbrowser.open(data["release_url"])
-            return None
+            self.startup_warnings.append("I couldn't check if there is a new version availible: {0}".format(str(e)))
+            return
+        if offline_version < online_version:
+            if msgbox_question(
+                    title="New update found.",
+                    message="There is a new version availible for this program."
+                            "\n\nYou have the outdated version: {0}"
+                            "\nDo you want to Download the new one: {1}?"
+                            "\n\nIMPORTANT: Before updating, backup your options.ini file, it's located "
+                            "in this program folder and that's where your API keys and settings are stored."
+                            .format(__version__, data["version"])):
+                open_in_browser(data["release_url"])
 
     ######################
     # BUTTONS and EVENTS #
@@ -404,25 +581,26 @@ class MainForm(QMainWindow, Ui_MainWindow):
 
     def load_combo_stuff(self):
         """Load the stuff on selecting anything on the combo"""
+        # Stop any load still running for the previous key, and forget what we remember of it
+        if self.api_key is not None:
+            API_MEMO.invalidate(token=self.api_key)
+        self.key_deadline.cancel()
+        self.key_deadline = Deadline()
+        self.load_generation += 1
+        self.load_pending = False
+        self.buttonLoad.setEnabled(True)
         self.reset_everything()
+        self.paint_snapshot()
         self.load_permissions()
+        # What was painted from the snapshot is loaded again in the background, if the key stays selected
+        self.revalidate_timer.stop()
+        if self.stale_sections:
+            self.revalidate_timer.start()
 
     def open_window_add(self):
-        """Create instance of the Add API window, get the right theme
-        Iterate over every widget to paint them, execute instance."""
+        """Create instance of the Add API window and execute it."""
         addwindow = AddNewApi()
-        # Get correct theme
-        theme = INI_OPTIONS.value("theme", "default")
-        if theme == "dark":
-            colors = self.dark_theme()
-        elif theme == "light":
-            colors = self.light_theme()
-        else:
-            colors = self.default_theme()
-        # Let's paint them
-        self.set_colors(addwindow, colors)
-        addwindow.setStyleSheet(colors['backgroundcolor'])
-        # Execute instance
+        # Execute instance, the stylesheet of the application already has the right theme
         addwindow.exec_()
 
     @staticmethod
@@ -444,6 +622,13 @@ class MainForm(QMainWindow, Ui_MainWindow):
                 for item in keys:
                     if item['name'] == self.comboSelectAPI.currentText():
                         keys.remove(item)
+                        # Forget everything we remember of it
+                        API_MEMO.invalidate(token=item['key'])
+                        INI_OPTIONS.remove("permissions_{0}".format(token_fingerprint(item['key'])))
+                        SNAPSHOTS.delete(item['key'])
+                        if item['key'] == self.api_key:
+                            self.api_key = None
+                            self.api_permissions = None
                 # update new keys
                 self.stored_keys = keys
                 # Save them into file
@@ -468,67 +653,67 @@ class MainForm(QMainWindow, Ui_MainWindow):
     def open_web_anet(self):
         """Open the website browser with this website."""
         self.change_statusbar("wait", "Loading website...")
-        webbrowser.open("https://account.arena.net/applications")
+        open_in_browser("https://account.arena.net/applications")
         self.change_statusbar("ready", "Website for Arenanet API keys launched on your browser.")
 
     def open_web_builds(self):
         """Open the website browser with this website."""
         self.change_statusbar("wait", "Loading website...")
-        webbrowser.open("https://www.snowcrows.com")
+        open_in_browser("https://www.snowcrows.com")
         self.change_statusbar("ready", "Website for Raid Builds launched on your browser.")
 
     def open_web_builds_alternative(self):
         """Open the website browser with this website."""
         self.change_statusbar("wait", "Loading website...")
-        webbrowser.open("http://metabattle.com/wiki/Raid")
+        open_in_browser("http://metabattle.com/wiki/Raid")
         self.change_statusbar("ready", "Website for Raid Builds launched on your browser.")
 
     def open_web_dpsreport(self):
         """Open the website browser with this website."""
         self.change_statusbar("wait", "Loading website...")
-        webbrowser.open("https://dps.report/")
+        open_in_browser("https://dps.report/")
         self.change_statusbar("ready", "Website for Raid DPS Reports launched on your browser.")
 
     def open_web_killproof(self):
         """Open the website browser with this website."""
         self.change_statusbar("wait", "Loading website...")
-        webbrowser.open("https://killproof.me")
+        open_in_browser("https://killproof.me")
         self.change_statusbar("ready", "Website to check Killproofs launched on your browser.")
 
     def open_web_raidar(self):
         """Open the website browser with this website."""
         self.change_statusbar("wait", "Loading website...")
-        webbrowser.open("https://www.gw2raidar.com")
+        open_in_browser("https://www.gw2raidar.com")
         self.change_statusbar("ready", "Website for Raid Reports Raidar launched on your browser.")
 
     def open_web_arcdps(self):
         """Open the website browser with this website."""
         self.change_statusbar("wait", "Loading website...")
-        webbrowser.open("https://www.deltaconnected.com/arcdps/")
+        open_in_browser("https://www.deltaconnected.com/arcdps/")
         self.change_statusbar("ready", "Website for ArcDps Plugin launched on your browser.")
 
     def open_web_arcdpsmechanics(self):
         """Open the website browser with this website."""
         self.change_statusbar("wait", "Loading website...")
-        webbrowser.open("http://martionlabs.com/arcdps-mechanics-log-plugin/")
+        open_in_browser("http://martionlabs.com/arcdps-mechanics-log-plugin/")
         self.change_statusbar("ready", "Website for ArcDps Mechanics Addon launched on your browser.")
 
     def open_web_dulfy(self):
         """Open the website browser with this website."""
         self.change_statusbar("wait", "Loading website...")
-        webbrowser.open("http://dulfy.net/category/gw2/raid-guides/")
+        open_in_browser("http://dulfy.net/category/gw2/raid-guides/")
         self.change_statusbar("ready", "Website for Dulfy raid guides launched on your browser.")
 
     def open_web_gw2raidexplorer(self):
         """Open the website browser with this website."""
         self.change_statusbar("wait", "Loading website...")
-        webbrowser.open("https://github.com/Aens/Gw2RaidExplorer")
+        open_in_browser("https://github.com/Aens/Gw2RaidExplorer")
         self.change_statusbar("ready", "Website for this tool launched on your browser.")
 
     def open_web_donate(self):
         """Open the website browser with this website."""
         self.change_statusbar("wait", "Loading website...")
-        webbrowser.open("https://www.paypal.com/cgi-bin/webscr?cmd=_donations"
+        open_in_browser("https://www.paypal.com/cgi-bin/webscr?cmd=_donations"
                         "&business=Aenswindstorm@gmail.com&lc=US&item_name=For+Gw2raidexplorer"
                         "&no_note=0&cn=&curency_code=USD&bn=PP-DonationsBF:btn_donateCC_LG.gif:NonHosted")
         self.change_statusbar("ready", "Website to donate launched on your browser.")
@@ -559,6 +744,7 @@ class MainForm(QMainWindow, Ui_MainWindow):
     @staticmethod
     def get_hash_of_file(filepath):
         """Get the hash of a file"""
+        import hashlib  # Only the ArcDps updater needs it
         hash_md5 = hashlib.md5()
         with open(filepath, "rb") as file_to_check:
             for chunk in iter(lambda: file_to_check.read(4096), b""):
@@ -575,37 +761,41 @@ class MainForm(QMainWindow, Ui_MainWindow):
             return False
 
     def update_arcdps(self):
-        """Install or update ArcDps plugin."""
+        """Install or update ArcDps plugin. The download happens in the background."""
         if self.check_folder_is_right():
             self.change_statusbar("wait", "Verifying hash files of ArcDps...")
-            # Files
-            bin_folder = self.lineInstallationFolder.text()
-            local_file = f'{bin_folder}/d3d11.dll'
-            online_file = "https://www.deltaconnected.com/arcdps/x64/d3d11.dll"
-            online_file_md5 = "https://www.deltaconnected.com/arcdps/x64/d3d11.dll.md5sum"
-            # Check if exists
-            try:
-                if self.file_exists(local_file):
-                    # Get both md5
-                    local_file_md5 = self.get_hash_of_file(local_file)
-                    address = urllib.parse.quote(online_file_md5, safe='/:=', encoding="utf-8", errors="strict")
-                    address = urllib.request.urlopen(address).read().decode('utf8')
-                    online_md5 = address.split(" ")[0]
-                    # Compare online MD5 with local md5
-                    if online_md5 == local_file_md5:
-                        self.change_statusbar("ready", "NOPE, ArcDps was already updated.")
-                    else:
-                        # Download files and replace them
-                        self.change_statusbar("wait", "ArcDps is being updated...")
-                        urllib.request.urlretrieve(online_file, local_file)
-                        self.change_statusbar("ready", "YES, there was a new version. ArcDps has been updated.")
-                else:
-                    # Download files
-                    self.change_statusbar("wait", "ArcDps is not installed, downloading...")
-                    urllib.request.urlretrieve(online_file, local_file)
-                    self.change_statusbar("ready", "YES, there was a new version. ArcDps has been Installed.")
-            except Exception as e:
-                self.change_statusbar("error", "Unexpected error: {0}".format(str(e)))
+            worker = Worker(self.download_arcdps, self.lineInstallationFolder.text(),
+                            deadline=Deadline(ARCDPS_BUDGET, parent=self.app_deadline))
+            worker.signals.status.connect(self.change_statusbar)
+            worker.signals.result.connect(lambda message: self.change_statusbar("ready", message))
+            worker.signals.error.connect(
+                lambda e: self.change_statusbar("error", "Unexpected error: {0}".format(str(e))))
+            start_worker(worker, self)
+
+    def download_arcdps(self, bin_folder, status, deadline=None):
+        """Compare the local ArcDps with the online one and download it if needed.
+        Runs on a worker thread, so it only reports through `status`."""
+        # Files
+        local_file = f'{bin_folder}/d3d11.dll'
+        online_file = "https://www.deltaconnected.com/arcdps/x64/d3d11.dll"
+        online_file_md5 = "https://www.deltaconnected.com/arcdps/x64/d3d11.dll.md5sum"
+        # Check if exists
+        if self.file_exists(local_file):
+            # Get both md5
+            local_file_md5 = self.get_hash_of_file(local_file)
+            address = urllib.parse.quote(online_file_md5, safe='/:=', encoding="utf-8", errors="strict")
+            online_md5 = HTTP_CLIENT.request(address, use_cache=False, deadline=deadline).text().split(" ")[0]
+            # Compare online MD5 with local md5
+            if online_md5 == local_file_md5:
+                return "NOPE, ArcDps was already updated."
+            # Download files and replace them
+            status("wait", "ArcDps is being updated...")
+            HTTP_CLIENT.download(online_file, local_file, deadline=deadline)
+            return "YES, there was a new version. ArcDps has been updated."
+        # Download files
+        status("wait", "ArcDps is not installed, downloading...")
+        HTTP_CLIENT.download(online_file, local_file, deadline=deadline)
+        return "YES, there was a new version. ArcDps has been Installed."
 
     ################
     # GUILD WARS 2 #
@@ -614,6 +804,7 @@ class MainForm(QMainWindow, Ui_MainWindow):
     @staticmethod
     def game_is_running():
         """Check if game is running."""
+        import psutil  # Only the game buttons need it, it's slow to import
         game_names = ["Gw2-64.exe", "Gw2.exe"]
         for process in psutil.process_iter():
             for name in game_names:
@@ -633,6 +824,7 @@ class MainForm(QMainWindow, Ui_MainWindow):
                               "{0}/gw2-64.exe".format(filepath), "{0}/gw2.exe".format(filepath)]
                 for file in game_paths:
                     if self.file_exists(file):
+                        from subprocess import Popen
                         Popen([file, "-maploadinfo"])
                         self.change_statusbar("ready", "Guild Wars 2 started.")
                         return
@@ -661,663 +853,603 @@ class MainForm(QMainWindow, Ui_MainWindow):
         self.reset_minis()
         self.reset_skins()
 
-    def load_api(self):
-        """Load all the data of this API"""
+    def api_sections(self):
+        """Every section that can be loaded, with what it needs and how to paint it."""
+        return [{"name": "Bosses", "checkbox": self.checkBosses, "permissions": ("progression",),
+                 "fetch": self.fetch_bosses_section, "fill": self.fill_bosses, "reset": self.reset_bosses,
+                 "snapshot": self.snapshot_bosses, "restore": self.restore_bosses, "weekly_reset": True,
+                 "warning": "Raid bosses need: Progression"},
+                {"name": "Currency", "checkbox": self.checkCurrency,
+                 "permissions": ("inventories", "wallet", "characters"),
+                 "fetch": self.fetch_currency_section, "fill": self.fill_currency, "reset": self.reset_currency,
+                 "snapshot": self.snapshot_currency, "restore": self.restore_currency,
+                 "warning": "Currency needs: Inventories, Wallet, Characters"},
+                {"name": "Achievements", "checkbox": self.checkAchievements, "permissions": ("progression",),
+                 "fetch": self.fetch_achievements_section, "fill": self.fill_achievements,
+                 "reset": self.reset_achievements, "snapshot": self.snapshot_achievements,
+                 "restore": self.restore_achievements, "warning": "Achievements need: Progression"},
+                {"name": "Minis", "checkbox": self.checkMinis, "permissions": ("unlocks",),
+                 "fetch": self.fetch_minis_section, "fill": self.fill_minis, "reset": self.reset_minis,
+                 "snapshot": self.snapshot_minis, "restore": self.restore_unlocks,
+                 "warning": "Minis need: Unlocks"},
+                {"name": "Skins", "checkbox": self.checkSkins, "permissions": ("unlocks",),
+                 "fetch": self.fetch_skins_section, "fill": self.fill_skins, "reset": self.reset_skins,
+                 "snapshot": self.snapshot_skins, "restore": self.restore_unlocks,
+                 "warning": "Skins need: Unlocks"}]
+
+    def on_load_clicked(self):
+        """Load button. With Shift held everything is loaded again, even if the account didn't change."""
+        self.load_api(force=bool(QApplication.keyboardModifiers() & Qt.ShiftModifier))
+
+    def load_api(self, force=False, priority=INTERACTIVE):
+        """Load all the data of this API. First we ask when the account last changed, sections loaded
+        after that are painted from the snapshot (unless `force`), the rest are fetched in the background
+        and each one is painted as soon as it arrives. Revalidating what was painted from the snapshot
+        goes at BACKGROUND `priority`, behind what the user asks for."""
+        self.revalidate_timer.stop()
+        self.load_priority = priority
         if self.comboSelectAPI.currentText() == "":
             self.change_statusbar("error", "You have not added any API key yet.")
+        elif self.permissions_pending:
+            # Wait for the permissions, we need them to know what we can load
+            self.load_pending = True
+            if not self.stale_sections:
+                self.change_statusbar("wait", "Waiting for API key permissions...")
         else:
             self.change_statusbar("wait", "Loading your data...")
-            try:
-                # Fill Bosses section
-                self.change_statusbar("wait", "Loading Bosses section...")
-                bosses = self.load_bosses_section()
-                self.change_statusbar("ready", "Bosses section loaded.")
-                # Fill Raid currencies section
-                self.change_statusbar("wait", "Loading Currencies section...")
-                currency = self.load_currency_section()
-                self.change_statusbar("ready", "Currency section loaded.")
-                # Fill Raid Achievements section
-                self.change_statusbar("wait", "Loading Achievements section...")
-                achievements = self.load_achievements_section()
-                self.change_statusbar("ready", "Achievements section loaded.")
-                # Fill Minis section
-                self.change_statusbar("wait", "Loading Minis section...")
-                minis = self.load_minis_section()
-                self.change_statusbar("ready", "Minis section loaded.")
-                # Fill Skins section
-                self.change_statusbar("wait", "Loading Skins section...")
-                skins = self.load_skins_section()
-                self.change_statusbar("ready", "Skins section loaded.")
-                # Final message
-                warning = []
-                for result in [bosses, currency, achievements, minis, skins]:
-                    if result is not None:
-                        warning.append(result)
-                if len(warning) >= 1:
-                    self.change_statusbar("error", "Not enough permission to do that - {0}".format(" - ".join(warning)))
+            # Decide what to load. Sections not checked or without permission get cleaned
+            self.load_generation += 1
+            self.load_sections = {}
+            self.load_warnings = []
+            self.load_errors = []
+            self.served_stale = False
+            self.load_timeouts = []
+            self.snapshot_changed = False
+            self.load_last_modified = None
+            self.load_unchanged = False
+            permissions = self.api_permissions or []
+            for section in self.api_sections():
+                if not section['checkbox'].isChecked():
+                    section['reset']()
+                    self.stale_sections.discard(section['name'])
+                elif not all(permission in permissions for permission in section['permissions']):
+                    section['reset']()
+                    self.stale_sections.discard(section['name'])
+                    self.load_warnings.append(section['warning'])
                 else:
-                    self.change_statusbar("ready", "API data loaded.")
-            # Special exceptions
-            except Exception as e:
-                if "HTTP Error 400" in str(e):
-                    self.change_statusbar("error", "Your API key is not valid.")
-                elif "HTTP Error 403" in str(e):
-                    self.change_statusbar("error", "LAZY BUG 0001 - If you can read this, tell the programmer.")
-                else:
-                    self.change_statusbar("error", str(e))
+                    self.load_sections[section['name']] = section
+            self.buttonLoad.setEnabled(False)
+            self.show_load_status(HTTP_CLIENT.scheduler.expected_wait(self.api_key, priority))
+            # One time budget for the whole load, shared by every request in it
+            deadline = Deadline(LOAD_BUDGET, parent=self.key_deadline)
+            generation = self.load_generation
+            # Asking when the account last changed is cheap and may spare fetching the sections
+            worker = Worker(self.fetch_last_modified, self.api_key, deadline=deadline, priority=priority)
+            worker.signals.result.connect(
+                lambda last_modified: self.on_account_checked(generation, deadline, force, last_modified, priority))
+            worker.signals.error.connect(
+                lambda e: self.on_account_checked(generation, deadline, force, None, priority))
+            start_worker(worker, self)
+
+    def show_load_status(self, expected_wait=0):
+        """Say what is being loaded. While sections painted from the snapshot are still stale, say so,
+        they stay that way until they arrive."""
+        if self.stale_sections:
+            message = "Updating {0}, showing your data of {1} meanwhile...".format(
+                ", ".join(sorted(self.stale_sections)), self.describe_snapshot_time())
+        else:
+            message = "Loading {0}...".format(", ".join(self.load_sections))
+        if expected_wait >= 1:
+            message = "{0} ({1:.0f} seconds waiting for the API limits)".format(message, expected_wait)
+        self.change_statusbar("wait", message)
+
+    def fetch_last_modified(self, api_key, status, deadline=None, priority=INTERACTIVE):
+        """Get when the account last changed. Never from the cache, it's what tells if the cache is still right."""
+        account = self.api_open("account", token=api_key, headers={"X-Schema-Version": ACCOUNT_SCHEMA},
+                                use_cache=False, deadline=deadline, priority=priority)
+        return account.get("last_modified")
+
+    def on_account_checked(self, generation, deadline, force, last_modified, priority=INTERACTIVE):
+        """We know when the account last changed (None if we couldn't ask). Paint the sections loaded
+        after that from the snapshot and fetch the rest."""
+        if generation != self.load_generation:
+            return
+        self.load_last_modified = last_modified
+        if not force and last_modified is not None:
+            # Bosses reset every week without the account changing, their snapshot only counts after that
+            after_reset = changed_since_weekly_reset(last_modified)
+            for name in list(self.load_sections):
+                if self.load_sections[name].get("weekly_reset") and not after_reset:
+                    continue
+                if self.snapshot_versions.get(name) == last_modified and name in self.snapshot_sections:
+                    section = self.load_sections.pop(name)
+                    section['fill'](*section['restore'](self.snapshot_sections[name]))
+                    self.stale_sections.discard(name)
+        if not self.load_sections:
+            self.load_unchanged = True
+            self.on_load_finished(generation)
+            return
+        # Fetch the rest at the same time in the background
+        worker = SectionsWorker({name: partial(section['fetch'], self.api_key, deadline, priority)
+                                 for name, section in self.load_sections.items()})
+        worker.signals.section_loaded.connect(
+            lambda name, result: self.on_section_loaded(generation, name, result))
+        worker.signals.section_failed.connect(
+            lambda name, error: self.on_section_failed(generation, name, error))
+        worker.signals.finished.connect(lambda: self.on_load_finished(generation))
+        start_worker(worker, self)
+
+    def on_section_loaded(self, generation, name, result):
+        """A section arrived, paint it (only what changed since the snapshot) and remember it for the next time."""
+        if generation == self.load_generation:
+            section = self.load_sections[name]
+            section['fill'](*result)
+            self.snapshot_sections[name] = section['snapshot'](*result)
+            self.snapshot_versions[name] = self.load_last_modified
+            self.stale_sections.discard(name)
+            self.snapshot_changed = True
+            if self.stale_sections:
+                self.show_load_status()
+            else:
+                self.change_statusbar("ready", "{0} section loaded.".format(name))
+
+    def on_section_failed(self, generation, name, error):
+        """A section failed, clean it (unless it shows the snapshot, then it stays) and remember why."""
+        if generation == self.load_generation:
+            if name not in self.stale_sections:
+                self.load_sections[name]['reset']()
+            if isinstance(error, DeadlineExceeded):
+                self.load_timeouts.append(name)
+            elif not isinstance(error, Cancelled):
+                self.load_errors.append(error)
+
+    def on_load_finished(self, generation):
+        """Every section has finished, show the final message."""
+        if generation != self.load_generation:
+            return
+        self.buttonLoad.setEnabled(True)
+        if self.snapshot_changed and self.api_key is not None:
+            SNAPSHOTS.save(self.api_key, self.snapshot_sections, self.snapshot_versions)
+        if self.debug_mode:
+            self.debug_message.emit("Network stats: {0}".format(HTTP_CLIENT.stats()))
+        # Special exceptions
+        if self.load_errors:
+            self.change_statusbar("error", self.describe_error(self.load_errors[0]))
+        elif self.load_timeouts:
+            self.change_statusbar("error", "ANet servers took too long for: {0}. The rest has been loaded.".format(
+                ", ".join(self.load_timeouts)))
+        # Final message
+        elif len(self.load_warnings) >= 1:
+            self.change_statusbar("error", "Not enough permission to do that - {0}".format(
+                " - ".join(self.load_warnings)))
+        elif self.served_stale:
+            self.change_statusbar("special", "ANet servers seem to be down, showing the last data we got.")
+        elif self.stale_sections:
+            self.change_statusbar("special", "{0} could not be updated, showing your data of {1}.".format(
+                ", ".join(sorted(self.stale_sections)), self.describe_snapshot_time()))
+        elif self.load_unchanged:
+            self.change_statusbar("ready", "Your account didn't change since the last load. "
+                                           "Shift+click Load to load everything again.")
+        else:
+            self.change_statusbar("ready", "API data loaded.")
+
+    def paint_snapshot(self):
+        """Paint the sections of the last load of the selected key, without the network.
+        They are marked as stale until they are loaded again."""
+        api_key = self.selected_key()
+        snapshot = SNAPSHOTS.load(api_key) if api_key is not None else None
+        self.snapshot_saved, self.snapshot_sections, self.snapshot_versions = \
+            snapshot if snapshot is not None else (None, {}, {})
+        self.stale_sections = set()
+        for section in self.api_sections():
+            data = self.snapshot_sections.get(section['name'])
+            if data is not None and section['checkbox'].isChecked():
+                section['fill'](*section['restore'](data))
+                self.stale_sections.add(section['name'])
+        if self.stale_sections:
+            self.change_statusbar("special", "Showing your data of {0}, it will be updated.".format(
+                self.describe_snapshot_time()))
+
+    def describe_snapshot_time(self):
+        """When the snapshot painted was saved, for the status bar."""
+        return time.strftime("%Y-%m-%d %H:%M", time.localtime(self.snapshot_saved))
 
-    def load_permissions(self):
-        """Load the permissions of the selected key"""
+    @staticmethod
+    def describe_error(e):
+        """Turn an error of the API into a message for the status bar."""
+        status = getattr(e, "status", None)
+        if status == 400:
+            return "Your API key is not valid."
+        elif status == 403:
+            return "LAZY BUG 0001 - If you can read this, tell the programmer."
+        elif status == 429:
+            return "Too many requests to ANet servers, wait a bit and try again."
+        return str(e)
+
+    def selected_key(self):
+        """Get the key of the name selected in the combo, or None."""
+        for x in self.stored_keys:
+            if x['name'] == self.comboSelectAPI.currentText():
+                return x['key']
+        return None
+
+    @staticmethod
+    def cached_permissions(api_key):
+        """Permissions of a key saved on the last session, or None."""
+        permissions = INI_OPTIONS.value("permissions_{0}".format(token_fingerprint(api_key)), None)
+        return json.loads(permissions) if permissions else None
+
+    def paint_cached_permissions(self):
+        """Paint the permissions of the selected key saved on the last session, without the network."""
+        api_key = self.selected_key()
+        if api_key is not None:
+            permissions = self.cached_permissions(api_key)
+            if permissions is not None:
+                self.api_key = api_key
+                self.api_permissions = permissions
+                self.fill_permissions(permissions)
+
+    def load_permissions(self, budget=None, priority=INTERACTIVE):
+        """Load the permissions of the selected key in the background.
+        The ones saved on the last session are painted meanwhile."""
         if not self.comboSelectAPI.currentText() == "":
-            self.change_statusbar("wait", "Loading API key permissions...")
+            if not self.stale_sections:
+                self.change_statusbar("wait", "Loading API key permissions...")
             # Get key of that name
-            self.api_key = None
-            for x in self.stored_keys:
-                if x['name'] == self.comboSelectAPI.currentText():
-                    self.api_key = x['key']
-                    break
+            self.api_key = self.selected_key()
             if self.api_key is not None:
-                # Fill the permissions sections
-                try:
-                    permissions = self.api_open("tokeninfo", token=self.api_key)['permissions']
-                    self.fill_permissions(permissions)
-                    self.api_permissions = permissions
-                except Exception as e:
-                    if "HTTP Error 400" in str(e):
-                        self.change_statusbar("error", "Your API key is not valid.")
+                # Fill the permissions sections, with the old ones while we wait
+                api_key = self.api_key
+                cached = self.cached_permissions(api_key)
+                # Never the ones of the previous key
+                self.api_permissions = cached
+                if cached is not None:
+                    self.fill_permissions(cached)
+                self.permissions_pending = cached is None
+                PROFILER.begin("load_permissions")
+                worker = Worker(self.fetch_permissions, api_key, priority=priority,
+                                deadline=Deadline(budget, parent=self.key_deadline))
+                worker.signals.result.connect(lambda permissions: self.on_permissions_loaded(api_key, permissions))
+                worker.signals.error.connect(lambda e: self.on_permissions_failed(api_key, e))
+                start_worker(worker, self)
             else:
                 self.change_statusbar("ready", "API key not valid, probably empty or corrupted.")
 
+    def fetch_permissions(self, api_key, status, deadline=None, priority=INTERACTIVE):
+        """Get the permissions of a key."""
+        return self.api_open("tokeninfo", token=api_key, deadline=deadline, priority=priority)['permissions']
+
+    def on_permissions_loaded(self, api_key, permissions):
+        """Permissions arrived, paint them (if the key is still the selected one)."""
+        PROFILER.end("load_permissions")
+        if api_key == self.api_key:
+            self.permissions_pending = False
+            self.fill_permissions(permissions)
+            self.api_permissions = permissions
+            INI_OPTIONS.setValue("permissions_{0}".format(token_fingerprint(api_key)), json.dumps(permissions))
+            if self.load_pending:
+                self.load_pending = False
+                self.load_api(priority=self.load_priority)
+        self.finish_startup_profile()
+
+    def on_permissions_failed(self, api_key, e):
+        """Permissions could not be loaded. A load waiting for them goes on with the ones of the last session,
+        if there are any, otherwise the error is shown: the status bar is never left waiting."""
+        PROFILER.end("load_permissions")
+        if api_key == self.api_key and not isinstance(e, Cancelled):
+            self.permissions_pending = False
+            load_pending = self.load_pending
+            self.load_pending = False
+            if getattr(e, "status", None) == 400:
+                self.change_statusbar("error", self.describe_error(e))
+            elif load_pending and self.api_permissions is not None:
+                self.load_api(priority=self.load_priority)
+            elif load_pending or (self.buttonLoad.isEnabled() and not self.stale_sections):
+                # Nothing else (a load, the notice of the snapshot) is using the status bar
+                self.change_statusbar("error", "I couldn't load the API key permissions: {0}".format(
+                    self.describe_error(e)))
+        self.finish_startup_profile()
+
+    def repaint_permissions(self):
+        """Paint the permissions again with the ones we already know, without asking the API."""
+        if self.api_permissions is not None:
+            self.fill_permissions(self.api_permissions)
+        else:
+            self.reset_permissions()
+
     def fill_permissions(self, permissions):
         """Set yes or no for each item."""
-        # Get new colors to paint based on theme
-        yes_style = self.adapt_line_theme("yes")
-        no_style = self.adapt_line_theme("no")
-        # Load everything
-        all_sections = [("account", self.linePermission_Account),
-                        ("builds", self.linePermission_Builds),
-                        ("characters", self.linePermission_Characters),
-                        ("guilds", self.linePermission_Guilds),
-                        ("inventories", self.linePermission_Inventories),
-                        ("progression", self.linePermission_Progression),
-                        ("pvp", self.linePermission_PvP),
-                        ("tradingpost", self.linePermission_Tradingpost),
-                        ("unlocks", self.linePermission_Unlocks),
-                        ("wallet", self.linePermission_Wallet)]
-        for section in all_sections:
-            if section[0] in permissions:
-                section[1].setStyleSheet(yes_style)
-            else:
-                section[1].setStyleSheet(no_style)
+        all_sections = [("account", "linePermission_Account"),
+                        ("builds", "linePermission_Builds"),
+                        ("characters", "linePermission_Characters"),
+                        ("guilds", "linePermission_Guilds"),
+                        ("inventories", "linePermission_Inventories"),
+                        ("progression", "linePermission_Progression"),
+                        ("pvp", "linePermission_PvP"),
+                        ("tradingpost", "linePermission_Tradingpost"),
+                        ("unlocks", "linePermission_Unlocks"),
+                        ("wallet", "linePermission_Wallet")]
+        self.apply_states({field: "yes" if permission in permissions else "no"
+                           for permission, field in all_sections})
         self.change_statusbar("ready", "Permissions loaded.")
 
     def reset_permissions(self):
         """Clean all permissions"""
-        # Get new color to paint based on theme
-        reset_style = self.adapt_line_theme("reset")
-        # Clean everything
         permission_fields = (
-            self.linePermission_Progression, self.linePermission_Wallet,
-            self.linePermission_Unlocks, self.linePermission_PvP,
-            self.linePermission_Inventories, self.linePermission_Guilds,
-            self.linePermission_Guilds, self.linePermission_Characters,
-            self.linePermission_Builds, self.linePermission_Account,
-            self.linePermission_Tradingpost)
-        for i in permission_fields:
-            i.setStyleSheet(reset_style)
-
-    def adapt_line_theme(self, value):
-        """Get a sample of a linedit and change the theme to meet new conditions."""
-        background_color = ""
-        border = ""
-        if value == "yes":
-            background_color = "background-color: rgb(160, 200, 90)"
-            border = "border: 1px solid rgb(180, 200, 90)"
-        elif value == "no":
-            background_color = "background-color: rgb(200, 0, 0)"
-            border = "border: 1px solid rgb(220, 0, 0)"
-        elif value == "reset":
-            return self.style_lineedits
-        # Create the new style
-        new_style = self.lineInstallationFolder.styleSheet().split(";")
-        for index, value in enumerate(new_style):
-            if "background-color:" in value:
-                new_style[index] = background_color
-            elif "border:" in value:
-                new_style[index] = border
-        new_style = ";".join(new_style)
-        return new_style
+            "linePermission_Progression", "linePermission_Wallet",
+            "linePermission_Unlocks", "linePermission_PvP",
+            "linePermission_Inventories", "linePermission_Guilds",
+            "linePermission_Characters", "linePermission_Builds",
+            "linePermission_Account", "linePermission_Tradingpost")
+        self.apply_states({field: "reset" for field in permission_fields})
+
+    def apply_states(self, states):
+        """Paint a dict of widget name -> "yes"/"no"/"reset".
+        Only the widgets that changed are touched, all of them in a single repaint.
+        Widgets of pages not built yet get painted when their page is built."""
+        changes = self.view_state.diff(states)
+        for name in list(changes):
+            if getattr(self, name, None) is None:
+                self.pending_states[name] = changes.pop(name)
+        if not changes:
+            return
+        self.setUpdatesEnabled(False)
+        try:
+            for name, state in changes.items():
+                widget = getattr(self, name)
+                # The stylesheet of the application has a rule for each state
+                set_style_property(widget, "state", state)
+        finally:
+            self.setUpdatesEnabled(True)
+        self.view_state.applied(changes)
+
+    def apply_texts(self, texts):
+        """Set a dict of widget name -> (text, tooltip), now or when their page is built."""
+        for name, (text, tooltip) in texts.items():
+            widget = getattr(self, name, None)
+            if widget is None:
+                self.pending_texts[name] = (text, tooltip)
+            else:
+                widget.setText(text)
+                widget.setToolTip(tooltip)
+
+    def apply_grid_states(self, section, states):
+        """Paint a dict of API id -> state on the grids of a section, built or not."""
+        for model in self.raid_grids[section].values():
+            model.set_states(states)
+
+    def on_page_built(self, page):
+        """A raid page was built, attach its grids and paint what arrived for it meanwhile."""
+        for section, prefix in (("minis", "gridMinis"), ("skins", "gridSkins")):
+            _, cell_width, cell_height = GRID_LAYOUTS[section]
+            for wing, model in self.raid_grids[section].items():
+                view = getattr(self, "{0}_w{1}".format(prefix, wing), None)
+                if view is not None and view.model() is None:
+                    setup_grid(view, model, self.grid_delegate, cell_width, cell_height)
+        if page is self.tab_achievements:
+            _, cell_width, cell_height = GRID_LAYOUTS['achievements']
+            setup_grid(self.gridAchievements, self.raid_grids['achievements'][None], self.grid_delegate,
+                       cell_width, cell_height)
+            self.comboAchievementsWing.addItem("All wings", None)
+            for wing, name in sorted(RAID_CATALOG.wing_names("achievements").items()):
+                self.comboAchievementsWing.addItem("Wing {0} - {1}".format(wing, name), wing)
+            self.comboAchievementsWing.currentIndexChanged.connect(self.filter_achievements)
+        pending_states, self.pending_states = self.pending_states, {}
+        pending_texts, self.pending_texts = self.pending_texts, {}
+        self.apply_texts(pending_texts)
+        self.apply_states(pending_states)
+
+    @staticmethod
+    def compile_line_styles(colors):
+        """Final style of the YES/NO fields for each state, built from the read-only fields of a theme."""
+        styles = {"reset": colors['inputcolorreadonly']}
+        for state, (background_color, border_color) in LINE_STATE_COLORS.items():
+            new_style = colors['inputcolorreadonly'].split(";")
+            for index, value in enumerate(new_style):
+                if "background-color:" in value:
+                    new_style[index] = "background-color: rgb{0}".format(background_color)
+                elif "border:" in value:
+                    new_style[index] = "border: 1px solid rgb{0}".format(border_color)
+            styles[state] = ";".join(new_style)
+        return styles
 
     ##################
     # BOSSES SECTION #
     ##################
 
-    def load_bosses_section(self):
-        """Load bosses section"""
-        if self.checkBosses.isChecked():
-            if "progression" in self.api_permissions:
-                self.fill_bosses(self.api_key)
-            else:
-                self.reset_bosses()
-                return "Raid bosses need: Progression"
-        else:
-            self.reset_bosses()
+    def fetch_bosses_section(self, api_key, deadline=None, priority=INTERACTIVE):
+        """Get the data of the bosses section."""
+        bosses_killed = self.api_open("account", ids=["raids"], token=api_key, deadline=deadline, priority=priority)
+        return (bosses_killed,)
 
-    def fill_bosses(self, api_key):
+    def fill_bosses(self, bosses_killed):
         """Set the correct style for each item."""
-        # Get new colors to paint based on theme
-        yes_style = self.adapt_line_theme("yes")
-        no_style = self.adapt_line_theme("no")
-        # Bosses
-        bosses = [{"name": "vale_guardian", "flag": 0, "uiitem": self.lineRaidboss_valeguardian},
-                  {"name": "spirit_woods", "flag": 0, "uiitem": self.lineRaidboss_spiritwoods},
-                  {"name": "gorseval", "flag": 0, "uiitem": self.lineRaidboss_gorseval},
-                  {"name": "sabetha", "flag": 0, "uiitem": self.lineRaidboss_sabetha},
-                  {"name": "slothasor", "flag": 0, "uiitem": self.lineRaidboss_slothasor},
-                  {"name": "bandit_trio", "flag": 0, "uiitem": self.lineRaidboss_trio},
-                  {"name": "matthias", "flag": 0, "uiitem": self.lineRaidboss_matthias},
-                  {"name": "escort", "flag": 0, "uiitem": self.lineRaidboss_glenna},
-                  {"name": "keep_construct", "flag": 0, "uiitem": self.lineRaidboss_keepconstruct},
-                  {"name": "twisted_castle", "flag": 0, "uiitem": self.lineRaidboss_twistedcastle},
-                  {"name": "xera", "flag": 0, "uiitem": self.lineRaidboss_xera},
-                  {"name": "cairn", "flag": 0, "uiitem": self.lineRaidboss_cairn},
-                  {"name": "mursaat_overseer", "flag": 0, "uiitem": self.lineRaidboss_mursaat},
-                  {"name": "samarog", "flag": 0, "uiitem": self.lineRaidboss_samarog},
-                  {"name": "deimos", "flag": 0, "uiitem": self.lineRaidboss_deimos},
-                  {"name": "soulless_horror", "flag": 0, "uiitem": self.lineRaidboss_desmina},
-                  {"name": "river_of_souls", "flag": 0, "uiitem": self.lineRaidboss_riverofsouls},
-                  {"name": "statues_of_grenth", "flag": 0, "uiitem": self.lineRaidboss_statues},
-                  {"name": "voice_in_the_void", "flag": 0, "uiitem": self.lineRaidboss_dhuum},
-                  {"name": "conjured_amalgamate", "flag": 0, "uiitem": self.lineRaidboss_conjureda},
-                  {"name": "twin_largos", "flag": 0, "uiitem": self.lineRaidboss_twinlargos},
-                  {"name": "qadim", "flag": 0, "uiitem": self.lineRaidboss_qadim},
-                  {"name": "gate", "flag": 0, "uiitem": self.lineRaidboss_gateofahdashim},
-                  {"name": "adina", "flag": 0, "uiitem": self.lineRaidboss_adina},
-                  {"name": "sabir", "flag": 0, "uiitem": self.lineRaidboss_sabir},
-                  {"name": "qadim_the_peerless", "flag": 0, "uiitem": self.lineRaidboss_qadim2},
-                  ]
-        bosses_killed = self.api_open("account", ids=["raids"], token=api_key)
-        for i in bosses:
-            for j in bosses_killed:
-                if j == i['name']:
-                    i['flag'] = 1
-                    break
-            if i['flag'] == 1:
-                i['uiitem'].setStyleSheet(yes_style)
-            else:
-                i['uiitem'].setStyleSheet(no_style)
+        bosses_killed = set(bosses_killed)
+        self.apply_states({field: "yes" if boss in bosses_killed else "no"
+                           for boss, field in self.boss_fields.items()})
 
     def reset_bosses(self):
         """Clean all bosses"""
-        # Get new color to paint based on theme
-        reset_style = self.adapt_line_theme("reset")
-        # Clean everything
-        raids_fields = (
-            self.lineRaidboss_valeguardian, self.lineRaidboss_spiritwoods, self.lineRaidboss_gorseval,
-            self.lineRaidboss_sabetha, self.lineRaidboss_slothasor, self.lineRaidboss_trio,
-            self.lineRaidboss_matthias, self.lineRaidboss_glenna, self.lineRaidboss_keepconstruct,
-            self.lineRaidboss_twistedcastle, self.lineRaidboss_xera, self.lineRaidboss_cairn,
-            self.lineRaidboss_mursaat, self.lineRaidboss_samarog, self.lineRaidboss_deimos,
-            self.lineRaidboss_desmina, self.lineRaidboss_riverofsouls, self.lineRaidboss_statues,
-            self.lineRaidboss_dhuum, self.lineRaidboss_conjureda, self.lineRaidboss_twinlargos,
-            self.lineRaidboss_qadim, self.lineRaidboss_gateofahdashim, self.lineRaidboss_adina,
-            self.lineRaidboss_sabir, self.lineRaidboss_qadim2)
-        for i in raids_fields:
-            i.setStyleSheet(reset_style)
+        self.apply_states({field: "reset" for field in self.boss_fields.values()})
+
+    @staticmethod
+    def snapshot_bosses(bosses_killed):
+        """What the snapshot keeps of the bosses section."""
+        return list(bosses_killed)
+
+    @staticmethod
+    def restore_bosses(bosses_killed):
+        """Arguments of fill_bosses, from the snapshot."""
+        return (bosses_killed,)
 
     ####################
     # CURRENCY SECTION #
     ####################
 
-    def load_currency_section(self):
-        """Load currency section"""
-        if self.checkCurrency.isChecked():
-            if ("inventories" in self.api_permissions
-                    and "wallet" in self.api_permissions
-                    and "characters" in self.api_permissions):
-                api_characters_names = self.api_open("characters", token=self.api_key)
-                api_characters = self.api_open("characters", ids=api_characters_names, token=self.api_key)
-                if type(api_characters) is dict:
-                    api_characters = [api_characters]
-                api_shared_inventory = self.api_open("account/inventory", token=self.api_key)
-                api_materials = self.api_open("account/materials", token=self.api_key)
-                api_bank = self.api_open("account/bank", token=self.api_key)
-                api_wallet = self.api_open("account", ids=["wallet"], token=self.api_key)
-                self.fill_currency(api_wallet, api_characters,
-                                   api_shared_inventory, api_materials, api_bank)
-            else:
-                self.reset_currency()
-                return "Currency needs: Inventories, Wallet, Characters"
-        else:
-            self.reset_currency()
-
-    def fill_currency(self, api_wallet, api_characters, api_shared_inventory, api_materials, api_bank):
-        """Sum the values and set the correct style for each item."""
-        # Get new colors to paint based on theme
-        yes_style = self.adapt_line_theme("yes")
+    def fetch_currency_section(self, api_key, deadline=None, priority=INTERACTIVE):
+        """Get the data of the currency section. Everything but the characters list goes in parallel."""
+        # The characters list is the first of two steps, leave time for the second one
+        first_step = Deadline(deadline.timeout(steps_left=2), parent=deadline) if deadline is not None else None
+        api_characters_names = self.api_open("characters", token=api_key, deadline=first_step, priority=priority)
+        data = SectionLoader().gather({
+            "characters": lambda: self.api_open("characters", ids=api_characters_names, token=api_key,
+                                                deadline=deadline, priority=priority),
+            "shared_inventory": lambda: self.api_open("account/inventory", token=api_key, deadline=deadline,
+                                                      priority=priority),
+            "materials": lambda: self.api_open("account/materials", token=api_key, deadline=deadline,
+                                               priority=priority),
+            "bank": lambda: self.api_open("account/bank", token=api_key, deadline=deadline, priority=priority),
+            "wallet": lambda: self.api_open("account", ids=["wallet"], token=api_key, deadline=deadline,
+                                            priority=priority)})
+        api_characters = data['characters']
+        if type(api_characters) is dict:
+            api_characters = [api_characters]
+        item_index = ItemIndex.build(api_characters, data['shared_inventory'], data['materials'], data['bank'])
+        return data['wallet'], item_index
+
+    def fill_currency(self, api_wallet, item_index):
+        """Set the values and the correct style for each item."""
+        texts = {}
         # Wallet
         for i in api_wallet:
-            wallet_items = [{"name": "magnetite_shards", "id": 28, "uiitem": self.lineCurrency_Magnetiteshards},
-                            {"name": "gaeting_crystals", "id": 39, "uiitem": self.lineCurrency_Gaetingcrystals}]
-            for item in wallet_items:
-                if i['id'] == item['id']:
-                    item['uiitem'].setText(str(i['value']))
-                    item['uiitem'].setStyleSheet(yes_style)
-        # Find items everywhere
-        items_to_find = [{"name": "legendary_insight", "id": 77302, "uiitem": self.lineCurrency_Legend_insights},
-                         {"name": "legendary_divination", "id": 88485, "uiitem": self.lineCurrency_Legend_divinations}]
-        for item in items_to_find:
-            total = 0
-            # Each character
-            for char in api_characters:
-                char_items = 0
-                # Equipped items
-                if "equipment" in char:
-                    for equipped in char['equipment']:
-                        if "id" in equipped:
-                            if equipped['id'] == item['id']:
-                                char_items += 1
-                                break
-                # Inventories
-                for bag in char['bags']:
-                    if bag is not None:
-                        for slot in bag['inventory']:
-                            if slot is not None:
-                                if slot['id'] == item['id']:
-                                    char_items += slot['count']
-                                    break
-                total += char_items
-            # Shared inventory
-            for slot in api_shared_inventory:
-                if slot is not None:
-                    if slot['id'] == item['id']:
-                        total += slot['count']
-            # Materials bank
-            for mat in api_materials:
-                if mat['id'] == item['id']:
-                    total += mat['count']
-                    break
-            # Bank tabs
-            for slot in api_bank:
-                if slot is not None:
-                    if slot['id'] == item['id']:
-                        total += slot['count']
-            # Set the UI
-            item['uiitem'].setText(str(total))
-            item['uiitem'].setStyleSheet(yes_style)
+            if i['id'] in WALLET_FIELDS:
+                texts[WALLET_FIELDS[i['id']]] = (str(i['value']), "")
+        # Items, already counted everywhere
+        for item, field in ITEM_FIELDS.items():
+            locations = item_index.where(item)
+            texts[field] = (str(item_index.count(item)),
+                            "\n".join("{0}: {1}".format(place, count) for place, count in sorted(locations.items())))
+        self.apply_texts(texts)
+        self.apply_states({field: "yes" for field in texts})
 
     def reset_currency(self):
         """Clean all currency"""
-        # Get new color to paint based on theme
-        reset_style = self.adapt_line_theme("reset")
-        # Clean everything
-        currency_fields = (self.lineCurrency_Magnetiteshards, self.lineCurrency_Gaetingcrystals,
-                           self.lineCurrency_Legend_insights, self.lineCurrency_Legend_divinations,)
-        for i in currency_fields:
-            i.clear()
-            i.setStyleSheet(reset_style)
+        currency_fields = list(WALLET_FIELDS.values()) + list(ITEM_FIELDS.values())
+        self.apply_texts({field: ("", "") for field in currency_fields})
+        self.apply_states({field: "reset" for field in currency_fields})
+
+    @staticmethod
+    def snapshot_currency(api_wallet, item_index):
+        """What the snapshot keeps of the currency section: only the currencies and items we show."""
+        return {"wallet": [i for i in api_wallet if i['id'] in WALLET_FIELDS],
+                "items": [[item, item_index.where(item)] for item in ITEM_FIELDS]}
+
+    @staticmethod
+    def restore_currency(data):
+        """Arguments of fill_currency, from the snapshot."""
+        item_index = ItemIndex()
+        for item, locations in data['items']:
+            for place, count in locations.items():
+                item_index.add(item, count, place)
+        return data['wallet'], item_index
 
     ########################
     # ACHIEVEMENTS SECTION #
     ########################
 
-    def load_achievements_section(self):
-        """Load achievements section"""
-        if self.checkAchievements.isChecked():
-            if "progression" in self.api_permissions:
-                api_achievs = self.api_open("account/achievements", token=self.api_key)
-                self.fill_achievements(api_achievs)
-            else:
-                self.reset_achievements()
-                return "Achievements need: Progression"
-        else:
-            self.reset_achievements()
+    def fetch_achievements_section(self, api_key, deadline=None, priority=INTERACTIVE):
+        """Get the data of the achievements section.
+        Only the raid achievements are asked for, in chunks of as many ids as the API takes."""
+        ids = [str(achievement) for achievement in RAID_CATALOG.ids("achievements")]
+        chunks = {start: ids[start:start + API_MAX_IDS] for start in range(0, len(ids), API_MAX_IDS)}
+        data = SectionLoader().gather({
+            start: partial(self.fetch_achievements_chunk, api_key, chunk, deadline, priority)
+            for start, chunk in chunks.items()})
+        api_achievs = {}
+        for chunk in data.values():
+            for api_achiev in chunk:
+                api_achievs[api_achiev['id']] = api_achiev
+        return (api_achievs,)
+
+    def fetch_achievements_chunk(self, api_key, ids, deadline=None, priority=INTERACTIVE):
+        """Get the progress of some achievements. The API says 404 when none of them was started."""
+        try:
+            return self.api_open("account/achievements", ids=ids, token=api_key, deadline=deadline,
+                                 priority=priority)
+        except HttpError as e:
+            if e.status == 404:
+                return []
+            raise
 
     def fill_achievements(self, api_achievs):
-        """Set the correct style for each item."""
-        # Get new colors to paint based on theme
-        yes_style = self.adapt_line_theme("yes")
-        no_style = self.adapt_line_theme("no")
-        # Achievements
-        achievements = [{"id": 2657, "flag": 0, "uiitem": self.lineAchiev_w1_closure},
-                        {"id": 2651, "flag": 0, "uiitem": self.lineAchiev_w1_lootfinder},
-                        {"id": 2663, "flag": 0, "uiitem": self.lineAchiev_w1_piecingit},
-                        {"id": 2654, "flag": 0, "uiitem": self.lineAchiev_w1_beyondthevale},
-                        {"id": 2658, "flag": 0, "uiitem": self.lineAchiev_w1_fleethestorm},
-                        {"id": 2655, "flag": 0, "uiitem": self.lineAchiev_w1_rgb},
-                        {"id": 2656, "flag": 0, "uiitem": self.lineAchiev_w1_whitenoise},
-                        {"id": 2647, "flag": 0, "uiitem": self.lineAchiev_w1_intothewoods},
-                        {"id": 2660, "flag": 0, "uiitem": self.lineAchiev_w1_outranaghost},
-                        {"id": 2665, "flag": 0, "uiitem": self.lineAchiev_w1_keepthelights},
-                        {"id": 2662, "flag": 0, "uiitem": self.lineAchiev_w1_quickmarch},
-                        {"id": 2667, "flag": 0, "uiitem": self.lineAchiev_w1_puttorest},
-                        {"id": 2666, "flag": 0, "uiitem": self.lineAchiev_w1_angermanage},
-                        {"id": 2649, "flag": 0, "uiitem": self.lineAchiev_w1_denied},
-                        {"id": 2648, "flag": 0, "uiitem": self.lineAchiev_w1_spectralanomaly},
-                        {"id": 2659, "flag": 0, "uiitem": self.lineAchiev_w1_fireextinguish},
-                        {"id": 2664, "flag": 0, "uiitem": self.lineAchiev_w1_backdraftd},
-                        {"id": 2652, "flag": 0, "uiitem": self.lineAchiev_w1_lastcannon},
-                        {"id": 2661, "flag": 0, "uiitem": self.lineAchiev_w1_liftoff},
-                        {"id": 2668, "flag": 0, "uiitem": self.lineAchiev_w1_myhero},
-                        {"id": 2653, "flag": 0, "uiitem": self.lineAchiev_w1_undefeated},
-                        {"id": 2832, "flag": 0, "uiitem": self.lineAchiev_w2_scatteredm},
-                        {"id": 2826, "flag": 0, "uiitem": self.lineAchiev_w2_thebigsleep},
-                        {"id": 2824, "flag": 0, "uiitem": self.lineAchiev_w2_spmastery},
-                        {"id": 2830, "flag": 0, "uiitem": self.lineAchiev_w2_theshield},
-                        {"id": 2821, "flag": 0, "uiitem": self.lineAchiev_w2_seimurwasw},
-                        {"id": 2836, "flag": 0, "uiitem": self.lineAchiev_w2_avengerofpact},
-                        {"id": 2831, "flag": 0, "uiitem": self.lineAchiev_w2_slipperyslub},
-                        {"id": 2835, "flag": 0, "uiitem": self.lineAchiev_w2_environmentally},
-                        {"id": 2823, "flag": 0, "uiitem": self.lineAchiev_w2_spsadist},
-                        {"id": 3024, "flag": 0, "uiitem": self.lineAchiev_w3_siegethestrong},
-                        {"id": 3021, "flag": 0, "uiitem": self.lineAchiev_w3_minecontrol},
-                        {"id": 3016, "flag": 0, "uiitem": self.lineAchiev_w3_scourgeofwm},
-                        {"id": 3014, "flag": 0, "uiitem": self.lineAchiev_w3_deconstructed},
-                        {"id": 3010, "flag": 0, "uiitem": self.lineAchiev_w3_traversethetc},
-                        {"id": 3017, "flag": 0, "uiitem": self.lineAchiev_w3_dismantled},
-                        {"id": 3019, "flag": 0, "uiitem": self.lineAchiev_w3_downdownd},
-                        {"id": 3011, "flag": 0, "uiitem": self.lineAchiev_w3_evasivemane},
-                        {"id": 3022, "flag": 0, "uiitem": self.lineAchiev_w3_outrunawarg},
-                        {"id": 3025, "flag": 0, "uiitem": self.lineAchiev_w3_loveisbunny},
-                        {"id": 3013, "flag": 0, "uiitem": self.lineAchiev_w3_mildlyinsane},
-                        {"id": 3287, "flag": 0, "uiitem": self.lineAchiev_w4_attuned},
-                        {"id": 3349, "flag": 0, "uiitem": self.lineAchiev_w4_breakingin},
-                        {"id": 3364, "flag": 0, "uiitem": self.lineAchiev_w4_freeatlast},
-                        {"id": 3299, "flag": 0, "uiitem": self.lineAchiev_w4_greetedaslib},
-                        {"id": 3342, "flag": 0, "uiitem": self.lineAchiev_w4_harshsentence},
-                        {"id": 3321, "flag": 0, "uiitem": self.lineAchiev_w4_justagame},
-                        {"id": 3334, "flag": 0, "uiitem": self.lineAchiev_w4_jaded},
-                        {"id": 3292, "flag": 0, "uiitem": self.lineAchiev_w4_solitaryconfi},
-                        {"id": 3347, "flag": 0, "uiitem": self.lineAchiev_w4_wardenwillsee},
-                        {"id": 3296, "flag": 0, "uiitem": self.lineAchiev_w4_voiceofdecease},
-                        {"id": 3392, "flag": 0, "uiitem": self.lineAchiev_w4_realraidertyr},
-                        {"id": 4020, "flag": 0, "uiitem": self.lineAchiev_w5_silencer},
-                        {"id": 3979, "flag": 0, "uiitem": self.lineAchiev_w5_deatheater},
-                        {"id": 3998, "flag": 0, "uiitem": self.lineAchiev_w5_deathsaver},
-                        {"id": 3993, "flag": 0, "uiitem": self.lineAchiev_w5_exileexecution},
-                        {"id": 4038, "flag": 0, "uiitem": self.lineAchiev_w5_icebreaker},
-                        {"id": 4033, "flag": 0, "uiitem": self.lineAchiev_w5_necrodancer},
-                        {"id": 4036, "flag": 0, "uiitem": self.lineAchiev_w5_soreeyes},
-                        {"id": 4004, "flag": 0, "uiitem": self.lineAchiev_w5_souledout},
-                        {"id": 4037, "flag": 0, "uiitem": self.lineAchiev_w5_statuesoflimit},
-                        {"id": 4010, "flag": 0, "uiitem": self.lineAchiev_w5_theferrywoman},
-                        {"id": 4016, "flag": 0, "uiitem": self.lineAchiev_w5_whatisdeathmay},
-                        {"id": 4423, "flag": 0, "uiitem": self.lineAchiev_w6_thunderfall},
-                        {"id": 4364, "flag": 0, "uiitem": self.lineAchiev_w6_aquaassasins},
-                        {"id": 4397, "flag": 0, "uiitem": self.lineAchiev_w6_dontgowater},
-                        {"id": 4415, "flag": 0, "uiitem": self.lineAchiev_w6_hardhats},
-                        {"id": 4355, "flag": 0, "uiitem": self.lineAchiev_w6_heroesofforge},
-                        {"id": 4429, "flag": 0, "uiitem": self.lineAchiev_w6_letsnotdothat},
-                        {"id": 4361, "flag": 0, "uiitem": self.lineAchiev_w6_manipulateman},
-                        {"id": 4409, "flag": 0, "uiitem": self.lineAchiev_w6_mythscholar},
-                        {"id": 4395, "flag": 0, "uiitem": self.lineAchiev_w6_regularstour},
-                        {"id": 4416, "flag": 0, "uiitem": self.lineAchiev_w6_somedisassem},
-                        {"id": 4388, "flag": 0, "uiitem": self.lineAchiev_w6_stackingswords},
-                        {"id": 4404, "flag": 0, "uiitem": self.lineAchiev_w6_takingturns},
-                        {"id": 4396, "flag": 0, "uiitem": self.lineAchiev_w6_firedjinnextin}]
-        # Flag the ones done
-        for api_achiev in api_achievs:
-            for achievement in achievements:
-                if api_achiev['id'] == achievement['id']:
-                    if api_achiev['done']:
-                        achievement['flag'] = 1
-                        break
-        # Set the UI
-        for achievement in achievements:
-            if achievement['flag'] == 1:
-                achievement['uiitem'].setStyleSheet(yes_style)
-            else:
-                achievement['uiitem'].setStyleSheet(no_style)
+        """Set the correct style for each item. `api_achievs` is a dict of id -> progress."""
+        states = {}
+        for achievement in RAID_CATALOG.ids("achievements"):
+            api_achiev = api_achievs.get(achievement)
+            states[achievement] = "yes" if api_achiev is not None and api_achiev['done'] else "no"
+        self.apply_grid_states("achievements", states)
 
     def reset_achievements(self):
         """Clean all achievements"""
-        # Get new color to paint based on theme
-        reset_style = self.adapt_line_theme("reset")
-        # Clean everything
-        achievements_fields = (
-            self.lineAchiev_w1_closure, self.lineAchiev_w1_lootfinder, self.lineAchiev_w1_piecingit,
-            self.lineAchiev_w1_beyondthevale, self.lineAchiev_w1_fleethestorm, self.lineAchiev_w1_rgb,
-            self.lineAchiev_w1_whitenoise, self.lineAchiev_w1_intothewoods, self.lineAchiev_w1_outranaghost,
-            self.lineAchiev_w1_keepthelights, self.lineAchiev_w1_quickmarch, self.lineAchiev_w1_puttorest,
-            self.lineAchiev_w1_angermanage, self.lineAchiev_w1_denied, self.lineAchiev_w1_spectralanomaly,
-            self.lineAchiev_w1_fireextinguish, self.lineAchiev_w1_backdraftd, self.lineAchiev_w1_lastcannon,
-            self.lineAchiev_w1_liftoff, self.lineAchiev_w1_myhero, self.lineAchiev_w1_undefeated,
-            self.lineAchiev_w2_scatteredm, self.lineAchiev_w2_thebigsleep, self.lineAchiev_w2_spmastery,
-            self.lineAchiev_w2_theshield, self.lineAchiev_w2_seimurwasw, self.lineAchiev_w2_avengerofpact,
-            self.lineAchiev_w2_slipperyslub, self.lineAchiev_w2_environmentally, self.lineAchiev_w2_spsadist,
-            self.lineAchiev_w3_siegethestrong, self.lineAchiev_w3_minecontrol, self.lineAchiev_w3_scourgeofwm,
-            self.lineAchiev_w3_deconstructed, self.lineAchiev_w3_traversethetc, self.lineAchiev_w3_dismantled,
-            self.lineAchiev_w3_downdownd, self.lineAchiev_w3_evasivemane, self.lineAchiev_w3_outrunawarg,
-            self.lineAchiev_w3_loveisbunny, self.lineAchiev_w3_mildlyinsane, self.lineAchiev_w4_attuned,
-            self.lineAchiev_w4_breakingin, self.lineAchiev_w4_freeatlast, self.lineAchiev_w4_greetedaslib,
-            self.lineAchiev_w4_harshsentence, self.lineAchiev_w4_justagame, self.lineAchiev_w4_jaded,
-            self.lineAchiev_w4_solitaryconfi, self.lineAchiev_w4_wardenwillsee, self.lineAchiev_w4_voiceofdecease,
-            self.lineAchiev_w4_realraidertyr, self.lineAchiev_w5_silencer, self.lineAchiev_w5_deatheater,
-            self.lineAchiev_w5_deathsaver, self.lineAchiev_w5_exileexecution, self.lineAchiev_w5_icebreaker,
-            self.lineAchiev_w5_necrodancer, self.lineAchiev_w5_soreeyes, self.lineAchiev_w5_souledout,
-            self.lineAchiev_w5_statuesoflimit, self.lineAchiev_w5_theferrywoman, self.lineAchiev_w5_whatisdeathmay,
-            self.lineAchiev_w6_thunderfall, self.lineAchiev_w6_aquaassasins, self.lineAchiev_w6_dontgowater,
-            self.lineAchiev_w6_hardhats, self.lineAchiev_w6_heroesofforge, self.lineAchiev_w6_letsnotdothat,
-            self.lineAchiev_w6_manipulateman, self.lineAchiev_w6_mythscholar, self.lineAchiev_w6_regularstour,
-            self.lineAchiev_w6_somedisassem, self.lineAchiev_w6_stackingswords, self.lineAchiev_w6_takingturns,
-            self.lineAchiev_w6_firedjinnextin)
-        for i in achievements_fields:
-            i.setStyleSheet(reset_style)
+        self.apply_grid_states("achievements", {achievement: "reset"
+                                                for achievement in RAID_CATALOG.ids("achievements")})
+
+    @staticmethod
+    def snapshot_achievements(api_achievs):
+        """What the snapshot keeps of the achievements section."""
+        return [api_achievs[achievement] for achievement in RAID_CATALOG.ids("achievements")
+                if achievement in api_achievs]
+
+    @staticmethod
+    def restore_achievements(api_achievs):
+        """Arguments of fill_achievements, from the snapshot."""
+        return ({api_achiev['id']: api_achiev for api_achiev in api_achievs},)
+
+    def filter_achievements(self, index):
+        """Show the achievements of the wing picked in the combo, or all of them."""
+        wing = self.comboAchievementsWing.itemData(index)
+        self.raid_grids['achievements'][None].set_wings(None if wing is None else (wing,))
 
     #################
     # MINIS SECTION #
     #################
 
-    def load_minis_section(self):
-        """Load minis section"""
-        if self.checkMinis.isChecked():
-            if "unlocks" in self.api_permissions:
-                api_minis = self.api_open("account/minis", token=self.api_key)
-                self.fill_minis(api_minis)
-            else:
-                self.reset_minis()
-                return "Minis need: Unlocks"
-        else:
-            self.reset_minis()
+    def fetch_minis_section(self, api_key, deadline=None, priority=INTERACTIVE):
+        """Get the data of the minis section."""
+        api_minis = self.api_open("account/minis", token=api_key, deadline=deadline, priority=priority)
+        return (UnlockSet(api_minis),)
 
     def fill_minis(self, api_minis):
-        """Set the correct style for each item."""
-        # Minis IDs
-        raid_minis = [{"id": 371, "flag": 0, "uiitem": self.label_Mini_redguardian},
-                      {"id": 376, "flag": 0, "uiitem": self.label_Mini_greenguardian},
-                      {"id": 373, "flag": 0, "uiitem": self.label_Mini_blueguardian},
-                      {"id": 368, "flag": 0, "uiitem": self.label_Mini_valeguardian},
-                      {"id": 372, "flag": 0, "uiitem": self.label_Mini_gorseval},
-                      {"id": 377, "flag": 0, "uiitem": self.label_Mini_knuckles},
-                      {"id": 375, "flag": 0, "uiitem": self.label_Mini_kernan},
-                      {"id": 370, "flag": 0, "uiitem": self.label_Mini_karde},
-                      {"id": 390, "flag": 0, "uiitem": self.label_Mini_slubling},
-                      {"id": 389, "flag": 0, "uiitem": self.label_Mini_slothasor},
-                      {"id": 393, "flag": 0, "uiitem": self.label_Mini_berg},
-                      {"id": 394, "flag": 0, "uiitem": self.label_Mini_zane},
-                      {"id": 392, "flag": 0, "uiitem": self.label_Mini_narella},
-                      {"id": 391, "flag": 0, "uiitem": self.label_Mini_matthias},
-                      {"id": 402, "flag": 0, "uiitem": self.label_Mini_mcleod},
-                      {"id": 403, "flag": 0, "uiitem": self.label_Mini_keepconstruct},
-                      {"id": 401, "flag": 0, "uiitem": self.label_Mini_xera},
-                      {"id": 441, "flag": 0, "uiitem": self.label_Mini_cairn},
-                      {"id": 438, "flag": 0, "uiitem": self.label_Mini_mursaat},
-                      {"id": 447, "flag": 0, "uiitem": self.label_Mini_eyeofjanthir},
-                      {"id": 442, "flag": 0, "uiitem": self.label_Mini_samarog},
-                      {"id": 440, "flag": 0, "uiitem": self.label_Mini_whitemantle},
-                      {"id": 436, "flag": 0, "uiitem": self.label_Mini_ragged_whitemantle},
-                      {"id": 622, "flag": 0, "uiitem": self.label_Mini_desmina},
-                      {"id": 621, "flag": 0, "uiitem": self.label_Mini_brokenking},
-                      {"id": 623, "flag": 0, "uiitem": self.label_Mini_dhuum},
-                      {"id": 722, "flag": 0, "uiitem": self.label_Mini_zommoros},
-                      {"id": 721, "flag": 0, "uiitem": self.label_Mini_kenut},
-                      {"id": 725, "flag": 0, "uiitem": self.label_Mini_nikare},
-                      {"id": 723, "flag": 0, "uiitem": self.label_Mini_qadim},
-                      {"id": 763, "flag": 0, "uiitem": self.label_Mini_keyofahdashim},
-                      {"id": 765, "flag": 0, "uiitem": self.label_Mini_djinnlamp},
-                      {"id": 764, "flag": 0, "uiitem": self.label_Mini_qadim2}]
-        # Flag the ones done
-        for your_mini in api_minis:
-            for mini in raid_minis:
-                if mini['id'] == your_mini:
-                    mini['flag'] = 1
-                    break
-        # Set the UI
-        for mini in raid_minis:
-            if mini['flag'] == 1:
-                yes_style = QGraphicsColorizeEffect(self)
-                yes_style.setColor(QColor(0, 150, 0))
-                mini['uiitem'].setGraphicsEffect(yes_style)
-            else:
-                no_style = QGraphicsColorizeEffect(self)
-                no_style.setColor(QColor(0, 0, 0))
-                mini['uiitem'].setGraphicsEffect(no_style)
+        """Set the correct style for each item. `api_minis` is the UnlockSet of the account."""
+        self.apply_grid_states("minis", {mini: "yes" if mini in api_minis else "grey"
+                                         for mini in RAID_CATALOG.ids("minis")})
 
     def reset_minis(self):
         """Clean all minis"""
-        # Clean everything
-        minis_fields = (self.label_Mini_redguardian, self.label_Mini_greenguardian, self.label_Mini_blueguardian,
-                        self.label_Mini_valeguardian, self.label_Mini_gorseval, self.label_Mini_knuckles,
-                        self.label_Mini_kernan, self.label_Mini_karde, self.label_Mini_slubling,
-                        self.label_Mini_slothasor, self.label_Mini_berg, self.label_Mini_zane,
-                        self.label_Mini_narella, self.label_Mini_matthias, self.label_Mini_mcleod,
-                        self.label_Mini_keepconstruct, self.label_Mini_xera, self.label_Mini_cairn,
-                        self.label_Mini_mursaat, self.label_Mini_eyeofjanthir, self.label_Mini_samarog,
-                        self.label_Mini_whitemantle, self.label_Mini_ragged_whitemantle, self.label_Mini_desmina,
-                        self.label_Mini_brokenking, self.label_Mini_dhuum, self.label_Mini_zommoros,
-                        self.label_Mini_kenut, self.label_Mini_nikare, self.label_Mini_qadim,
-                        self.label_Mini_keyofahdashim, self.label_Mini_djinnlamp, self.label_Mini_qadim2)
-        for i in minis_fields:
-            i.setGraphicsEffect(None)
+        self.apply_grid_states("minis", {mini: "reset" for mini in RAID_CATALOG.ids("minis")})
+
+    @staticmethod
+    def snapshot_minis(api_minis):
+        """What the snapshot keeps of the minis section: only the raid ones unlocked."""
+        return [mini for mini in RAID_CATALOG.ids("minis") if mini in api_minis]
+
+    @staticmethod
+    def restore_unlocks(unlocks):
+        """Arguments of fill_minis and fill_skins, from the snapshot."""
+        return (UnlockSet(unlocks),)
 
     #################
     # SKINS SECTION #
     #################
 
-    def load_skins_section(self):
-        """Load skins section"""
-        if self.checkSkins.isChecked():
-            if "unlocks" in self.api_permissions:
-                api_skins = self.api_open("account/skins", token=self.api_key)
-                self.fill_skins(api_skins)
-            else:
-                self.reset_skins()
-                return "Skins need: Unlocks"
-        else:
-            self.reset_skins()
+    def fetch_skins_section(self, api_key, deadline=None, priority=INTERACTIVE):
+        """Get the data of the skins section."""
+        api_skins = self.api_open("account/skins", token=api_key, deadline=deadline, priority=priority)
+        return (UnlockSet(api_skins),)
 
     def fill_skins(self, api_skins):
-        """Set the correct style for each item."""
-        # Skins IDs
-        raid_skins = [{"id": 6528, "flag": 0, "uiitem": self.label_Skin_vg_dagger},
-                      {"id": 6532, "flag": 0, "uiitem": self.label_Skin_vg_greatsword},
-                      {"id": 6536, "flag": 0, "uiitem": self.label_Skin_gorse_shield},
-                      {"id": 6531, "flag": 0, "uiitem": self.label_Skin_gorse_staff},
-                      {"id": 6141, "flag": 0, "uiitem": self.label_Skin_sab_rifle},
-                      {"id": 6135, "flag": 0, "uiitem": self.label_Skin_sab_back},
-                      {"id": 6642, "flag": 0, "uiitem": self.label_Skin_sloth_hammer},
-                      {"id": 6639, "flag": 0, "uiitem": self.label_Skin_sloth_focus},
-                      {"id": 6645, "flag": 0, "uiitem": self.label_Skin_matthias_staff},
-                      {"id": 6630, "flag": 0, "uiitem": self.label_Skin_matthias_greatsword},
-                      {"id": 6652, "flag": 0, "uiitem": self.label_Skin_matthias_longbow},
-                      {"id": 6638, "flag": 0, "uiitem": self.label_Skin_matthias_shortbow},
-                      {"id": 6649, "flag": 0, "uiitem": self.label_Skin_matthias_mace},
-                      {"id": 6651, "flag": 0, "uiitem": self.label_Skin_matthias_shield},
-                      {"id": 6626, "flag": 0, "uiitem": self.label_Skin_matthias_warhorn},
-                      {"id": 6635, "flag": 0, "uiitem": self.label_Skin_matthias_pistol},
-                      {"id": 6633, "flag": 0, "uiitem": self.label_Skin_matthias_torch},
-                      {"id": 6805, "flag": 0, "uiitem": self.label_Skin_kc_hammer},
-                      {"id": 6836, "flag": 0, "uiitem": self.label_Skin_kc_torch},
-                      {"id": 6821, "flag": 0, "uiitem": self.label_Skin_kc_focus},
-                      {"id": 6804, "flag": 0, "uiitem": self.label_Skin_kc_scepter},
-                      {"id": 6813, "flag": 0, "uiitem": self.label_Skin_xera_scepter},
-                      {"id": 6825, "flag": 0, "uiitem": self.label_Skin_xera_staff},
-                      {"id": 6835, "flag": 0, "uiitem": self.label_Skin_xera_rifle},
-                      {"id": 6788, "flag": 0, "uiitem": self.label_Skin_xera_sword},
-                      {"id": 6810, "flag": 0, "uiitem": self.label_Skin_xera_axe},
-                      {"id": 6815, "flag": 0, "uiitem": self.label_Skin_xera_dagger},
-                      {"id": 6809, "flag": 0, "uiitem": self.label_Skin_xera_back},
-                      {"id": 7101, "flag": 0, "uiitem": self.label_Skin_cairn_pistol},
-                      {"id": 7125, "flag": 0, "uiitem": self.label_Skin_cairn_sword},
-                      {"id": 7097, "flag": 0, "uiitem": self.label_Skin_mursaat_longbow},
-                      {"id": 7091, "flag": 0, "uiitem": self.label_Skin_samarog_axe},
-                      {"id": 7155, "flag": 0, "uiitem": self.label_Skin_samarog_shortbow},
-                      {"id": 7113, "flag": 0, "uiitem": self.label_Skin_samarog_staff},
-                      {"id": 7147, "flag": 0, "uiitem": self.label_Skin_samarog_warhorn},
-                      {"id": 7076, "flag": 0, "uiitem": self.label_Skin_deimos_mace},
-                      {"id": 7151, "flag": 0, "uiitem": self.label_Skin_deimos_hammer},
-                      {"id": 7104, "flag": 0, "uiitem": self.label_Skin_deimos_staff},
-                      {"id": 7114, "flag": 0, "uiitem": self.label_Skin_deimos_back},
-                      {"id": 7115, "flag": 0, "uiitem": self.label_Skin_deimos_gloves},
-                      {"id": 7909, "flag": 0, "uiitem": self.label_Skin_desmina_axe},
-                      {"id": 7894, "flag": 0, "uiitem": self.label_Skin_desmina_hammer},
-                      {"id": 7845, "flag": 0, "uiitem": self.label_Skin_river_shield},
-                      {"id": 7863, "flag": 0, "uiitem": self.label_Skin_river_sword},
-                      {"id": 7867, "flag": 0, "uiitem": self.label_Skin_statues_dagger},
-                      {"id": 7910, "flag": 0, "uiitem": self.label_Skin_statues_greatsword},
-                      {"id": 7881, "flag": 0, "uiitem": self.label_Skin_dhuum_staff},
-                      {"id": 7872, "flag": 0, "uiitem": self.label_Skin_dhuum_helm},
-                      {"id": 7871, "flag": 0, "uiitem": self.label_Skin_dhuum_shoulders},
-                      {"id": 7848, "flag": 0, "uiitem": self.label_Skin_dhuum_gloves},
-                      {"id": 7887, "flag": 0, "uiitem": self.label_Skin_dhuum_boots},
-                      {"id": 8412, "flag": 0, "uiitem": self.label_Skin_conjured_shield},
-                      {"id": 8398, "flag": 0, "uiitem": self.label_Skin_conjured_greatsword},
-                      {"id": 8337, "flag": 0, "uiitem": self.label_Skin_largos_sword},
-                      {"id": 8363, "flag": 0, "uiitem": self.label_Skin_largos_longbow},
-                      {"id": 8344, "flag": 0, "uiitem": self.label_Skin_qadim_mace},
-                      {"id": 8409, "flag": 0, "uiitem": self.label_Skin_qadim_pistol},
-                      {"id": 8800, "flag": 0, "uiitem": self.label_Skin_sabir_scepter},
-                      {"id": 8802, "flag": 0, "uiitem": self.label_Skin_sabir_warhorn},
-                      {"id": 8783, "flag": 0, "uiitem": self.label_Skin_adina_focus},
-                      {"id": 8803, "flag": 0, "uiitem": self.label_Skin_adina_rifle},
-                      {"id": 8793, "flag": 0, "uiitem": self.label_Skin_qadim_longbow},
-                      {"id": 8797, "flag": 0, "uiitem": self.label_Skin_qadim_torch}]
-        # Flag the ones done
-        for your_skin in api_skins:
-            for skin in raid_skins:
-                if skin['id'] == your_skin:
-                    skin['flag'] = 1
-                    break
-        # Set the UI
-        for skin in raid_skins:
-            if skin['flag'] == 1:
-                yes_style = QGraphicsColorizeEffect(self)
-                yes_style.setColor(QColor(0, 150, 0))
-                skin['uiitem'].setGraphicsEffect(yes_style)
-            else:
-                no_style = QGraphicsColorizeEffect(self)
-                no_style.setColor(QColor(150, 0, 0))
-                skin['uiitem'].setGraphicsEffect(no_style)
+        """Set the correct style for each item. `api_skins` is the UnlockSet of the account."""
+        self.apply_grid_states("skins", {skin: "yes" if skin in api_skins else "no"
+                                         for skin in RAID_CATALOG.ids("skins")})
 
     def reset_skins(self):
         """Clean all skins"""
-        # Clean everything
-        skins_fields = (self.label_Skin_vg_dagger, self.label_Skin_vg_greatsword, self.label_Skin_gorse_shield,
-                        self.label_Skin_gorse_staff, self.label_Skin_sab_rifle, self.label_Skin_sab_back,
-                        self.label_Skin_sloth_hammer, self.label_Skin_sloth_focus, self.label_Skin_matthias_staff,
-                        self.label_Skin_matthias_greatsword, self.label_Skin_matthias_longbow,
-                        self.label_Skin_matthias_shortbow, self.label_Skin_matthias_mace,
-                        self.label_Skin_matthias_shield, self.label_Skin_matthias_warhorn,
-                        self.label_Skin_matthias_pistol, self.label_Skin_matthias_torch,  self.label_Skin_kc_hammer,
-                        self.label_Skin_kc_torch, self.label_Skin_kc_focus, self.label_Skin_kc_scepter,
-                        self.label_Skin_xera_scepter, self.label_Skin_xera_staff, self.label_Skin_xera_rifle,
-                        self.label_Skin_xera_sword, self.label_Skin_xera_axe, self.label_Skin_xera_dagger,
-                        self.label_Skin_xera_back, self.label_Skin_cairn_pistol, self.label_Skin_cairn_sword,
-                        self.label_Skin_mursaat_longbow, self.label_Skin_samarog_axe,
-                        self.label_Skin_samarog_shortbow, self.label_Skin_samarog_staff,
-                        self.label_Skin_samarog_warhorn, self.label_Skin_deimos_mace, self.label_Skin_deimos_hammer,
-                        self.label_Skin_deimos_staff, self.label_Skin_deimos_back, self.label_Skin_deimos_gloves,
-                        self.label_Skin_desmina_axe, self.label_Skin_desmina_hammer, self.label_Skin_river_shield,
-                        self.label_Skin_river_sword, self.label_Skin_statues_dagger,
-                        self.label_Skin_statues_greatsword, self.label_Skin_dhuum_staff, self.label_Skin_dhuum_helm,
-                        self.label_Skin_dhuum_shoulders, self.label_Skin_dhuum_gloves, self.label_Skin_dhuum_boots,
-                        self.label_Skin_conjured_shield, self.label_Skin_conjured_greatsword,
-                        self.label_Skin_largos_sword, self.label_Skin_largos_longbow, self.label_Skin_qadim_mace,
-                        self.label_Skin_qadim_pistol, self.label_Skin_sabir_scepter, self.label_Skin_sabir_warhorn,
-                        self.label_Skin_adina_rifle, self.label_Skin_adina_focus, self.label_Skin_qadim_longbow,
-                        self.label_Skin_qadim_torch)
-        for i in skins_fields:
-            i.setGraphicsEffect(None)
+        self.apply_grid_states("skins", {skin: "reset" for skin in RAID_CATALOG.ids("skins")})
+
+    @staticmethod
+    def snapshot_skins(api_skins):
+        """What the snapshot keeps of the skins section: only the raid ones unlocked."""
+        return [skin for skin in RAID_CATALOG.ids("skins") if skin in api_skins]
 
 ##################
 # WINDOW ADD API #
@@ -1340,10 +1472,10 @@ class AddNewApi(QDialog, Ui_Dialog):
         """Validate the data. Get old keys. Add the new one. Store them."""
         # Validate the data
         if not len(self.lineKey.text()) == 72:
-            self.labelInfo.setStyleSheet("color: rgb(250, 0, 0);")
+            set_style_property(self.labelInfo, "status", "error")
             self.labelInfo.setText("Error: The provided Key doesn't fits 72 characters.")
         elif self.lineName.text() == "":
-            self.labelInfo.setStyleSheet("color: rgb(250, 0, 0);")
+            set_style_property(self.labelInfo, "status", "error")
             self.labelInfo.setText("Error: You must provide a name for that key.")
         else:
             self.labelInfo.clear()
@@ -1353,7 +1485,7 @@ class AddNewApi(QDialog, Ui_Dialog):
             keys.append({'name': self.lineName.text(), 'key': self.lineKey.text()})
             # Save them into file
             INI_OPTIONS.setValue("api_keys", keys)
-            self.labelInfo.setStyleSheet("color: rgb(0, 190, 0);")
+            set_style_property(self.labelInfo, "status", "success")
             self.labelInfo.setText("Success: Key stored.")
 
     def closeEvent(self, event):
@@ -1372,7 +1504,11 @@ if __name__ == "__main__":
     QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps)
     # Launch the app
     app = QApplication(sys.argv)
+    PROFILER.mark("QApplication")
+    initialize_settings()
+    PROFILER.mark("settings")
     # Launch the window
     window = MainForm()
+    PROFILER.mark("MainForm")
     window.show()
     sys.exit(app.exec_())
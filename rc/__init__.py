@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+
+"""Images of the program, registered in Qt under ":/".
+resources_rc.py (built by pyside2-rcc) is the only copy kept in the repository. resources.rcc, a bundle
+Qt maps from disk and reads an image of only when it's shown, is built out of it by build_rcc: when the
+program is packaged, or the first time it runs without one. If it can't be built, the module is imported.
+The ui modules don't import resources_rc (pyside2-uic adds that line, remove it when regenerating them),
+the images only have to be registered before a window is built."""
+from pathlib import Path
+
+MODULE_FILE = Path(__file__).with_name("resources_rc.py")
+RCC_FILE = Path(__file__).with_name("resources.rcc")
+
+
+def is_outdated(rcc_file=RCC_FILE, module_file=MODULE_FILE):
+    """Check if the bundle is missing or older than the module it's built from."""
+    if not rcc_file.is_file():
+        return True
+    try:
+        return rcc_file.stat().st_mtime < module_file.stat().st_mtime
+    except OSError:
+        return False  # Packaged with the bundle only
+
+
+def load_resources(rcc_file=RCC_FILE, module_file=MODULE_FILE):
+    """Register the images, from the bundle if possible (building it first if needed).
+    Returns what was used: "rcc" or "module"."""
+    from PySide2.QtCore import QResource
+    from rc.build_rcc import build_rcc
+    try:
+        if is_outdated(rcc_file, module_file):
+            build_rcc(module_file, rcc_file)
+        if QResource.registerResource(str(rcc_file)):
+            return "rcc"
+    except OSError:
+        pass
+    import rc.resources_rc
+    return "module"
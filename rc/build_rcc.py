@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+
+"""Build resources.rcc out of resources_rc.py. The program does it when the bundle is missing or older
+than the module, packages should have it built already:
+
+    python -m rc.build_rcc
+
+The module already has the three tables Qt needs (data, names and tree), a binary bundle
+is the same tables behind a small header, so no image has to be compiled again."""
+import ast
+import struct
+from pathlib import Path
+from rc import MODULE_FILE, RCC_FILE
+
+# Format of the tables written by pyside2-rcc (the first argument of qRegisterResourceData)
+RCC_VERSION = 1
+HEADER_SIZE = 20
+
+
+def read_tables(module_file=MODULE_FILE):
+    """Read the data, names and tree tables of a module built by pyside2-rcc, without running it."""
+    tables = {}
+    for node in ast.parse(module_file.read_bytes()).body:
+        if isinstance(node, ast.Assign):
+            for target in node.targets:
+                if isinstance(target, ast.Name) and target.id.startswith("qt_resource_"):
+                    tables[target.id] = ast.literal_eval(node.value)
+    return tables['qt_resource_data'], tables['qt_resource_name'], tables['qt_resource_struct']
+
+
+def build_rcc(module_file=MODULE_FILE, rcc_file=RCC_FILE):
+    """Write the bundle: "qres", the version and the offsets of the tree, data and names, then the tables.
+    Offsets inside the tables are relative to their own table, so they are copied as they are."""
+    data, names, tree = read_tables(module_file)
+    data_offset = HEADER_SIZE
+    names_offset = data_offset + len(data)
+    tree_offset = names_offset + len(names)
+    rcc_file = Path(rcc_file)
+    temporary = rcc_file.with_name(rcc_file.name + ".tmp")
+    with open(temporary, "wb") as f:
+        f.write(b"qres" + struct.pack(">iiii", RCC_VERSION, tree_offset, data_offset, names_offset))
+        f.write(data)
+        f.write(names)
+        f.write(tree)
+    temporary.replace(rcc_file)
+    return rcc_file
+
+
+if __name__ == "__main__":
+    print("Written {0}".format(build_rcc()))
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+
+"""The tests import the program modules (core, ui...) from the root of the repository.
+Helpers shared by the tests of HttpClient live here too."""
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+class FakeAnswer(object):
+    """What HttpClient._send gives back, without a socket."""
+    def __init__(self, status, headers=None):
+        self.status = status
+        self.reason = "Whatever"
+        self.headers = headers or {}
+        self.will_close = False
+
+    def getheaders(self):
+        return list(self.headers.items())
+
+
+@pytest.fixture
+def fake_send():
+    """Make a client answer without the network. `answers` are (status, headers, body) tuples,
+    or exceptions to raise, in order. Returns the list of the headers of every request sent."""
+    def install(client, answers):
+        answers = list(answers)
+        sent = []
+
+        def send(url, headers, timeout, consume, deadline=None):
+            sent.append(dict(headers or {}))
+            answer = answers.pop(0)
+            if isinstance(answer, Exception):
+                raise answer
+            status, answer_headers, body = answer
+            return FakeAnswer(status, answer_headers), (body, len(body))
+        client._send = send
+        return sent
+    return install
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+
+"""ResponseCache keys and the revalidation of cached answers by HttpClient."""
+import json
+import os
+
+import pytest
+
+from core.cache import ResponseCache, INDEX_FILE, token_fingerprint
+from core.http_client import HttpClient, HttpError
+
+API_KEY = "ABCDEF01-2345-6789-ABCD-EF0123456789ABCDEF01-2345-6789-ABCD-EF0123456789"
+URL = "https://api.guildwars2.com/v2/account/raids?access_token=" + API_KEY
+
+
+#######
+# KEY #
+#######
+
+def test_key_ignores_the_order_of_the_query():
+    assert ResponseCache.key_for(URL + "&ids=1,2") == ResponseCache.key_for(
+        "https://api.guildwars2.com/v2/account/raids?ids=1,2&access_token=" + API_KEY)
+
+
+def test_key_depends_on_the_token():
+    assert ResponseCache.key_for(URL) != ResponseCache.key_for(URL.replace("ABCDEF01", "00000000"))
+    assert ResponseCache.key_for(URL) != ResponseCache.key_for("https://api.guildwars2.com/v2/account/raids")
+
+
+def test_key_uses_the_fingerprint_of_the_token():
+    without_token = "https://api.guildwars2.com/v2/account/raids?access_token="
+    assert ResponseCache.key_for(URL) != ResponseCache.key_for(without_token + token_fingerprint(API_KEY))
+    assert token_fingerprint(API_KEY) not in ResponseCache.key_for(URL)
+
+
+def test_nothing_written_to_disk_has_the_token(tmp_path):
+    cache = ResponseCache(tmp_path)
+    cache.store(URL, {"etag": '"abc"', "cache-control": "max-age=300"}, b'["vale_guardian"]')
+    assert cache.read(URL) == b'["vale_guardian"]'
+    for path in tmp_path.iterdir():
+        assert API_KEY not in path.name
+        assert API_KEY.encode() not in path.read_bytes()
+    assert API_KEY not in (tmp_path / INDEX_FILE).read_text()
+    assert len(json.loads((tmp_path / INDEX_FILE).read_text())) == 1
+
+
+################
+# REVALIDATION #
+################
+
+def test_not_modified_uses_the_cached_copy(tmp_path, fake_send):
+    cache = ResponseCache(tmp_path)
+    cache.store(URL, {"etag": '"abc"'}, b'["vale_guardian"]')
+    client = HttpClient(cache=cache)
+    sent = fake_send(client, [(304, {"etag": '"abc"'}, b"")])
+    response = client.request(URL)
+    assert response.json() == ["vale_guardian"]
+    assert response.from_cache
+    assert sent[0]["If-None-Match"] == '"abc"'
+
+
+def test_not_modified_without_cached_copy_asks_again_without_conditions(tmp_path, fake_send):
+    cache = ResponseCache(tmp_path)
+    cache.store(URL, {"etag": '"abc"'}, b'["vale_guardian"]')
+    client = HttpClient(cache=cache)
+    # The copy vanishes between the conditional request and its answer
+    sent = fake_send(client, [(304, {"etag": '"abc"'}, b""), (200, {"etag": '"def"'}, b'["gorseval"]')])
+    send = client._send
+
+    def send_and_evict(*arguments, **keyarguments):
+        cache.clear()
+        return send(*arguments, **keyarguments)
+    client._send = send_and_evict
+    assert client.request(URL).json() == ["gorseval"]
+    assert "If-None-Match" in sent[0]
+    assert "If-None-Match" not in sent[1]
+    assert cache.read(URL) == b'["gorseval"]'
+
+
+def test_not_modified_to_caller_conditions_asks_again_without_them(tmp_path, fake_send):
+    client = HttpClient(cache=ResponseCache(tmp_path))
+    sent = fake_send(client, [(304, {}, b""), (200, {}, b'{"id": 1}')])
+    assert client.request(URL, headers={"If-None-Match": '"abc"'}).json() == {"id": 1}
+    assert "If-None-Match" not in sent[1]
+
+
+def test_not_modified_is_never_stored_as_an_empty_body(tmp_path, fake_send):
+    cache = ResponseCache(tmp_path)
+    client = HttpClient(cache=cache)
+    fake_send(client, [(304, {"etag": '"abc"'}, b"")])
+    with pytest.raises(HttpError):
+        client.request(URL)
+    assert cache.lookup(URL) is None
+
+
+#############
+# FRESHNESS #
+#############
+
+def test_fresh_copies_are_served_without_asking(tmp_path, fake_send):
+    cache = ResponseCache(tmp_path)
+    cache.store(URL, {"cache-control": "max-age=300"}, b'["vale_guardian"]')
+    client = HttpClient(cache=cache)
+    sent = fake_send(client, [])
+    assert client.request(URL).from_cache
+    assert sent == []
+
+
+def test_revalidated_copy_is_fresh_again(tmp_path):
+    cache = ResponseCache(tmp_path)
+    cache.store(URL, {"etag": '"abc"', "cache-control": "max-age=0"}, b'["vale_guardian"]')
+    assert not cache.is_fresh(cache.lookup(URL))
+    cache.revalidated(URL, {"cache-control": "max-age=300", "etag": '"def"'})
+    entry = cache.lookup(URL)
+    assert cache.is_fresh(entry)
+    assert cache.conditional_headers(entry) == {"If-None-Match": '"def"'}
+
+
+def test_uncacheable_answers_are_not_stored(tmp_path):
+    cache = ResponseCache(tmp_path)
+    cache.store(URL, {"etag": '"abc"', "cache-control": "no-store"}, b"[]")
+    cache.store(URL + "&v=2", {}, b"[]")
+    assert cache.lookup(URL) is None and cache.lookup(URL + "&v=2") is None
+
+
+def test_least_recently_used_copies_go_first(tmp_path):
+    body = os.urandom(1000)  # Doesn't compress, so each copy takes about 1 KB
+    cache = ResponseCache(tmp_path, max_size=2500)
+    urls = ["https://api.guildwars2.com/v2/items/{0}".format(item) for item in range(3)]
+    cache.store(urls[0], {"etag": '"0"'}, body)
+    cache.store(urls[1], {"etag": '"1"'}, body)
+    assert cache.read(urls[0]) == body
+    cache.store(urls[2], {"etag": '"2"'}, body)
+    assert cache.lookup(urls[1]) is None
+    assert cache.lookup(urls[0]) is not None and cache.lookup(urls[2]) is not None
+    assert cache.size() <= 2500
+    # And the index on disk agrees
+    assert ResponseCache(tmp_path).lookup(urls[1]) is None
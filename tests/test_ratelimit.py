@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+
+"""Token buckets and the order in which the scheduler lets requests go."""
+import threading
+import time
+
+import pytest
+
+from core.deadline import Deadline, Cancelled
+from core.ratelimit import TokenBucket, RequestScheduler, INTERACTIVE, BACKGROUND
+
+
+def test_bucket_starts_full_and_refills_at_its_rate():
+    bucket = TokenBucket(rate=2, burst=3)
+    now = bucket._updated
+    for _ in range(3):
+        assert bucket.wait_time(now) == 0
+        bucket.take(now)
+    assert bucket.wait_time(now) == pytest.approx(0.5)
+    assert bucket.wait_time(now + 0.5) == 0
+    # Never more than the burst, however long it waits
+    assert bucket.wait_time(now + 100, tokens=4) == pytest.approx(0.5)
+
+
+def test_burst_goes_without_waiting():
+    scheduler = RequestScheduler(global_rate=1, global_burst=5, key_rate=1, key_burst=5)
+    start = time.monotonic()
+    assert all(scheduler.acquire("key") for _ in range(5))
+    assert time.monotonic() - start < 0.5
+
+
+def test_timeout_when_there_are_no_tokens():
+    scheduler = RequestScheduler(global_rate=0.1, global_burst=1)
+    assert scheduler.acquire()
+    start = time.monotonic()
+    assert not scheduler.acquire(timeout=0.1)
+    assert time.monotonic() - start < 1
+    assert scheduler.queue_depth() == 0
+
+
+def test_cancelling_leaves_the_queue_at_once():
+    scheduler = RequestScheduler(global_rate=0.1, global_burst=1)
+    assert scheduler.acquire()
+    deadline = Deadline(3)
+    threading.Timer(0.1, deadline.cancel).start()
+    start = time.monotonic()
+    with pytest.raises(Cancelled):
+        scheduler.acquire(timeout=deadline.remaining(), cancellable=deadline)
+    assert time.monotonic() - start < 1
+    assert scheduler.queue_depth() == 0
+    assert deadline._callbacks == set()
+
+
+def test_already_cancelled_never_waits():
+    scheduler = RequestScheduler()
+    deadline = Deadline()
+    deadline.cancel()
+    with pytest.raises(Cancelled):
+        scheduler.acquire(cancellable=deadline)
+    # It didn't spend a token either
+    assert scheduler.global_bucket.tokens == scheduler.global_bucket.burst
+
+
+def test_each_key_has_its_own_budget():
+    scheduler = RequestScheduler(global_rate=100, global_burst=100, key_rate=0.1, key_burst=2)
+    assert scheduler.acquire("first") and scheduler.acquire("first")
+    assert not scheduler.acquire("first", timeout=0.05)
+    assert scheduler.acquire("second", timeout=0.05)
+    # Requests without key only use the global bucket
+    assert scheduler.acquire(None, timeout=0.05)
+
+
+def test_interactive_requests_go_before_background_ones():
+    scheduler = RequestScheduler(global_rate=5, global_burst=1)
+    assert scheduler.acquire()
+    order = []
+
+    def request(priority):
+        scheduler.acquire(priority=priority, timeout=5)
+        order.append(priority)
+    background = threading.Thread(target=request, args=(BACKGROUND,))
+    background.start()
+    while scheduler.queue_depth(BACKGROUND) == 0:
+        time.sleep(0.001)
+    interactive = threading.Thread(target=request, args=(INTERACTIVE,))
+    interactive.start()
+    background.join(5)
+    interactive.join(5)
+    assert order == [INTERACTIVE, BACKGROUND]
+
+
+def test_expected_wait_counts_the_requests_ahead():
+    scheduler = RequestScheduler(global_rate=10, global_burst=1, key_rate=1, key_burst=1)
+    assert scheduler.expected_wait("key") == 0
+    assert scheduler.acquire("key")
+    # The key bucket is the slow one
+    assert scheduler.expected_wait("key") == pytest.approx(1, abs=0.05)
+    assert scheduler.expected_wait("other") == pytest.approx(0.1, abs=0.05)
+    assert scheduler.expected_wait() == pytest.approx(0.1, abs=0.05)
@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+
+"""Retry policy, circuit breaker and how HttpClient uses them."""
+import socket
+import time
+from email.utils import formatdate
+
+import pytest
+
+from core.cache import ResponseCache
+from core.deadline import Deadline, Cancelled, DeadlineExceeded
+from core.http_client import HttpClient, HttpError
+from core.ratelimit import RequestScheduler
+from core.retry import RetryPolicy, CircuitBreaker, CircuitOpenError, retry_after_seconds
+
+URL = "https://api.guildwars2.com/v2/build"
+
+
+def error(status, headers=None):
+    return HttpError(URL, status, "Whatever", headers)
+
+
+##########
+# POLICY #
+##########
+
+def test_what_is_retried():
+    policy = RetryPolicy(max_attempts=3)
+    assert policy.should_retry(error(502), 1)
+    assert policy.should_retry(error(429), 1)
+    assert policy.should_retry(socket.timeout(), 2)
+    assert not policy.should_retry(error(502), 3)
+    assert not policy.should_retry(error(404), 1)
+    assert not policy.should_retry(ValueError(), 1)
+
+
+def test_too_many_requests_is_not_a_server_failure():
+    assert RetryPolicy.is_server_failure(error(503))
+    assert RetryPolicy.is_server_failure(ConnectionResetError())
+    assert not RetryPolicy.is_server_failure(error(429))
+    assert not RetryPolicy.is_server_failure(error(400))
+
+
+def test_delay_grows_and_is_capped():
+    policy = RetryPolicy(base_delay=0.5, max_delay=2.0)
+    for _ in range(100):
+        assert 0 <= policy.delay(1) <= 0.5
+        assert 0 <= policy.delay(2) <= 1.0
+        assert 0 <= policy.delay(10) <= 2.0
+
+
+def test_delay_follows_retry_after():
+    policy = RetryPolicy(max_retry_after=30.0)
+    assert policy.delay(1, error(429, {"retry-after": "7"})) == 7
+    assert policy.delay(1, error(429, {"retry-after": "3600"})) == 30
+    assert retry_after_seconds({"retry-after": formatdate(time.time() + 60, usegmt=True)}) == pytest.approx(60, abs=2)
+    assert retry_after_seconds({"retry-after": "soon"}) is None
+    assert retry_after_seconds(None) is None
+
+
+###################
+# CIRCUIT BREAKER #
+###################
+
+def test_breaker_opens_after_failures_in_a_row():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+    assert breaker.counters.snapshot() == {"breaker_opened": 1, "breaker_rejected": 1}
+
+
+def test_breaker_lets_a_single_trial_through_once_the_timeout_passes():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    breaker.record_failure()
+    assert breaker.allow()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert not breaker.allow()
+    # A failed trial opens it again, a good one closes it
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow() and breaker.allow()
+
+
+def test_released_trial_can_be_tried_again():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.release_trial()
+    assert breaker.allow()
+
+
+def test_trial_is_released_when_the_deadline_runs_out_before_sending(fake_send):
+    scheduler = RequestScheduler(global_rate=0.1, global_burst=1)
+    assert scheduler.acquire()
+    client = no_wait_client(scheduler=scheduler)
+    breaker = client._breaker_for("api.guildwars2.com")
+    breaker.failure_threshold = 1
+    breaker.reset_timeout = 0
+    breaker.record_failure()
+    # The trial waits for the rate limit until its deadline runs out, without being sent
+    with pytest.raises(DeadlineExceeded):
+        client.request(URL, deadline=Deadline(0.05))
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    fake_send(client, answers(200))
+    client.scheduler = None
+    assert client.request(URL).json() == {"id": 1}
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_trial_is_released_when_cancelled_before_sending():
+    client = no_wait_client()
+    breaker = client._breaker_for("api.guildwars2.com")
+    breaker.failure_threshold = 1
+    breaker.reset_timeout = 0
+    breaker.record_failure()
+    deadline = Deadline()
+    deadline.cancel()
+    with pytest.raises(Cancelled):
+        client.request(URL, deadline=deadline)
+    assert breaker.allow()
+
+
+###############
+# HTTP CLIENT #
+###############
+
+def answers(*statuses):
+    """Answers for fake_send: a JSON for a 200, an empty body for the other statuses, exceptions as they are."""
+    return [status if isinstance(status, Exception) else
+            (status, {"etag": '"1"'}, b'{"id": 1}') if status == 200 else (status, {}, b"")
+            for status in statuses]
+
+
+def no_wait_client(**keyarguments):
+    """HttpClient that doesn't wait to retry."""
+    return HttpClient(retry_policy=RetryPolicy(base_delay=0), **keyarguments)
+
+
+def test_transient_failures_are_retried(fake_send):
+    client = no_wait_client()
+    sent = fake_send(client, answers(502, ConnectionResetError(), 200))
+    assert client.request(URL).json() == {"id": 1}
+    assert len(sent) == 3
+    assert client.counters.snapshot()["retries"] == 2
+
+
+def test_client_errors_are_not_retried(fake_send):
+    client = no_wait_client()
+    sent = fake_send(client, answers(404))
+    with pytest.raises(HttpError):
+        client.request(URL)
+    assert len(sent) == 1
+
+
+def test_open_breaker_serves_the_cached_copy(tmp_path, fake_send):
+    client = no_wait_client(cache=ResponseCache(tmp_path))
+    sent = fake_send(client, answers(200, *[503] * 6))
+    client._breaker_for("api.guildwars2.com").failure_threshold = 3
+    assert not client.request(URL).from_cache
+    # Failing until the breaker opens, then the copy is served without asking
+    for _ in range(2):
+        response = client.request(URL)
+        assert response.stale and response.json() == {"id": 1}
+    count = len(sent)
+    assert client.request(URL).stale
+    assert len(sent) == count
+
+
+def test_open_breaker_without_cached_copy_fails_at_once(fake_send):
+    client = no_wait_client()
+    sent = fake_send(client, answers(503, 503, 503))
+    client._breaker_for("api.guildwars2.com").failure_threshold = 3
+    with pytest.raises(HttpError):
+        client.request(URL)
+    with pytest.raises(CircuitOpenError):
+        client.request(URL)
+    assert len(sent) == 3
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+
+"""Snapshots of the last data of each key, and the weekly reset that makes the bosses ones old."""
+from datetime import datetime, timezone
+
+from core.snapshot import SnapshotStore, last_weekly_reset, changed_since_weekly_reset
+
+API_KEY = "ABCDEF01-2345-6789-ABCD-EF0123456789ABCDEF01-2345-6789-ABCD-EF0123456789"
+
+
+def at(*date):
+    """Seconds since the epoch of a UTC date."""
+    return datetime(*date, tzinfo=timezone.utc).timestamp()
+
+
+def test_snapshot_round_trip_without_the_key_on_disk(tmp_path):
+    store = SnapshotStore(tmp_path)
+    store.save(API_KEY, {"Bosses": ["vale_guardian"]}, {"Bosses": "2026-10-12T08:00:00Z"})
+    _, sections, versions = store.load(API_KEY)
+    assert sections == {"Bosses": ["vale_guardian"]}
+    assert versions == {"Bosses": "2026-10-12T08:00:00Z"}
+    assert all(API_KEY not in path.name for path in tmp_path.iterdir())
+    store.delete(API_KEY)
+    assert store.load(API_KEY) is None
+
+
+def test_last_weekly_reset():
+    # 2026-10-12 is a Monday
+    assert last_weekly_reset(at(2026, 10, 14, 12, 0)) == at(2026, 10, 12, 7, 30)
+    assert last_weekly_reset(at(2026, 10, 12, 7, 30)) == at(2026, 10, 12, 7, 30)
+    assert last_weekly_reset(at(2026, 10, 12, 7, 29)) == at(2026, 10, 5, 7, 30)
+    assert last_weekly_reset(at(2026, 10, 18, 23, 59)) == at(2026, 10, 12, 7, 30)
+
+
+def test_changed_since_weekly_reset():
+    now = at(2026, 10, 14, 12, 0)
+    assert changed_since_weekly_reset("2026-10-13T20:00:00Z", now)
+    assert not changed_since_weekly_reset("2026-10-11T20:00:00Z", now)
+    assert not changed_since_weekly_reset("not a date", now)
+    assert not changed_since_weekly_reset(None, now)
@@ -16,7 +16,6 @@ class Ui_Dialog(object):
         Dialog.resize(581, 90)
         self.lineKey = QtWidgets.QLineEdit(Dialog)
         self.lineKey.setGeometry(QtCore.QRect(70, 20, 501, 20))
-        self.lineKey.setStyleSheet("background-color: rgb(255,250,209);")
         self.lineKey.setAlignment(QtCore.Qt.AlignCenter)
         self.lineKey.setObjectName("lineKey")
         self.label = QtWidgets.QLabel(Dialog)
@@ -25,7 +24,6 @@ class Ui_Dialog(object):
         self.label.setObjectName("label")
         self.lineName = QtWidgets.QLineEdit(Dialog)
         self.lineName.setGeometry(QtCore.QRect(70, 50, 111, 20))
-        self.lineName.setStyleSheet("background-color: rgb(255,250,209);")
         self.lineName.setAlignment(QtCore.Qt.AlignCenter)
         self.lineName.setObjectName("lineName")
         self.label_2 = QtWidgets.QLabel(Dialog)
@@ -34,7 +32,6 @@ class Ui_Dialog(object):
         self.label_2.setObjectName("label_2")
         self.buttonSave = QtWidgets.QPushButton(Dialog)
         self.buttonSave.setGeometry(QtCore.QRect(490, 50, 81, 31))
-        self.buttonSave.setStyleSheet("background-color: rgb(170, 208, 169);")
         icon = QtGui.QIcon()
         icon.addPixmap(QtGui.QPixmap("Images/Save.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
         self.buttonSave.setIcon(icon)
@@ -42,7 +39,6 @@ class Ui_Dialog(object):
         self.buttonSave.setObjectName("buttonSave")
         self.labelInfo = QtWidgets.QLabel(Dialog)
         self.labelInfo.setGeometry(QtCore.QRect(190, 50, 291, 21))
-        self.labelInfo.setStyleSheet("color: rgb(255, 0, 0);")
         self.labelInfo.setText("")
         self.labelInfo.setAlignment(QtCore.Qt.AlignCenter)
         self.labelInfo.setObjectName("labelInfo")
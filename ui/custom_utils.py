@@ -15,6 +15,13 @@ class ThemedLayout(QWidget):
         QWidget.__init__(self, parent)
 
 
+def set_style_property(widget, name, value):
+    """Set a property the stylesheet of the application picks the style of a widget with, and paint it again."""
+    widget.setProperty(name, value)
+    widget.style().unpolish(widget)
+    widget.style().polish(widget)
+
+
 ###########################################
 ################ QMESSAGEBOX ##############
 ###########################################
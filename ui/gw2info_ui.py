@@ -23,17 +23,14 @@ class Ui_MainWindow(object):
         self.label_32.setObjectName("label_32")
         self.buttonThemeDefault = QtWidgets.QPushButton(self.MainLayout)
         self.buttonThemeDefault.setGeometry(QtCore.QRect(190, 20, 41, 21))
-        self.buttonThemeDefault.setStyleSheet("background-color: rgb(170, 208, 169);")
         self.buttonThemeDefault.setIconSize(QtCore.QSize(20, 20))
         self.buttonThemeDefault.setObjectName("buttonThemeDefault")
         self.buttonThemeLight = QtWidgets.QPushButton(self.MainLayout)
         self.buttonThemeLight.setGeometry(QtCore.QRect(270, 20, 41, 21))
-        self.buttonThemeLight.setStyleSheet("background-color: rgb(170, 208, 169);")
         self.buttonThemeLight.setIconSize(QtCore.QSize(20, 20))
         self.buttonThemeLight.setObjectName("buttonThemeLight")
         self.buttonThemeDark = QtWidgets.QPushButton(self.MainLayout)
         self.buttonThemeDark.setGeometry(QtCore.QRect(230, 20, 41, 21))
-        self.buttonThemeDark.setStyleSheet("background-color: rgb(170, 208, 169);")
         self.buttonThemeDark.setIconSize(QtCore.QSize(20, 20))
         self.buttonThemeDark.setObjectName("buttonThemeDark")
         self.buttonLanguage_spanish = QtWidgets.QPushButton(self.MainLayout)
@@ -75,46 +72,23 @@ class Ui_MainWindow(object):
         self.plainDebugger.setObjectName("plainDebugger")
         self.tabOptions = QtWidgets.QTabWidget(self.MainLayout)
         self.tabOptions.setGeometry(QtCore.QRect(10, 50, 331, 521))
-        self.tabOptions.setStyleSheet(" /* The tab menu buttons */\n"
-"QTabBar::tab {\n"
-"    border: 2px solid gray;\n"
-"    border-bottom: 0px;\n"
-"    border-top-left-radius: 6px;\n"
-"    border-top-right-radius: 6px;\n"
-"    padding: 2px;}\n"
-"\n"
-" /* The tab specific buttons */\n"
-"QTabBar::tab:selected {border-color: black;background-color: gray;}\n"
-"QTabBar::tab:hover {background-color: gray;}\n"
-"\n"
-" /* The tab widget frame */\n"
-"QTabWidget::pane {\n"
-"    border: 2px solid gray;\n"
-"    border-top-right-radius: 5px;\n"
-"    border-bottom-right-radius: 5px;\n"
-"    border-bottom-left-radius: 5px;\n"
-"    padding: 2px;\n"
-"}")
         self.tabOptions.setObjectName("tabOptions")
         self.tab_api = ThemedLayout()
         self.tab_api.setObjectName("tab_api")
         self.linePermission_Wallet = QtWidgets.QLineEdit(self.tab_api)
         self.linePermission_Wallet.setGeometry(QtCore.QRect(170, 90, 61, 20))
-        self.linePermission_Wallet.setStyleSheet("background-color: rgb(150, 150, 150);")
         self.linePermission_Wallet.setFrame(False)
         self.linePermission_Wallet.setAlignment(QtCore.Qt.AlignCenter)
         self.linePermission_Wallet.setReadOnly(True)
         self.linePermission_Wallet.setObjectName("linePermission_Wallet")
         self.linePermission_Tradingpost = QtWidgets.QLineEdit(self.tab_api)
         self.linePermission_Tradingpost.setGeometry(QtCore.QRect(90, 130, 71, 20))
-        self.linePermission_Tradingpost.setStyleSheet("background-color: rgb(150, 150, 150);")
         self.linePermission_Tradingpost.setFrame(False)
         self.linePermission_Tradingpost.setAlignment(QtCore.Qt.AlignCenter)
         self.linePermission_Tradingpost.setReadOnly(True)
         self.linePermission_Tradingpost.setObjectName("linePermission_Tradingpost")
         self.buttonAddAPI = QtWidgets.QPushButton(self.tab_api)
         self.buttonAddAPI.setGeometry(QtCore.QRect(90, 210, 121, 31))
-        self.buttonAddAPI.setStyleSheet("background-color: rgb(170, 208, 169);")
         icon4 = QtGui.QIcon()
         icon4.addPixmap(QtGui.QPixmap(":/images/Images/Save.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
         self.buttonAddAPI.setIcon(icon4)
@@ -130,14 +104,12 @@ class Ui_MainWindow(object):
         self.label_25.setObjectName("label_25")
         self.linePermission_Account = QtWidgets.QLineEdit(self.tab_api)
         self.linePermission_Account.setGeometry(QtCore.QRect(10, 110, 71, 20))
-        self.linePermission_Account.setStyleSheet("background-color: rgb(150, 150, 150);")
         self.linePermission_Account.setFrame(False)
         self.linePermission_Account.setAlignment(QtCore.Qt.AlignCenter)
         self.linePermission_Account.setReadOnly(True)
         self.linePermission_Account.setObjectName("linePermission_Account")
         self.buttonWebsite_Anet = QtWidgets.QPushButton(self.tab_api)
         self.buttonWebsite_Anet.setGeometry(QtCore.QRect(10, 210, 71, 31))
-        self.buttonWebsite_Anet.setStyleSheet("background-color: rgb(170, 208, 169);")
         icon5 = QtGui.QIcon()
         icon5.addPixmap(QtGui.QPixmap(":/images/Images/Browser.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
         self.buttonWebsite_Anet.setIcon(icon5)
@@ -145,21 +117,18 @@ class Ui_MainWindow(object):
         self.buttonWebsite_Anet.setObjectName("buttonWebsite_Anet")
         self.linePermission_Unlocks = QtWidgets.QLineEdit(self.tab_api)
         self.linePermission_Unlocks.setGeometry(QtCore.QRect(170, 110, 61, 20))
-        self.linePermission_Unlocks.setStyleSheet("background-color: rgb(150, 150, 150);")
         self.linePermission_Unlocks.setFrame(False)
         self.linePermission_Unlocks.setAlignment(QtCore.Qt.AlignCenter)
         self.linePermission_Unlocks.setReadOnly(True)
         self.linePermission_Unlocks.setObjectName("linePermission_Unlocks")
         self.linePermission_Characters = QtWidgets.QLineEdit(self.tab_api)
         self.linePermission_Characters.setGeometry(QtCore.QRect(90, 110, 71, 20))
-        self.linePermission_Characters.setStyleSheet("background-color: rgb(150, 150, 150);")
         self.linePermission_Characters.setFrame(False)
         self.linePermission_Characters.setAlignment(QtCore.Qt.AlignCenter)
         self.linePermission_Characters.setReadOnly(True)
         self.linePermission_Characters.setObjectName("linePermission_Characters")
         self.buttonDeleteAPI = QtWidgets.QPushButton(self.tab_api)
         self.buttonDeleteAPI.setGeometry(QtCore.QRect(220, 210, 91, 31))
-        self.buttonDeleteAPI.setStyleSheet("background-color: rgb(170, 208, 169);")
         icon6 = QtGui.QIcon()
         icon6.addPixmap(QtGui.QPixmap(":/images/Images/Delete.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
         self.buttonDeleteAPI.setIcon(icon6)
@@ -167,28 +136,24 @@ class Ui_MainWindow(object):
         self.buttonDeleteAPI.setObjectName("buttonDeleteAPI")
         self.linePermission_PvP = QtWidgets.QLineEdit(self.tab_api)
         self.linePermission_PvP.setGeometry(QtCore.QRect(240, 90, 71, 20))
-        self.linePermission_PvP.setStyleSheet("background-color: rgb(150, 150, 150);")
         self.linePermission_PvP.setFrame(False)
         self.linePermission_PvP.setAlignment(QtCore.Qt.AlignCenter)
         self.linePermission_PvP.setReadOnly(True)
         self.linePermission_PvP.setObjectName("linePermission_PvP")
         self.linePermission_Guilds = QtWidgets.QLineEdit(self.tab_api)
         self.linePermission_Guilds.setGeometry(QtCore.QRect(170, 130, 61, 20))
-        self.linePermission_Guilds.setStyleSheet("background-color: rgb(150, 150, 150);")
         self.linePermission_Guilds.setFrame(False)
         self.linePermission_Guilds.setAlignment(QtCore.Qt.AlignCenter)
         self.linePermission_Guilds.setReadOnly(True)
         self.linePermission_Guilds.setObjectName("linePermission_Guilds")
         self.linePermission_Progression = QtWidgets.QLineEdit(self.tab_api)
         self.linePermission_Progression.setGeometry(QtCore.QRect(240, 130, 71, 20))
-        self.linePermission_Progression.setStyleSheet("background-color: rgb(150, 150, 150);")
         self.linePermission_Progression.setFrame(False)
         self.linePermission_Progression.setAlignment(QtCore.Qt.AlignCenter)
         self.linePermission_Progression.setReadOnly(True)
         self.linePermission_Progression.setObjectName("linePermission_Progression")
         self.buttonLoad = QtWidgets.QPushButton(self.tab_api)
         self.buttonLoad.setGeometry(QtCore.QRect(220, 22, 91, 31))
-        self.buttonLoad.setStyleSheet("background-color: rgb(170, 208, 169);")
         icon7 = QtGui.QIcon()
         icon7.addPixmap(QtGui.QPixmap(":/images/Images/Refresh.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
         self.buttonLoad.setIcon(icon7)
@@ -199,14 +164,12 @@ class Ui_MainWindow(object):
         self.comboSelectAPI.setObjectName("comboSelectAPI")
         self.linePermission_Inventories = QtWidgets.QLineEdit(self.tab_api)
         self.linePermission_Inventories.setGeometry(QtCore.QRect(10, 130, 71, 20))
-        self.linePermission_Inventories.setStyleSheet("background-color: rgb(150, 150, 150);")
         self.linePermission_Inventories.setFrame(False)
         self.linePermission_Inventories.setAlignment(QtCore.Qt.AlignCenter)
         self.linePermission_Inventories.setReadOnly(True)
         self.linePermission_Inventories.setObjectName("linePermission_Inventories")
         self.linePermission_Builds = QtWidgets.QLineEdit(self.tab_api)
         self.linePermission_Builds.setGeometry(QtCore.QRect(240, 110, 71, 20))
-        self.linePermission_Builds.setStyleSheet("background-color: rgb(150, 150, 150);")
         self.linePermission_Builds.setFrame(False)
         self.linePermission_Builds.setAlignment(QtCore.Qt.AlignCenter)
         self.linePermission_Builds.setReadOnly(True)
@@ -218,7 +181,6 @@ class Ui_MainWindow(object):
         self.line_13.setObjectName("line_13")
         self.buttonDebugger = QtWidgets.QPushButton(self.tab_api)
         self.buttonDebugger.setGeometry(QtCore.QRect(10, 450, 151, 31))
-        self.buttonDebugger.setStyleSheet("background-color: rgb(170, 208, 169);")
         self.buttonDebugger.setIconSize(QtCore.QSize(20, 20))
         self.buttonDebugger.setObjectName("buttonDebugger")
         self.label_54 = QtWidgets.QLabel(self.tab_api)
@@ -229,12 +191,10 @@ class Ui_MainWindow(object):
         self.label_54.setObjectName("label_54")
         self.buttonDonate = QtWidgets.QPushButton(self.tab_api)
         self.buttonDonate.setGeometry(QtCore.QRect(170, 450, 141, 31))
-        self.buttonDonate.setStyleSheet("background-color: rgb(170, 208, 169);")
         self.buttonDonate.setIconSize(QtCore.QSize(20, 20))
         self.buttonDonate.setObjectName("buttonDonate")
         self.label_33 = QtWidgets.QLabel(self.tab_api)
         self.label_33.setGeometry(QtCore.QRect(10, 60, 301, 21))
-        self.label_33.setStyleSheet("color: rgb(111, 111, 111);")
         self.label_33.setTextFormat(QtCore.Qt.RichText)
         self.label_33.setAlignment(QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft|QtCore.Qt.AlignTop)
         self.label_33.setWordWrap(True)
@@ -246,7 +206,6 @@ class Ui_MainWindow(object):
         self.line_2.setObjectName("line_2")
         self.label_36 = QtWidgets.QLabel(self.tab_api)
         self.label_36.setGeometry(QtCore.QRect(10, 160, 301, 41))
-        self.label_36.setStyleSheet("color: rgb(111, 111, 111);")
         self.label_36.setTextFormat(QtCore.Qt.RichText)
         self.label_36.setAlignment(QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft|QtCore.Qt.AlignTop)
         self.label_36.setWordWrap(True)
@@ -256,17 +215,14 @@ class Ui_MainWindow(object):
         self.tab_plugins.setObjectName("tab_plugins")
         self.buttonWebsite_dulfy = QtWidgets.QPushButton(self.tab_plugins)
         self.buttonWebsite_dulfy.setGeometry(QtCore.QRect(170, 370, 141, 31))
-        self.buttonWebsite_dulfy.setStyleSheet("background-color: rgb(170, 208, 169);")
         self.buttonWebsite_dulfy.setIconSize(QtCore.QSize(20, 20))
         self.buttonWebsite_dulfy.setObjectName("buttonWebsite_dulfy")
         self.buttonWebsite_builds = QtWidgets.QPushButton(self.tab_plugins)
         self.buttonWebsite_builds.setGeometry(QtCore.QRect(10, 410, 141, 31))
-        self.buttonWebsite_builds.setStyleSheet("background-color: rgb(170, 208, 169);")
         self.buttonWebsite_builds.setIconSize(QtCore.QSize(20, 20))
         self.buttonWebsite_builds.setObjectName("buttonWebsite_builds")
         self.buttonClosegame = QtWidgets.QPushButton(self.tab_plugins)
         self.buttonClosegame.setGeometry(QtCore.QRect(10, 210, 141, 31))
-        self.buttonClosegame.setStyleSheet("background-color: rgb(170, 208, 169);")
         icon8 = QtGui.QIcon()
         icon8.addPixmap(QtGui.QPixmap(":/images/Images/Game.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
         self.buttonClosegame.setIcon(icon8)
@@ -285,23 +241,19 @@ class Ui_MainWindow(object):
         self.buttonFindfolder.setObjectName("buttonFindfolder")
         self.buttonLaunchgame = QtWidgets.QPushButton(self.tab_plugins)
         self.buttonLaunchgame.setGeometry(QtCore.QRect(170, 210, 141, 31))
-        self.buttonLaunchgame.setStyleSheet("background-color: rgb(170, 208, 169);")
         self.buttonLaunchgame.setIcon(icon8)
         self.buttonLaunchgame.setIconSize(QtCore.QSize(20, 20))
         self.buttonLaunchgame.setObjectName("buttonLaunchgame")
         self.buttonWebsite_arcdpsmechanics = QtWidgets.QPushButton(self.tab_plugins)
         self.buttonWebsite_arcdpsmechanics.setGeometry(QtCore.QRect(170, 290, 141, 31))
-        self.buttonWebsite_arcdpsmechanics.setStyleSheet("background-color: rgb(170, 208, 169);")
         self.buttonWebsite_arcdpsmechanics.setIconSize(QtCore.QSize(20, 20))
         self.buttonWebsite_arcdpsmechanics.setObjectName("buttonWebsite_arcdpsmechanics")
         self.buttonWebsite_builds_alternative = QtWidgets.QPushButton(self.tab_plugins)
         self.buttonWebsite_builds_alternative.setGeometry(QtCore.QRect(170, 410, 141, 31))
-        self.buttonWebsite_builds_alternative.setStyleSheet("background-color: rgb(170, 208, 169);")
         self.buttonWebsite_builds_alternative.setIconSize(QtCore.QSize(20, 20))
         self.buttonWebsite_builds_alternative.setObjectName("buttonWebsite_builds_alternative")
         self.buttonArcDps = QtWidgets.QPushButton(self.tab_plugins)
         self.buttonArcDps.setGeometry(QtCore.QRect(10, 70, 301, 31))
-        self.buttonArcDps.setStyleSheet("background-color: rgb(170, 208, 169);")
         icon10 = QtGui.QIcon()
         icon10.addPixmap(QtGui.QPixmap(":/images/Images/Script.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
         self.buttonArcDps.setIcon(icon10)
@@ -309,12 +261,10 @@ class Ui_MainWindow(object):
         self.buttonArcDps.setObjectName("buttonArcDps")
         self.buttonWebsite_gw2raidexplorer = QtWidgets.QPushButton(self.tab_plugins)
         self.buttonWebsite_gw2raidexplorer.setGeometry(QtCore.QRect(10, 450, 301, 31))
-        self.buttonWebsite_gw2raidexplorer.setStyleSheet("background-color: rgb(170, 208, 169);")
         self.buttonWebsite_gw2raidexplorer.setIconSize(QtCore.QSize(20, 20))
         self.buttonWebsite_gw2raidexplorer.setObjectName("buttonWebsite_gw2raidexplorer")
         self.buttonWebsite_raidar = QtWidgets.QPushButton(self.tab_plugins)
         self.buttonWebsite_raidar.setGeometry(QtCore.QRect(170, 330, 141, 31))
-        self.buttonWebsite_raidar.setStyleSheet("background-color: rgb(170, 208, 169);")
         self.buttonWebsite_raidar.setIconSize(QtCore.QSize(20, 20))
         self.buttonWebsite_raidar.setObjectName("buttonWebsite_raidar")
         self.label_53 = QtWidgets.QLabel(self.tab_plugins)
@@ -325,17 +275,14 @@ class Ui_MainWindow(object):
         self.label_53.setObjectName("label_53")
         self.buttonWebsite_arcdps = QtWidgets.QPushButton(self.tab_plugins)
         self.buttonWebsite_arcdps.setGeometry(QtCore.QRect(10, 290, 141, 31))
-        self.buttonWebsite_arcdps.setStyleSheet("background-color: rgb(170, 208, 169);")
         self.buttonWebsite_arcdps.setIconSize(QtCore.QSize(20, 20))
         self.buttonWebsite_arcdps.setObjectName("buttonWebsite_arcdps")
         self.buttonWebsite_killproof = QtWidgets.QPushButton(self.tab_plugins)
         self.buttonWebsite_killproof.setGeometry(QtCore.QRect(10, 370, 141, 31))
-        self.buttonWebsite_killproof.setStyleSheet("background-color: rgb(170, 208, 169);")
         self.buttonWebsite_killproof.setIconSize(QtCore.QSize(20, 20))
         self.buttonWebsite_killproof.setObjectName("buttonWebsite_killproof")
         self.buttonWebsite_dpsreport = QtWidgets.QPushButton(self.tab_plugins)
         self.buttonWebsite_dpsreport.setGeometry(QtCore.QRect(10, 330, 141, 31))
-        self.buttonWebsite_dpsreport.setStyleSheet("background-color: rgb(170, 208, 169);")
         self.buttonWebsite_dpsreport.setIconSize(QtCore.QSize(20, 20))
         self.buttonWebsite_dpsreport.setObjectName("buttonWebsite_dpsreport")
         self.label_46 = QtWidgets.QLabel(self.tab_plugins)
@@ -394,1650 +341,19 @@ class Ui_MainWindow(object):
         self.checkCurrency.setObjectName("checkCurrency")
         self.groupUnused = QtWidgets.QGroupBox(self.MainLayout)
         self.groupUnused.setGeometry(QtCore.QRect(1010, 510, 161, 111))
-        self.groupUnused.setStyleSheet("QGroupBox{\n"
-"border: 2px solid gray;\n"
-"border-radius: 5px;\n"
-"margin-top: 5px; /* leave space at the top for the title */\n"
-"}\n"
-"QGroupBox::title {\n"
-"subcontrol-origin: margin;\n"
-"subcontrol-position: top center; /* position at the top center */\n"
-"padding: 0 3px;  /* empty space at each side of title */\n"
-"}")
         self.groupUnused.setAlignment(QtCore.Qt.AlignCenter)
         self.groupUnused.setObjectName("groupUnused")
         self.tabRaids = QtWidgets.QTabWidget(self.MainLayout)
         self.tabRaids.setGeometry(QtCore.QRect(360, 30, 601, 541))
-        self.tabRaids.setStyleSheet(" /* The tab menu buttons */\n"
-"QTabBar::tab {\n"
-"    border: 2px solid gray;\n"
-"    border-bottom: 0px;\n"
-"    border-top-left-radius: 6px;\n"
-"    border-top-right-radius: 6px;\n"
-"    padding: 2px;}\n"
-"\n"
-" /* The tab specific buttons */\n"
-"QTabBar::tab:selected {border-color: black;background-color: gray;}\n"
-"QTabBar::tab:hover {background-color: gray;}\n"
-"\n"
-" /* The tab widget frame */\n"
-"QTabWidget::pane {\n"
-"    border: 2px solid gray;\n"
-"    border-top-right-radius: 5px;\n"
-"    border-bottom-right-radius: 5px;\n"
-"    border-bottom-left-radius: 5px;\n"
-"    padding: 2px;\n"
-"}")
         self.tabRaids.setObjectName("tabRaids")
         self.tab_bosses_hot = ThemedLayout()
         self.tab_bosses_hot.setObjectName("tab_bosses_hot")
-        self.label_Skin_mursaat_longbow = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_Skin_mursaat_longbow.setGeometry(QtCore.QRect(280, 440, 32, 32))
-        self.label_Skin_mursaat_longbow.setPixmap(QtGui.QPixmap(":/skins/Images/skins/Arbiter Greatbow.png"))
-        self.label_Skin_mursaat_longbow.setScaledContents(True)
-        self.label_Skin_mursaat_longbow.setObjectName("label_Skin_mursaat_longbow")
-        self.label_Skin_xera_axe = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_Skin_xera_axe.setGeometry(QtCore.QRect(280, 360, 32, 32))
-        self.label_Skin_xera_axe.setPixmap(QtGui.QPixmap(":/skins/Images/skins/White Mantle Axe.png"))
-        self.label_Skin_xera_axe.setScaledContents(True)
-        self.label_Skin_xera_axe.setObjectName("label_Skin_xera_axe")
-        self.label_Skin_xera_back = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_Skin_xera_back.setGeometry(QtCore.QRect(340, 360, 32, 32))
-        self.label_Skin_xera_back.setPixmap(QtGui.QPixmap(":/skins/Images/skins/Xera\'s Mask.png"))
-        self.label_Skin_xera_back.setScaledContents(True)
-        self.label_Skin_xera_back.setObjectName("label_Skin_xera_back")
-        self.label_Skin_deimos_back = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_Skin_deimos_back.setGeometry(QtCore.QRect(340, 470, 32, 32))
-        self.label_Skin_deimos_back.setPixmap(QtGui.QPixmap(":/skins/Images/skins/Burden.png"))
-        self.label_Skin_deimos_back.setScaledContents(True)
-        self.label_Skin_deimos_back.setObjectName("label_Skin_deimos_back")
-        self.label_Skin_matthias_greatsword = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_Skin_matthias_greatsword.setGeometry(QtCore.QRect(310, 220, 32, 32))
-        self.label_Skin_matthias_greatsword.setPixmap(QtGui.QPixmap(":/skins/Images/skins/White Mantle Sunderer.png"))
-        self.label_Skin_matthias_greatsword.setScaledContents(True)
-        self.label_Skin_matthias_greatsword.setObjectName("label_Skin_matthias_greatsword")
-        self.lineRaidboss_matthias = QtWidgets.QLineEdit(self.tab_bosses_hot)
-        self.lineRaidboss_matthias.setGeometry(QtCore.QRect(100, 220, 91, 31))
-        self.lineRaidboss_matthias.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineRaidboss_matthias.setFrame(False)
-        self.lineRaidboss_matthias.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineRaidboss_matthias.setReadOnly(True)
-        self.lineRaidboss_matthias.setObjectName("lineRaidboss_matthias")
-        self.line_9 = QtWidgets.QFrame(self.tab_bosses_hot)
-        self.line_9.setGeometry(QtCore.QRect(0, 400, 590, 3))
-        self.line_9.setFrameShape(QtWidgets.QFrame.HLine)
-        self.line_9.setFrameShadow(QtWidgets.QFrame.Sunken)
-        self.line_9.setObjectName("line_9")
-        self.label_Mini_valeguardian = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_Mini_valeguardian.setGeometry(QtCore.QRect(520, 110, 32, 32))
-        self.label_Mini_valeguardian.setPixmap(QtGui.QPixmap(":/Minis/Images/minis/Mini Vale Guardian.png"))
-        self.label_Mini_valeguardian.setScaledContents(True)
-        self.label_Mini_valeguardian.setObjectName("label_Mini_valeguardian")
-        self.lineRaidboss_cairn = QtWidgets.QLineEdit(self.tab_bosses_hot)
-        self.lineRaidboss_cairn.setGeometry(QtCore.QRect(10, 440, 91, 31))
-        self.lineRaidboss_cairn.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineRaidboss_cairn.setFrame(False)
-        self.lineRaidboss_cairn.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineRaidboss_cairn.setReadOnly(True)
-        self.lineRaidboss_cairn.setObjectName("lineRaidboss_cairn")
-        self.label_27 = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_27.setGeometry(QtCore.QRect(0, 70, 591, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        font.setWeight(75)
-        font.setUnderline(True)
-        font.setBold(True)
-        self.label_27.setFont(font)
-        self.label_27.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_27.setObjectName("label_27")
-        self.lineRaidboss_xera = QtWidgets.QLineEdit(self.tab_bosses_hot)
-        self.lineRaidboss_xera.setGeometry(QtCore.QRect(100, 360, 91, 31))
-        self.lineRaidboss_xera.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineRaidboss_xera.setFrame(False)
-        self.lineRaidboss_xera.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineRaidboss_xera.setReadOnly(True)
-        self.lineRaidboss_xera.setObjectName("lineRaidboss_xera")
-        self.label_82 = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_82.setGeometry(QtCore.QRect(390, 40, 131, 20))
-        self.label_82.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
-        self.label_82.setObjectName("label_82")
-        self.label_Skin_gorse_staff = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_Skin_gorse_staff.setGeometry(QtCore.QRect(310, 110, 32, 32))
-        self.label_Skin_gorse_staff.setPixmap(QtGui.QPixmap(":/skins/Images/skins/Assaulter\'s Spirit Branch.png"))
-        self.label_Skin_gorse_staff.setScaledContents(True)
-        self.label_Skin_gorse_staff.setObjectName("label_Skin_gorse_staff")
-        self.label_116 = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_116.setGeometry(QtCore.QRect(0, 0, 281, 21))
-        self.label_116.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_116.setObjectName("label_116")
-        self.lineRaidboss_glenna = QtWidgets.QLineEdit(self.tab_bosses_hot)
-        self.lineRaidboss_glenna.setGeometry(QtCore.QRect(10, 330, 91, 31))
-        self.lineRaidboss_glenna.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineRaidboss_glenna.setFrame(False)
-        self.lineRaidboss_glenna.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineRaidboss_glenna.setReadOnly(True)
-        self.lineRaidboss_glenna.setObjectName("lineRaidboss_glenna")
-        self.lineRaidboss_valeguardian = QtWidgets.QLineEdit(self.tab_bosses_hot)
-        self.lineRaidboss_valeguardian.setGeometry(QtCore.QRect(10, 110, 91, 31))
-        self.lineRaidboss_valeguardian.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineRaidboss_valeguardian.setFrame(False)
-        self.lineRaidboss_valeguardian.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineRaidboss_valeguardian.setReadOnly(True)
-        self.lineRaidboss_valeguardian.setObjectName("lineRaidboss_valeguardian")
-        self.lineCurrency_Magnetiteshards = QtWidgets.QLineEdit(self.tab_bosses_hot)
-        self.lineCurrency_Magnetiteshards.setGeometry(QtCore.QRect(530, 20, 51, 20))
-        self.lineCurrency_Magnetiteshards.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineCurrency_Magnetiteshards.setText("")
-        self.lineCurrency_Magnetiteshards.setFrame(False)
-        self.lineCurrency_Magnetiteshards.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineCurrency_Magnetiteshards.setReadOnly(True)
-        self.lineCurrency_Magnetiteshards.setObjectName("lineCurrency_Magnetiteshards")
-        self.label_Skin_vg_greatsword = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_Skin_vg_greatsword.setGeometry(QtCore.QRect(250, 110, 32, 32))
-        self.label_Skin_vg_greatsword.setPixmap(QtGui.QPixmap(":/skins/Images/skins/Assaulter\'s Sparking Vanquisher.png"))
-        self.label_Skin_vg_greatsword.setScaledContents(True)
-        self.label_Skin_vg_greatsword.setObjectName("label_Skin_vg_greatsword")
-        self.lineRaidboss_trio = QtWidgets.QLineEdit(self.tab_bosses_hot)
-        self.lineRaidboss_trio.setGeometry(QtCore.QRect(10, 250, 91, 31))
-        self.lineRaidboss_trio.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineRaidboss_trio.setFrame(False)
-        self.lineRaidboss_trio.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineRaidboss_trio.setReadOnly(True)
-        self.lineRaidboss_trio.setObjectName("lineRaidboss_trio")
-        self.label_72 = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_72.setGeometry(QtCore.QRect(10, 40, 311, 21))
-        self.label_72.setAlignment(QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft|QtCore.Qt.AlignVCenter)
-        self.label_72.setObjectName("label_72")
-        self.line_8 = QtWidgets.QFrame(self.tab_bosses_hot)
-        self.line_8.setGeometry(QtCore.QRect(0, 290, 590, 3))
-        self.line_8.setFrameShape(QtWidgets.QFrame.HLine)
-        self.line_8.setFrameShadow(QtWidgets.QFrame.Sunken)
-        self.line_8.setObjectName("line_8")
-        self.lineCurrency_Legend_insights = QtWidgets.QLineEdit(self.tab_bosses_hot)
-        self.lineCurrency_Legend_insights.setGeometry(QtCore.QRect(530, 40, 51, 20))
-        self.lineCurrency_Legend_insights.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineCurrency_Legend_insights.setText("")
-        self.lineCurrency_Legend_insights.setFrame(False)
-        self.lineCurrency_Legend_insights.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineCurrency_Legend_insights.setReadOnly(True)
-        self.lineCurrency_Legend_insights.setObjectName("lineCurrency_Legend_insights")
-        self.lineRaidboss_slothasor = QtWidgets.QLineEdit(self.tab_bosses_hot)
-        self.lineRaidboss_slothasor.setGeometry(QtCore.QRect(10, 220, 91, 31))
-        self.lineRaidboss_slothasor.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineRaidboss_slothasor.setFrame(False)
-        self.lineRaidboss_slothasor.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineRaidboss_slothasor.setReadOnly(True)
-        self.lineRaidboss_slothasor.setObjectName("lineRaidboss_slothasor")
-        self.label_71 = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_71.setGeometry(QtCore.QRect(10, 22, 311, 21))
-        self.label_71.setAlignment(QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft|QtCore.Qt.AlignVCenter)
-        self.label_71.setObjectName("label_71")
-        self.label_Skin_matthias_staff = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_Skin_matthias_staff.setGeometry(QtCore.QRect(280, 220, 32, 32))
-        self.label_Skin_matthias_staff.setPixmap(QtGui.QPixmap(":/skins/Images/skins/Staff of Matthias.png"))
-        self.label_Skin_matthias_staff.setScaledContents(True)
-        self.label_Skin_matthias_staff.setObjectName("label_Skin_matthias_staff")
-        self.label_Skin_kc_torch = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_Skin_kc_torch.setGeometry(QtCore.QRect(250, 330, 32, 32))
-        self.label_Skin_kc_torch.setPixmap(QtGui.QPixmap(":/skins/Images/skins/Keep Construct Torch.png"))
-        self.label_Skin_kc_torch.setScaledContents(True)
-        self.label_Skin_kc_torch.setObjectName("label_Skin_kc_torch")
-        self.label_Mini_greenguardian = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_Mini_greenguardian.setGeometry(QtCore.QRect(460, 110, 32, 32))
-        self.label_Mini_greenguardian.setPixmap(QtGui.QPixmap(":/Minis/Images/minis/Mini Green Guardian.png"))
-        self.label_Mini_greenguardian.setScaledContents(True)
-        self.label_Mini_greenguardian.setObjectName("label_Mini_greenguardian")
-        self.label_Skin_kc_scepter = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_Skin_kc_scepter.setGeometry(QtCore.QRect(310, 330, 32, 32))
-        self.label_Skin_kc_scepter.setPixmap(QtGui.QPixmap(":/skins/Images/skins/White Mantle Rod.png"))
-        self.label_Skin_kc_scepter.setScaledContents(True)
-        self.label_Skin_kc_scepter.setObjectName("label_Skin_kc_scepter")
-        self.label_Skin_deimos_staff = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_Skin_deimos_staff.setGeometry(QtCore.QRect(310, 470, 32, 32))
-        self.label_Skin_deimos_staff.setPixmap(QtGui.QPixmap(":/skins/Images/skins/Prisoner\'s Treasured Bough.png"))
-        self.label_Skin_deimos_staff.setScaledContents(True)
-        self.label_Skin_deimos_staff.setObjectName("label_Skin_deimos_staff")
-        self.label_Skin_samarog_shortbow = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_Skin_samarog_shortbow.setGeometry(QtCore.QRect(340, 440, 32, 32))
-        self.label_Skin_samarog_shortbow.setPixmap(QtGui.QPixmap(":/skins/Images/skins/Watchkeeper Trophy Bow.png"))
-        self.label_Skin_samarog_shortbow.setScaledContents(True)
-        self.label_Skin_samarog_shortbow.setObjectName("label_Skin_samarog_shortbow")
-        self.label_Skin_cairn_sword = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_Skin_cairn_sword.setGeometry(QtCore.QRect(250, 440, 32, 32))
-        self.label_Skin_cairn_sword.setPixmap(QtGui.QPixmap(":/skins/Images/skins/Indomitable Gladius.png"))
-        self.label_Skin_cairn_sword.setScaledContents(True)
-        self.label_Skin_cairn_sword.setObjectName("label_Skin_cairn_sword")
-        self.lineRaidboss_twistedcastle = QtWidgets.QLineEdit(self.tab_bosses_hot)
-        self.lineRaidboss_twistedcastle.setGeometry(QtCore.QRect(100, 330, 91, 31))
-        self.lineRaidboss_twistedcastle.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineRaidboss_twistedcastle.setFrame(False)
-        self.lineRaidboss_twistedcastle.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineRaidboss_twistedcastle.setReadOnly(True)
-        self.lineRaidboss_twistedcastle.setObjectName("lineRaidboss_twistedcastle")
-        self.label_Skin_sab_rifle = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_Skin_sab_rifle.setGeometry(QtCore.QRect(340, 110, 32, 32))
-        self.label_Skin_sab_rifle.setPixmap(QtGui.QPixmap(":/skins/Images/skins/Sabetha\'s Rifle.png"))
-        self.label_Skin_sab_rifle.setScaledContents(True)
-        self.label_Skin_sab_rifle.setObjectName("label_Skin_sab_rifle")
-        self.line_7 = QtWidgets.QFrame(self.tab_bosses_hot)
-        self.line_7.setGeometry(QtCore.QRect(0, 180, 590, 3))
-        self.line_7.setFrameShape(QtWidgets.QFrame.HLine)
-        self.line_7.setFrameShadow(QtWidgets.QFrame.Sunken)
-        self.line_7.setObjectName("line_7")
-        self.label_31 = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_31.setGeometry(QtCore.QRect(0, 180, 591, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        font.setWeight(75)
-        font.setUnderline(True)
-        font.setBold(True)
-        self.label_31.setFont(font)
-        self.label_31.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_31.setObjectName("label_31")
-        self.label_115 = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_115.setGeometry(QtCore.QRect(390, 0, 191, 21))
-        self.label_115.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_115.setObjectName("label_115")
-        self.label_Skin_deimos_mace = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_Skin_deimos_mace.setGeometry(QtCore.QRect(250, 470, 32, 32))
-        self.label_Skin_deimos_mace.setPixmap(QtGui.QPixmap(":/skins/Images/skins/The Virge.png"))
-        self.label_Skin_deimos_mace.setScaledContents(True)
-        self.label_Skin_deimos_mace.setObjectName("label_Skin_deimos_mace")
-        self.label_Skin_xera_sword = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_Skin_xera_sword.setGeometry(QtCore.QRect(250, 360, 32, 32))
-        self.label_Skin_xera_sword.setPixmap(QtGui.QPixmap(":/skins/Images/skins/White Mantle Gladius.png"))
-        self.label_Skin_xera_sword.setScaledContents(True)
-        self.label_Skin_xera_sword.setObjectName("label_Skin_xera_sword")
-        self.lineRaidboss_gorseval = QtWidgets.QLineEdit(self.tab_bosses_hot)
-        self.lineRaidboss_gorseval.setGeometry(QtCore.QRect(100, 110, 91, 31))
-        self.lineRaidboss_gorseval.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineRaidboss_gorseval.setFrame(False)
-        self.lineRaidboss_gorseval.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineRaidboss_gorseval.setReadOnly(True)
-        self.lineRaidboss_gorseval.setObjectName("lineRaidboss_gorseval")
-        self.label_35 = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_35.setGeometry(QtCore.QRect(0, 400, 591, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        font.setWeight(75)
-        font.setUnderline(True)
-        font.setBold(True)
-        self.label_35.setFont(font)
-        self.label_35.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_35.setObjectName("label_35")
-        self.lineRaidboss_deimos = QtWidgets.QLineEdit(self.tab_bosses_hot)
-        self.lineRaidboss_deimos.setGeometry(QtCore.QRect(100, 470, 91, 31))
-        self.lineRaidboss_deimos.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineRaidboss_deimos.setFrame(False)
-        self.lineRaidboss_deimos.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineRaidboss_deimos.setReadOnly(True)
-        self.lineRaidboss_deimos.setObjectName("lineRaidboss_deimos")
-        self.lineRaidboss_samarog = QtWidgets.QLineEdit(self.tab_bosses_hot)
-        self.lineRaidboss_samarog.setGeometry(QtCore.QRect(10, 470, 91, 31))
-        self.lineRaidboss_samarog.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineRaidboss_samarog.setFrame(False)
-        self.lineRaidboss_samarog.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineRaidboss_samarog.setReadOnly(True)
-        self.lineRaidboss_samarog.setObjectName("lineRaidboss_samarog")
-        self.label_Skin_matthias_pistol = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_Skin_matthias_pistol.setGeometry(QtCore.QRect(310, 250, 32, 32))
-        self.label_Skin_matthias_pistol.setPixmap(QtGui.QPixmap(":/skins/Images/skins/White Mantle Pistol.png"))
-        self.label_Skin_matthias_pistol.setScaledContents(True)
-        self.label_Skin_matthias_pistol.setObjectName("label_Skin_matthias_pistol")
-        self.label_Skin_xera_scepter = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_Skin_xera_scepter.setGeometry(QtCore.QRect(340, 330, 32, 32))
-        self.label_Skin_xera_scepter.setPixmap(QtGui.QPixmap(":/skins/Images/skins/Xera\'s Scepter.png"))
-        self.label_Skin_xera_scepter.setScaledContents(True)
-        self.label_Skin_xera_scepter.setObjectName("label_Skin_xera_scepter")
-        self.label_Mini_blueguardian = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_Mini_blueguardian.setGeometry(QtCore.QRect(490, 110, 32, 32))
-        self.label_Mini_blueguardian.setPixmap(QtGui.QPixmap(":/Minis/Images/minis/Mini Blue Guardian.png"))
-        self.label_Mini_blueguardian.setScaledContents(True)
-        self.label_Mini_blueguardian.setObjectName("label_Mini_blueguardian")
-        self.label_Skin_matthias_warhorn = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_Skin_matthias_warhorn.setGeometry(QtCore.QRect(280, 250, 32, 32))
-        self.label_Skin_matthias_warhorn.setPixmap(QtGui.QPixmap(":/skins/Images/skins/White Mantle Bugle.png"))
-        self.label_Skin_matthias_warhorn.setScaledContents(True)
-        self.label_Skin_matthias_warhorn.setObjectName("label_Skin_matthias_warhorn")
-        self.label_Skin_kc_focus = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_Skin_kc_focus.setGeometry(QtCore.QRect(280, 330, 32, 32))
-        self.label_Skin_kc_focus.setPixmap(QtGui.QPixmap(":/skins/Images/skins/White Mantle Icon.png"))
-        self.label_Skin_kc_focus.setScaledContents(True)
-        self.label_Skin_kc_focus.setObjectName("label_Skin_kc_focus")
-        self.label_Mini_kernan = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_Mini_kernan.setGeometry(QtCore.QRect(460, 140, 32, 32))
-        self.label_Mini_kernan.setPixmap(QtGui.QPixmap(":/Minis/Images/minis/Mini Kernan.png"))
-        self.label_Mini_kernan.setScaledContents(True)
-        self.label_Mini_kernan.setObjectName("label_Mini_kernan")
-        self.label_Skin_matthias_shortbow = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_Skin_matthias_shortbow.setGeometry(QtCore.QRect(370, 220, 32, 32))
-        self.label_Skin_matthias_shortbow.setPixmap(QtGui.QPixmap(":/skins/Images/skins/White Mantle Short Bow.png"))
-        self.label_Skin_matthias_shortbow.setScaledContents(True)
-        self.label_Skin_matthias_shortbow.setObjectName("label_Skin_matthias_shortbow")
-        self.label_Skin_matthias_torch = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_Skin_matthias_torch.setGeometry(QtCore.QRect(340, 250, 32, 32))
-        self.label_Skin_matthias_torch.setPixmap(QtGui.QPixmap(":/skins/Images/skins/White Mantle Censer.png"))
-        self.label_Skin_matthias_torch.setScaledContents(True)
-        self.label_Skin_matthias_torch.setObjectName("label_Skin_matthias_torch")
-        self.label_Skin_matthias_longbow = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_Skin_matthias_longbow.setGeometry(QtCore.QRect(340, 220, 32, 32))
-        self.label_Skin_matthias_longbow.setPixmap(QtGui.QPixmap(":/skins/Images/skins/White Mantle Greatbow.png"))
-        self.label_Skin_matthias_longbow.setScaledContents(True)
-        self.label_Skin_matthias_longbow.setObjectName("label_Skin_matthias_longbow")
-        self.lineRaidboss_keepconstruct = QtWidgets.QLineEdit(self.tab_bosses_hot)
-        self.lineRaidboss_keepconstruct.setGeometry(QtCore.QRect(10, 360, 91, 31))
-        self.lineRaidboss_keepconstruct.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineRaidboss_keepconstruct.setFrame(False)
-        self.lineRaidboss_keepconstruct.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineRaidboss_keepconstruct.setReadOnly(True)
-        self.lineRaidboss_keepconstruct.setObjectName("lineRaidboss_keepconstruct")
-        self.label_Skin_xera_staff = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_Skin_xera_staff.setGeometry(QtCore.QRect(370, 330, 32, 32))
-        self.label_Skin_xera_staff.setPixmap(QtGui.QPixmap(":/skins/Images/skins/White Mantle Spire.png"))
-        self.label_Skin_xera_staff.setScaledContents(True)
-        self.label_Skin_xera_staff.setObjectName("label_Skin_xera_staff")
-        self.label_Skin_sab_back = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_Skin_sab_back.setGeometry(QtCore.QRect(370, 110, 32, 32))
-        self.label_Skin_sab_back.setPixmap(QtGui.QPixmap(":/skins/Images/skins/Sabetha\'s Scorcher.png"))
-        self.label_Skin_sab_back.setScaledContents(True)
-        self.label_Skin_sab_back.setObjectName("label_Skin_sab_back")
-        self.label_Mini_xera = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_Mini_xera.setGeometry(QtCore.QRect(490, 330, 32, 32))
-        self.label_Mini_xera.setPixmap(QtGui.QPixmap(":/Minis/Images/minis/Mini Xera.png"))
-        self.label_Mini_xera.setScaledContents(True)
-        self.label_Mini_xera.setObjectName("label_Mini_xera")
-        self.label_Mini_knuckles = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_Mini_knuckles.setGeometry(QtCore.QRect(430, 140, 32, 32))
-        self.label_Mini_knuckles.setPixmap(QtGui.QPixmap(":/Minis/Images/minis/Mini Knuckles.png"))
-        self.label_Mini_knuckles.setScaledContents(True)
-        self.label_Mini_knuckles.setObjectName("label_Mini_knuckles")
-        self.line_10 = QtWidgets.QFrame(self.tab_bosses_hot)
-        self.line_10.setGeometry(QtCore.QRect(0, 70, 590, 3))
-        self.line_10.setFrameShape(QtWidgets.QFrame.HLine)
-        self.line_10.setFrameShadow(QtWidgets.QFrame.Sunken)
-        self.line_10.setObjectName("line_10")
-        self.label_34 = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_34.setGeometry(QtCore.QRect(0, 290, 591, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        font.setWeight(75)
-        font.setUnderline(True)
-        font.setBold(True)
-        self.label_34.setFont(font)
-        self.label_34.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_34.setObjectName("label_34")
-        self.label_Skin_matthias_mace = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_Skin_matthias_mace.setGeometry(QtCore.QRect(220, 250, 32, 32))
-        self.label_Skin_matthias_mace.setPixmap(QtGui.QPixmap(":/skins/Images/skins/White Mantle Gavel.png"))
-        self.label_Skin_matthias_mace.setScaledContents(True)
-        self.label_Skin_matthias_mace.setObjectName("label_Skin_matthias_mace")
-        self.lineRaidboss_spiritwoods = QtWidgets.QLineEdit(self.tab_bosses_hot)
-        self.lineRaidboss_spiritwoods.setGeometry(QtCore.QRect(10, 140, 91, 31))
-        self.lineRaidboss_spiritwoods.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineRaidboss_spiritwoods.setFrame(False)
-        self.lineRaidboss_spiritwoods.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineRaidboss_spiritwoods.setReadOnly(True)
-        self.lineRaidboss_spiritwoods.setObjectName("lineRaidboss_spiritwoods")
-        self.label_44 = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_44.setGeometry(QtCore.QRect(390, 20, 131, 20))
-        self.label_44.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
-        self.label_44.setObjectName("label_44")
-        self.label_Skin_kc_hammer = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_Skin_kc_hammer.setGeometry(QtCore.QRect(220, 330, 32, 32))
-        self.label_Skin_kc_hammer.setPixmap(QtGui.QPixmap(":/skins/Images/skins/White Mantle Sledge.png"))
-        self.label_Skin_kc_hammer.setScaledContents(True)
-        self.label_Skin_kc_hammer.setObjectName("label_Skin_kc_hammer")
-        self.label_Skin_deimos_hammer = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_Skin_deimos_hammer.setGeometry(QtCore.QRect(280, 470, 32, 32))
-        self.label_Skin_deimos_hammer.setPixmap(QtGui.QPixmap(":/skins/Images/skins/The Gavel.png"))
-        self.label_Skin_deimos_hammer.setScaledContents(True)
-        self.label_Skin_deimos_hammer.setObjectName("label_Skin_deimos_hammer")
-        self.label_Skin_gorse_shield = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_Skin_gorse_shield.setGeometry(QtCore.QRect(280, 110, 32, 32))
-        self.label_Skin_gorse_shield.setPixmap(QtGui.QPixmap(":/skins/Images/skins/Assaulter\'s Spirit Ward.png"))
-        self.label_Skin_gorse_shield.setScaledContents(True)
-        self.label_Skin_gorse_shield.setObjectName("label_Skin_gorse_shield")
-        self.label_Skin_samarog_axe = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_Skin_samarog_axe.setGeometry(QtCore.QRect(310, 440, 32, 32))
-        self.label_Skin_samarog_axe.setPixmap(QtGui.QPixmap(":/skins/Images/skins/Axe of the Unseen.png"))
-        self.label_Skin_samarog_axe.setScaledContents(True)
-        self.label_Skin_samarog_axe.setObjectName("label_Skin_samarog_axe")
-        self.label_Skin_matthias_shield = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_Skin_matthias_shield.setGeometry(QtCore.QRect(250, 250, 32, 32))
-        self.label_Skin_matthias_shield.setPixmap(QtGui.QPixmap(":/skins/Images/skins/White Mantle Bulwark.png"))
-        self.label_Skin_matthias_shield.setScaledContents(True)
-        self.label_Skin_matthias_shield.setObjectName("label_Skin_matthias_shield")
-        self.label_Mini_keepconstruct = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_Mini_keepconstruct.setGeometry(QtCore.QRect(460, 330, 32, 32))
-        self.label_Mini_keepconstruct.setPixmap(QtGui.QPixmap(":/Minis/Images/minis/Mini Keep Construct.png"))
-        self.label_Mini_keepconstruct.setScaledContents(True)
-        self.label_Mini_keepconstruct.setObjectName("label_Mini_keepconstruct")
-        self.label_Skin_samarog_staff = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_Skin_samarog_staff.setGeometry(QtCore.QRect(370, 440, 32, 32))
-        self.label_Skin_samarog_staff.setPixmap(QtGui.QPixmap(":/skins/Images/skins/Spire of Samarog.png"))
-        self.label_Skin_samarog_staff.setScaledContents(True)
-        self.label_Skin_samarog_staff.setObjectName("label_Skin_samarog_staff")
-        self.label_Mini_mcleod = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_Mini_mcleod.setGeometry(QtCore.QRect(430, 330, 32, 32))
-        self.label_Mini_mcleod.setPixmap(QtGui.QPixmap(":/Minis/Images/minis/Mini McLeod the Silent.png"))
-        self.label_Mini_mcleod.setScaledContents(True)
-        self.label_Mini_mcleod.setObjectName("label_Mini_mcleod")
-        self.label_Skin_deimos_gloves = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_Skin_deimos_gloves.setGeometry(QtCore.QRect(370, 470, 32, 32))
-        self.label_Skin_deimos_gloves.setPixmap(QtGui.QPixmap(":/skins/Images/skins/Gloves of the Obedient.png"))
-        self.label_Skin_deimos_gloves.setScaledContents(True)
-        self.label_Skin_deimos_gloves.setObjectName("label_Skin_deimos_gloves")
-        self.label_Skin_samarog_warhorn = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_Skin_samarog_warhorn.setGeometry(QtCore.QRect(220, 470, 32, 32))
-        self.label_Skin_samarog_warhorn.setPixmap(QtGui.QPixmap(":/skins/Images/skins/Watchkeeper Trophy Warhorn.png"))
-        self.label_Skin_samarog_warhorn.setScaledContents(True)
-        self.label_Skin_samarog_warhorn.setObjectName("label_Skin_samarog_warhorn")
-        self.label_Mini_gorseval = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_Mini_gorseval.setGeometry(QtCore.QRect(550, 110, 32, 32))
-        self.label_Mini_gorseval.setPixmap(QtGui.QPixmap(":/Minis/Images/minis/Mini Gorseval the Multifarious.png"))
-        self.label_Mini_gorseval.setScaledContents(True)
-        self.label_Mini_gorseval.setObjectName("label_Mini_gorseval")
-        self.label_Skin_sloth_focus = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_Skin_sloth_focus.setGeometry(QtCore.QRect(250, 220, 32, 32))
-        self.label_Skin_sloth_focus.setPixmap(QtGui.QPixmap(":/skins/Images/skins/Slothasor Effigy.png"))
-        self.label_Skin_sloth_focus.setScaledContents(True)
-        self.label_Skin_sloth_focus.setObjectName("label_Skin_sloth_focus")
-        self.label_Skin_sloth_hammer = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_Skin_sloth_hammer.setGeometry(QtCore.QRect(220, 220, 32, 32))
-        self.label_Skin_sloth_hammer.setPixmap(QtGui.QPixmap(":/skins/Images/skins/Sloth-Hunting Hammer.png"))
-        self.label_Skin_sloth_hammer.setScaledContents(True)
-        self.label_Skin_sloth_hammer.setObjectName("label_Skin_sloth_hammer")
-        self.label_Mini_redguardian = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_Mini_redguardian.setGeometry(QtCore.QRect(430, 110, 32, 32))
-        self.label_Mini_redguardian.setPixmap(QtGui.QPixmap(":/Minis/Images/minis/Mini Red Guardian.png"))
-        self.label_Mini_redguardian.setScaledContents(True)
-        self.label_Mini_redguardian.setObjectName("label_Mini_redguardian")
-        self.label_Skin_xera_dagger = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_Skin_xera_dagger.setGeometry(QtCore.QRect(310, 360, 32, 32))
-        self.label_Skin_xera_dagger.setPixmap(QtGui.QPixmap(":/skins/Images/skins/White Mantle Seax.png"))
-        self.label_Skin_xera_dagger.setScaledContents(True)
-        self.label_Skin_xera_dagger.setObjectName("label_Skin_xera_dagger")
-        self.label_Mini_karde = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_Mini_karde.setGeometry(QtCore.QRect(490, 140, 32, 32))
-        self.label_Mini_karde.setPixmap(QtGui.QPixmap(":/Minis/Images/minis/Mini Karde.png"))
-        self.label_Mini_karde.setScaledContents(True)
-        self.label_Mini_karde.setObjectName("label_Mini_karde")
-        self.label_Skin_cairn_pistol = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_Skin_cairn_pistol.setGeometry(QtCore.QRect(220, 440, 32, 32))
-        self.label_Skin_cairn_pistol.setPixmap(QtGui.QPixmap(":/skins/Images/skins/Indomitable Pistol.png"))
-        self.label_Skin_cairn_pistol.setScaledContents(True)
-        self.label_Skin_cairn_pistol.setObjectName("label_Skin_cairn_pistol")
-        self.lineRaidboss_sabetha = QtWidgets.QLineEdit(self.tab_bosses_hot)
-        self.lineRaidboss_sabetha.setGeometry(QtCore.QRect(100, 140, 91, 31))
-        self.lineRaidboss_sabetha.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineRaidboss_sabetha.setFrame(False)
-        self.lineRaidboss_sabetha.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineRaidboss_sabetha.setReadOnly(True)
-        self.lineRaidboss_sabetha.setObjectName("lineRaidboss_sabetha")
-        self.lineRaidboss_mursaat = QtWidgets.QLineEdit(self.tab_bosses_hot)
-        self.lineRaidboss_mursaat.setGeometry(QtCore.QRect(100, 440, 91, 31))
-        self.lineRaidboss_mursaat.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineRaidboss_mursaat.setFrame(False)
-        self.lineRaidboss_mursaat.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineRaidboss_mursaat.setReadOnly(True)
-        self.lineRaidboss_mursaat.setObjectName("lineRaidboss_mursaat")
-        self.label_Skin_vg_dagger = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_Skin_vg_dagger.setGeometry(QtCore.QRect(220, 110, 32, 32))
-        self.label_Skin_vg_dagger.setPixmap(QtGui.QPixmap(":/skins/Images/skins/Assaulter\'s Sparking Dagger.png"))
-        self.label_Skin_vg_dagger.setScaledContents(True)
-        self.label_Skin_vg_dagger.setObjectName("label_Skin_vg_dagger")
-        self.label_Skin_xera_rifle = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_Skin_xera_rifle.setGeometry(QtCore.QRect(220, 360, 32, 32))
-        self.label_Skin_xera_rifle.setPixmap(QtGui.QPixmap(":/skins/Images/skins/White Mantle Rifle.png"))
-        self.label_Skin_xera_rifle.setScaledContents(True)
-        self.label_Skin_xera_rifle.setObjectName("label_Skin_xera_rifle")
-        self.label_Mini_samarog = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_Mini_samarog.setGeometry(QtCore.QRect(520, 440, 32, 32))
-        self.label_Mini_samarog.setPixmap(QtGui.QPixmap(":/Minis/Images/minis/Mini Samarog.png"))
-        self.label_Mini_samarog.setScaledContents(True)
-        self.label_Mini_samarog.setObjectName("label_Mini_samarog")
-        self.label_Mini_ragged_whitemantle = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_Mini_ragged_whitemantle.setGeometry(QtCore.QRect(430, 470, 32, 32))
-        self.label_Mini_ragged_whitemantle.setPixmap(QtGui.QPixmap(":/Minis/Images/minis/Mini Ragged White Mantle Figurehead.png"))
-        self.label_Mini_ragged_whitemantle.setScaledContents(True)
-        self.label_Mini_ragged_whitemantle.setObjectName("label_Mini_ragged_whitemantle")
-        self.label_Mini_whitemantle = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_Mini_whitemantle.setGeometry(QtCore.QRect(550, 440, 32, 32))
-        self.label_Mini_whitemantle.setPixmap(QtGui.QPixmap(":/Minis/Images/minis/Mini White Mantle Figurehead.png"))
-        self.label_Mini_whitemantle.setScaledContents(True)
-        self.label_Mini_whitemantle.setObjectName("label_Mini_whitemantle")
-        self.label_Mini_cairn = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_Mini_cairn.setGeometry(QtCore.QRect(430, 440, 32, 32))
-        self.label_Mini_cairn.setPixmap(QtGui.QPixmap(":/Minis/Images/minis/Mini Cairn the Indomitable.png"))
-        self.label_Mini_cairn.setScaledContents(True)
-        self.label_Mini_cairn.setObjectName("label_Mini_cairn")
-        self.label_Mini_mursaat = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_Mini_mursaat.setGeometry(QtCore.QRect(460, 440, 32, 32))
-        self.label_Mini_mursaat.setPixmap(QtGui.QPixmap(":/Minis/Images/minis/Mini Mursaat Overseer.png"))
-        self.label_Mini_mursaat.setScaledContents(True)
-        self.label_Mini_mursaat.setObjectName("label_Mini_mursaat")
-        self.label_Mini_eyeofjanthir = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_Mini_eyeofjanthir.setGeometry(QtCore.QRect(490, 440, 32, 32))
-        self.label_Mini_eyeofjanthir.setPixmap(QtGui.QPixmap(":/Minis/Images/minis/Mini Eye of Janthir.png"))
-        self.label_Mini_eyeofjanthir.setScaledContents(True)
-        self.label_Mini_eyeofjanthir.setObjectName("label_Mini_eyeofjanthir")
-        self.label_119 = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_119.setGeometry(QtCore.QRect(220, 420, 181, 21))
-        self.label_119.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_119.setObjectName("label_119")
-        self.label_120 = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_120.setGeometry(QtCore.QRect(430, 420, 151, 21))
-        self.label_120.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_120.setObjectName("label_120")
-        self.label_121 = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_121.setGeometry(QtCore.QRect(10, 410, 181, 31))
-        self.label_121.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_121.setObjectName("label_121")
-        self.label_124 = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_124.setGeometry(QtCore.QRect(220, 310, 181, 21))
-        self.label_124.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_124.setObjectName("label_124")
-        self.label_123 = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_123.setGeometry(QtCore.QRect(430, 310, 151, 21))
-        self.label_123.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_123.setObjectName("label_123")
-        self.label_122 = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_122.setGeometry(QtCore.QRect(10, 300, 181, 31))
-        self.label_122.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_122.setObjectName("label_122")
-        self.label_127 = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_127.setGeometry(QtCore.QRect(220, 200, 181, 21))
-        self.label_127.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_127.setObjectName("label_127")
-        self.label_125 = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_125.setGeometry(QtCore.QRect(430, 200, 151, 21))
-        self.label_125.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_125.setObjectName("label_125")
-        self.label_126 = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_126.setGeometry(QtCore.QRect(10, 190, 181, 31))
-        self.label_126.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_126.setObjectName("label_126")
-        self.label_130 = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_130.setGeometry(QtCore.QRect(220, 90, 181, 21))
-        self.label_130.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_130.setObjectName("label_130")
-        self.label_129 = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_129.setGeometry(QtCore.QRect(10, 80, 181, 31))
-        self.label_129.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_129.setObjectName("label_129")
-        self.label_128 = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_128.setGeometry(QtCore.QRect(430, 90, 151, 21))
-        self.label_128.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_128.setObjectName("label_128")
-        self.label_Mini_zane = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_Mini_zane.setGeometry(QtCore.QRect(520, 220, 32, 32))
-        self.label_Mini_zane.setPixmap(QtGui.QPixmap(":/Minis/Images/minis/Mini Zane.png"))
-        self.label_Mini_zane.setScaledContents(True)
-        self.label_Mini_zane.setObjectName("label_Mini_zane")
-        self.label_Mini_berg = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_Mini_berg.setGeometry(QtCore.QRect(490, 220, 32, 32))
-        self.label_Mini_berg.setPixmap(QtGui.QPixmap(":/Minis/Images/minis/Mini Berg.png"))
-        self.label_Mini_berg.setScaledContents(True)
-        self.label_Mini_berg.setObjectName("label_Mini_berg")
-        self.label_Mini_matthias = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_Mini_matthias.setGeometry(QtCore.QRect(430, 250, 32, 32))
-        self.label_Mini_matthias.setPixmap(QtGui.QPixmap(":/Minis/Images/minis/Mini Matthias Abomination.png"))
-        self.label_Mini_matthias.setScaledContents(True)
-        self.label_Mini_matthias.setObjectName("label_Mini_matthias")
-        self.label_Mini_narella = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_Mini_narella.setGeometry(QtCore.QRect(550, 220, 32, 32))
-        self.label_Mini_narella.setPixmap(QtGui.QPixmap(":/Minis/Images/minis/Mini Narella.png"))
-        self.label_Mini_narella.setScaledContents(True)
-        self.label_Mini_narella.setObjectName("label_Mini_narella")
-        self.label_Mini_slothasor = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_Mini_slothasor.setGeometry(QtCore.QRect(460, 220, 32, 32))
-        self.label_Mini_slothasor.setPixmap(QtGui.QPixmap(":/Minis/Images/minis/Mini Slothasor.png"))
-        self.label_Mini_slothasor.setScaledContents(True)
-        self.label_Mini_slothasor.setObjectName("label_Mini_slothasor")
-        self.label_Mini_slubling = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_Mini_slubling.setGeometry(QtCore.QRect(430, 220, 32, 32))
-        self.label_Mini_slubling.setPixmap(QtGui.QPixmap(":/Minis/Images/minis/Mini Slubling.png"))
-        self.label_Mini_slubling.setScaledContents(True)
-        self.label_Mini_slubling.setObjectName("label_Mini_slubling")
-        self.label_83 = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_83.setGeometry(QtCore.QRect(410, 70, 171, 20))
-        self.label_83.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
-        self.label_83.setObjectName("label_83")
-        self.label_84 = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_84.setGeometry(QtCore.QRect(430, 180, 151, 20))
-        self.label_84.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
-        self.label_84.setObjectName("label_84")
-        self.label_85 = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_85.setGeometry(QtCore.QRect(430, 290, 151, 20))
-        self.label_85.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
-        self.label_85.setObjectName("label_85")
-        self.label_86 = QtWidgets.QLabel(self.tab_bosses_hot)
-        self.label_86.setGeometry(QtCore.QRect(420, 400, 161, 20))
-        self.label_86.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
-        self.label_86.setObjectName("label_86")
         self.tabRaids.addTab(self.tab_bosses_hot, "")
         self.tab_bosses_pof = ThemedLayout()
         self.tab_bosses_pof.setObjectName("tab_bosses_pof")
-        self.label_Mini_dhuum = QtWidgets.QLabel(self.tab_bosses_pof)
-        self.label_Mini_dhuum.setGeometry(QtCore.QRect(490, 110, 32, 32))
-        self.label_Mini_dhuum.setPixmap(QtGui.QPixmap(":/Minis/Images/minis/Mini Dhuum.png"))
-        self.label_Mini_dhuum.setScaledContents(True)
-        self.label_Mini_dhuum.setObjectName("label_Mini_dhuum")
-        self.label_Mini_brokenking = QtWidgets.QLabel(self.tab_bosses_pof)
-        self.label_Mini_brokenking.setGeometry(QtCore.QRect(460, 110, 32, 32))
-        self.label_Mini_brokenking.setPixmap(QtGui.QPixmap(":/Minis/Images/minis/Mini Broken King.png"))
-        self.label_Mini_brokenking.setScaledContents(True)
-        self.label_Mini_brokenking.setObjectName("label_Mini_brokenking")
-        self.line_5 = QtWidgets.QFrame(self.tab_bosses_pof)
-        self.line_5.setGeometry(QtCore.QRect(0, 70, 590, 3))
-        self.line_5.setFrameShape(QtWidgets.QFrame.HLine)
-        self.line_5.setFrameShadow(QtWidgets.QFrame.Sunken)
-        self.line_5.setObjectName("line_5")
-        self.label_Skin_qadim_pistol = QtWidgets.QLabel(self.tab_bosses_pof)
-        self.label_Skin_qadim_pistol.setGeometry(QtCore.QRect(370, 220, 32, 32))
-        self.label_Skin_qadim_pistol.setPixmap(QtGui.QPixmap(":/skins/Images/skins/Qadim\'s Flamebelcher.png"))
-        self.label_Skin_qadim_pistol.setScaledContents(True)
-        self.label_Skin_qadim_pistol.setObjectName("label_Skin_qadim_pistol")
-        self.label_Skin_conjured_shield = QtWidgets.QLabel(self.tab_bosses_pof)
-        self.label_Skin_conjured_shield.setGeometry(QtCore.QRect(220, 220, 32, 32))
-        self.label_Skin_conjured_shield.setPixmap(QtGui.QPixmap(":/skins/Images/skins/Conjured Amalgamate\'s Shield.png"))
-        self.label_Skin_conjured_shield.setScaledContents(True)
-        self.label_Skin_conjured_shield.setObjectName("label_Skin_conjured_shield")
-        self.label_Mini_zommoros = QtWidgets.QLabel(self.tab_bosses_pof)
-        self.label_Mini_zommoros.setGeometry(QtCore.QRect(430, 220, 32, 32))
-        self.label_Mini_zommoros.setPixmap(QtGui.QPixmap(":/Minis/Images/minis/Mini Zommoros.png"))
-        self.label_Mini_zommoros.setScaledContents(True)
-        self.label_Mini_zommoros.setObjectName("label_Mini_zommoros")
-        self.label_Skin_desmina_hammer = QtWidgets.QLabel(self.tab_bosses_pof)
-        self.label_Skin_desmina_hammer.setGeometry(QtCore.QRect(250, 110, 32, 32))
-        self.label_Skin_desmina_hammer.setPixmap(QtGui.QPixmap(":/skins/Images/skins/Sledge of the Red Witch.png"))
-        self.label_Skin_desmina_hammer.setScaledContents(True)
-        self.label_Skin_desmina_hammer.setObjectName("label_Skin_desmina_hammer")
-        self.label_Skin_dhuum_gloves = QtWidgets.QLabel(self.tab_bosses_pof)
-        self.label_Skin_dhuum_gloves.setGeometry(QtCore.QRect(310, 140, 32, 32))
-        self.label_Skin_dhuum_gloves.setPixmap(QtGui.QPixmap(":/skins/Images/skins/Gloves of Dhuum.png"))
-        self.label_Skin_dhuum_gloves.setScaledContents(True)
-        self.label_Skin_dhuum_gloves.setObjectName("label_Skin_dhuum_gloves")
-        self.label_Skin_dhuum_helm = QtWidgets.QLabel(self.tab_bosses_pof)
-        self.label_Skin_dhuum_helm.setGeometry(QtCore.QRect(250, 140, 32, 32))
-        self.label_Skin_dhuum_helm.setPixmap(QtGui.QPixmap(":/skins/Images/skins/Skullcap of Dhuum.png"))
-        self.label_Skin_dhuum_helm.setScaledContents(True)
-        self.label_Skin_dhuum_helm.setObjectName("label_Skin_dhuum_helm")
-        self.lineRaidboss_dhuum = QtWidgets.QLineEdit(self.tab_bosses_pof)
-        self.lineRaidboss_dhuum.setGeometry(QtCore.QRect(100, 140, 91, 31))
-        self.lineRaidboss_dhuum.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineRaidboss_dhuum.setFrame(False)
-        self.lineRaidboss_dhuum.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineRaidboss_dhuum.setReadOnly(True)
-        self.lineRaidboss_dhuum.setObjectName("lineRaidboss_dhuum")
-        self.label_Skin_statues_dagger = QtWidgets.QLabel(self.tab_bosses_pof)
-        self.label_Skin_statues_dagger.setGeometry(QtCore.QRect(340, 110, 32, 32))
-        self.label_Skin_statues_dagger.setPixmap(QtGui.QPixmap(":/skins/Images/skins/Touch of Dhuum.png"))
-        self.label_Skin_statues_dagger.setScaledContents(True)
-        self.label_Skin_statues_dagger.setObjectName("label_Skin_statues_dagger")
-        self.line_11 = QtWidgets.QFrame(self.tab_bosses_pof)
-        self.line_11.setGeometry(QtCore.QRect(0, 290, 590, 3))
-        self.line_11.setFrameShape(QtWidgets.QFrame.HLine)
-        self.line_11.setFrameShadow(QtWidgets.QFrame.Sunken)
-        self.line_11.setObjectName("line_11")
-        self.label_Mini_qadim = QtWidgets.QLabel(self.tab_bosses_pof)
-        self.label_Mini_qadim.setGeometry(QtCore.QRect(520, 220, 32, 32))
-        self.label_Mini_qadim.setPixmap(QtGui.QPixmap(":/Minis/Images/minis/Mini Qadim.png"))
-        self.label_Mini_qadim.setScaledContents(True)
-        self.label_Mini_qadim.setObjectName("label_Mini_qadim")
-        self.label_Mini_nikare = QtWidgets.QLabel(self.tab_bosses_pof)
-        self.label_Mini_nikare.setGeometry(QtCore.QRect(490, 220, 32, 32))
-        self.label_Mini_nikare.setPixmap(QtGui.QPixmap(":/Minis/Images/minis/Mini Nikare.png"))
-        self.label_Mini_nikare.setScaledContents(True)
-        self.label_Mini_nikare.setObjectName("label_Mini_nikare")
-        self.label_Skin_qadim_mace = QtWidgets.QLabel(self.tab_bosses_pof)
-        self.label_Skin_qadim_mace.setGeometry(QtCore.QRect(340, 220, 32, 32))
-        self.label_Skin_qadim_mace.setPixmap(QtGui.QPixmap(":/skins/Images/skins/Qadim\'s War Gavel.png"))
-        self.label_Skin_qadim_mace.setScaledContents(True)
-        self.label_Skin_qadim_mace.setObjectName("label_Skin_qadim_mace")
-        self.label_Skin_dhuum_shoulders = QtWidgets.QLabel(self.tab_bosses_pof)
-        self.label_Skin_dhuum_shoulders.setGeometry(QtCore.QRect(280, 140, 32, 32))
-        self.label_Skin_dhuum_shoulders.setPixmap(QtGui.QPixmap(":/skins/Images/skins/Pauldrons of Dhuum.png"))
-        self.label_Skin_dhuum_shoulders.setScaledContents(True)
-        self.label_Skin_dhuum_shoulders.setObjectName("label_Skin_dhuum_shoulders")
-        self.label_Skin_dhuum_staff = QtWidgets.QLabel(self.tab_bosses_pof)
-        self.label_Skin_dhuum_staff.setGeometry(QtCore.QRect(220, 140, 32, 32))
-        self.label_Skin_dhuum_staff.setPixmap(QtGui.QPixmap(":/skins/Images/skins/Oblivion.png"))
-        self.label_Skin_dhuum_staff.setScaledContents(True)
-        self.label_Skin_dhuum_staff.setObjectName("label_Skin_dhuum_staff")
-        self.label_Skin_river_sword = QtWidgets.QLabel(self.tab_bosses_pof)
-        self.label_Skin_river_sword.setGeometry(QtCore.QRect(310, 110, 32, 32))
-        self.label_Skin_river_sword.setPixmap(QtGui.QPixmap(":/skins/Images/skins/The Ender of All.png"))
-        self.label_Skin_river_sword.setScaledContents(True)
-        self.label_Skin_river_sword.setObjectName("label_Skin_river_sword")
-        self.label_39 = QtWidgets.QLabel(self.tab_bosses_pof)
-        self.label_39.setGeometry(QtCore.QRect(0, 70, 591, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        font.setWeight(75)
-        font.setUnderline(True)
-        font.setBold(True)
-        self.label_39.setFont(font)
-        self.label_39.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_39.setObjectName("label_39")
-        self.line_4 = QtWidgets.QFrame(self.tab_bosses_pof)
-        self.line_4.setGeometry(QtCore.QRect(0, 180, 590, 3))
-        self.line_4.setFrameShape(QtWidgets.QFrame.HLine)
-        self.line_4.setFrameShadow(QtWidgets.QFrame.Sunken)
-        self.line_4.setObjectName("line_4")
-        self.lineRaidboss_qadim = QtWidgets.QLineEdit(self.tab_bosses_pof)
-        self.lineRaidboss_qadim.setGeometry(QtCore.QRect(100, 220, 91, 31))
-        self.lineRaidboss_qadim.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineRaidboss_qadim.setFrame(False)
-        self.lineRaidboss_qadim.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineRaidboss_qadim.setReadOnly(True)
-        self.lineRaidboss_qadim.setObjectName("lineRaidboss_qadim")
-        self.label_Skin_conjured_greatsword = QtWidgets.QLabel(self.tab_bosses_pof)
-        self.label_Skin_conjured_greatsword.setGeometry(QtCore.QRect(250, 220, 32, 32))
-        self.label_Skin_conjured_greatsword.setPixmap(QtGui.QPixmap(":/skins/Images/skins/Conjured Amalgamate\'s Greatblade.png"))
-        self.label_Skin_conjured_greatsword.setScaledContents(True)
-        self.label_Skin_conjured_greatsword.setObjectName("label_Skin_conjured_greatsword")
-        self.label_Mini_desmina = QtWidgets.QLabel(self.tab_bosses_pof)
-        self.label_Mini_desmina.setGeometry(QtCore.QRect(430, 110, 32, 32))
-        self.label_Mini_desmina.setPixmap(QtGui.QPixmap(":/Minis/Images/minis/Mini Desmina.png"))
-        self.label_Mini_desmina.setScaledContents(True)
-        self.label_Mini_desmina.setObjectName("label_Mini_desmina")
-        self.label_Skin_river_shield = QtWidgets.QLabel(self.tab_bosses_pof)
-        self.label_Skin_river_shield.setGeometry(QtCore.QRect(280, 110, 32, 32))
-        self.label_Skin_river_shield.setPixmap(QtGui.QPixmap(":/skins/Images/skins/The Voice in the Void.png"))
-        self.label_Skin_river_shield.setScaledContents(True)
-        self.label_Skin_river_shield.setObjectName("label_Skin_river_shield")
-        self.label_Skin_statues_greatsword = QtWidgets.QLabel(self.tab_bosses_pof)
-        self.label_Skin_statues_greatsword.setGeometry(QtCore.QRect(370, 110, 32, 32))
-        self.label_Skin_statues_greatsword.setPixmap(QtGui.QPixmap(":/skins/Images/skins/Final Death.png"))
-        self.label_Skin_statues_greatsword.setScaledContents(True)
-        self.label_Skin_statues_greatsword.setObjectName("label_Skin_statues_greatsword")
-        self.label_Skin_desmina_axe = QtWidgets.QLabel(self.tab_bosses_pof)
-        self.label_Skin_desmina_axe.setGeometry(QtCore.QRect(220, 110, 32, 32))
-        self.label_Skin_desmina_axe.setPixmap(QtGui.QPixmap(":/skins/Images/skins/Flesh and Sinew.png"))
-        self.label_Skin_desmina_axe.setScaledContents(True)
-        self.label_Skin_desmina_axe.setObjectName("label_Skin_desmina_axe")
-        self.lineRaidboss_riverofsouls = QtWidgets.QLineEdit(self.tab_bosses_pof)
-        self.lineRaidboss_riverofsouls.setGeometry(QtCore.QRect(10, 140, 91, 31))
-        self.lineRaidboss_riverofsouls.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineRaidboss_riverofsouls.setFrame(False)
-        self.lineRaidboss_riverofsouls.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineRaidboss_riverofsouls.setReadOnly(True)
-        self.lineRaidboss_riverofsouls.setObjectName("lineRaidboss_riverofsouls")
-        self.lineRaidboss_desmina = QtWidgets.QLineEdit(self.tab_bosses_pof)
-        self.lineRaidboss_desmina.setGeometry(QtCore.QRect(10, 110, 91, 31))
-        self.lineRaidboss_desmina.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineRaidboss_desmina.setFrame(False)
-        self.lineRaidboss_desmina.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineRaidboss_desmina.setReadOnly(True)
-        self.lineRaidboss_desmina.setObjectName("lineRaidboss_desmina")
-        self.lineRaidboss_conjureda = QtWidgets.QLineEdit(self.tab_bosses_pof)
-        self.lineRaidboss_conjureda.setGeometry(QtCore.QRect(10, 220, 91, 31))
-        self.lineRaidboss_conjureda.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineRaidboss_conjureda.setFrame(False)
-        self.lineRaidboss_conjureda.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineRaidboss_conjureda.setReadOnly(True)
-        self.lineRaidboss_conjureda.setObjectName("lineRaidboss_conjureda")
-        self.lineRaidboss_twinlargos = QtWidgets.QLineEdit(self.tab_bosses_pof)
-        self.lineRaidboss_twinlargos.setGeometry(QtCore.QRect(10, 250, 91, 31))
-        self.lineRaidboss_twinlargos.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineRaidboss_twinlargos.setFrame(False)
-        self.lineRaidboss_twinlargos.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineRaidboss_twinlargos.setReadOnly(True)
-        self.lineRaidboss_twinlargos.setObjectName("lineRaidboss_twinlargos")
-        self.label_47 = QtWidgets.QLabel(self.tab_bosses_pof)
-        self.label_47.setGeometry(QtCore.QRect(0, 180, 591, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        font.setWeight(75)
-        font.setUnderline(True)
-        font.setBold(True)
-        self.label_47.setFont(font)
-        self.label_47.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_47.setObjectName("label_47")
-        self.label_Skin_largos_sword = QtWidgets.QLabel(self.tab_bosses_pof)
-        self.label_Skin_largos_sword.setGeometry(QtCore.QRect(280, 220, 32, 32))
-        self.label_Skin_largos_sword.setPixmap(QtGui.QPixmap(":/skins/Images/skins/Largos\' Swiftblade.png"))
-        self.label_Skin_largos_sword.setScaledContents(True)
-        self.label_Skin_largos_sword.setObjectName("label_Skin_largos_sword")
-        self.lineRaidboss_statues = QtWidgets.QLineEdit(self.tab_bosses_pof)
-        self.lineRaidboss_statues.setGeometry(QtCore.QRect(100, 110, 91, 31))
-        self.lineRaidboss_statues.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineRaidboss_statues.setFrame(False)
-        self.lineRaidboss_statues.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineRaidboss_statues.setReadOnly(True)
-        self.lineRaidboss_statues.setObjectName("lineRaidboss_statues")
-        self.label_Mini_kenut = QtWidgets.QLabel(self.tab_bosses_pof)
-        self.label_Mini_kenut.setGeometry(QtCore.QRect(460, 220, 32, 32))
-        self.label_Mini_kenut.setPixmap(QtGui.QPixmap(":/Minis/Images/minis/Mini Kenut.png"))
-        self.label_Mini_kenut.setScaledContents(True)
-        self.label_Mini_kenut.setObjectName("label_Mini_kenut")
-        self.label_Skin_largos_longbow = QtWidgets.QLabel(self.tab_bosses_pof)
-        self.label_Skin_largos_longbow.setGeometry(QtCore.QRect(310, 220, 32, 32))
-        self.label_Skin_largos_longbow.setPixmap(QtGui.QPixmap(":/skins/Images/skins/Largos\' Greatbow.png"))
-        self.label_Skin_largos_longbow.setScaledContents(True)
-        self.label_Skin_largos_longbow.setObjectName("label_Skin_largos_longbow")
-        self.label_68 = QtWidgets.QLabel(self.tab_bosses_pof)
-        self.label_68.setGeometry(QtCore.QRect(0, 290, 591, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        font.setWeight(75)
-        font.setUnderline(True)
-        font.setBold(True)
-        self.label_68.setFont(font)
-        self.label_68.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_68.setObjectName("label_68")
-        self.label_Skin_dhuum_boots = QtWidgets.QLabel(self.tab_bosses_pof)
-        self.label_Skin_dhuum_boots.setGeometry(QtCore.QRect(340, 140, 32, 32))
-        self.label_Skin_dhuum_boots.setPixmap(QtGui.QPixmap(":/skins/Images/skins/Slippers of Dhuum.png"))
-        self.label_Skin_dhuum_boots.setScaledContents(True)
-        self.label_Skin_dhuum_boots.setObjectName("label_Skin_dhuum_boots")
-        self.label_74 = QtWidgets.QLabel(self.tab_bosses_pof)
-        self.label_74.setGeometry(QtCore.QRect(10, 22, 311, 21))
-        self.label_74.setAlignment(QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft|QtCore.Qt.AlignVCenter)
-        self.label_74.setObjectName("label_74")
-        self.label_118 = QtWidgets.QLabel(self.tab_bosses_pof)
-        self.label_118.setGeometry(QtCore.QRect(0, 0, 281, 21))
-        self.label_118.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_118.setObjectName("label_118")
-        self.label_73 = QtWidgets.QLabel(self.tab_bosses_pof)
-        self.label_73.setGeometry(QtCore.QRect(10, 40, 311, 21))
-        self.label_73.setAlignment(QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft|QtCore.Qt.AlignVCenter)
-        self.label_73.setObjectName("label_73")
-        self.label_117 = QtWidgets.QLabel(self.tab_bosses_pof)
-        self.label_117.setGeometry(QtCore.QRect(390, 0, 191, 21))
-        self.label_117.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_117.setObjectName("label_117")
-        self.lineCurrency_Legend_divinations = QtWidgets.QLineEdit(self.tab_bosses_pof)
-        self.lineCurrency_Legend_divinations.setGeometry(QtCore.QRect(530, 40, 51, 20))
-        self.lineCurrency_Legend_divinations.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineCurrency_Legend_divinations.setText("")
-        self.lineCurrency_Legend_divinations.setFrame(False)
-        self.lineCurrency_Legend_divinations.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineCurrency_Legend_divinations.setReadOnly(True)
-        self.lineCurrency_Legend_divinations.setObjectName("lineCurrency_Legend_divinations")
-        self.lineCurrency_Gaetingcrystals = QtWidgets.QLineEdit(self.tab_bosses_pof)
-        self.lineCurrency_Gaetingcrystals.setGeometry(QtCore.QRect(530, 20, 51, 20))
-        self.lineCurrency_Gaetingcrystals.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineCurrency_Gaetingcrystals.setText("")
-        self.lineCurrency_Gaetingcrystals.setFrame(False)
-        self.lineCurrency_Gaetingcrystals.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineCurrency_Gaetingcrystals.setReadOnly(True)
-        self.lineCurrency_Gaetingcrystals.setObjectName("lineCurrency_Gaetingcrystals")
-        self.label_45 = QtWidgets.QLabel(self.tab_bosses_pof)
-        self.label_45.setGeometry(QtCore.QRect(420, 20, 101, 20))
-        self.label_45.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
-        self.label_45.setObjectName("label_45")
-        self.label_81 = QtWidgets.QLabel(self.tab_bosses_pof)
-        self.label_81.setGeometry(QtCore.QRect(380, 40, 141, 20))
-        self.label_81.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
-        self.label_81.setObjectName("label_81")
-        self.label_87 = QtWidgets.QLabel(self.tab_bosses_pof)
-        self.label_87.setGeometry(QtCore.QRect(420, 70, 171, 20))
-        self.label_87.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
-        self.label_87.setObjectName("label_87")
-        self.label_88 = QtWidgets.QLabel(self.tab_bosses_pof)
-        self.label_88.setGeometry(QtCore.QRect(420, 180, 171, 20))
-        self.label_88.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
-        self.label_88.setObjectName("label_88")
-        self.label_91 = QtWidgets.QLabel(self.tab_bosses_pof)
-        self.label_91.setGeometry(QtCore.QRect(410, 290, 171, 20))
-        self.label_91.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
-        self.label_91.setObjectName("label_91")
-        self.label_133 = QtWidgets.QLabel(self.tab_bosses_pof)
-        self.label_133.setGeometry(QtCore.QRect(220, 90, 181, 21))
-        self.label_133.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_133.setObjectName("label_133")
-        self.label_131 = QtWidgets.QLabel(self.tab_bosses_pof)
-        self.label_131.setGeometry(QtCore.QRect(10, 80, 181, 31))
-        self.label_131.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_131.setObjectName("label_131")
-        self.label_132 = QtWidgets.QLabel(self.tab_bosses_pof)
-        self.label_132.setGeometry(QtCore.QRect(430, 90, 151, 21))
-        self.label_132.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_132.setObjectName("label_132")
-        self.label_134 = QtWidgets.QLabel(self.tab_bosses_pof)
-        self.label_134.setGeometry(QtCore.QRect(220, 200, 181, 21))
-        self.label_134.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_134.setObjectName("label_134")
-        self.label_135 = QtWidgets.QLabel(self.tab_bosses_pof)
-        self.label_135.setGeometry(QtCore.QRect(10, 190, 181, 31))
-        self.label_135.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_135.setObjectName("label_135")
-        self.label_136 = QtWidgets.QLabel(self.tab_bosses_pof)
-        self.label_136.setGeometry(QtCore.QRect(430, 200, 151, 21))
-        self.label_136.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_136.setObjectName("label_136")
-        self.lineRaidboss_adina = QtWidgets.QLineEdit(self.tab_bosses_pof)
-        self.lineRaidboss_adina.setGeometry(QtCore.QRect(10, 360, 91, 31))
-        self.lineRaidboss_adina.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineRaidboss_adina.setFrame(False)
-        self.lineRaidboss_adina.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineRaidboss_adina.setReadOnly(True)
-        self.lineRaidboss_adina.setObjectName("lineRaidboss_adina")
-        self.lineRaidboss_gateofahdashim = QtWidgets.QLineEdit(self.tab_bosses_pof)
-        self.lineRaidboss_gateofahdashim.setGeometry(QtCore.QRect(10, 330, 91, 31))
-        self.lineRaidboss_gateofahdashim.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineRaidboss_gateofahdashim.setFrame(False)
-        self.lineRaidboss_gateofahdashim.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineRaidboss_gateofahdashim.setReadOnly(True)
-        self.lineRaidboss_gateofahdashim.setObjectName("lineRaidboss_gateofahdashim")
-        self.lineRaidboss_sabir = QtWidgets.QLineEdit(self.tab_bosses_pof)
-        self.lineRaidboss_sabir.setGeometry(QtCore.QRect(100, 330, 91, 31))
-        self.lineRaidboss_sabir.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineRaidboss_sabir.setFrame(False)
-        self.lineRaidboss_sabir.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineRaidboss_sabir.setReadOnly(True)
-        self.lineRaidboss_sabir.setObjectName("lineRaidboss_sabir")
-        self.label_137 = QtWidgets.QLabel(self.tab_bosses_pof)
-        self.label_137.setGeometry(QtCore.QRect(10, 300, 181, 31))
-        self.label_137.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_137.setObjectName("label_137")
-        self.lineRaidboss_qadim2 = QtWidgets.QLineEdit(self.tab_bosses_pof)
-        self.lineRaidboss_qadim2.setGeometry(QtCore.QRect(100, 360, 91, 31))
-        self.lineRaidboss_qadim2.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineRaidboss_qadim2.setFrame(False)
-        self.lineRaidboss_qadim2.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineRaidboss_qadim2.setReadOnly(True)
-        self.lineRaidboss_qadim2.setObjectName("lineRaidboss_qadim2")
-        self.label_Mini_djinnlamp = QtWidgets.QLabel(self.tab_bosses_pof)
-        self.label_Mini_djinnlamp.setGeometry(QtCore.QRect(460, 330, 32, 32))
-        self.label_Mini_djinnlamp.setPixmap(QtGui.QPixmap(":/Minis/Images/minis/Mini Djinn Lamp.png"))
-        self.label_Mini_djinnlamp.setScaledContents(True)
-        self.label_Mini_djinnlamp.setObjectName("label_Mini_djinnlamp")
-        self.label_Mini_qadim2 = QtWidgets.QLabel(self.tab_bosses_pof)
-        self.label_Mini_qadim2.setGeometry(QtCore.QRect(490, 330, 32, 32))
-        self.label_Mini_qadim2.setPixmap(QtGui.QPixmap(":/Minis/Images/minis/Mini Qadim2.png"))
-        self.label_Mini_qadim2.setScaledContents(True)
-        self.label_Mini_qadim2.setObjectName("label_Mini_qadim2")
-        self.label_Mini_keyofahdashim = QtWidgets.QLabel(self.tab_bosses_pof)
-        self.label_Mini_keyofahdashim.setGeometry(QtCore.QRect(430, 330, 32, 32))
-        self.label_Mini_keyofahdashim.setPixmap(QtGui.QPixmap(":/Minis/Images/minis/Mini Key of Ahdashim.png"))
-        self.label_Mini_keyofahdashim.setScaledContents(True)
-        self.label_Mini_keyofahdashim.setObjectName("label_Mini_keyofahdashim")
-        self.label_138 = QtWidgets.QLabel(self.tab_bosses_pof)
-        self.label_138.setGeometry(QtCore.QRect(430, 310, 151, 21))
-        self.label_138.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_138.setObjectName("label_138")
-        self.label_Skin_sabir_scepter = QtWidgets.QLabel(self.tab_bosses_pof)
-        self.label_Skin_sabir_scepter.setGeometry(QtCore.QRect(220, 330, 32, 32))
-        self.label_Skin_sabir_scepter.setPixmap(QtGui.QPixmap(":/skins/Images/skins/Sabir Scepter.png"))
-        self.label_Skin_sabir_scepter.setScaledContents(True)
-        self.label_Skin_sabir_scepter.setObjectName("label_Skin_sabir_scepter")
-        self.label_Skin_qadim_torch = QtWidgets.QLabel(self.tab_bosses_pof)
-        self.label_Skin_qadim_torch.setGeometry(QtCore.QRect(370, 330, 32, 32))
-        self.label_Skin_qadim_torch.setPixmap(QtGui.QPixmap(":/skins/Images/skins/Qadim Torch.png"))
-        self.label_Skin_qadim_torch.setScaledContents(True)
-        self.label_Skin_qadim_torch.setObjectName("label_Skin_qadim_torch")
-        self.label_Skin_adina_rifle = QtWidgets.QLabel(self.tab_bosses_pof)
-        self.label_Skin_adina_rifle.setGeometry(QtCore.QRect(310, 330, 32, 32))
-        self.label_Skin_adina_rifle.setPixmap(QtGui.QPixmap(":/skins/Images/skins/Adina rifle.png"))
-        self.label_Skin_adina_rifle.setScaledContents(True)
-        self.label_Skin_adina_rifle.setObjectName("label_Skin_adina_rifle")
-        self.label_Skin_qadim_longbow = QtWidgets.QLabel(self.tab_bosses_pof)
-        self.label_Skin_qadim_longbow.setGeometry(QtCore.QRect(340, 330, 32, 32))
-        self.label_Skin_qadim_longbow.setPixmap(QtGui.QPixmap(":/skins/Images/skins/Qadim Longbow.png"))
-        self.label_Skin_qadim_longbow.setScaledContents(True)
-        self.label_Skin_qadim_longbow.setObjectName("label_Skin_qadim_longbow")
-        self.label_139 = QtWidgets.QLabel(self.tab_bosses_pof)
-        self.label_139.setGeometry(QtCore.QRect(220, 310, 181, 21))
-        self.label_139.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_139.setObjectName("label_139")
-        self.label_Skin_sabir_warhorn = QtWidgets.QLabel(self.tab_bosses_pof)
-        self.label_Skin_sabir_warhorn.setGeometry(QtCore.QRect(250, 330, 32, 32))
-        self.label_Skin_sabir_warhorn.setPixmap(QtGui.QPixmap(":/skins/Images/skins/Sabir Warhorn.png"))
-        self.label_Skin_sabir_warhorn.setScaledContents(True)
-        self.label_Skin_sabir_warhorn.setObjectName("label_Skin_sabir_warhorn")
-        self.label_Skin_adina_focus = QtWidgets.QLabel(self.tab_bosses_pof)
-        self.label_Skin_adina_focus.setGeometry(QtCore.QRect(280, 330, 32, 32))
-        self.label_Skin_adina_focus.setPixmap(QtGui.QPixmap(":/skins/Images/skins/Adina Focus.png"))
-        self.label_Skin_adina_focus.setScaledContents(True)
-        self.label_Skin_adina_focus.setObjectName("label_Skin_adina_focus")
         self.tabRaids.addTab(self.tab_bosses_pof, "")
         self.tab_achievements = ThemedLayout()
         self.tab_achievements.setObjectName("tab_achievements")
-        self.label_28 = QtWidgets.QLabel(self.tab_achievements)
-        self.label_28.setGeometry(QtCore.QRect(10, 0, 581, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        font.setWeight(75)
-        font.setUnderline(True)
-        font.setBold(True)
-        self.label_28.setFont(font)
-        self.label_28.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_28.setObjectName("label_28")
-        self.label_40 = QtWidgets.QLabel(self.tab_achievements)
-        self.label_40.setGeometry(QtCore.QRect(10, 260, 581, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        font.setWeight(75)
-        font.setUnderline(True)
-        font.setBold(True)
-        self.label_40.setFont(font)
-        self.label_40.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_40.setObjectName("label_40")
-        self.lineAchiev_w4_wardenwillsee = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w4_wardenwillsee.setGeometry(QtCore.QRect(10, 320, 151, 20))
-        self.lineAchiev_w4_wardenwillsee.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w4_wardenwillsee.setFrame(False)
-        self.lineAchiev_w4_wardenwillsee.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineAchiev_w4_wardenwillsee.setReadOnly(True)
-        self.lineAchiev_w4_wardenwillsee.setObjectName("lineAchiev_w4_wardenwillsee")
-        self.lineAchiev_w4_voiceofdecease = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w4_voiceofdecease.setGeometry(QtCore.QRect(170, 280, 131, 20))
-        self.lineAchiev_w4_voiceofdecease.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w4_voiceofdecease.setFrame(False)
-        self.lineAchiev_w4_voiceofdecease.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineAchiev_w4_voiceofdecease.setReadOnly(True)
-        self.lineAchiev_w4_voiceofdecease.setObjectName("lineAchiev_w4_voiceofdecease")
-        self.lineAchiev_w4_realraidertyr = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w4_realraidertyr.setGeometry(QtCore.QRect(10, 280, 151, 20))
-        self.lineAchiev_w4_realraidertyr.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w4_realraidertyr.setFrame(False)
-        self.lineAchiev_w4_realraidertyr.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
-        self.lineAchiev_w4_realraidertyr.setReadOnly(True)
-        self.lineAchiev_w4_realraidertyr.setObjectName("lineAchiev_w4_realraidertyr")
-        self.label_37 = QtWidgets.QLabel(self.tab_achievements)
-        self.label_37.setGeometry(QtCore.QRect(10, 100, 581, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        font.setWeight(75)
-        font.setUnderline(True)
-        font.setBold(True)
-        self.label_37.setFont(font)
-        self.label_37.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_37.setObjectName("label_37")
-        self.label_41 = QtWidgets.QLabel(self.tab_achievements)
-        self.label_41.setGeometry(QtCore.QRect(10, 170, 581, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        font.setWeight(75)
-        font.setUnderline(True)
-        font.setBold(True)
-        self.label_41.setFont(font)
-        self.label_41.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_41.setObjectName("label_41")
-        self.label_42 = QtWidgets.QLabel(self.tab_achievements)
-        self.label_42.setGeometry(QtCore.QRect(10, 340, 581, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        font.setWeight(75)
-        font.setUnderline(True)
-        font.setBold(True)
-        self.label_42.setFont(font)
-        self.label_42.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_42.setObjectName("label_42")
-        self.label_48 = QtWidgets.QLabel(self.tab_achievements)
-        self.label_48.setGeometry(QtCore.QRect(10, 410, 581, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        font.setWeight(75)
-        font.setUnderline(True)
-        font.setBold(True)
-        self.label_48.setFont(font)
-        self.label_48.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_48.setObjectName("label_48")
-        self.lineAchiev_w1_beyondthevale = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w1_beyondthevale.setGeometry(QtCore.QRect(290, 20, 91, 20))
-        self.lineAchiev_w1_beyondthevale.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w1_beyondthevale.setFrame(False)
-        self.lineAchiev_w1_beyondthevale.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineAchiev_w1_beyondthevale.setReadOnly(True)
-        self.lineAchiev_w1_beyondthevale.setObjectName("lineAchiev_w1_beyondthevale")
-        self.lineAchiev_w1_denied = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w1_denied.setGeometry(QtCore.QRect(460, 40, 51, 20))
-        self.lineAchiev_w1_denied.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w1_denied.setFrame(False)
-        self.lineAchiev_w1_denied.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineAchiev_w1_denied.setReadOnly(True)
-        self.lineAchiev_w1_denied.setObjectName("lineAchiev_w1_denied")
-        self.lineAchiev_w1_rgb = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w1_rgb.setGeometry(QtCore.QRect(460, 60, 51, 20))
-        self.lineAchiev_w1_rgb.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w1_rgb.setFrame(False)
-        self.lineAchiev_w1_rgb.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineAchiev_w1_rgb.setReadOnly(True)
-        self.lineAchiev_w1_rgb.setObjectName("lineAchiev_w1_rgb")
-        self.lineAchiev_w1_lastcannon = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w1_lastcannon.setGeometry(QtCore.QRect(170, 80, 111, 20))
-        self.lineAchiev_w1_lastcannon.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w1_lastcannon.setFrame(False)
-        self.lineAchiev_w1_lastcannon.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineAchiev_w1_lastcannon.setReadOnly(True)
-        self.lineAchiev_w1_lastcannon.setObjectName("lineAchiev_w1_lastcannon")
-        self.lineAchiev_w1_fleethestorm = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w1_fleethestorm.setGeometry(QtCore.QRect(290, 40, 91, 20))
-        self.lineAchiev_w1_fleethestorm.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w1_fleethestorm.setFrame(False)
-        self.lineAchiev_w1_fleethestorm.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineAchiev_w1_fleethestorm.setReadOnly(True)
-        self.lineAchiev_w1_fleethestorm.setObjectName("lineAchiev_w1_fleethestorm")
-        self.lineAchiev_w1_spectralanomaly = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w1_spectralanomaly.setGeometry(QtCore.QRect(10, 80, 151, 20))
-        self.lineAchiev_w1_spectralanomaly.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w1_spectralanomaly.setFrame(False)
-        self.lineAchiev_w1_spectralanomaly.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineAchiev_w1_spectralanomaly.setReadOnly(True)
-        self.lineAchiev_w1_spectralanomaly.setObjectName("lineAchiev_w1_spectralanomaly")
-        self.lineAchiev_w1_puttorest = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w1_puttorest.setGeometry(QtCore.QRect(390, 40, 61, 20))
-        self.lineAchiev_w1_puttorest.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w1_puttorest.setFrame(False)
-        self.lineAchiev_w1_puttorest.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineAchiev_w1_puttorest.setReadOnly(True)
-        self.lineAchiev_w1_puttorest.setObjectName("lineAchiev_w1_puttorest")
-        self.lineAchiev_w1_piecingit = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w1_piecingit.setGeometry(QtCore.QRect(170, 20, 111, 20))
-        self.lineAchiev_w1_piecingit.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w1_piecingit.setFrame(False)
-        self.lineAchiev_w1_piecingit.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineAchiev_w1_piecingit.setReadOnly(True)
-        self.lineAchiev_w1_piecingit.setObjectName("lineAchiev_w1_piecingit")
-        self.lineAchiev_w1_keepthelights = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w1_keepthelights.setGeometry(QtCore.QRect(170, 40, 111, 20))
-        self.lineAchiev_w1_keepthelights.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w1_keepthelights.setFrame(False)
-        self.lineAchiev_w1_keepthelights.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineAchiev_w1_keepthelights.setReadOnly(True)
-        self.lineAchiev_w1_keepthelights.setObjectName("lineAchiev_w1_keepthelights")
-        self.lineAchiev_w1_myhero = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w1_myhero.setGeometry(QtCore.QRect(390, 60, 61, 20))
-        self.lineAchiev_w1_myhero.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w1_myhero.setFrame(False)
-        self.lineAchiev_w1_myhero.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineAchiev_w1_myhero.setReadOnly(True)
-        self.lineAchiev_w1_myhero.setObjectName("lineAchiev_w1_myhero")
-        self.lineAchiev_w1_angermanage = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w1_angermanage.setGeometry(QtCore.QRect(10, 40, 151, 20))
-        self.lineAchiev_w1_angermanage.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w1_angermanage.setFrame(False)
-        self.lineAchiev_w1_angermanage.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineAchiev_w1_angermanage.setReadOnly(True)
-        self.lineAchiev_w1_angermanage.setObjectName("lineAchiev_w1_angermanage")
-        self.lineAchiev_w1_lootfinder = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w1_lootfinder.setGeometry(QtCore.QRect(390, 20, 61, 20))
-        self.lineAchiev_w1_lootfinder.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w1_lootfinder.setFrame(False)
-        self.lineAchiev_w1_lootfinder.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineAchiev_w1_lootfinder.setReadOnly(True)
-        self.lineAchiev_w1_lootfinder.setObjectName("lineAchiev_w1_lootfinder")
-        self.lineAchiev_w1_fireextinguish = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w1_fireextinguish.setGeometry(QtCore.QRect(10, 60, 151, 20))
-        self.lineAchiev_w1_fireextinguish.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w1_fireextinguish.setFrame(False)
-        self.lineAchiev_w1_fireextinguish.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineAchiev_w1_fireextinguish.setReadOnly(True)
-        self.lineAchiev_w1_fireextinguish.setObjectName("lineAchiev_w1_fireextinguish")
-        self.lineAchiev_w1_liftoff = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w1_liftoff.setGeometry(QtCore.QRect(460, 20, 51, 20))
-        self.lineAchiev_w1_liftoff.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w1_liftoff.setFrame(False)
-        self.lineAchiev_w1_liftoff.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineAchiev_w1_liftoff.setReadOnly(True)
-        self.lineAchiev_w1_liftoff.setObjectName("lineAchiev_w1_liftoff")
-        self.lineAchiev_w1_outranaghost = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w1_outranaghost.setGeometry(QtCore.QRect(10, 20, 151, 20))
-        self.lineAchiev_w1_outranaghost.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w1_outranaghost.setFrame(False)
-        self.lineAchiev_w1_outranaghost.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineAchiev_w1_outranaghost.setReadOnly(True)
-        self.lineAchiev_w1_outranaghost.setObjectName("lineAchiev_w1_outranaghost")
-        self.lineAchiev_w1_backdraftd = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w1_backdraftd.setGeometry(QtCore.QRect(170, 60, 111, 20))
-        self.lineAchiev_w1_backdraftd.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w1_backdraftd.setFrame(False)
-        self.lineAchiev_w1_backdraftd.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineAchiev_w1_backdraftd.setReadOnly(True)
-        self.lineAchiev_w1_backdraftd.setObjectName("lineAchiev_w1_backdraftd")
-        self.lineAchiev_w1_intothewoods = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w1_intothewoods.setGeometry(QtCore.QRect(290, 60, 91, 20))
-        self.lineAchiev_w1_intothewoods.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w1_intothewoods.setFrame(False)
-        self.lineAchiev_w1_intothewoods.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineAchiev_w1_intothewoods.setReadOnly(True)
-        self.lineAchiev_w1_intothewoods.setObjectName("lineAchiev_w1_intothewoods")
-        self.lineAchiev_w2_environmentally = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w2_environmentally.setGeometry(QtCore.QRect(10, 120, 151, 20))
-        self.lineAchiev_w2_environmentally.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w2_environmentally.setFrame(False)
-        self.lineAchiev_w2_environmentally.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineAchiev_w2_environmentally.setReadOnly(True)
-        self.lineAchiev_w2_environmentally.setObjectName("lineAchiev_w2_environmentally")
-        self.lineAchiev_w2_spmastery = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w2_spmastery.setGeometry(QtCore.QRect(10, 140, 151, 20))
-        self.lineAchiev_w2_spmastery.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w2_spmastery.setFrame(False)
-        self.lineAchiev_w2_spmastery.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineAchiev_w2_spmastery.setReadOnly(True)
-        self.lineAchiev_w2_spmastery.setObjectName("lineAchiev_w2_spmastery")
-        self.lineAchiev_w2_seimurwasw = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w2_seimurwasw.setGeometry(QtCore.QRect(170, 120, 111, 20))
-        self.lineAchiev_w2_seimurwasw.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w2_seimurwasw.setFrame(False)
-        self.lineAchiev_w2_seimurwasw.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineAchiev_w2_seimurwasw.setReadOnly(True)
-        self.lineAchiev_w2_seimurwasw.setObjectName("lineAchiev_w2_seimurwasw")
-        self.lineAchiev_w2_spsadist = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w2_spsadist.setGeometry(QtCore.QRect(290, 140, 111, 20))
-        self.lineAchiev_w2_spsadist.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w2_spsadist.setFrame(False)
-        self.lineAchiev_w2_spsadist.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineAchiev_w2_spsadist.setReadOnly(True)
-        self.lineAchiev_w2_spsadist.setObjectName("lineAchiev_w2_spsadist")
-        self.lineAchiev_w2_slipperyslub = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w2_slipperyslub.setGeometry(QtCore.QRect(290, 120, 111, 20))
-        self.lineAchiev_w2_slipperyslub.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w2_slipperyslub.setFrame(False)
-        self.lineAchiev_w2_slipperyslub.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
-        self.lineAchiev_w2_slipperyslub.setReadOnly(True)
-        self.lineAchiev_w2_slipperyslub.setObjectName("lineAchiev_w2_slipperyslub")
-        self.lineAchiev_w3_traversethetc = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w3_traversethetc.setGeometry(QtCore.QRect(10, 190, 151, 20))
-        self.lineAchiev_w3_traversethetc.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w3_traversethetc.setFrame(False)
-        self.lineAchiev_w3_traversethetc.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineAchiev_w3_traversethetc.setReadOnly(True)
-        self.lineAchiev_w3_traversethetc.setObjectName("lineAchiev_w3_traversethetc")
-        self.lineAchiev_w3_scourgeofwm = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w3_scourgeofwm.setGeometry(QtCore.QRect(10, 210, 151, 20))
-        self.lineAchiev_w3_scourgeofwm.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w3_scourgeofwm.setFrame(False)
-        self.lineAchiev_w3_scourgeofwm.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineAchiev_w3_scourgeofwm.setReadOnly(True)
-        self.lineAchiev_w3_scourgeofwm.setObjectName("lineAchiev_w3_scourgeofwm")
-        self.lineAchiev_w3_outrunawarg = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w3_outrunawarg.setGeometry(QtCore.QRect(170, 210, 111, 20))
-        self.lineAchiev_w3_outrunawarg.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w3_outrunawarg.setFrame(False)
-        self.lineAchiev_w3_outrunawarg.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineAchiev_w3_outrunawarg.setReadOnly(True)
-        self.lineAchiev_w3_outrunawarg.setObjectName("lineAchiev_w3_outrunawarg")
-        self.lineAchiev_w3_downdownd = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w3_downdownd.setGeometry(QtCore.QRect(170, 190, 111, 20))
-        self.lineAchiev_w3_downdownd.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w3_downdownd.setFrame(False)
-        self.lineAchiev_w3_downdownd.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineAchiev_w3_downdownd.setReadOnly(True)
-        self.lineAchiev_w3_downdownd.setObjectName("lineAchiev_w3_downdownd")
-        self.lineAchiev_w4_greetedaslib = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w4_greetedaslib.setGeometry(QtCore.QRect(10, 300, 151, 20))
-        self.lineAchiev_w4_greetedaslib.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w4_greetedaslib.setFrame(False)
-        self.lineAchiev_w4_greetedaslib.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineAchiev_w4_greetedaslib.setReadOnly(True)
-        self.lineAchiev_w4_greetedaslib.setObjectName("lineAchiev_w4_greetedaslib")
-        self.lineAchiev_w4_harshsentence = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w4_harshsentence.setGeometry(QtCore.QRect(410, 280, 101, 20))
-        self.lineAchiev_w4_harshsentence.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w4_harshsentence.setFrame(False)
-        self.lineAchiev_w4_harshsentence.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineAchiev_w4_harshsentence.setReadOnly(True)
-        self.lineAchiev_w4_harshsentence.setObjectName("lineAchiev_w4_harshsentence")
-        self.lineAchiev_w4_breakingin = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w4_breakingin.setGeometry(QtCore.QRect(310, 280, 91, 20))
-        self.lineAchiev_w4_breakingin.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w4_breakingin.setFrame(False)
-        self.lineAchiev_w4_breakingin.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineAchiev_w4_breakingin.setReadOnly(True)
-        self.lineAchiev_w4_breakingin.setObjectName("lineAchiev_w4_breakingin")
-        self.lineAchiev_w4_jaded = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w4_jaded.setGeometry(QtCore.QRect(310, 300, 91, 20))
-        self.lineAchiev_w4_jaded.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w4_jaded.setFrame(False)
-        self.lineAchiev_w4_jaded.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineAchiev_w4_jaded.setReadOnly(True)
-        self.lineAchiev_w4_jaded.setObjectName("lineAchiev_w4_jaded")
-        self.lineAchiev_w4_attuned = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w4_attuned.setGeometry(QtCore.QRect(520, 280, 71, 20))
-        self.lineAchiev_w4_attuned.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w4_attuned.setFrame(False)
-        self.lineAchiev_w4_attuned.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
-        self.lineAchiev_w4_attuned.setReadOnly(True)
-        self.lineAchiev_w4_attuned.setObjectName("lineAchiev_w4_attuned")
-        self.lineAchiev_w3_minecontrol = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w3_minecontrol.setGeometry(QtCore.QRect(520, 190, 71, 20))
-        self.lineAchiev_w3_minecontrol.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w3_minecontrol.setFrame(False)
-        self.lineAchiev_w3_minecontrol.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineAchiev_w3_minecontrol.setReadOnly(True)
-        self.lineAchiev_w3_minecontrol.setObjectName("lineAchiev_w3_minecontrol")
-        self.lineAchiev_w3_dismantled = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w3_dismantled.setGeometry(QtCore.QRect(520, 210, 71, 20))
-        self.lineAchiev_w3_dismantled.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w3_dismantled.setFrame(False)
-        self.lineAchiev_w3_dismantled.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineAchiev_w3_dismantled.setReadOnly(True)
-        self.lineAchiev_w3_dismantled.setObjectName("lineAchiev_w3_dismantled")
-        self.lineAchiev_w2_avengerofpact = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w2_avengerofpact.setGeometry(QtCore.QRect(410, 140, 111, 20))
-        self.lineAchiev_w2_avengerofpact.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w2_avengerofpact.setFrame(False)
-        self.lineAchiev_w2_avengerofpact.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineAchiev_w2_avengerofpact.setReadOnly(True)
-        self.lineAchiev_w2_avengerofpact.setObjectName("lineAchiev_w2_avengerofpact")
-        self.lineAchiev_w2_scatteredm = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w2_scatteredm.setGeometry(QtCore.QRect(410, 120, 111, 20))
-        self.lineAchiev_w2_scatteredm.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w2_scatteredm.setFrame(False)
-        self.lineAchiev_w2_scatteredm.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineAchiev_w2_scatteredm.setReadOnly(True)
-        self.lineAchiev_w2_scatteredm.setObjectName("lineAchiev_w2_scatteredm")
-        self.lineAchiev_w4_freeatlast = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w4_freeatlast.setGeometry(QtCore.QRect(520, 300, 71, 20))
-        self.lineAchiev_w4_freeatlast.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w4_freeatlast.setFrame(False)
-        self.lineAchiev_w4_freeatlast.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineAchiev_w4_freeatlast.setReadOnly(True)
-        self.lineAchiev_w4_freeatlast.setObjectName("lineAchiev_w4_freeatlast")
-        self.lineAchiev_w3_loveisbunny = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w3_loveisbunny.setGeometry(QtCore.QRect(290, 210, 91, 20))
-        self.lineAchiev_w3_loveisbunny.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w3_loveisbunny.setFrame(False)
-        self.lineAchiev_w3_loveisbunny.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineAchiev_w3_loveisbunny.setReadOnly(True)
-        self.lineAchiev_w3_loveisbunny.setObjectName("lineAchiev_w3_loveisbunny")
-        self.lineAchiev_w3_mildlyinsane = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w3_mildlyinsane.setGeometry(QtCore.QRect(290, 190, 91, 20))
-        self.lineAchiev_w3_mildlyinsane.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w3_mildlyinsane.setFrame(False)
-        self.lineAchiev_w3_mildlyinsane.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineAchiev_w3_mildlyinsane.setReadOnly(True)
-        self.lineAchiev_w3_mildlyinsane.setObjectName("lineAchiev_w3_mildlyinsane")
-        self.lineAchiev_w3_siegethestrong = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w3_siegethestrong.setGeometry(QtCore.QRect(10, 230, 151, 20))
-        self.lineAchiev_w3_siegethestrong.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w3_siegethestrong.setFrame(False)
-        self.lineAchiev_w3_siegethestrong.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineAchiev_w3_siegethestrong.setReadOnly(True)
-        self.lineAchiev_w3_siegethestrong.setObjectName("lineAchiev_w3_siegethestrong")
-        self.lineAchiev_w3_evasivemane = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w3_evasivemane.setGeometry(QtCore.QRect(390, 190, 121, 20))
-        self.lineAchiev_w3_evasivemane.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w3_evasivemane.setFrame(False)
-        self.lineAchiev_w3_evasivemane.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineAchiev_w3_evasivemane.setReadOnly(True)
-        self.lineAchiev_w3_evasivemane.setObjectName("lineAchiev_w3_evasivemane")
-        self.lineAchiev_w3_deconstructed = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w3_deconstructed.setGeometry(QtCore.QRect(390, 210, 121, 20))
-        self.lineAchiev_w3_deconstructed.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w3_deconstructed.setFrame(False)
-        self.lineAchiev_w3_deconstructed.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineAchiev_w3_deconstructed.setReadOnly(True)
-        self.lineAchiev_w3_deconstructed.setObjectName("lineAchiev_w3_deconstructed")
-        self.lineAchiev_w5_whatisdeathmay = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w5_whatisdeathmay.setGeometry(QtCore.QRect(10, 360, 151, 20))
-        self.lineAchiev_w5_whatisdeathmay.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w5_whatisdeathmay.setFrame(False)
-        self.lineAchiev_w5_whatisdeathmay.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineAchiev_w5_whatisdeathmay.setReadOnly(True)
-        self.lineAchiev_w5_whatisdeathmay.setObjectName("lineAchiev_w5_whatisdeathmay")
-        self.lineAchiev_w5_statuesoflimit = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w5_statuesoflimit.setGeometry(QtCore.QRect(10, 380, 151, 20))
-        self.lineAchiev_w5_statuesoflimit.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w5_statuesoflimit.setFrame(False)
-        self.lineAchiev_w5_statuesoflimit.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineAchiev_w5_statuesoflimit.setReadOnly(True)
-        self.lineAchiev_w5_statuesoflimit.setObjectName("lineAchiev_w5_statuesoflimit")
-        self.lineAchiev_w5_exileexecution = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w5_exileexecution.setGeometry(QtCore.QRect(170, 360, 101, 20))
-        self.lineAchiev_w5_exileexecution.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w5_exileexecution.setFrame(False)
-        self.lineAchiev_w5_exileexecution.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineAchiev_w5_exileexecution.setReadOnly(True)
-        self.lineAchiev_w5_exileexecution.setObjectName("lineAchiev_w5_exileexecution")
-        self.lineAchiev_w5_theferrywoman = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w5_theferrywoman.setGeometry(QtCore.QRect(170, 380, 101, 20))
-        self.lineAchiev_w5_theferrywoman.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w5_theferrywoman.setFrame(False)
-        self.lineAchiev_w5_theferrywoman.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineAchiev_w5_theferrywoman.setReadOnly(True)
-        self.lineAchiev_w5_theferrywoman.setObjectName("lineAchiev_w5_theferrywoman")
-        self.lineAchiev_w5_soreeyes = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w5_soreeyes.setGeometry(QtCore.QRect(370, 380, 61, 20))
-        self.lineAchiev_w5_soreeyes.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w5_soreeyes.setFrame(False)
-        self.lineAchiev_w5_soreeyes.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineAchiev_w5_soreeyes.setReadOnly(True)
-        self.lineAchiev_w5_soreeyes.setObjectName("lineAchiev_w5_soreeyes")
-        self.lineAchiev_w5_icebreaker = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w5_icebreaker.setGeometry(QtCore.QRect(370, 360, 61, 20))
-        self.lineAchiev_w5_icebreaker.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w5_icebreaker.setFrame(False)
-        self.lineAchiev_w5_icebreaker.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineAchiev_w5_icebreaker.setReadOnly(True)
-        self.lineAchiev_w5_icebreaker.setObjectName("lineAchiev_w5_icebreaker")
-        self.lineAchiev_w5_deatheater = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w5_deatheater.setGeometry(QtCore.QRect(280, 360, 81, 20))
-        self.lineAchiev_w5_deatheater.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w5_deatheater.setFrame(False)
-        self.lineAchiev_w5_deatheater.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineAchiev_w5_deatheater.setReadOnly(True)
-        self.lineAchiev_w5_deatheater.setObjectName("lineAchiev_w5_deatheater")
-        self.lineAchiev_w5_necrodancer = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w5_necrodancer.setGeometry(QtCore.QRect(280, 380, 81, 20))
-        self.lineAchiev_w5_necrodancer.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w5_necrodancer.setFrame(False)
-        self.lineAchiev_w5_necrodancer.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineAchiev_w5_necrodancer.setReadOnly(True)
-        self.lineAchiev_w5_necrodancer.setObjectName("lineAchiev_w5_necrodancer")
-        self.lineAchiev_w5_silencer = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w5_silencer.setGeometry(QtCore.QRect(520, 360, 71, 20))
-        self.lineAchiev_w5_silencer.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w5_silencer.setFrame(False)
-        self.lineAchiev_w5_silencer.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
-        self.lineAchiev_w5_silencer.setReadOnly(True)
-        self.lineAchiev_w5_silencer.setObjectName("lineAchiev_w5_silencer")
-        self.lineAchiev_w2_theshield = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w2_theshield.setGeometry(QtCore.QRect(530, 120, 61, 20))
-        self.lineAchiev_w2_theshield.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w2_theshield.setFrame(False)
-        self.lineAchiev_w2_theshield.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineAchiev_w2_theshield.setReadOnly(True)
-        self.lineAchiev_w2_theshield.setObjectName("lineAchiev_w2_theshield")
-        self.lineAchiev_w1_whitenoise = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w1_whitenoise.setGeometry(QtCore.QRect(520, 40, 71, 20))
-        self.lineAchiev_w1_whitenoise.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w1_whitenoise.setFrame(False)
-        self.lineAchiev_w1_whitenoise.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineAchiev_w1_whitenoise.setReadOnly(True)
-        self.lineAchiev_w1_whitenoise.setObjectName("lineAchiev_w1_whitenoise")
-        self.lineAchiev_w1_closure = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w1_closure.setGeometry(QtCore.QRect(520, 60, 71, 20))
-        self.lineAchiev_w1_closure.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w1_closure.setFrame(False)
-        self.lineAchiev_w1_closure.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineAchiev_w1_closure.setReadOnly(True)
-        self.lineAchiev_w1_closure.setObjectName("lineAchiev_w1_closure")
-        self.lineAchiev_w1_undefeated = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w1_undefeated.setGeometry(QtCore.QRect(290, 80, 91, 20))
-        self.lineAchiev_w1_undefeated.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w1_undefeated.setFrame(False)
-        self.lineAchiev_w1_undefeated.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
-        self.lineAchiev_w1_undefeated.setReadOnly(True)
-        self.lineAchiev_w1_undefeated.setObjectName("lineAchiev_w1_undefeated")
-        self.lineAchiev_w4_solitaryconfi = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w4_solitaryconfi.setGeometry(QtCore.QRect(170, 300, 131, 20))
-        self.lineAchiev_w4_solitaryconfi.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w4_solitaryconfi.setFrame(False)
-        self.lineAchiev_w4_solitaryconfi.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineAchiev_w4_solitaryconfi.setReadOnly(True)
-        self.lineAchiev_w4_solitaryconfi.setObjectName("lineAchiev_w4_solitaryconfi")
-        self.lineAchiev_w4_justagame = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w4_justagame.setGeometry(QtCore.QRect(410, 300, 101, 20))
-        self.lineAchiev_w4_justagame.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w4_justagame.setFrame(False)
-        self.lineAchiev_w4_justagame.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineAchiev_w4_justagame.setReadOnly(True)
-        self.lineAchiev_w4_justagame.setObjectName("lineAchiev_w4_justagame")
-        self.lineAchiev_w6_somedisassem = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w6_somedisassem.setGeometry(QtCore.QRect(10, 470, 161, 20))
-        self.lineAchiev_w6_somedisassem.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w6_somedisassem.setFrame(False)
-        self.lineAchiev_w6_somedisassem.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineAchiev_w6_somedisassem.setReadOnly(True)
-        self.lineAchiev_w6_somedisassem.setObjectName("lineAchiev_w6_somedisassem")
-        self.lineAchiev_w6_manipulateman = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w6_manipulateman.setGeometry(QtCore.QRect(10, 450, 161, 20))
-        self.lineAchiev_w6_manipulateman.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w6_manipulateman.setFrame(False)
-        self.lineAchiev_w6_manipulateman.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineAchiev_w6_manipulateman.setReadOnly(True)
-        self.lineAchiev_w6_manipulateman.setObjectName("lineAchiev_w6_manipulateman")
-        self.lineAchiev_w6_mythscholar = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w6_mythscholar.setGeometry(QtCore.QRect(180, 450, 131, 20))
-        self.lineAchiev_w6_mythscholar.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w6_mythscholar.setFrame(False)
-        self.lineAchiev_w6_mythscholar.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineAchiev_w6_mythscholar.setReadOnly(True)
-        self.lineAchiev_w6_mythscholar.setObjectName("lineAchiev_w6_mythscholar")
-        self.lineAchiev_w5_deathsaver = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w5_deathsaver.setGeometry(QtCore.QRect(440, 380, 71, 20))
-        self.lineAchiev_w5_deathsaver.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w5_deathsaver.setFrame(False)
-        self.lineAchiev_w5_deathsaver.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineAchiev_w5_deathsaver.setReadOnly(True)
-        self.lineAchiev_w5_deathsaver.setObjectName("lineAchiev_w5_deathsaver")
-        self.lineAchiev_w5_souledout = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w5_souledout.setGeometry(QtCore.QRect(440, 360, 71, 20))
-        self.lineAchiev_w5_souledout.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w5_souledout.setFrame(False)
-        self.lineAchiev_w5_souledout.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineAchiev_w5_souledout.setReadOnly(True)
-        self.lineAchiev_w5_souledout.setObjectName("lineAchiev_w5_souledout")
-        self.lineAchiev_w6_letsnotdothat = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w6_letsnotdothat.setGeometry(QtCore.QRect(10, 490, 161, 20))
-        self.lineAchiev_w6_letsnotdothat.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w6_letsnotdothat.setFrame(False)
-        self.lineAchiev_w6_letsnotdothat.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineAchiev_w6_letsnotdothat.setReadOnly(True)
-        self.lineAchiev_w6_letsnotdothat.setObjectName("lineAchiev_w6_letsnotdothat")
-        self.lineAchiev_w6_hardhats = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w6_hardhats.setGeometry(QtCore.QRect(320, 470, 191, 20))
-        self.lineAchiev_w6_hardhats.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w6_hardhats.setFrame(False)
-        self.lineAchiev_w6_hardhats.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineAchiev_w6_hardhats.setReadOnly(True)
-        self.lineAchiev_w6_hardhats.setObjectName("lineAchiev_w6_hardhats")
-        self.lineAchiev_w6_dontgowater = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w6_dontgowater.setGeometry(QtCore.QRect(180, 470, 131, 20))
-        self.lineAchiev_w6_dontgowater.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w6_dontgowater.setFrame(False)
-        self.lineAchiev_w6_dontgowater.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineAchiev_w6_dontgowater.setReadOnly(True)
-        self.lineAchiev_w6_dontgowater.setObjectName("lineAchiev_w6_dontgowater")
-        self.label_Titleicon_3 = QtWidgets.QLabel(self.tab_achievements)
-        self.label_Titleicon_3.setGeometry(QtCore.QRect(290, 120, 20, 20))
-        self.label_Titleicon_3.setPixmap(QtGui.QPixmap(":/images/Images/Titleicon.png"))
-        self.label_Titleicon_3.setScaledContents(True)
-        self.label_Titleicon_3.setObjectName("label_Titleicon_3")
-        self.label_Titleicon_5 = QtWidgets.QLabel(self.tab_achievements)
-        self.label_Titleicon_5.setGeometry(QtCore.QRect(520, 360, 20, 20))
-        self.label_Titleicon_5.setPixmap(QtGui.QPixmap(":/images/Images/Titleicon.png"))
-        self.label_Titleicon_5.setScaledContents(True)
-        self.label_Titleicon_5.setObjectName("label_Titleicon_5")
-        self.label_Titleicon_6 = QtWidgets.QLabel(self.tab_achievements)
-        self.label_Titleicon_6.setGeometry(QtCore.QRect(290, 80, 20, 20))
-        self.label_Titleicon_6.setPixmap(QtGui.QPixmap(":/images/Images/Titleicon.png"))
-        self.label_Titleicon_6.setScaledContents(True)
-        self.label_Titleicon_6.setObjectName("label_Titleicon_6")
-        self.label_Titleicon_8 = QtWidgets.QLabel(self.tab_achievements)
-        self.label_Titleicon_8.setGeometry(QtCore.QRect(520, 280, 20, 20))
-        self.label_Titleicon_8.setPixmap(QtGui.QPixmap(":/images/Images/Titleicon.png"))
-        self.label_Titleicon_8.setScaledContents(True)
-        self.label_Titleicon_8.setObjectName("label_Titleicon_8")
-        self.label_Titleicon_2 = QtWidgets.QLabel(self.tab_achievements)
-        self.label_Titleicon_2.setGeometry(QtCore.QRect(10, 300, 20, 20))
-        self.label_Titleicon_2.setPixmap(QtGui.QPixmap(":/images/Images/Titleicon.png"))
-        self.label_Titleicon_2.setScaledContents(True)
-        self.label_Titleicon_2.setObjectName("label_Titleicon_2")
-        self.label_Titleicon = QtWidgets.QLabel(self.tab_achievements)
-        self.label_Titleicon.setGeometry(QtCore.QRect(10, 280, 20, 20))
-        self.label_Titleicon.setPixmap(QtGui.QPixmap(":/images/Images/Titleicon.png"))
-        self.label_Titleicon.setScaledContents(True)
-        self.label_Titleicon.setObjectName("label_Titleicon")
-        self.lineAchiev_w6_firedjinnextin = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w6_firedjinnextin.setGeometry(QtCore.QRect(10, 430, 161, 20))
-        self.lineAchiev_w6_firedjinnextin.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w6_firedjinnextin.setFrame(False)
-        self.lineAchiev_w6_firedjinnextin.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
-        self.lineAchiev_w6_firedjinnextin.setReadOnly(True)
-        self.lineAchiev_w6_firedjinnextin.setObjectName("lineAchiev_w6_firedjinnextin")
-        self.label_Titleicon_4 = QtWidgets.QLabel(self.tab_achievements)
-        self.label_Titleicon_4.setGeometry(QtCore.QRect(10, 430, 20, 20))
-        self.label_Titleicon_4.setPixmap(QtGui.QPixmap(":/images/Images/Titleicon.png"))
-        self.label_Titleicon_4.setScaledContents(True)
-        self.label_Titleicon_4.setObjectName("label_Titleicon_4")
-        self.lineAchiev_w6_regularstour = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w6_regularstour.setGeometry(QtCore.QRect(180, 430, 131, 20))
-        self.lineAchiev_w6_regularstour.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w6_regularstour.setFrame(False)
-        self.lineAchiev_w6_regularstour.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
-        self.lineAchiev_w6_regularstour.setReadOnly(True)
-        self.lineAchiev_w6_regularstour.setObjectName("lineAchiev_w6_regularstour")
-        self.label_Titleicon_7 = QtWidgets.QLabel(self.tab_achievements)
-        self.label_Titleicon_7.setGeometry(QtCore.QRect(180, 430, 20, 20))
-        self.label_Titleicon_7.setPixmap(QtGui.QPixmap(":/images/Images/Titleicon.png"))
-        self.label_Titleicon_7.setScaledContents(True)
-        self.label_Titleicon_7.setObjectName("label_Titleicon_7")
-        self.lineAchiev_w6_heroesofforge = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w6_heroesofforge.setGeometry(QtCore.QRect(320, 450, 111, 20))
-        self.lineAchiev_w6_heroesofforge.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w6_heroesofforge.setFrame(False)
-        self.lineAchiev_w6_heroesofforge.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineAchiev_w6_heroesofforge.setReadOnly(True)
-        self.lineAchiev_w6_heroesofforge.setObjectName("lineAchiev_w6_heroesofforge")
-        self.lineAchiev_w6_aquaassasins = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w6_aquaassasins.setGeometry(QtCore.QRect(180, 490, 131, 20))
-        self.lineAchiev_w6_aquaassasins.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w6_aquaassasins.setFrame(False)
-        self.lineAchiev_w6_aquaassasins.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineAchiev_w6_aquaassasins.setReadOnly(True)
-        self.lineAchiev_w6_aquaassasins.setObjectName("lineAchiev_w6_aquaassasins")
-        self.lineAchiev_w6_thunderfall = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w6_thunderfall.setGeometry(QtCore.QRect(320, 430, 111, 20))
-        self.lineAchiev_w6_thunderfall.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w6_thunderfall.setFrame(False)
-        self.lineAchiev_w6_thunderfall.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineAchiev_w6_thunderfall.setReadOnly(True)
-        self.lineAchiev_w6_thunderfall.setObjectName("lineAchiev_w6_thunderfall")
-        self.lineAchiev_w6_stackingswords = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w6_stackingswords.setGeometry(QtCore.QRect(440, 430, 151, 20))
-        self.lineAchiev_w6_stackingswords.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w6_stackingswords.setFrame(False)
-        self.lineAchiev_w6_stackingswords.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineAchiev_w6_stackingswords.setReadOnly(True)
-        self.lineAchiev_w6_stackingswords.setObjectName("lineAchiev_w6_stackingswords")
-        self.lineAchiev_w6_takingturns = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w6_takingturns.setGeometry(QtCore.QRect(440, 450, 71, 20))
-        self.lineAchiev_w6_takingturns.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w6_takingturns.setFrame(False)
-        self.lineAchiev_w6_takingturns.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineAchiev_w6_takingturns.setReadOnly(True)
-        self.lineAchiev_w6_takingturns.setObjectName("lineAchiev_w6_takingturns")
-        self.lineAchiev_w2_thebigsleep = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w2_thebigsleep.setGeometry(QtCore.QRect(170, 140, 111, 20))
-        self.lineAchiev_w2_thebigsleep.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w2_thebigsleep.setFrame(False)
-        self.lineAchiev_w2_thebigsleep.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineAchiev_w2_thebigsleep.setReadOnly(True)
-        self.lineAchiev_w2_thebigsleep.setObjectName("lineAchiev_w2_thebigsleep")
-        self.lineAchiev_w1_quickmarch = QtWidgets.QLineEdit(self.tab_achievements)
-        self.lineAchiev_w1_quickmarch.setGeometry(QtCore.QRect(520, 20, 71, 20))
-        self.lineAchiev_w1_quickmarch.setStyleSheet("background-color: rgb(150, 150, 150);")
-        self.lineAchiev_w1_quickmarch.setFrame(False)
-        self.lineAchiev_w1_quickmarch.setAlignment(QtCore.Qt.AlignCenter)
-        self.lineAchiev_w1_quickmarch.setReadOnly(True)
-        self.lineAchiev_w1_quickmarch.setObjectName("lineAchiev_w1_quickmarch")
-        self.label_75 = QtWidgets.QLabel(self.tab_achievements)
-        self.label_75.setGeometry(QtCore.QRect(310, 490, 281, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        font.setWeight(75)
-        font.setUnderline(True)
-        font.setBold(True)
-        self.label_75.setFont(font)
-        self.label_75.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_75.setObjectName("label_75")
         self.tabRaids.addTab(self.tab_achievements, "")
         self.checkAchievements = QtWidgets.QCheckBox(self.MainLayout)
         self.checkAchievements.setGeometry(QtCore.QRect(850, 0, 91, 20))
@@ -2061,17 +377,6 @@ class Ui_MainWindow(object):
         self.statusbar.setFont(font)
         self.statusbar.setObjectName("statusbar")
         MainWindow.setStatusBar(self.statusbar)
-        self.label_82.setBuddy(self.linePermission_PvP)
-        self.label_44.setBuddy(self.linePermission_PvP)
-        self.label_83.setBuddy(self.linePermission_PvP)
-        self.label_84.setBuddy(self.linePermission_PvP)
-        self.label_85.setBuddy(self.linePermission_PvP)
-        self.label_86.setBuddy(self.linePermission_PvP)
-        self.label_45.setBuddy(self.linePermission_PvP)
-        self.label_81.setBuddy(self.linePermission_PvP)
-        self.label_87.setBuddy(self.linePermission_PvP)
-        self.label_88.setBuddy(self.linePermission_PvP)
-        self.label_91.setBuddy(self.linePermission_PvP)
         self.label_92.setBuddy(self.linePermission_PvP)
 
         self.retranslateUi(MainWindow)
@@ -2141,167 +446,10 @@ class Ui_MainWindow(object):
         self.checkBosses.setText(QtWidgets.QApplication.translate("MainWindow", "Bosses", None, -1))
         self.checkCurrency.setText(QtWidgets.QApplication.translate("MainWindow", "Currency", None, -1))
         self.groupUnused.setTitle(QtWidgets.QApplication.translate("MainWindow", "UNUSED GROUPBOX", None, -1))
-        self.lineRaidboss_matthias.setText(QtWidgets.QApplication.translate("MainWindow", "Matthias", None, -1))
-        self.lineRaidboss_cairn.setText(QtWidgets.QApplication.translate("MainWindow", "Cairn", None, -1))
-        self.label_27.setText(QtWidgets.QApplication.translate("MainWindow", "Wing 1 - Spirit Vale", None, -1))
-        self.lineRaidboss_xera.setText(QtWidgets.QApplication.translate("MainWindow", "Xera", None, -1))
-        self.label_82.setText(QtWidgets.QApplication.translate("MainWindow", "Legendary Insights (LIs):", None, -1))
-        self.label_116.setText(QtWidgets.QApplication.translate("MainWindow", "<html><head/><body><p><span style=\" font-weight:600;\">REQUIREMENTS</span></p></body></html>", None, -1))
-        self.lineRaidboss_glenna.setText(QtWidgets.QApplication.translate("MainWindow", "Escort", None, -1))
-        self.lineRaidboss_valeguardian.setText(QtWidgets.QApplication.translate("MainWindow", "Vale Guardian", None, -1))
-        self.lineRaidboss_trio.setText(QtWidgets.QApplication.translate("MainWindow", "Bandit Trio", None, -1))
-        self.label_72.setText(QtWidgets.QApplication.translate("MainWindow", "<html><head/><body><p><span style=\" font-weight:600; text-decoration: underline;\">MASTERIES:</span> Ley Line Gliding and Forsaken Magic</p></body></html>", None, -1))
-        self.lineRaidboss_slothasor.setText(QtWidgets.QApplication.translate("MainWindow", "Slothasor", None, -1))
-        self.label_71.setText(QtWidgets.QApplication.translate("MainWindow", "<html><head/><body><p><span style=\" font-weight:600; text-decoration: underline;\">EXPANSION: </span>Heart of Thorns<br/></p></body></html>", None, -1))
-        self.lineRaidboss_twistedcastle.setText(QtWidgets.QApplication.translate("MainWindow", " Twisted Castle", None, -1))
-        self.label_31.setText(QtWidgets.QApplication.translate("MainWindow", "Wing 2 - Salvation Pass", None, -1))
-        self.label_115.setText(QtWidgets.QApplication.translate("MainWindow", "<html><head/><body><p><span style=\" font-weight:600;\">CURRENCY</span></p></body></html>", None, -1))
-        self.lineRaidboss_gorseval.setText(QtWidgets.QApplication.translate("MainWindow", "Gorseval", None, -1))
-        self.label_35.setText(QtWidgets.QApplication.translate("MainWindow", "Wing 4 - Bastion of the Penitent", None, -1))
-        self.lineRaidboss_deimos.setText(QtWidgets.QApplication.translate("MainWindow", "Deimos", None, -1))
-        self.lineRaidboss_samarog.setText(QtWidgets.QApplication.translate("MainWindow", "Samarog", None, -1))
-        self.lineRaidboss_keepconstruct.setText(QtWidgets.QApplication.translate("MainWindow", "Keep Construct", None, -1))
-        self.label_34.setText(QtWidgets.QApplication.translate("MainWindow", "Wing 3 - Stronghold of the Faithful", None, -1))
-        self.lineRaidboss_spiritwoods.setText(QtWidgets.QApplication.translate("MainWindow", "Spirit Woods", None, -1))
-        self.label_44.setText(QtWidgets.QApplication.translate("MainWindow", "Magnetite Shards:", None, -1))
-        self.lineRaidboss_sabetha.setText(QtWidgets.QApplication.translate("MainWindow", "Sabetha", None, -1))
-        self.lineRaidboss_mursaat.setText(QtWidgets.QApplication.translate("MainWindow", "Mursaat Overseer", None, -1))
-        self.label_119.setText(QtWidgets.QApplication.translate("MainWindow", "<html><head/><body><p>Skins unlocked</p></body></html>", None, -1))
-        self.label_120.setText(QtWidgets.QApplication.translate("MainWindow", "<html><head/><body><p>Minis unlocked</p></body></html>", None, -1))
-        self.label_121.setText(QtWidgets.QApplication.translate("MainWindow", "<html><head/><body><p align=\"center\">Bosses/Events<br/>Completed this week</p></body></html>", None, -1))
-        self.label_124.setText(QtWidgets.QApplication.translate("MainWindow", "<html><head/><body><p>Skins unlocked</p></body></html>", None, -1))
-        self.label_123.setText(QtWidgets.QApplication.translate("MainWindow", "<html><head/><body><p>Minis unlocked</p></body></html>", None, -1))
-        self.label_122.setText(QtWidgets.QApplication.translate("MainWindow", "<html><head/><body><p align=\"center\">Bosses/Events<br/>Completed this week</p></body></html>", None, -1))
-        self.label_127.setText(QtWidgets.QApplication.translate("MainWindow", "<html><head/><body><p>Skins unlocked</p></body></html>", None, -1))
-        self.label_125.setText(QtWidgets.QApplication.translate("MainWindow", "<html><head/><body><p>Minis unlocked</p></body></html>", None, -1))
-        self.label_126.setText(QtWidgets.QApplication.translate("MainWindow", "<html><head/><body><p align=\"center\">Bosses/Events<br/>Completed this week</p></body></html>", None, -1))
-        self.label_130.setText(QtWidgets.QApplication.translate("MainWindow", "<html><head/><body><p>Skins unlocked</p></body></html>", None, -1))
-        self.label_129.setText(QtWidgets.QApplication.translate("MainWindow", "<html><head/><body><p align=\"center\">Bosses/Events<br/>Completed this week</p></body></html>", None, -1))
-        self.label_128.setText(QtWidgets.QApplication.translate("MainWindow", "<html><head/><body><p>Minis unlocked</p></body></html>", None, -1))
-        self.label_83.setText(QtWidgets.QApplication.translate("MainWindow", "Released on: November 17, 2015", None, -1))
-        self.label_84.setText(QtWidgets.QApplication.translate("MainWindow", "Released on: March 8, 2016 ", None, -1))
-        self.label_85.setText(QtWidgets.QApplication.translate("MainWindow", "Released on: June 14, 2016 ", None, -1))
-        self.label_86.setText(QtWidgets.QApplication.translate("MainWindow", "Released on: February 8, 2017 ", None, -1))
         self.tabRaids.setTabText(self.tabRaids.indexOf(self.tab_bosses_hot), QtWidgets.QApplication.translate("MainWindow", "HoT Raids", None, -1))
-        self.lineRaidboss_dhuum.setText(QtWidgets.QApplication.translate("MainWindow", "Dhuum", None, -1))
-        self.label_39.setText(QtWidgets.QApplication.translate("MainWindow", "Wing 5 - Hall of Chains", None, -1))
-        self.lineRaidboss_qadim.setText(QtWidgets.QApplication.translate("MainWindow", "Qadim", None, -1))
-        self.lineRaidboss_riverofsouls.setText(QtWidgets.QApplication.translate("MainWindow", "River of Souls", None, -1))
-        self.lineRaidboss_desmina.setText(QtWidgets.QApplication.translate("MainWindow", "Soulless Horror", None, -1))
-        self.lineRaidboss_conjureda.setText(QtWidgets.QApplication.translate("MainWindow", "C. Amalgamated", None, -1))
-        self.lineRaidboss_twinlargos.setText(QtWidgets.QApplication.translate("MainWindow", "Twin Largos", None, -1))
-        self.label_47.setText(QtWidgets.QApplication.translate("MainWindow", "Wing 6 - The Mythwright Gambit", None, -1))
-        self.lineRaidboss_statues.setText(QtWidgets.QApplication.translate("MainWindow", "The 3 Statues", None, -1))
-        self.label_68.setText(QtWidgets.QApplication.translate("MainWindow", "Wing 7 - The Key Of Ahdashim", None, -1))
-        self.label_74.setText(QtWidgets.QApplication.translate("MainWindow", "<html><head/><body><p><span style=\" font-weight:600; text-decoration: underline;\">EXPANSION: </span>Path of Fire<br/></p></body></html>", None, -1))
-        self.label_118.setText(QtWidgets.QApplication.translate("MainWindow", "<html><head/><body><p><span style=\" font-weight:600;\">REQUIREMENTS</span></p></body></html>", None, -1))
-        self.label_73.setText(QtWidgets.QApplication.translate("MainWindow", "<html><head/><body><p><span style=\" font-weight:600; text-decoration: underline;\">MASTERIES:</span> Either Gliding or at least Springer High Vault.</p></body></html>", None, -1))
-        self.label_117.setText(QtWidgets.QApplication.translate("MainWindow", "<html><head/><body><p><span style=\" font-weight:600;\">CURRENCY</span></p></body></html>", None, -1))
-        self.label_45.setText(QtWidgets.QApplication.translate("MainWindow", "Gaeting Crystals:", None, -1))
-        self.label_81.setText(QtWidgets.QApplication.translate("MainWindow", "Legendary Divinations (DIs):", None, -1))
-        self.label_87.setText(QtWidgets.QApplication.translate("MainWindow", "Released on: November 28, 2017", None, -1))
-        self.label_88.setText(QtWidgets.QApplication.translate("MainWindow", "Released on: September 18, 2018", None, -1))
-        self.label_91.setText(QtWidgets.QApplication.translate("MainWindow", "Released on: June 11, 2019", None, -1))
-        self.label_133.setText(QtWidgets.QApplication.translate("MainWindow", "<html><head/><body><p>Skins unlocked</p></body></html>", None, -1))
-        self.label_131.setText(QtWidgets.QApplication.translate("MainWindow", "<html><head/><body><p align=\"center\">Bosses/Events<br/>Completed this week</p></body></html>", None, -1))
-        self.label_132.setText(QtWidgets.QApplication.translate("MainWindow", "<html><head/><body><p>Minis unlocked</p></body></html>", None, -1))
-        self.label_134.setText(QtWidgets.QApplication.translate("MainWindow", "<html><head/><body><p>Skins unlocked</p></body></html>", None, -1))
-        self.label_135.setText(QtWidgets.QApplication.translate("MainWindow", "<html><head/><body><p align=\"center\">Bosses/Events<br/>Completed this week</p></body></html>", None, -1))
-        self.label_136.setText(QtWidgets.QApplication.translate("MainWindow", "<html><head/><body><p>Minis unlocked</p></body></html>", None, -1))
-        self.lineRaidboss_adina.setText(QtWidgets.QApplication.translate("MainWindow", "Adina", None, -1))
-        self.lineRaidboss_gateofahdashim.setText(QtWidgets.QApplication.translate("MainWindow", "The Gate", None, -1))
-        self.lineRaidboss_sabir.setText(QtWidgets.QApplication.translate("MainWindow", "Sabir", None, -1))
-        self.label_137.setText(QtWidgets.QApplication.translate("MainWindow", "<html><head/><body><p align=\"center\">Bosses/Events<br/>Completed this week</p></body></html>", None, -1))
-        self.lineRaidboss_qadim2.setText(QtWidgets.QApplication.translate("MainWindow", "Qadim", None, -1))
-        self.label_138.setText(QtWidgets.QApplication.translate("MainWindow", "<html><head/><body><p>Minis unlocked</p></body></html>", None, -1))
-        self.label_139.setText(QtWidgets.QApplication.translate("MainWindow", "<html><head/><body><p>Skins unlocked</p></body></html>", None, -1))
         self.tabRaids.setTabText(self.tabRaids.indexOf(self.tab_bosses_pof), QtWidgets.QApplication.translate("MainWindow", "PoF Raids", None, -1))
-        self.label_28.setText(QtWidgets.QApplication.translate("MainWindow", "Wing 1 - Spirit Vale", None, -1))
-        self.label_40.setText(QtWidgets.QApplication.translate("MainWindow", "Wing 4 - Bastion of the Penitent", None, -1))
-        self.lineAchiev_w4_wardenwillsee.setText(QtWidgets.QApplication.translate("MainWindow", "The Warden Will See You Now ", None, -1))
-        self.lineAchiev_w4_voiceofdecease.setText(QtWidgets.QApplication.translate("MainWindow", "Voice of the Deceased", None, -1))
-        self.lineAchiev_w4_realraidertyr.setText(QtWidgets.QApplication.translate("MainWindow", "The Real Raiders of Tyria ", None, -1))
-        self.label_37.setText(QtWidgets.QApplication.translate("MainWindow", "Wing 2 - Salvation Pass", None, -1))
-        self.label_41.setText(QtWidgets.QApplication.translate("MainWindow", "Wing 3 - Stronghold of the Faithful", None, -1))
-        self.label_42.setText(QtWidgets.QApplication.translate("MainWindow", "Wing 5 - Hall of Chains", None, -1))
-        self.label_48.setText(QtWidgets.QApplication.translate("MainWindow", "Wing 6 - The Mythwright Gambit", None, -1))
-        self.lineAchiev_w1_beyondthevale.setText(QtWidgets.QApplication.translate("MainWindow", "Beyond the Vale", None, -1))
-        self.lineAchiev_w1_denied.setText(QtWidgets.QApplication.translate("MainWindow", "Denied", None, -1))
-        self.lineAchiev_w1_rgb.setText(QtWidgets.QApplication.translate("MainWindow", "RGB", None, -1))
-        self.lineAchiev_w1_lastcannon.setText(QtWidgets.QApplication.translate("MainWindow", "Last Cannon ", None, -1))
-        self.lineAchiev_w1_fleethestorm.setText(QtWidgets.QApplication.translate("MainWindow", "Flee the Storm", None, -1))
-        self.lineAchiev_w1_spectralanomaly.setText(QtWidgets.QApplication.translate("MainWindow", "Spectral Anomaly ", None, -1))
-        self.lineAchiev_w1_puttorest.setText(QtWidgets.QApplication.translate("MainWindow", "Put to Rest", None, -1))
-        self.lineAchiev_w1_piecingit.setText(QtWidgets.QApplication.translate("MainWindow", "Piecing it Together", None, -1))
-        self.lineAchiev_w1_keepthelights.setText(QtWidgets.QApplication.translate("MainWindow", "Keep the Lights On ", None, -1))
-        self.lineAchiev_w1_myhero.setText(QtWidgets.QApplication.translate("MainWindow", "My Hero! ", None, -1))
-        self.lineAchiev_w1_angermanage.setText(QtWidgets.QApplication.translate("MainWindow", "Anger Management ", None, -1))
-        self.lineAchiev_w1_lootfinder.setText(QtWidgets.QApplication.translate("MainWindow", "Loot Finder", None, -1))
-        self.lineAchiev_w1_fireextinguish.setText(QtWidgets.QApplication.translate("MainWindow", "Fire Extinguisher ", None, -1))
-        self.lineAchiev_w1_liftoff.setText(QtWidgets.QApplication.translate("MainWindow", "Liftoff ", None, -1))
-        self.lineAchiev_w1_outranaghost.setText(QtWidgets.QApplication.translate("MainWindow", "I Can Outrun A...Ghost ", None, -1))
-        self.lineAchiev_w1_backdraftd.setText(QtWidgets.QApplication.translate("MainWindow", "Backdraft Dodger ", None, -1))
-        self.lineAchiev_w1_intothewoods.setText(QtWidgets.QApplication.translate("MainWindow", "Into the Woods", None, -1))
-        self.lineAchiev_w2_environmentally.setText(QtWidgets.QApplication.translate("MainWindow", "Environmentally Friendly ", None, -1))
-        self.lineAchiev_w2_spmastery.setText(QtWidgets.QApplication.translate("MainWindow", "Salvation Pass Mastery ", None, -1))
-        self.lineAchiev_w2_seimurwasw.setText(QtWidgets.QApplication.translate("MainWindow", "Seimur Was Wrong ", None, -1))
-        self.lineAchiev_w2_spsadist.setText(QtWidgets.QApplication.translate("MainWindow", "Salvation Pass Sadist ", None, -1))
-        self.lineAchiev_w2_slipperyslub.setText(QtWidgets.QApplication.translate("MainWindow", "Slippery Slubling ", None, -1))
-        self.lineAchiev_w3_traversethetc.setText(QtWidgets.QApplication.translate("MainWindow", "Traverse the Twisted Castle ", None, -1))
-        self.lineAchiev_w3_scourgeofwm.setText(QtWidgets.QApplication.translate("MainWindow", "Scourge of the White Mantle ", None, -1))
-        self.lineAchiev_w3_outrunawarg.setText(QtWidgets.QApplication.translate("MainWindow", "I Can Outrun A... Warg ", None, -1))
-        self.lineAchiev_w3_downdownd.setText(QtWidgets.QApplication.translate("MainWindow", "Down, Down, Downed", None, -1))
-        self.lineAchiev_w4_greetedaslib.setText(QtWidgets.QApplication.translate("MainWindow", " Greeted as Liberators ", None, -1))
-        self.lineAchiev_w4_harshsentence.setText(QtWidgets.QApplication.translate("MainWindow", "Harsh Sentence ", None, -1))
-        self.lineAchiev_w4_breakingin.setText(QtWidgets.QApplication.translate("MainWindow", "Breaking In ", None, -1))
-        self.lineAchiev_w4_jaded.setText(QtWidgets.QApplication.translate("MainWindow", "Jaded ", None, -1))
-        self.lineAchiev_w4_attuned.setText(QtWidgets.QApplication.translate("MainWindow", "Attuned ", None, -1))
-        self.lineAchiev_w3_minecontrol.setText(QtWidgets.QApplication.translate("MainWindow", "Mine Control ", None, -1))
-        self.lineAchiev_w3_dismantled.setText(QtWidgets.QApplication.translate("MainWindow", "Dismantled ", None, -1))
-        self.lineAchiev_w2_avengerofpact.setText(QtWidgets.QApplication.translate("MainWindow", "Avenger of the Pact ", None, -1))
-        self.lineAchiev_w2_scatteredm.setText(QtWidgets.QApplication.translate("MainWindow", "Scattered Memories ", None, -1))
-        self.lineAchiev_w4_freeatlast.setText(QtWidgets.QApplication.translate("MainWindow", " Free at Last ", None, -1))
-        self.lineAchiev_w3_loveisbunny.setText(QtWidgets.QApplication.translate("MainWindow", "Love Is Bunny", None, -1))
-        self.lineAchiev_w3_mildlyinsane.setText(QtWidgets.QApplication.translate("MainWindow", "Mildly Insane ", None, -1))
-        self.lineAchiev_w3_siegethestrong.setText(QtWidgets.QApplication.translate("MainWindow", "Siege the Stronghold ", None, -1))
-        self.lineAchiev_w3_evasivemane.setText(QtWidgets.QApplication.translate("MainWindow", "Evasive Maneuver ", None, -1))
-        self.lineAchiev_w3_deconstructed.setText(QtWidgets.QApplication.translate("MainWindow", "Deconstructed ", None, -1))
-        self.lineAchiev_w5_whatisdeathmay.setText(QtWidgets.QApplication.translate("MainWindow", "What\'s Death May Never Die ", None, -1))
-        self.lineAchiev_w5_statuesoflimit.setText(QtWidgets.QApplication.translate("MainWindow", "Statues of Limitation ", None, -1))
-        self.lineAchiev_w5_exileexecution.setText(QtWidgets.QApplication.translate("MainWindow", "Exile Executioner ", None, -1))
-        self.lineAchiev_w5_theferrywoman.setText(QtWidgets.QApplication.translate("MainWindow", "The Ferrywoman ", None, -1))
-        self.lineAchiev_w5_soreeyes.setText(QtWidgets.QApplication.translate("MainWindow", "Sore Eyes ", None, -1))
-        self.lineAchiev_w5_icebreaker.setText(QtWidgets.QApplication.translate("MainWindow", "Icebreaker ", None, -1))
-        self.lineAchiev_w5_deatheater.setText(QtWidgets.QApplication.translate("MainWindow", "Death Eater ", None, -1))
-        self.lineAchiev_w5_necrodancer.setText(QtWidgets.QApplication.translate("MainWindow", "Necro Dancer ", None, -1))
-        self.lineAchiev_w5_silencer.setText(QtWidgets.QApplication.translate("MainWindow", "Silencer ", None, -1))
-        self.lineAchiev_w2_theshield.setText(QtWidgets.QApplication.translate("MainWindow", "The Shield ", None, -1))
-        self.lineAchiev_w1_whitenoise.setText(QtWidgets.QApplication.translate("MainWindow", "White Noise", None, -1))
-        self.lineAchiev_w1_closure.setText(QtWidgets.QApplication.translate("MainWindow", "Closure", None, -1))
-        self.lineAchiev_w1_undefeated.setText(QtWidgets.QApplication.translate("MainWindow", "Undefeated ", None, -1))
-        self.lineAchiev_w4_solitaryconfi.setText(QtWidgets.QApplication.translate("MainWindow", "Solitary Confinement ", None, -1))
-        self.lineAchiev_w4_justagame.setText(QtWidgets.QApplication.translate("MainWindow", "It\'s Just a Game ", None, -1))
-        self.lineAchiev_w6_somedisassem.setText(QtWidgets.QApplication.translate("MainWindow", "Some Disassembly Required ", None, -1))
-        self.lineAchiev_w6_manipulateman.setText(QtWidgets.QApplication.translate("MainWindow", "Manipulate the Manipulator ", None, -1))
-        self.lineAchiev_w6_mythscholar.setText(QtWidgets.QApplication.translate("MainWindow", "Mythwright Scholar ", None, -1))
-        self.lineAchiev_w5_deathsaver.setText(QtWidgets.QApplication.translate("MainWindow", "Deathsaver ", None, -1))
-        self.lineAchiev_w5_souledout.setText(QtWidgets.QApplication.translate("MainWindow", "Souled Out ", None, -1))
-        self.lineAchiev_w6_letsnotdothat.setText(QtWidgets.QApplication.translate("MainWindow", "Let\'s Not Do That Again ", None, -1))
-        self.lineAchiev_w6_hardhats.setText(QtWidgets.QApplication.translate("MainWindow", "Hard Hats Required beyond This Point", None, -1))
-        self.lineAchiev_w6_dontgowater.setText(QtWidgets.QApplication.translate("MainWindow", "Don\'t Go in the Water ", None, -1))
-        self.lineAchiev_w6_firedjinnextin.setText(QtWidgets.QApplication.translate("MainWindow", " The Fire Djinn Extinguished ", None, -1))
-        self.lineAchiev_w6_regularstour.setText(QtWidgets.QApplication.translate("MainWindow", "Regulars on the Tour ", None, -1))
-        self.lineAchiev_w6_heroesofforge.setText(QtWidgets.QApplication.translate("MainWindow", "Heroes of the Forge ", None, -1))
-        self.lineAchiev_w6_aquaassasins.setText(QtWidgets.QApplication.translate("MainWindow", "Aquatic Assassins ", None, -1))
-        self.lineAchiev_w6_thunderfall.setText(QtWidgets.QApplication.translate("MainWindow", "A Thunderous Fall ", None, -1))
-        self.lineAchiev_w6_stackingswords.setText(QtWidgets.QApplication.translate("MainWindow", "Stacking Swords and Shields ", None, -1))
-        self.lineAchiev_w6_takingturns.setText(QtWidgets.QApplication.translate("MainWindow", "Taking Turns ", None, -1))
-        self.lineAchiev_w2_thebigsleep.setText(QtWidgets.QApplication.translate("MainWindow", "The Big Sleep ", None, -1))
-        self.lineAchiev_w1_quickmarch.setText(QtWidgets.QApplication.translate("MainWindow", "Quick March ", None, -1))
-        self.label_75.setText(QtWidgets.QApplication.translate("MainWindow", "Wing 7 - The Key Of Ahdashim... To Be Done", None, -1))
         self.tabRaids.setTabText(self.tabRaids.indexOf(self.tab_achievements), QtWidgets.QApplication.translate("MainWindow", "Achievements", None, -1))
         self.checkAchievements.setText(QtWidgets.QApplication.translate("MainWindow", "Achievements", None, -1))
         self.label_92.setText(QtWidgets.QApplication.translate("MainWindow", "Data to request from your API Key:", None, -1))
 
 from ui.custom_utils import ThemedLayout
-import rc.resources_rc
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+
+"""Pages of a QTabWidget that are built the first time they are shown.
+Each page has its own designer file, most sessions never open most of them."""
+from importlib import import_module
+from PySide2.QtWidgets import QWidget
+
+
+class LazyPages(object):
+    """Build the pages of `tabs` on demand. `pages` is a dict of page widget -> Ui class of its contents,
+    or its dotted path ("ui.module.Class") so its module is only imported when the page is built.
+    The widgets of each page become attributes of `owner`, like the ones built by setupUi."""
+    def __init__(self, owner, tabs, pages, on_built=None):
+        self.owner = owner
+        self.tabs = tabs
+        self.pending = dict(pages)
+        self.on_built = on_built
+        tabs.currentChanged.connect(lambda index: self.build(tabs.widget(index)))
+
+    def build(self, page):
+        """Build a page if it wasn't built yet. Returns True if it was built now."""
+        ui_class = self.pending.pop(page, None)
+        if ui_class is None:
+            return False
+        if isinstance(ui_class, str):
+            module, name = ui_class.rsplit(".", 1)
+            ui_class = getattr(import_module(module), name)
+        ui = ui_class()
+        ui.setupUi(page)
+        for name, widget in vars(ui).items():
+            setattr(self.owner, name, widget)
+        # Children added to a visible widget have to be shown by hand
+        if page.isVisible():
+            for child in page.children():
+                if isinstance(child, QWidget):
+                    child.show()
+        if self.on_built is not None:
+            self.on_built(page)
+        return True
+
+    def build_current(self):
+        """Build the page that is being shown."""
+        return self.build(self.tabs.currentWidget())
+
+    def is_built(self, page):
+        """Check if a page was built already."""
+        return page not in self.pending
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+
+"""Icons tinted green/red/grey, rendered once and reused.
+A QGraphicsColorizeEffect renders its label offscreen on every repaint,
+a tinted pixmap is just drawn."""
+from collections import OrderedDict
+from PySide2.QtCore import Qt
+from PySide2.QtGui import QColor, QImage, QPainter, QPixmap
+
+DEFAULT_CACHE_ENTRIES = 512
+
+
+def tint_image(image, color):
+    """Same look as a QGraphicsColorizeEffect of that color: grayscale, then screened with the color."""
+    tinted = image.convertToFormat(QImage.Format_Grayscale8).convertToFormat(QImage.Format_ARGB32_Premultiplied)
+    painter = QPainter(tinted)
+    painter.setCompositionMode(QPainter.CompositionMode_Screen)
+    painter.fillRect(tinted.rect(), color)
+    # Keep the transparency of the original icon
+    painter.setCompositionMode(QPainter.CompositionMode_DestinationIn)
+    painter.drawImage(0, 0, image)
+    painter.end()
+    return tinted
+
+
+class TintedPixmapCache(object):
+    """LRU cache of pixmaps by (resource path, tint, size, device pixel ratio).
+    Pixmaps are rendered at the real resolution of the screen, so they stay sharp on high DPI."""
+    def __init__(self, max_entries=DEFAULT_CACHE_ENTRIES):
+        self.max_entries = max_entries
+        self._pixmaps = OrderedDict()
+
+    def get(self, path, tint=None, size=None, device_pixel_ratio=1.0):
+        """Get an icon, tinted with an (r, g, b) tuple (None for the original colors),
+        scaled to a QSize in logical pixels (None for its own size)."""
+        key = (path, tint, (size.width(), size.height()) if size is not None else None, device_pixel_ratio)
+        pixmap = self._pixmaps.get(key)
+        if pixmap is not None:
+            self._pixmaps.move_to_end(key)
+            return pixmap
+        image = QImage(path)
+        if size is not None:
+            image = image.scaled(size * device_pixel_ratio, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+        if tint is not None:
+            image = tint_image(image, QColor(*tint))
+        pixmap = QPixmap.fromImage(image)
+        pixmap.setDevicePixelRatio(device_pixel_ratio)
+        self._pixmaps[key] = pixmap
+        while len(self._pixmaps) > self.max_entries:
+            self._pixmaps.popitem(last=False)
+        return pixmap
+
+    def clear(self):
+        """Forget every pixmap."""
+        self._pixmaps.clear()
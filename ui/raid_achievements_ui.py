@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'raid_achievements.ui',
+# licensing of 'raid_achievements.ui' applies.
+#
+# Created: Sun Oct 18 11:02:37 2026
+#      by: pyside2-uic  running on PySide2 5.13.2
+#
+# WARNING! All changes made in this file will be lost!
+
+from PySide2 import QtCore, QtGui, QtWidgets
+
+class Ui_RaidAchievementsPage(object):
+    def setupUi(self, tab_achievements):
+        tab_achievements.setObjectName("tab_achievements")
+        self.comboAchievementsWing = QtWidgets.QComboBox(tab_achievements)
+        self.comboAchievementsWing.setGeometry(QtCore.QRect(10, 0, 201, 21))
+        self.comboAchievementsWing.setObjectName("comboAchievementsWing")
+        self.gridAchievements = QtWidgets.QTableView(tab_achievements)
+        self.gridAchievements.setGeometry(QtCore.QRect(10, 30, 581, 480))
+        self.gridAchievements.setObjectName("gridAchievements")
+
+        self.retranslateUi(tab_achievements)
+        QtCore.QMetaObject.connectSlotsByName(tab_achievements)
+
+    def retranslateUi(self, tab_achievements):
+        pass
@@ -0,0 +1,337 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'raid_hot.ui',
+# licensing of 'raid_hot.ui' applies.
+#
+# Created: Sun Oct 18 11:02:37 2026
+#      by: pyside2-uic  running on PySide2 5.13.2
+#
+# WARNING! All changes made in this file will be lost!
+
+from PySide2 import QtCore, QtGui, QtWidgets
+
+class Ui_RaidHotPage(object):
+    def setupUi(self, tab_bosses_hot):
+        tab_bosses_hot.setObjectName("tab_bosses_hot")
+        self.lineRaidboss_matthias = QtWidgets.QLineEdit(tab_bosses_hot)
+        self.lineRaidboss_matthias.setGeometry(QtCore.QRect(100, 220, 91, 31))
+        self.lineRaidboss_matthias.setFrame(False)
+        self.lineRaidboss_matthias.setAlignment(QtCore.Qt.AlignCenter)
+        self.lineRaidboss_matthias.setReadOnly(True)
+        self.lineRaidboss_matthias.setObjectName("lineRaidboss_matthias")
+        self.line_9 = QtWidgets.QFrame(tab_bosses_hot)
+        self.line_9.setGeometry(QtCore.QRect(0, 400, 590, 3))
+        self.line_9.setFrameShape(QtWidgets.QFrame.HLine)
+        self.line_9.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.line_9.setObjectName("line_9")
+        self.lineRaidboss_cairn = QtWidgets.QLineEdit(tab_bosses_hot)
+        self.lineRaidboss_cairn.setGeometry(QtCore.QRect(10, 440, 91, 31))
+        self.lineRaidboss_cairn.setFrame(False)
+        self.lineRaidboss_cairn.setAlignment(QtCore.Qt.AlignCenter)
+        self.lineRaidboss_cairn.setReadOnly(True)
+        self.lineRaidboss_cairn.setObjectName("lineRaidboss_cairn")
+        self.label_27 = QtWidgets.QLabel(tab_bosses_hot)
+        self.label_27.setGeometry(QtCore.QRect(0, 70, 591, 20))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        font.setWeight(75)
+        font.setUnderline(True)
+        font.setBold(True)
+        self.label_27.setFont(font)
+        self.label_27.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_27.setObjectName("label_27")
+        self.lineRaidboss_xera = QtWidgets.QLineEdit(tab_bosses_hot)
+        self.lineRaidboss_xera.setGeometry(QtCore.QRect(100, 360, 91, 31))
+        self.lineRaidboss_xera.setFrame(False)
+        self.lineRaidboss_xera.setAlignment(QtCore.Qt.AlignCenter)
+        self.lineRaidboss_xera.setReadOnly(True)
+        self.lineRaidboss_xera.setObjectName("lineRaidboss_xera")
+        self.label_82 = QtWidgets.QLabel(tab_bosses_hot)
+        self.label_82.setGeometry(QtCore.QRect(390, 40, 131, 20))
+        self.label_82.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
+        self.label_82.setObjectName("label_82")
+        self.label_116 = QtWidgets.QLabel(tab_bosses_hot)
+        self.label_116.setGeometry(QtCore.QRect(0, 0, 281, 21))
+        self.label_116.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_116.setObjectName("label_116")
+        self.lineRaidboss_glenna = QtWidgets.QLineEdit(tab_bosses_hot)
+        self.lineRaidboss_glenna.setGeometry(QtCore.QRect(10, 330, 91, 31))
+        self.lineRaidboss_glenna.setFrame(False)
+        self.lineRaidboss_glenna.setAlignment(QtCore.Qt.AlignCenter)
+        self.lineRaidboss_glenna.setReadOnly(True)
+        self.lineRaidboss_glenna.setObjectName("lineRaidboss_glenna")
+        self.lineRaidboss_valeguardian = QtWidgets.QLineEdit(tab_bosses_hot)
+        self.lineRaidboss_valeguardian.setGeometry(QtCore.QRect(10, 110, 91, 31))
+        self.lineRaidboss_valeguardian.setFrame(False)
+        self.lineRaidboss_valeguardian.setAlignment(QtCore.Qt.AlignCenter)
+        self.lineRaidboss_valeguardian.setReadOnly(True)
+        self.lineRaidboss_valeguardian.setObjectName("lineRaidboss_valeguardian")
+        self.lineCurrency_Magnetiteshards = QtWidgets.QLineEdit(tab_bosses_hot)
+        self.lineCurrency_Magnetiteshards.setGeometry(QtCore.QRect(530, 20, 51, 20))
+        self.lineCurrency_Magnetiteshards.setText("")
+        self.lineCurrency_Magnetiteshards.setFrame(False)
+        self.lineCurrency_Magnetiteshards.setAlignment(QtCore.Qt.AlignCenter)
+        self.lineCurrency_Magnetiteshards.setReadOnly(True)
+        self.lineCurrency_Magnetiteshards.setObjectName("lineCurrency_Magnetiteshards")
+        self.lineRaidboss_trio = QtWidgets.QLineEdit(tab_bosses_hot)
+        self.lineRaidboss_trio.setGeometry(QtCore.QRect(10, 250, 91, 31))
+        self.lineRaidboss_trio.setFrame(False)
+        self.lineRaidboss_trio.setAlignment(QtCore.Qt.AlignCenter)
+        self.lineRaidboss_trio.setReadOnly(True)
+        self.lineRaidboss_trio.setObjectName("lineRaidboss_trio")
+        self.label_72 = QtWidgets.QLabel(tab_bosses_hot)
+        self.label_72.setGeometry(QtCore.QRect(10, 40, 311, 21))
+        self.label_72.setAlignment(QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft|QtCore.Qt.AlignVCenter)
+        self.label_72.setObjectName("label_72")
+        self.line_8 = QtWidgets.QFrame(tab_bosses_hot)
+        self.line_8.setGeometry(QtCore.QRect(0, 290, 590, 3))
+        self.line_8.setFrameShape(QtWidgets.QFrame.HLine)
+        self.line_8.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.line_8.setObjectName("line_8")
+        self.lineCurrency_Legend_insights = QtWidgets.QLineEdit(tab_bosses_hot)
+        self.lineCurrency_Legend_insights.setGeometry(QtCore.QRect(530, 40, 51, 20))
+        self.lineCurrency_Legend_insights.setText("")
+        self.lineCurrency_Legend_insights.setFrame(False)
+        self.lineCurrency_Legend_insights.setAlignment(QtCore.Qt.AlignCenter)
+        self.lineCurrency_Legend_insights.setReadOnly(True)
+        self.lineCurrency_Legend_insights.setObjectName("lineCurrency_Legend_insights")
+        self.lineRaidboss_slothasor = QtWidgets.QLineEdit(tab_bosses_hot)
+        self.lineRaidboss_slothasor.setGeometry(QtCore.QRect(10, 220, 91, 31))
+        self.lineRaidboss_slothasor.setFrame(False)
+        self.lineRaidboss_slothasor.setAlignment(QtCore.Qt.AlignCenter)
+        self.lineRaidboss_slothasor.setReadOnly(True)
+        self.lineRaidboss_slothasor.setObjectName("lineRaidboss_slothasor")
+        self.label_71 = QtWidgets.QLabel(tab_bosses_hot)
+        self.label_71.setGeometry(QtCore.QRect(10, 22, 311, 21))
+        self.label_71.setAlignment(QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft|QtCore.Qt.AlignVCenter)
+        self.label_71.setObjectName("label_71")
+        self.lineRaidboss_twistedcastle = QtWidgets.QLineEdit(tab_bosses_hot)
+        self.lineRaidboss_twistedcastle.setGeometry(QtCore.QRect(100, 330, 91, 31))
+        self.lineRaidboss_twistedcastle.setFrame(False)
+        self.lineRaidboss_twistedcastle.setAlignment(QtCore.Qt.AlignCenter)
+        self.lineRaidboss_twistedcastle.setReadOnly(True)
+        self.lineRaidboss_twistedcastle.setObjectName("lineRaidboss_twistedcastle")
+        self.line_7 = QtWidgets.QFrame(tab_bosses_hot)
+        self.line_7.setGeometry(QtCore.QRect(0, 180, 590, 3))
+        self.line_7.setFrameShape(QtWidgets.QFrame.HLine)
+        self.line_7.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.line_7.setObjectName("line_7")
+        self.label_31 = QtWidgets.QLabel(tab_bosses_hot)
+        self.label_31.setGeometry(QtCore.QRect(0, 180, 591, 20))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        font.setWeight(75)
+        font.setUnderline(True)
+        font.setBold(True)
+        self.label_31.setFont(font)
+        self.label_31.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_31.setObjectName("label_31")
+        self.label_115 = QtWidgets.QLabel(tab_bosses_hot)
+        self.label_115.setGeometry(QtCore.QRect(390, 0, 191, 21))
+        self.label_115.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_115.setObjectName("label_115")
+        self.lineRaidboss_gorseval = QtWidgets.QLineEdit(tab_bosses_hot)
+        self.lineRaidboss_gorseval.setGeometry(QtCore.QRect(100, 110, 91, 31))
+        self.lineRaidboss_gorseval.setFrame(False)
+        self.lineRaidboss_gorseval.setAlignment(QtCore.Qt.AlignCenter)
+        self.lineRaidboss_gorseval.setReadOnly(True)
+        self.lineRaidboss_gorseval.setObjectName("lineRaidboss_gorseval")
+        self.label_35 = QtWidgets.QLabel(tab_bosses_hot)
+        self.label_35.setGeometry(QtCore.QRect(0, 400, 591, 20))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        font.setWeight(75)
+        font.setUnderline(True)
+        font.setBold(True)
+        self.label_35.setFont(font)
+        self.label_35.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_35.setObjectName("label_35")
+        self.lineRaidboss_deimos = QtWidgets.QLineEdit(tab_bosses_hot)
+        self.lineRaidboss_deimos.setGeometry(QtCore.QRect(100, 470, 91, 31))
+        self.lineRaidboss_deimos.setFrame(False)
+        self.lineRaidboss_deimos.setAlignment(QtCore.Qt.AlignCenter)
+        self.lineRaidboss_deimos.setReadOnly(True)
+        self.lineRaidboss_deimos.setObjectName("lineRaidboss_deimos")
+        self.lineRaidboss_samarog = QtWidgets.QLineEdit(tab_bosses_hot)
+        self.lineRaidboss_samarog.setGeometry(QtCore.QRect(10, 470, 91, 31))
+        self.lineRaidboss_samarog.setFrame(False)
+        self.lineRaidboss_samarog.setAlignment(QtCore.Qt.AlignCenter)
+        self.lineRaidboss_samarog.setReadOnly(True)
+        self.lineRaidboss_samarog.setObjectName("lineRaidboss_samarog")
+        self.lineRaidboss_keepconstruct = QtWidgets.QLineEdit(tab_bosses_hot)
+        self.lineRaidboss_keepconstruct.setGeometry(QtCore.QRect(10, 360, 91, 31))
+        self.lineRaidboss_keepconstruct.setFrame(False)
+        self.lineRaidboss_keepconstruct.setAlignment(QtCore.Qt.AlignCenter)
+        self.lineRaidboss_keepconstruct.setReadOnly(True)
+        self.lineRaidboss_keepconstruct.setObjectName("lineRaidboss_keepconstruct")
+        self.line_10 = QtWidgets.QFrame(tab_bosses_hot)
+        self.line_10.setGeometry(QtCore.QRect(0, 70, 590, 3))
+        self.line_10.setFrameShape(QtWidgets.QFrame.HLine)
+        self.line_10.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.line_10.setObjectName("line_10")
+        self.label_34 = QtWidgets.QLabel(tab_bosses_hot)
+        self.label_34.setGeometry(QtCore.QRect(0, 290, 591, 20))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        font.setWeight(75)
+        font.setUnderline(True)
+        font.setBold(True)
+        self.label_34.setFont(font)
+        self.label_34.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_34.setObjectName("label_34")
+        self.lineRaidboss_spiritwoods = QtWidgets.QLineEdit(tab_bosses_hot)
+        self.lineRaidboss_spiritwoods.setGeometry(QtCore.QRect(10, 140, 91, 31))
+        self.lineRaidboss_spiritwoods.setFrame(False)
+        self.lineRaidboss_spiritwoods.setAlignment(QtCore.Qt.AlignCenter)
+        self.lineRaidboss_spiritwoods.setReadOnly(True)
+        self.lineRaidboss_spiritwoods.setObjectName("lineRaidboss_spiritwoods")
+        self.label_44 = QtWidgets.QLabel(tab_bosses_hot)
+        self.label_44.setGeometry(QtCore.QRect(390, 20, 131, 20))
+        self.label_44.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
+        self.label_44.setObjectName("label_44")
+        self.lineRaidboss_sabetha = QtWidgets.QLineEdit(tab_bosses_hot)
+        self.lineRaidboss_sabetha.setGeometry(QtCore.QRect(100, 140, 91, 31))
+        self.lineRaidboss_sabetha.setFrame(False)
+        self.lineRaidboss_sabetha.setAlignment(QtCore.Qt.AlignCenter)
+        self.lineRaidboss_sabetha.setReadOnly(True)
+        self.lineRaidboss_sabetha.setObjectName("lineRaidboss_sabetha")
+        self.lineRaidboss_mursaat = QtWidgets.QLineEdit(tab_bosses_hot)
+        self.lineRaidboss_mursaat.setGeometry(QtCore.QRect(100, 440, 91, 31))
+        self.lineRaidboss_mursaat.setFrame(False)
+        self.lineRaidboss_mursaat.setAlignment(QtCore.Qt.AlignCenter)
+        self.lineRaidboss_mursaat.setReadOnly(True)
+        self.lineRaidboss_mursaat.setObjectName("lineRaidboss_mursaat")
+        self.label_119 = QtWidgets.QLabel(tab_bosses_hot)
+        self.label_119.setGeometry(QtCore.QRect(220, 420, 181, 21))
+        self.label_119.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_119.setObjectName("label_119")
+        self.label_120 = QtWidgets.QLabel(tab_bosses_hot)
+        self.label_120.setGeometry(QtCore.QRect(430, 420, 151, 21))
+        self.label_120.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_120.setObjectName("label_120")
+        self.label_121 = QtWidgets.QLabel(tab_bosses_hot)
+        self.label_121.setGeometry(QtCore.QRect(10, 410, 181, 31))
+        self.label_121.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_121.setObjectName("label_121")
+        self.label_124 = QtWidgets.QLabel(tab_bosses_hot)
+        self.label_124.setGeometry(QtCore.QRect(220, 310, 181, 21))
+        self.label_124.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_124.setObjectName("label_124")
+        self.label_123 = QtWidgets.QLabel(tab_bosses_hot)
+        self.label_123.setGeometry(QtCore.QRect(430, 310, 151, 21))
+        self.label_123.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_123.setObjectName("label_123")
+        self.label_122 = QtWidgets.QLabel(tab_bosses_hot)
+        self.label_122.setGeometry(QtCore.QRect(10, 300, 181, 31))
+        self.label_122.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_122.setObjectName("label_122")
+        self.label_127 = QtWidgets.QLabel(tab_bosses_hot)
+        self.label_127.setGeometry(QtCore.QRect(220, 200, 181, 21))
+        self.label_127.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_127.setObjectName("label_127")
+        self.label_125 = QtWidgets.QLabel(tab_bosses_hot)
+        self.label_125.setGeometry(QtCore.QRect(430, 200, 151, 21))
+        self.label_125.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_125.setObjectName("label_125")
+        self.label_126 = QtWidgets.QLabel(tab_bosses_hot)
+        self.label_126.setGeometry(QtCore.QRect(10, 190, 181, 31))
+        self.label_126.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_126.setObjectName("label_126")
+        self.label_130 = QtWidgets.QLabel(tab_bosses_hot)
+        self.label_130.setGeometry(QtCore.QRect(220, 90, 181, 21))
+        self.label_130.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_130.setObjectName("label_130")
+        self.label_129 = QtWidgets.QLabel(tab_bosses_hot)
+        self.label_129.setGeometry(QtCore.QRect(10, 80, 181, 31))
+        self.label_129.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_129.setObjectName("label_129")
+        self.label_128 = QtWidgets.QLabel(tab_bosses_hot)
+        self.label_128.setGeometry(QtCore.QRect(430, 90, 151, 21))
+        self.label_128.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_128.setObjectName("label_128")
+        self.label_83 = QtWidgets.QLabel(tab_bosses_hot)
+        self.label_83.setGeometry(QtCore.QRect(410, 70, 171, 20))
+        self.label_83.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
+        self.label_83.setObjectName("label_83")
+        self.label_84 = QtWidgets.QLabel(tab_bosses_hot)
+        self.label_84.setGeometry(QtCore.QRect(430, 180, 151, 20))
+        self.label_84.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
+        self.label_84.setObjectName("label_84")
+        self.label_85 = QtWidgets.QLabel(tab_bosses_hot)
+        self.label_85.setGeometry(QtCore.QRect(430, 290, 151, 20))
+        self.label_85.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
+        self.label_85.setObjectName("label_85")
+        self.label_86 = QtWidgets.QLabel(tab_bosses_hot)
+        self.label_86.setGeometry(QtCore.QRect(420, 400, 161, 20))
+        self.label_86.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
+        self.label_86.setObjectName("label_86")
+        self.gridSkins_w1 = QtWidgets.QTableView(tab_bosses_hot)
+        self.gridSkins_w1.setGeometry(QtCore.QRect(220, 110, 180, 30))
+        self.gridSkins_w1.setObjectName("gridSkins_w1")
+        self.gridMinis_w1 = QtWidgets.QTableView(tab_bosses_hot)
+        self.gridMinis_w1.setGeometry(QtCore.QRect(430, 110, 150, 60))
+        self.gridMinis_w1.setObjectName("gridMinis_w1")
+        self.gridSkins_w2 = QtWidgets.QTableView(tab_bosses_hot)
+        self.gridSkins_w2.setGeometry(QtCore.QRect(220, 220, 180, 60))
+        self.gridSkins_w2.setObjectName("gridSkins_w2")
+        self.gridMinis_w2 = QtWidgets.QTableView(tab_bosses_hot)
+        self.gridMinis_w2.setGeometry(QtCore.QRect(430, 220, 150, 60))
+        self.gridMinis_w2.setObjectName("gridMinis_w2")
+        self.gridSkins_w3 = QtWidgets.QTableView(tab_bosses_hot)
+        self.gridSkins_w3.setGeometry(QtCore.QRect(220, 330, 180, 60))
+        self.gridSkins_w3.setObjectName("gridSkins_w3")
+        self.gridMinis_w3 = QtWidgets.QTableView(tab_bosses_hot)
+        self.gridMinis_w3.setGeometry(QtCore.QRect(430, 330, 150, 30))
+        self.gridMinis_w3.setObjectName("gridMinis_w3")
+        self.gridSkins_w4 = QtWidgets.QTableView(tab_bosses_hot)
+        self.gridSkins_w4.setGeometry(QtCore.QRect(220, 440, 180, 60))
+        self.gridSkins_w4.setObjectName("gridSkins_w4")
+        self.gridMinis_w4 = QtWidgets.QTableView(tab_bosses_hot)
+        self.gridMinis_w4.setGeometry(QtCore.QRect(430, 440, 150, 60))
+        self.gridMinis_w4.setObjectName("gridMinis_w4")
+
+        self.retranslateUi(tab_bosses_hot)
+        QtCore.QMetaObject.connectSlotsByName(tab_bosses_hot)
+
+    def retranslateUi(self, tab_bosses_hot):
+        self.lineRaidboss_matthias.setText(QtWidgets.QApplication.translate("RaidHotPage", "Matthias", None, -1))
+        self.lineRaidboss_cairn.setText(QtWidgets.QApplication.translate("RaidHotPage", "Cairn", None, -1))
+        self.label_27.setText(QtWidgets.QApplication.translate("RaidHotPage", "Wing 1 - Spirit Vale", None, -1))
+        self.lineRaidboss_xera.setText(QtWidgets.QApplication.translate("RaidHotPage", "Xera", None, -1))
+        self.label_82.setText(QtWidgets.QApplication.translate("RaidHotPage", "Legendary Insights (LIs):", None, -1))
+        self.label_116.setText(QtWidgets.QApplication.translate("RaidHotPage", "<html><head/><body><p><span style=\" font-weight:600;\">REQUIREMENTS</span></p></body></html>", None, -1))
+        self.lineRaidboss_glenna.setText(QtWidgets.QApplication.translate("RaidHotPage", "Escort", None, -1))
+        self.lineRaidboss_valeguardian.setText(QtWidgets.QApplication.translate("RaidHotPage", "Vale Guardian", None, -1))
+        self.lineRaidboss_trio.setText(QtWidgets.QApplication.translate("RaidHotPage", "Bandit Trio", None, -1))
+        self.label_72.setText(QtWidgets.QApplication.translate("RaidHotPage", "<html><head/><body><p><span style=\" font-weight:600; text-decoration: underline;\">MASTERIES:</span> Ley Line Gliding and Forsaken Magic</p></body></html>", None, -1))
+        self.lineRaidboss_slothasor.setText(QtWidgets.QApplication.translate("RaidHotPage", "Slothasor", None, -1))
+        self.label_71.setText(QtWidgets.QApplication.translate("RaidHotPage", "<html><head/><body><p><span style=\" font-weight:600; text-decoration: underline;\">EXPANSION: </span>Heart of Thorns<br/></p></body></html>", None, -1))
+        self.lineRaidboss_twistedcastle.setText(QtWidgets.QApplication.translate("RaidHotPage", " Twisted Castle", None, -1))
+        self.label_31.setText(QtWidgets.QApplication.translate("RaidHotPage", "Wing 2 - Salvation Pass", None, -1))
+        self.label_115.setText(QtWidgets.QApplication.translate("RaidHotPage", "<html><head/><body><p><span style=\" font-weight:600;\">CURRENCY</span></p></body></html>", None, -1))
+        self.lineRaidboss_gorseval.setText(QtWidgets.QApplication.translate("RaidHotPage", "Gorseval", None, -1))
+        self.label_35.setText(QtWidgets.QApplication.translate("RaidHotPage", "Wing 4 - Bastion of the Penitent", None, -1))
+        self.lineRaidboss_deimos.setText(QtWidgets.QApplication.translate("RaidHotPage", "Deimos", None, -1))
+        self.lineRaidboss_samarog.setText(QtWidgets.QApplication.translate("RaidHotPage", "Samarog", None, -1))
+        self.lineRaidboss_keepconstruct.setText(QtWidgets.QApplication.translate("RaidHotPage", "Keep Construct", None, -1))
+        self.label_34.setText(QtWidgets.QApplication.translate("RaidHotPage", "Wing 3 - Stronghold of the Faithful", None, -1))
+        self.lineRaidboss_spiritwoods.setText(QtWidgets.QApplication.translate("RaidHotPage", "Spirit Woods", None, -1))
+        self.label_44.setText(QtWidgets.QApplication.translate("RaidHotPage", "Magnetite Shards:", None, -1))
+        self.lineRaidboss_sabetha.setText(QtWidgets.QApplication.translate("RaidHotPage", "Sabetha", None, -1))
+        self.lineRaidboss_mursaat.setText(QtWidgets.QApplication.translate("RaidHotPage", "Mursaat Overseer", None, -1))
+        self.label_119.setText(QtWidgets.QApplication.translate("RaidHotPage", "<html><head/><body><p>Skins unlocked</p></body></html>", None, -1))
+        self.label_120.setText(QtWidgets.QApplication.translate("RaidHotPage", "<html><head/><body><p>Minis unlocked</p></body></html>", None, -1))
+        self.label_121.setText(QtWidgets.QApplication.translate("RaidHotPage", "<html><head/><body><p align=\"center\">Bosses/Events<br/>Completed this week</p></body></html>", None, -1))
+        self.label_124.setText(QtWidgets.QApplication.translate("RaidHotPage", "<html><head/><body><p>Skins unlocked</p></body></html>", None, -1))
+        self.label_123.setText(QtWidgets.QApplication.translate("RaidHotPage", "<html><head/><body><p>Minis unlocked</p></body></html>", None, -1))
+        self.label_122.setText(QtWidgets.QApplication.translate("RaidHotPage", "<html><head/><body><p align=\"center\">Bosses/Events<br/>Completed this week</p></body></html>", None, -1))
+        self.label_127.setText(QtWidgets.QApplication.translate("RaidHotPage", "<html><head/><body><p>Skins unlocked</p></body></html>", None, -1))
+        self.label_125.setText(QtWidgets.QApplication.translate("RaidHotPage", "<html><head/><body><p>Minis unlocked</p></body></html>", None, -1))
+        self.label_126.setText(QtWidgets.QApplication.translate("RaidHotPage", "<html><head/><body><p align=\"center\">Bosses/Events<br/>Completed this week</p></body></html>", None, -1))
+        self.label_130.setText(QtWidgets.QApplication.translate("RaidHotPage", "<html><head/><body><p>Skins unlocked</p></body></html>", None, -1))
+        self.label_129.setText(QtWidgets.QApplication.translate("RaidHotPage", "<html><head/><body><p align=\"center\">Bosses/Events<br/>Completed this week</p></body></html>", None, -1))
+        self.label_128.setText(QtWidgets.QApplication.translate("RaidHotPage", "<html><head/><body><p>Minis unlocked</p></body></html>", None, -1))
+        self.label_83.setText(QtWidgets.QApplication.translate("RaidHotPage", "Released on: November 17, 2015", None, -1))
+        self.label_84.setText(QtWidgets.QApplication.translate("RaidHotPage", "Released on: March 8, 2016 ", None, -1))
+        self.label_85.setText(QtWidgets.QApplication.translate("RaidHotPage", "Released on: June 14, 2016 ", None, -1))
+        self.label_86.setText(QtWidgets.QApplication.translate("RaidHotPage", "Released on: February 8, 2017 ", None, -1))
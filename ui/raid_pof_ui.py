@@ -0,0 +1,267 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'raid_pof.ui',
+# licensing of 'raid_pof.ui' applies.
+#
+# Created: Sun Oct 18 11:02:37 2026
+#      by: pyside2-uic  running on PySide2 5.13.2
+#
+# WARNING! All changes made in this file will be lost!
+
+from PySide2 import QtCore, QtGui, QtWidgets
+
+class Ui_RaidPofPage(object):
+    def setupUi(self, tab_bosses_pof):
+        tab_bosses_pof.setObjectName("tab_bosses_pof")
+        self.line_5 = QtWidgets.QFrame(tab_bosses_pof)
+        self.line_5.setGeometry(QtCore.QRect(0, 70, 590, 3))
+        self.line_5.setFrameShape(QtWidgets.QFrame.HLine)
+        self.line_5.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.line_5.setObjectName("line_5")
+        self.lineRaidboss_dhuum = QtWidgets.QLineEdit(tab_bosses_pof)
+        self.lineRaidboss_dhuum.setGeometry(QtCore.QRect(100, 140, 91, 31))
+        self.lineRaidboss_dhuum.setFrame(False)
+        self.lineRaidboss_dhuum.setAlignment(QtCore.Qt.AlignCenter)
+        self.lineRaidboss_dhuum.setReadOnly(True)
+        self.lineRaidboss_dhuum.setObjectName("lineRaidboss_dhuum")
+        self.line_11 = QtWidgets.QFrame(tab_bosses_pof)
+        self.line_11.setGeometry(QtCore.QRect(0, 290, 590, 3))
+        self.line_11.setFrameShape(QtWidgets.QFrame.HLine)
+        self.line_11.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.line_11.setObjectName("line_11")
+        self.label_39 = QtWidgets.QLabel(tab_bosses_pof)
+        self.label_39.setGeometry(QtCore.QRect(0, 70, 591, 20))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        font.setWeight(75)
+        font.setUnderline(True)
+        font.setBold(True)
+        self.label_39.setFont(font)
+        self.label_39.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_39.setObjectName("label_39")
+        self.line_4 = QtWidgets.QFrame(tab_bosses_pof)
+        self.line_4.setGeometry(QtCore.QRect(0, 180, 590, 3))
+        self.line_4.setFrameShape(QtWidgets.QFrame.HLine)
+        self.line_4.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.line_4.setObjectName("line_4")
+        self.lineRaidboss_qadim = QtWidgets.QLineEdit(tab_bosses_pof)
+        self.lineRaidboss_qadim.setGeometry(QtCore.QRect(100, 220, 91, 31))
+        self.lineRaidboss_qadim.setFrame(False)
+        self.lineRaidboss_qadim.setAlignment(QtCore.Qt.AlignCenter)
+        self.lineRaidboss_qadim.setReadOnly(True)
+        self.lineRaidboss_qadim.setObjectName("lineRaidboss_qadim")
+        self.lineRaidboss_riverofsouls = QtWidgets.QLineEdit(tab_bosses_pof)
+        self.lineRaidboss_riverofsouls.setGeometry(QtCore.QRect(10, 140, 91, 31))
+        self.lineRaidboss_riverofsouls.setFrame(False)
+        self.lineRaidboss_riverofsouls.setAlignment(QtCore.Qt.AlignCenter)
+        self.lineRaidboss_riverofsouls.setReadOnly(True)
+        self.lineRaidboss_riverofsouls.setObjectName("lineRaidboss_riverofsouls")
+        self.lineRaidboss_desmina = QtWidgets.QLineEdit(tab_bosses_pof)
+        self.lineRaidboss_desmina.setGeometry(QtCore.QRect(10, 110, 91, 31))
+        self.lineRaidboss_desmina.setFrame(False)
+        self.lineRaidboss_desmina.setAlignment(QtCore.Qt.AlignCenter)
+        self.lineRaidboss_desmina.setReadOnly(True)
+        self.lineRaidboss_desmina.setObjectName("lineRaidboss_desmina")
+        self.lineRaidboss_conjureda = QtWidgets.QLineEdit(tab_bosses_pof)
+        self.lineRaidboss_conjureda.setGeometry(QtCore.QRect(10, 220, 91, 31))
+        self.lineRaidboss_conjureda.setFrame(False)
+        self.lineRaidboss_conjureda.setAlignment(QtCore.Qt.AlignCenter)
+        self.lineRaidboss_conjureda.setReadOnly(True)
+        self.lineRaidboss_conjureda.setObjectName("lineRaidboss_conjureda")
+        self.lineRaidboss_twinlargos = QtWidgets.QLineEdit(tab_bosses_pof)
+        self.lineRaidboss_twinlargos.setGeometry(QtCore.QRect(10, 250, 91, 31))
+        self.lineRaidboss_twinlargos.setFrame(False)
+        self.lineRaidboss_twinlargos.setAlignment(QtCore.Qt.AlignCenter)
+        self.lineRaidboss_twinlargos.setReadOnly(True)
+        self.lineRaidboss_twinlargos.setObjectName("lineRaidboss_twinlargos")
+        self.label_47 = QtWidgets.QLabel(tab_bosses_pof)
+        self.label_47.setGeometry(QtCore.QRect(0, 180, 591, 20))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        font.setWeight(75)
+        font.setUnderline(True)
+        font.setBold(True)
+        self.label_47.setFont(font)
+        self.label_47.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_47.setObjectName("label_47")
+        self.lineRaidboss_statues = QtWidgets.QLineEdit(tab_bosses_pof)
+        self.lineRaidboss_statues.setGeometry(QtCore.QRect(100, 110, 91, 31))
+        self.lineRaidboss_statues.setFrame(False)
+        self.lineRaidboss_statues.setAlignment(QtCore.Qt.AlignCenter)
+        self.lineRaidboss_statues.setReadOnly(True)
+        self.lineRaidboss_statues.setObjectName("lineRaidboss_statues")
+        self.label_68 = QtWidgets.QLabel(tab_bosses_pof)
+        self.label_68.setGeometry(QtCore.QRect(0, 290, 591, 20))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        font.setWeight(75)
+        font.setUnderline(True)
+        font.setBold(True)
+        self.label_68.setFont(font)
+        self.label_68.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_68.setObjectName("label_68")
+        self.label_74 = QtWidgets.QLabel(tab_bosses_pof)
+        self.label_74.setGeometry(QtCore.QRect(10, 22, 311, 21))
+        self.label_74.setAlignment(QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft|QtCore.Qt.AlignVCenter)
+        self.label_74.setObjectName("label_74")
+        self.label_118 = QtWidgets.QLabel(tab_bosses_pof)
+        self.label_118.setGeometry(QtCore.QRect(0, 0, 281, 21))
+        self.label_118.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_118.setObjectName("label_118")
+        self.label_73 = QtWidgets.QLabel(tab_bosses_pof)
+        self.label_73.setGeometry(QtCore.QRect(10, 40, 311, 21))
+        self.label_73.setAlignment(QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft|QtCore.Qt.AlignVCenter)
+        self.label_73.setObjectName("label_73")
+        self.label_117 = QtWidgets.QLabel(tab_bosses_pof)
+        self.label_117.setGeometry(QtCore.QRect(390, 0, 191, 21))
+        self.label_117.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_117.setObjectName("label_117")
+        self.lineCurrency_Legend_divinations = QtWidgets.QLineEdit(tab_bosses_pof)
+        self.lineCurrency_Legend_divinations.setGeometry(QtCore.QRect(530, 40, 51, 20))
+        self.lineCurrency_Legend_divinations.setText("")
+        self.lineCurrency_Legend_divinations.setFrame(False)
+        self.lineCurrency_Legend_divinations.setAlignment(QtCore.Qt.AlignCenter)
+        self.lineCurrency_Legend_divinations.setReadOnly(True)
+        self.lineCurrency_Legend_divinations.setObjectName("lineCurrency_Legend_divinations")
+        self.lineCurrency_Gaetingcrystals = QtWidgets.QLineEdit(tab_bosses_pof)
+        self.lineCurrency_Gaetingcrystals.setGeometry(QtCore.QRect(530, 20, 51, 20))
+        self.lineCurrency_Gaetingcrystals.setText("")
+        self.lineCurrency_Gaetingcrystals.setFrame(False)
+        self.lineCurrency_Gaetingcrystals.setAlignment(QtCore.Qt.AlignCenter)
+        self.lineCurrency_Gaetingcrystals.setReadOnly(True)
+        self.lineCurrency_Gaetingcrystals.setObjectName("lineCurrency_Gaetingcrystals")
+        self.label_45 = QtWidgets.QLabel(tab_bosses_pof)
+        self.label_45.setGeometry(QtCore.QRect(420, 20, 101, 20))
+        self.label_45.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
+        self.label_45.setObjectName("label_45")
+        self.label_81 = QtWidgets.QLabel(tab_bosses_pof)
+        self.label_81.setGeometry(QtCore.QRect(380, 40, 141, 20))
+        self.label_81.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
+        self.label_81.setObjectName("label_81")
+        self.label_87 = QtWidgets.QLabel(tab_bosses_pof)
+        self.label_87.setGeometry(QtCore.QRect(420, 70, 171, 20))
+        self.label_87.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
+        self.label_87.setObjectName("label_87")
+        self.label_88 = QtWidgets.QLabel(tab_bosses_pof)
+        self.label_88.setGeometry(QtCore.QRect(420, 180, 171, 20))
+        self.label_88.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
+        self.label_88.setObjectName("label_88")
+        self.label_91 = QtWidgets.QLabel(tab_bosses_pof)
+        self.label_91.setGeometry(QtCore.QRect(410, 290, 171, 20))
+        self.label_91.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
+        self.label_91.setObjectName("label_91")
+        self.label_133 = QtWidgets.QLabel(tab_bosses_pof)
+        self.label_133.setGeometry(QtCore.QRect(220, 90, 181, 21))
+        self.label_133.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_133.setObjectName("label_133")
+        self.label_131 = QtWidgets.QLabel(tab_bosses_pof)
+        self.label_131.setGeometry(QtCore.QRect(10, 80, 181, 31))
+        self.label_131.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_131.setObjectName("label_131")
+        self.label_132 = QtWidgets.QLabel(tab_bosses_pof)
+        self.label_132.setGeometry(QtCore.QRect(430, 90, 151, 21))
+        self.label_132.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_132.setObjectName("label_132")
+        self.label_134 = QtWidgets.QLabel(tab_bosses_pof)
+        self.label_134.setGeometry(QtCore.QRect(220, 200, 181, 21))
+        self.label_134.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_134.setObjectName("label_134")
+        self.label_135 = QtWidgets.QLabel(tab_bosses_pof)
+        self.label_135.setGeometry(QtCore.QRect(10, 190, 181, 31))
+        self.label_135.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_135.setObjectName("label_135")
+        self.label_136 = QtWidgets.QLabel(tab_bosses_pof)
+        self.label_136.setGeometry(QtCore.QRect(430, 200, 151, 21))
+        self.label_136.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_136.setObjectName("label_136")
+        self.lineRaidboss_adina = QtWidgets.QLineEdit(tab_bosses_pof)
+        self.lineRaidboss_adina.setGeometry(QtCore.QRect(10, 360, 91, 31))
+        self.lineRaidboss_adina.setFrame(False)
+        self.lineRaidboss_adina.setAlignment(QtCore.Qt.AlignCenter)
+        self.lineRaidboss_adina.setReadOnly(True)
+        self.lineRaidboss_adina.setObjectName("lineRaidboss_adina")
+        self.lineRaidboss_gateofahdashim = QtWidgets.QLineEdit(tab_bosses_pof)
+        self.lineRaidboss_gateofahdashim.setGeometry(QtCore.QRect(10, 330, 91, 31))
+        self.lineRaidboss_gateofahdashim.setFrame(False)
+        self.lineRaidboss_gateofahdashim.setAlignment(QtCore.Qt.AlignCenter)
+        self.lineRaidboss_gateofahdashim.setReadOnly(True)
+        self.lineRaidboss_gateofahdashim.setObjectName("lineRaidboss_gateofahdashim")
+        self.lineRaidboss_sabir = QtWidgets.QLineEdit(tab_bosses_pof)
+        self.lineRaidboss_sabir.setGeometry(QtCore.QRect(100, 330, 91, 31))
+        self.lineRaidboss_sabir.setFrame(False)
+        self.lineRaidboss_sabir.setAlignment(QtCore.Qt.AlignCenter)
+        self.lineRaidboss_sabir.setReadOnly(True)
+        self.lineRaidboss_sabir.setObjectName("lineRaidboss_sabir")
+        self.label_137 = QtWidgets.QLabel(tab_bosses_pof)
+        self.label_137.setGeometry(QtCore.QRect(10, 300, 181, 31))
+        self.label_137.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_137.setObjectName("label_137")
+        self.lineRaidboss_qadim2 = QtWidgets.QLineEdit(tab_bosses_pof)
+        self.lineRaidboss_qadim2.setGeometry(QtCore.QRect(100, 360, 91, 31))
+        self.lineRaidboss_qadim2.setFrame(False)
+        self.lineRaidboss_qadim2.setAlignment(QtCore.Qt.AlignCenter)
+        self.lineRaidboss_qadim2.setReadOnly(True)
+        self.lineRaidboss_qadim2.setObjectName("lineRaidboss_qadim2")
+        self.label_138 = QtWidgets.QLabel(tab_bosses_pof)
+        self.label_138.setGeometry(QtCore.QRect(430, 310, 151, 21))
+        self.label_138.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_138.setObjectName("label_138")
+        self.label_139 = QtWidgets.QLabel(tab_bosses_pof)
+        self.label_139.setGeometry(QtCore.QRect(220, 310, 181, 21))
+        self.label_139.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_139.setObjectName("label_139")
+        self.gridSkins_w5 = QtWidgets.QTableView(tab_bosses_pof)
+        self.gridSkins_w5.setGeometry(QtCore.QRect(220, 110, 180, 60))
+        self.gridSkins_w5.setObjectName("gridSkins_w5")
+        self.gridMinis_w5 = QtWidgets.QTableView(tab_bosses_pof)
+        self.gridMinis_w5.setGeometry(QtCore.QRect(430, 110, 150, 30))
+        self.gridMinis_w5.setObjectName("gridMinis_w5")
+        self.gridSkins_w6 = QtWidgets.QTableView(tab_bosses_pof)
+        self.gridSkins_w6.setGeometry(QtCore.QRect(220, 220, 180, 30))
+        self.gridSkins_w6.setObjectName("gridSkins_w6")
+        self.gridMinis_w6 = QtWidgets.QTableView(tab_bosses_pof)
+        self.gridMinis_w6.setGeometry(QtCore.QRect(430, 220, 150, 30))
+        self.gridMinis_w6.setObjectName("gridMinis_w6")
+        self.gridSkins_w7 = QtWidgets.QTableView(tab_bosses_pof)
+        self.gridSkins_w7.setGeometry(QtCore.QRect(220, 330, 180, 30))
+        self.gridSkins_w7.setObjectName("gridSkins_w7")
+        self.gridMinis_w7 = QtWidgets.QTableView(tab_bosses_pof)
+        self.gridMinis_w7.setGeometry(QtCore.QRect(430, 330, 150, 30))
+        self.gridMinis_w7.setObjectName("gridMinis_w7")
+
+        self.retranslateUi(tab_bosses_pof)
+        QtCore.QMetaObject.connectSlotsByName(tab_bosses_pof)
+
+    def retranslateUi(self, tab_bosses_pof):
+        self.lineRaidboss_dhuum.setText(QtWidgets.QApplication.translate("RaidPofPage", "Dhuum", None, -1))
+        self.label_39.setText(QtWidgets.QApplication.translate("RaidPofPage", "Wing 5 - Hall of Chains", None, -1))
+        self.lineRaidboss_qadim.setText(QtWidgets.QApplication.translate("RaidPofPage", "Qadim", None, -1))
+        self.lineRaidboss_riverofsouls.setText(QtWidgets.QApplication.translate("RaidPofPage", "River of Souls", None, -1))
+        self.lineRaidboss_desmina.setText(QtWidgets.QApplication.translate("RaidPofPage", "Soulless Horror", None, -1))
+        self.lineRaidboss_conjureda.setText(QtWidgets.QApplication.translate("RaidPofPage", "C. Amalgamated", None, -1))
+        self.lineRaidboss_twinlargos.setText(QtWidgets.QApplication.translate("RaidPofPage", "Twin Largos", None, -1))
+        self.label_47.setText(QtWidgets.QApplication.translate("RaidPofPage", "Wing 6 - The Mythwright Gambit", None, -1))
+        self.lineRaidboss_statues.setText(QtWidgets.QApplication.translate("RaidPofPage", "The 3 Statues", None, -1))
+        self.label_68.setText(QtWidgets.QApplication.translate("RaidPofPage", "Wing 7 - The Key Of Ahdashim", None, -1))
+        self.label_74.setText(QtWidgets.QApplication.translate("RaidPofPage", "<html><head/><body><p><span style=\" font-weight:600; text-decoration: underline;\">EXPANSION: </span>Path of Fire<br/></p></body></html>", None, -1))
+        self.label_118.setText(QtWidgets.QApplication.translate("RaidPofPage", "<html><head/><body><p><span style=\" font-weight:600;\">REQUIREMENTS</span></p></body></html>", None, -1))
+        self.label_73.setText(QtWidgets.QApplication.translate("RaidPofPage", "<html><head/><body><p><span style=\" font-weight:600; text-decoration: underline;\">MASTERIES:</span> Either Gliding or at least Springer High Vault.</p></body></html>", None, -1))
+        self.label_117.setText(QtWidgets.QApplication.translate("RaidPofPage", "<html><head/><body><p><span style=\" font-weight:600;\">CURRENCY</span></p></body></html>", None, -1))
+        self.label_45.setText(QtWidgets.QApplication.translate("RaidPofPage", "Gaeting Crystals:", None, -1))
+        self.label_81.setText(QtWidgets.QApplication.translate("RaidPofPage", "Legendary Divinations (DIs):", None, -1))
+        self.label_87.setText(QtWidgets.QApplication.translate("RaidPofPage", "Released on: November 28, 2017", None, -1))
+        self.label_88.setText(QtWidgets.QApplication.translate("RaidPofPage", "Released on: September 18, 2018", None, -1))
+        self.label_91.setText(QtWidgets.QApplication.translate("RaidPofPage", "Released on: June 11, 2019", None, -1))
+        self.label_133.setText(QtWidgets.QApplication.translate("RaidPofPage", "<html><head/><body><p>Skins unlocked</p></body></html>", None, -1))
+        self.label_131.setText(QtWidgets.QApplication.translate("RaidPofPage", "<html><head/><body><p align=\"center\">Bosses/Events<br/>Completed this week</p></body></html>", None, -1))
+        self.label_132.setText(QtWidgets.QApplication.translate("RaidPofPage", "<html><head/><body><p>Minis unlocked</p></body></html>", None, -1))
+        self.label_134.setText(QtWidgets.QApplication.translate("RaidPofPage", "<html><head/><body><p>Skins unlocked</p></body></html>", None, -1))
+        self.label_135.setText(QtWidgets.QApplication.translate("RaidPofPage", "<html><head/><body><p align=\"center\">Bosses/Events<br/>Completed this week</p></body></html>", None, -1))
+        self.label_136.setText(QtWidgets.QApplication.translate("RaidPofPage", "<html><head/><body><p>Minis unlocked</p></body></html>", None, -1))
+        self.lineRaidboss_adina.setText(QtWidgets.QApplication.translate("RaidPofPage", "Adina", None, -1))
+        self.lineRaidboss_gateofahdashim.setText(QtWidgets.QApplication.translate("RaidPofPage", "The Gate", None, -1))
+        self.lineRaidboss_sabir.setText(QtWidgets.QApplication.translate("RaidPofPage", "Sabir", None, -1))
+        self.label_137.setText(QtWidgets.QApplication.translate("RaidPofPage", "<html><head/><body><p align=\"center\">Bosses/Events<br/>Completed this week</p></body></html>", None, -1))
+        self.lineRaidboss_qadim2.setText(QtWidgets.QApplication.translate("RaidPofPage", "Qadim", None, -1))
+        self.label_138.setText(QtWidgets.QApplication.translate("RaidPofPage", "<html><head/><body><p>Minis unlocked</p></body></html>", None, -1))
+        self.label_139.setText(QtWidgets.QApplication.translate("RaidPofPage", "<html><head/><body><p>Skins unlocked</p></body></html>", None, -1))
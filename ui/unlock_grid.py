@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+
+"""Grids of tracked things (achievements, minis, skins) painted by a model and a delegate.
+A single view paints only the visible cells, instead of one widget per thing."""
+from PySide2.QtCore import Qt, QAbstractTableModel, QModelIndex, QRect
+from PySide2.QtGui import QColor, QPen
+from PySide2.QtWidgets import QAbstractItemView, QFrame, QHeaderView, QStyledItemDelegate
+
+STATE_ROLE = Qt.UserRole + 1
+ICON_ROLE = Qt.UserRole + 2
+
+########################################################
+######################## MODEL #########################
+########################################################
+
+
+class UnlockGridModel(QAbstractTableModel):
+    """Catalog entries (dicts with id, name, wing and maybe icon) laid out in rows of `columns` cells.
+    Every entry has a state: "yes", "no", "grey" or "reset"."""
+    def __init__(self, entries, columns, wings=None, parent=None):
+        QAbstractTableModel.__init__(self, parent)
+        self.entries = list(entries)
+        self.columns = columns
+        self.states = {}
+        self.visible = []
+        self.positions = {}
+        self.set_wings(wings)
+
+    def set_wings(self, wings=None):
+        """Show only the entries of some wings (None shows all of them)."""
+        self.beginResetModel()
+        self.visible = [entry for entry in self.entries if wings is None or entry['wing'] in wings]
+        self.positions = {entry['id']: divmod(position, self.columns) for position, entry in enumerate(self.visible)}
+        self.endResetModel()
+
+    def set_states(self, states):
+        """Set a dict of id -> state, repainting only the cells that changed."""
+        changed = [entry_id for entry_id, state in states.items() if self.states.get(entry_id, "reset") != state]
+        self.states.update(states)
+        for entry_id in changed:
+            if entry_id in self.positions:
+                index = self.index(*self.positions[entry_id])
+                self.dataChanged.emit(index, index)
+
+    def entry(self, index):
+        """Entry of a cell, or None for the empty cells of the last row."""
+        position = index.row() * self.columns + index.column()
+        return self.visible[position] if index.isValid() and position < len(self.visible) else None
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else (len(self.visible) + self.columns - 1) // self.columns
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.columns
+
+    def data(self, index, role=Qt.DisplayRole):
+        entry = self.entry(index)
+        if entry is None:
+            return None
+        if role == Qt.DisplayRole:
+            return None if "icon" in entry else entry['name']
+        if role == Qt.ToolTipRole:
+            return entry['name']
+        if role == STATE_ROLE:
+            return self.states.get(entry['id'], "reset")
+        if role == ICON_ROLE:
+            return entry.get("icon")
+        return None
+
+    def flags(self, index):
+        return Qt.ItemIsEnabled if self.entry(index) is not None else Qt.NoItemFlags
+
+########################################################
+###################### DELEGATE ########################
+########################################################
+
+
+class UnlockDelegate(QStyledItemDelegate):
+    """Paint icons tinted by their state, and names over the background of their state.
+    `tints` is state -> (r, g, b), `backgrounds` is state -> ((r, g, b) fill, (r, g, b) border)."""
+    def __init__(self, pixmap_cache, tints, backgrounds, parent=None):
+        QStyledItemDelegate.__init__(self, parent)
+        self.pixmap_cache = pixmap_cache
+        self.tints = tints
+        self.backgrounds = backgrounds
+
+    def paint(self, painter, option, index):
+        state = index.data(STATE_ROLE)
+        if state is None:
+            return
+        icon = index.data(ICON_ROLE)
+        if icon is not None:
+            rect = option.rect
+            pixmap = self.pixmap_cache.get(icon, self.tints.get(state), rect.size(), painter.device().devicePixelRatioF())
+            painter.drawPixmap(rect.topLeft(), pixmap)
+        elif state in self.backgrounds:
+            fill, border = self.backgrounds[state]
+            rect = option.rect.adjusted(1, 1, -1, -1)
+            painter.save()
+            painter.fillRect(rect, QColor(*fill))
+            painter.setPen(QPen(QColor(*border)))
+            painter.drawRect(rect.adjusted(0, 0, -1, -1))
+            painter.setPen(option.palette.text().color())
+            text = option.fontMetrics.elidedText(index.data(Qt.DisplayRole), Qt.ElideRight, rect.width() - 6)
+            painter.drawText(QRect(rect.left() + 3, rect.top(), rect.width() - 6, rect.height()),
+                             Qt.AlignLeft | Qt.AlignVCenter, text)
+            painter.restore()
+        else:
+            QStyledItemDelegate.paint(self, painter, option, index)
+
+
+def setup_grid(view, model, delegate, cell_width, cell_height):
+    """Turn a QTableView into a plain grid of fixed size cells."""
+    view.setModel(model)
+    view.setItemDelegate(delegate)
+    view.setShowGrid(False)
+    view.setFrameShape(QFrame.NoFrame)
+    view.setSelectionMode(QAbstractItemView.NoSelection)
+    view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+    view.setFocusPolicy(Qt.NoFocus)
+    view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+    for header, size in ((view.horizontalHeader(), cell_width), (view.verticalHeader(), cell_height)):
+        header.hide()
+        header.setMinimumSectionSize(1)
+        header.setSectionResizeMode(QHeaderView.Fixed)
+        header.setDefaultSectionSize(size)